@@ -52,6 +52,8 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    # gzip/brotli 압축 + ETag (본문을 읽거나 바꾸는 미들웨어보다 앞에 둠, labor/compression.py)
+    "labor.compression.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -81,6 +83,16 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    # orjson 기반 JSON 렌더러/파서 (orjson이 없으면 DRF 기본 동작, labor/renderers.py)
+    "DEFAULT_RENDERER_CLASSES": (
+        "labor.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "labor.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
 AUTH_USER_MODEL = "accounts.User"
@@ -128,6 +140,30 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# 공휴일, 급여 예측, 계산 결과 캐시(labor/invalidation.py)에 사용
+# 여러 워커 프로세스로 운영할 때는 무효화가 모든 워커에 반영되도록 Redis 등 공유 캐시를 지정하세요.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # 압축 응답 본문 전용 (계산 결과 캐시와 서로 밀어내지 않도록 분리)
+    'compressed_responses': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'compressed-responses',
+        'OPTIONS': {'MAX_ENTRIES': 500},
+    },
+}
+
+# 응답 압축 (labor/compression.py): 이 크기 이상만 압축
+# 압축 본문 캐시는 응답이 허용한 경우(Cache-Control max-age 또는 mark_compressed_cacheable)만 ETag 기준으로 저장
+RESPONSE_COMPRESSION_MIN_BYTES = 1024
+RESPONSE_COMPRESSION_CACHE_ALIAS = 'compressed_responses'
+RESPONSE_COMPRESSION_CACHE_TIMEOUT = 60 * 60 * 24
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
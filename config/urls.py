@@ -4,6 +4,8 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+from labor.views import batch_requests
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/accounts/", include("accounts.urls")),
@@ -12,6 +14,8 @@ urlpatterns = [
     path("api/documents/", include("documents.urls")),
     path("api/schedules/", include("schedules.urls")),
     path("api/procedures/", include("procedures.urls")),
+    # 여러 GET 요청을 한 번에 (labor/subrequests.py)
+    path("api/batch/", batch_requests, name="batch-requests"),
 ]
 
 if settings.DEBUG:
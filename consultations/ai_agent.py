@@ -7,11 +7,12 @@ from langchain_core.tools import tool
 from django.conf import settings
 from labor.models import Employee, CalculationResult
 from labor.services import (
-    compute_payroll_summary, 
     calculate_severance_v2, 
     evaluate_labor, 
     job_to_inputs
 )
+from labor.snapshots import get_payroll_summary
+from labor.compliance import check_compliance, compliance_warnings
 
 # 1. Define Tools
 @tool
@@ -94,7 +95,7 @@ def calculate_monthly_salary_tool(user_id: int, target_month: int = 0) -> str:
         
         for emp in employees:
             # 급여 계산
-            payroll = compute_payroll_summary(emp, year, month)
+            payroll = get_payroll_summary(emp, year, month)
             
             # 예상 수령액 (세후 우선, 없으면 세전)
             net_pay = payroll.get('net_pay', 0)
@@ -166,11 +167,12 @@ def diagnose_labor_law_tool(user_id: int) -> str:
             # 1. Employee -> JobInputs 변환
             inputs = job_to_inputs(emp)
             
-            # 2. 노동법 위반 여부 진단
+            # 2. 노동법 위반 여부 진단 (근로조건 + 근로기록 기반 규칙 점검)
             eval_result = evaluate_labor(inputs)
+            compliance = check_compliance(emp, inputs=inputs)
             
-            # 3. 결과 포맷팅
-            warnings = eval_result.get('warnings', [])
+            # 3. 결과 포맷팅 (경고는 규칙 엔진 결과에서만)
+            warnings = compliance_warnings(compliance)
             status_msg = "✅ 위반 사항 없음 (정상)"
             if warnings:
                  status_msg = "⚠️ " + ", ".join(warnings)
@@ -186,6 +188,10 @@ def diagnose_labor_law_tool(user_id: int) -> str:
                 f"- 주휴수당: {weekly_holiday}\n"
                 f"- 종합 판정: {status_msg}"
             )
+            # 위반 상세는 최근 5건만 (날짜/금액 포함)
+            for v in compliance['violations'][-5:]:
+                amount = f", 추정 {v['amount']:,}원" if v['amount'] else ""
+                info += f"\n  · {v['start_date']}~{v['end_date']}: {v['message']}{amount}"
             results.append(info)
             
         return "\n\n".join(results)
@@ -183,6 +183,27 @@ export async function fetchMe(accessToken: string): Promise<UserMe> {
   return response.data;
 }
 
+// 여러 GET을 한 번에 (POST /api/batch/). path는 apiClient와 같은 기준 (예: "/labor/jobs/3/calendar/")
+export interface BatchGetRequest {
+  path: string;
+  params?: Record<string, any>;
+}
+
+export async function batchGet<T = any>(requests: BatchGetRequest[]): Promise<T[]> {
+  const response = await apiClient.post("/batch/", {
+    requests: requests.map((r, i) => ({ id: i, path: `/api${r.path}`, params: r.params })),
+  });
+  return (response.data?.responses || []).map((sub: any) => {
+    if (sub.status >= 400) {
+      // 하위 요청 실패는 개별 axios 요청과 같은 형태로 던짐
+      throw Object.assign(new Error(`batch request failed (${sub.status})`), {
+        response: { status: sub.status, data: sub.body },
+      });
+    }
+    return sub.body as T;
+  });
+}
+
 // Documents API helpers
 export interface DocumentTemplate {
   id: number;
@@ -0,0 +1,196 @@
+"""labor/back_pay.py
+
+체불임금(미지급 임금) 추정 계산기
+
+근로기록/스케줄/근로조건 이력을 한 번(쿼리 4회) 적재한 뒤, 근무 시작일부터 날짜 순으로
+한 번만 순회하면서 월별 체불 원장을 만듭니다. 월이 끝날 때마다 한 행씩 생성(yield)하므로
+여러 해의 기록도 월 단위 누적값만 유지한 채 처리합니다.
+
+앱에는 실제 지급 명세가 없으므로 "약정 시급 × 근로시간"만 지급받았다고 가정하고,
+법정 기준과의 차액을 항목별로 냅니다.
+- minimum_wage: 해당 날짜의 최저임금에 못 미친 시급 부족분
+- weekly_holiday_pay: 주휴수당 (주휴일이 속한 달에 계상)
+- night_premium / holiday_premium / overtime_premium: 야간·휴일·연장 가산수당 50% (5인 이상 사업장)
+가산수당과 주휴수당은 최저임금 이상으로 보정한 시급으로 계산합니다.
+이미 지급받은 항목은 assume_paid로 제외할 수 있습니다.
+
+실제 근로기록이 없는 날은 급여 요약과 같이 스케줄대로 근무한 것으로 봅니다.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from django.utils import timezone
+
+from .dataset import EmployeeDataset, iter_dates, week_start_of
+from .ledger import day_hours
+from .terms import terms_for
+
+MINIMUM_WAGE_SHORTFALL = 'minimum_wage'
+WEEKLY_HOLIDAY_PAY = 'weekly_holiday_pay'
+NIGHT_PREMIUM = 'night_premium'
+HOLIDAY_PREMIUM = 'holiday_premium'
+OVERTIME_PREMIUM = 'overtime_premium'
+
+COMPONENTS = (MINIMUM_WAGE_SHORTFALL, WEEKLY_HOLIDAY_PAY, NIGHT_PREMIUM, HOLIDAY_PREMIUM, OVERTIME_PREMIUM)
+
+COMPONENT_LABELS = {
+    MINIMUM_WAGE_SHORTFALL: '최저임금 부족분',
+    WEEKLY_HOLIDAY_PAY: '주휴수당',
+    NIGHT_PREMIUM: '야간근로 가산수당',
+    HOLIDAY_PREMIUM: '휴일근로 가산수당',
+    OVERTIME_PREMIUM: '연장근로 가산수당',
+}
+
+# 근로기준법 제49조: 임금채권 소멸시효 3년
+LIMITATION_YEARS = 3
+
+
+def _add_years(target_date: date, years: int) -> date:
+    try:
+        return target_date.replace(year=target_date.year + years)
+    except ValueError:  # 2월 29일
+        return target_date.replace(year=target_date.year + years, day=28)
+
+
+def limitation_start(today: date) -> date:
+    """이 날짜 이전에 지급기일이 지난 임금은 소멸시효 완성"""
+    return _add_years(today, -LIMITATION_YEARS)
+
+
+def _new_month(d: date) -> Dict[str, Any]:
+    row = {
+        'month': f"{d.year}-{d.month:02d}",
+        'total_hours': 0.0,
+        'actual_hours': 0.0,
+        'scheduled_hours': 0.0,
+        'paid': 0,
+    }
+    row.update({c: 0 for c in COMPONENTS})
+    return row
+
+
+def _finish_month(row: Dict[str, Any], month_end: date, limitation: date) -> Dict[str, Any]:
+    for field in ('total_hours', 'actual_hours', 'scheduled_hours'):
+        row[field] = round(row[field], 1)
+    row['arrears'] = sum(row[c] for c in COMPONENTS)
+    row['owed'] = row['paid'] + row['arrears']
+    # 지급기일은 해당 월 말일로 봄
+    row['is_time_barred'] = month_end < limitation
+    return row
+
+
+def iter_back_pay_months(employee, dataset: EmployeeDataset, start: date, end: date,
+                         assume_paid: Iterable[str] = (), today: Optional[date] = None,
+                         week_records: Optional[Iterator] = None) -> Iterator[Dict[str, Any]]:
+    """start ~ end의 월별 체불 원장 행을 날짜 순으로 생성
+
+    dataset은 week_start_of(start) ~ end를 포함해야 합니다 (월 첫 주 연장근로 누적용).
+    week_records(dataset.iter_week_records)를 넘기면 dataset은 스케줄/근로조건만 쓰고(with_records=False)
+    근로기록은 주마다 window로 얹어 판정하므로, 긴 기간도 한 주 분량의 기록만 메모리에 둡니다.
+    주휴수당은 주휴일(일요일)이 end 이전인 완료된 주만 계상합니다.
+    """
+    from .holidays import get_holidays_for_year
+    from .law_params import MINIMUM_WAGE, law_param
+    from .overtime import WeeklyOvertimeCounter
+    from .services import price_weekly_holiday, weekly_holiday_facts
+
+    today = today or timezone.localdate()
+    limitation = limitation_start(today)
+    skip = set(assume_paid)
+    terms = terms_for(employee, dataset)
+    overtime_counter = WeeklyOvertimeCounter()
+    holiday_dates = set()
+    holiday_year = None
+    row = None
+
+    base = dataset
+    for d in iter_dates(week_start_of(start), end):
+        if week_records is not None and d.weekday() == 0:
+            week_start, records = next(week_records)
+            dataset = base.window(week_start, week_start + timedelta(days=6), records)
+        if d.year != holiday_year:
+            holiday_year = d.year
+            holiday_dates = {
+                h['date'] for month in get_holidays_for_year(d.year).values() for h in month if h['type'] == 'LEGAL'
+            }
+        hours, night_hours, source = day_hours(dataset, d)
+        is_holiday = d.weekday() == 6 or d.isoformat() in holiday_dates
+        overtime_hours = overtime_counter.add(d, hours, is_holiday)
+        if d < start:
+            continue  # 월 첫 주의 시작일 이전 날짜는 연장근로 주 누적에만 사용
+
+        if row is None:
+            row = _new_month(d)
+
+        day_terms = terms.as_of(d)
+        if hours > 0:
+            rate = int(day_terms.hourly_rate)
+            owed_rate = max(rate, int(law_param(MINIMUM_WAGE, d)))
+            row['paid'] += int(hours * rate)
+            row[MINIMUM_WAGE_SHORTFALL] += int(hours * (owed_rate - rate))
+            if day_terms.is_workplace_over_5:
+                if is_holiday:
+                    row[HOLIDAY_PREMIUM] += int(hours * owed_rate * 0.5)
+                if night_hours > 0:
+                    row[NIGHT_PREMIUM] += int(night_hours * owed_rate * 0.5)
+                if overtime_hours > 0:
+                    row[OVERTIME_PREMIUM] += int(overtime_hours * owed_rate * 0.5)
+            row['total_hours'] += hours
+            row['actual_hours' if source == 'actual' else 'scheduled_hours'] += hours
+
+        if d.weekday() == 6:
+            facts = weekly_holiday_facts(employee, d, dataset=dataset)
+            if facts.has_scheduled_day:
+                owed_rate = max(Decimal(day_terms.hourly_rate), Decimal(law_param(MINIMUM_WAGE, d)))
+                row[WEEKLY_HOLIDAY_PAY] += price_weekly_holiday(
+                    facts, owed_rate, day_terms.contract_weekly_hours
+                )['amount']
+
+        if d == end or (d + timedelta(days=1)).day == 1:
+            for component in skip:
+                row[component] = 0
+            yield _finish_month(row, d, limitation)
+            row = None
+
+
+def back_pay_period(employee, today: Optional[date] = None):
+    """계산 기간: 근무 시작일 ~ 어제"""
+    today = today or timezone.localdate()
+    return employee.start_date, today - timedelta(days=1)
+
+
+def calculate_back_pay(employee, today: Optional[date] = None, dataset: Optional[EmployeeDataset] = None,
+                       assume_paid: Iterable[str] = ()) -> Dict[str, Any]:
+    """전체 근무 기간의 월별 체불 원장과 합계"""
+    today = today or timezone.localdate()
+    assume_paid = [c for c in COMPONENTS if c in set(assume_paid)]
+    start, end = back_pay_period(employee, today)
+    totals = {c: 0 for c in COMPONENTS}
+    totals.update({'paid': 0, 'owed': 0, 'arrears': 0, 'claimable_arrears': 0})
+    if not start or end < start:
+        return {
+            'period': None, 'assume_paid': assume_paid, 'limitation_start': limitation_start(today).isoformat(),
+            'months': [], 'totals': totals,
+        }
+
+    span_start = week_start_of(start)
+    if dataset is None or not dataset.covers(span_start, end):
+        dataset = EmployeeDataset.load(employee, span_start, end)
+
+    months = []
+    for row in iter_back_pay_months(employee, dataset, start, end, assume_paid, today):
+        months.append(row)
+        for field in COMPONENTS + ('paid', 'owed', 'arrears'):
+            totals[field] += row[field]
+        if not row['is_time_barred']:
+            totals['claimable_arrears'] += row['arrears']
+
+    return {
+        'period': {'start': start.isoformat(), 'end': end.isoformat()},
+        'assume_paid': assume_paid,
+        'limitation_start': limitation_start(today).isoformat(),
+        'months': months,
+        'totals': totals,
+    }
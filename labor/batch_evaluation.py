@@ -0,0 +1,125 @@
+"""labor/batch_evaluation.py
+
+evaluate_labor의 벡터화(NumPy) 버전 - 플랫폼 전체 리포트용
+
+JobInputs 필드별 배열(열 단위)을 받아 결과도 배열로 돌려줍니다.
+값은 services의 스칼라 함수(calc_weekly_holiday_pay, calc_annual_leave, calc_severance,
+check_minimum_wage)와 같습니다. None은 NaN으로 받아 스칼라 버전의 `is None`/falsy 분기와 같게 처리합니다.
+"""
+
+from datetime import date
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+import numpy as np
+
+from .services import JobInputs, minimum_wage_for
+
+BATCH_FIELDS = (
+    'hourly_rate', 'start_date', 'attendance_rate_last_year', 'total_wage_last_3m',
+    'total_days_last_3m', 'contract_weekly_hours', 'weekly_hours', 'work_days_per_week',
+)
+
+
+def inputs_to_columns(jobs: Iterable[JobInputs]) -> Dict[str, np.ndarray]:
+    """JobInputs 목록 → 열 배열 (None은 NaN)"""
+    jobs = list(jobs)
+    columns = {}
+    for name in BATCH_FIELDS:
+        values = [getattr(job, name) for job in jobs]
+        if name == 'start_date':
+            columns[name] = np.array(values, dtype='datetime64[D]')
+        else:
+            columns[name] = _float_column(values)
+    return columns
+
+
+def _float_column(values) -> np.ndarray:
+    return np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+
+
+def _as_float(column) -> np.ndarray:
+    array = np.asarray(column)
+    if array.dtype == object:
+        return _float_column(array)
+    return array.astype(np.float64, copy=False)
+
+
+def _truthy(values: np.ndarray) -> np.ndarray:
+    """파이썬 truthiness (None/NaN/0 → False)"""
+    return ~np.isnan(values) & (values != 0)
+
+
+def calc_weekly_holiday_pay_batch(weekly_hours, hourly_rate, work_days_per_week, contract_weekly_hours) -> np.ndarray:
+    """calc_weekly_holiday_pay와 같은 규칙 (weekly_hours는 NaN 허용)"""
+    total = np.where(np.isnan(contract_weekly_hours), weekly_hours, contract_weekly_hours)
+    eligible = _truthy(total) & (total >= 15)
+
+    estimated_daily = np.where(total < 24, total, total / 5)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        estimated_days = np.maximum(1, np.round(total / np.maximum(estimated_daily, 1)))
+        days = np.where(_truthy(work_days_per_week) & (work_days_per_week > 0), work_days_per_week, estimated_days)
+        pay = np.round(total / days * hourly_rate)
+    return np.where(eligible, pay, 0).astype(np.int64)
+
+
+def calc_annual_leave_batch(service_days: np.ndarray, attendance_rate_last_year: np.ndarray) -> np.ndarray:
+    """calc_annual_leave와 같은 규칙"""
+    service_years = np.floor_divide(service_days, 365)
+    under_one_year = np.floor_divide(service_days, 30).astype(np.float64)
+    low_attendance = ~np.isnan(attendance_rate_last_year) & (attendance_rate_last_year < 0.8)
+    with_extra = np.minimum(25, 15 + (service_years - 1) // 2).astype(np.float64)
+    over_one_year = np.where(service_years >= 3, with_extra, 15.0)
+    return np.where(service_years < 1, under_one_year, np.where(low_attendance, 0.0, over_one_year))
+
+
+def calc_severance_batch(service_years, weekly_hours, total_wage_last_3m, total_days_last_3m,
+                         contract_weekly_hours) -> np.ndarray:
+    """calc_severance와 같은 규칙"""
+    total = np.where(np.isnan(contract_weekly_hours), weekly_hours, contract_weekly_hours)
+    eligible = (service_years >= 1) & _truthy(total) & (total >= 15)
+    eligible &= _truthy(total_wage_last_3m) & _truthy(total_days_last_3m) & (total_days_last_3m > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        severance = np.round(total_wage_last_3m / total_days_last_3m * 30 * service_years)
+    return np.where(eligible, severance, 0).astype(np.int64)
+
+
+def evaluate_labor_batch(columns: Mapping[str, Any], today: Optional[date] = None) -> Dict[str, np.ndarray]:
+    """evaluate_labor의 배열 버전
+
+    columns: BATCH_FIELDS 이름 → 배열 (start_date는 datetime64[D] 또는 date 목록)
+    반환: 결과 필드별 배열. warnings는 문장 대신 경고별 불리언 배열(warn_*)로 냅니다.
+    """
+    today = today or date.today()
+    start_date = np.asarray(columns['start_date'], dtype='datetime64[D]')
+    hourly_rate = _as_float(columns['hourly_rate'])
+    attendance = _as_float(columns.get('attendance_rate_last_year', np.full(len(start_date), np.nan)))
+    wage_3m = _as_float(columns.get('total_wage_last_3m', np.full(len(start_date), np.nan)))
+    days_3m = _as_float(columns.get('total_days_last_3m', np.full(len(start_date), np.nan)))
+    contract = _as_float(columns.get('contract_weekly_hours', np.full(len(start_date), np.nan)))
+    raw_weekly = _as_float(columns.get('weekly_hours', np.full(len(start_date), np.nan)))
+    work_days = _as_float(columns.get('work_days_per_week', np.full(len(start_date), np.nan)))
+
+    service_days = (np.datetime64(today, 'D') - start_date).astype(np.int64)
+    service_years = np.floor_divide(service_days, 365)
+    min_wage_required = minimum_wage_for(today.year)
+    min_wage_ok = hourly_rate >= min_wage_required
+    # evaluate_labor: weekly_hours = job.weekly_hours or 0
+    weekly_hours = np.where(_truthy(raw_weekly), raw_weekly, 0.0)
+
+    weekly_holiday_pay = calc_weekly_holiday_pay_batch(weekly_hours, hourly_rate, work_days, contract)
+    annual_leave_days = calc_annual_leave_batch(service_days, attendance)
+    severance_estimate = calc_severance_batch(service_years, weekly_hours, wage_3m, days_3m, contract)
+
+    total_weekly_hours = np.where(np.isnan(contract), weekly_hours, contract)
+    return {
+        'service_days': service_days,
+        'service_years': service_years,
+        'min_wage_ok': min_wage_ok,
+        'min_wage_required': min_wage_required,
+        'weekly_holiday_pay': weekly_holiday_pay,
+        'annual_leave_days': annual_leave_days,
+        'severance_estimate': severance_estimate,
+        'warn_min_wage': ~min_wage_ok,
+        'warn_weekly_holiday': (total_weekly_hours >= 15) & (weekly_holiday_pay == 0),
+        'warn_severance': (service_years >= 1) & (total_weekly_hours >= 15) & (severance_estimate == 0),
+    }
@@ -0,0 +1,82 @@
+"""labor/columnar.py
+
+행 배열의 열 단위 압축 표현 (?format=columnar)
+
+캘린더(dates)와 급여 요약(rows)은 같은 키를 가진 dict 수십 개로 이루어져 있어
+키 이름이 값보다 많은 바이트를 차지합니다. columnar 형식은 dict 목록을 필드별 배열 하나로 바꿉니다.
+
+    [{"date": "2025-03-01", "source": "actual"}, {"date": "2025-03-02", "source": "none"}]
+    →
+    {"length": 2, "columns": {
+        "date": ["2025-03-01", "2025-03-02"],
+        "source": {"enum": ["actual", "none"], "codes": [0, 1]}}}
+
+- ENUM_FIELDS(출결 상태, 구분 등)는 값 목록(enum)과 인덱스(codes)로 사전 인코딩합니다. null은 null 그대로.
+- 중첩 dict 열(캘린더의 record)은 같은 방식으로 다시 열 단위가 되고, 없는 행은 모든 하위 열이 null입니다.
+- 행 배열이 아닌 값(summary, notes 등)은 그대로 둡니다.
+"""
+
+from typing import Any, Dict, List
+
+from rest_framework.renderers import JSONRenderer
+
+ENUM_FIELDS = frozenset({
+    'attendance_status', 'attendance_type', 'day_type', 'source', 'schedule_source', 'holiday_type',
+})
+
+
+def _is_row_list(value: Any) -> bool:
+    return (
+        isinstance(value, list) and bool(value)
+        and all(item is None or isinstance(item, dict) for item in value)
+        and any(isinstance(item, dict) for item in value)
+    )
+
+
+def _encode_enum(values: List[Any]) -> Dict[str, list]:
+    enum: Dict[Any, int] = {}
+    codes = []
+    for value in values:
+        if value is None:
+            codes.append(None)
+        else:
+            codes.append(enum.setdefault(value, len(enum)))
+    return {'enum': list(enum), 'codes': codes}
+
+
+def to_columns(rows: List[Any]) -> Dict[str, Any]:
+    """dict 목록(없는 행은 None) → {"length": n, "columns": {필드: 배열}}"""
+    names: Dict[str, None] = {}
+    for row in rows:
+        if row:
+            names.update(dict.fromkeys(row))
+    columns: Dict[str, Any] = {}
+    for name in names:
+        values = [row.get(name) if row else None for row in rows]
+        if name in ENUM_FIELDS:
+            columns[name] = _encode_enum(values)
+        elif _is_row_list(values):
+            columns[name] = to_columns(values)
+        else:
+            columns[name] = [columnar(v) for v in values]
+    return {'length': len(rows), 'columns': columns}
+
+
+def columnar(data: Any) -> Any:
+    """응답 데이터 안의 행 배열을 모두 열 단위로 바꿈"""
+    if _is_row_list(data):
+        return to_columns(data)
+    if isinstance(data, dict):
+        return {key: columnar(value) for key, value in data.items()}
+    return data
+
+
+class ColumnarJSONRenderer(JSONRenderer):
+    """?format=columnar: 행 배열을 열 단위로 바꿔 JSON으로 응답 (오류 응답은 그대로)"""
+    format = 'columnar'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        response = (renderer_context or {}).get('response')
+        if response is None or not response.exception:
+            data = columnar(data)
+        return super().render(data, accepted_media_type, renderer_context)
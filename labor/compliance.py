@@ -0,0 +1,380 @@
+"""labor/compliance.py
+
+근로기준법 준수 여부 점검 (규칙 엔진)
+
+근로기록/스케줄/근로조건 이력을 한 번 적재한 뒤, 날짜별 근로(ResolvedDay)와
+주 단위 요약(ResolvedWeek)을 날짜 순으로 한 번만 흘려보냅니다.
+각 규칙은 이 흐름을 소비하면서 위반 사항(Violation)을 모으므로
+규칙 수와 무관하게 Employee당 한 번의 순회로 점검이 끝납니다.
+
+점검 기간은 최근 1년(근무 시작일 이후) 중 지난주까지의 완료된 주입니다.
+실제 근로기록이 없는 날은 급여 요약과 같이 스케줄대로 근무한 것으로 봅니다.
+
+근로기록과 무관한 현재 근로조건(JobInputs) 점검도 같은 규칙이 on_contract로 받아
+detail['basis'] == 'contract'인 위반으로 냅니다 (현재 시급의 최저임금 미달, 주휴수당, 퇴직금).
+evaluation 응답과 AI 진단의 warnings는 모두 이 결과에서만 만듭니다.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal
+from math import floor
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from django.utils import timezone
+
+from .dataset import EmployeeDataset, iter_dates, week_start_of
+from .ledger import day_hours
+from .terms import PayTerms, terms_for
+
+LOOKBACK_DAYS = 365
+
+# 근로기준법 제53조: 1주 40시간 + 연장 12시간
+WEEKLY_HOURS_CAP = 52
+
+RULE_MINIMUM_WAGE = 'MINIMUM_WAGE'
+RULE_BREAK_TIME = 'BREAK_TIME'
+RULE_WEEKLY_HOURS_CAP = 'WEEKLY_HOURS_CAP'
+RULE_WEEKLY_HOLIDAY_PAY = 'WEEKLY_HOLIDAY_PAY'
+RULE_SEVERANCE = 'SEVERANCE'
+
+BASIS_CONTRACT = 'contract'
+
+
+@dataclass(frozen=True)
+class ResolvedDay:
+    """하루의 인정 근로 (근로기록 우선, 없으면 스케줄)"""
+    date: date
+    source: str                   # 'actual' | 'scheduled'
+    hours: float
+    break_minutes: int
+    terms: PayTerms
+
+
+@dataclass(frozen=True)
+class ResolvedWeek:
+    """완료된 한 주 (해당 주의 ResolvedDay가 모두 지나간 뒤 전달)"""
+    week_start: date
+    week_end: date
+    hours: float
+    facts: Any                    # services.WeeklyHolidayFacts
+    terms: PayTerms               # 주 종료일 기준
+
+
+@dataclass
+class Violation:
+    rule: str
+    message: str
+    start_date: date
+    end_date: date
+    amount: Optional[int] = None  # 미지급 추정액 (금액과 무관한 위반은 None)
+    detail: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'rule': self.rule,
+            'message': self.message,
+            'start_date': self.start_date.isoformat(),
+            'end_date': self.end_date.isoformat(),
+            'amount': self.amount,
+            'detail': self.detail,
+        }
+
+
+class Rule:
+    """흐름 소비자: on_contract/on_day/on_week로 사실을 받아 finish()에서 위반 목록 반환"""
+    code = ''
+
+    def __init__(self, employee):
+        self.employee = employee
+        self.violations: List[Violation] = []
+
+    def on_contract(self, job, today: date) -> None:
+        """현재 근로조건(services.JobInputs) 점검 (흐름보다 먼저 한 번 호출)"""
+        pass
+
+    def _contract_violation(self, message: str, today: date, amount: Optional[int] = None, **detail) -> None:
+        self.violations.append(Violation(
+            rule=self.code, message=message, start_date=today, end_date=today,
+            amount=amount, detail={'basis': BASIS_CONTRACT, **detail},
+        ))
+
+    def on_day(self, day: ResolvedDay) -> None:
+        pass
+
+    def on_week(self, week: ResolvedWeek) -> None:
+        pass
+
+    def finish(self) -> List[Violation]:
+        return self.violations
+
+
+class MinimumWageRule(Rule):
+    """근무일의 시급이 해당 연도 최저임금 미만 (최저임금법 제6조)
+
+    같은 연도·같은 시급 구간은 하나의 위반으로 묶고, 부족분 × 근로시간을 금액으로 냅니다.
+    """
+    code = RULE_MINIMUM_WAGE
+
+    def __init__(self, employee):
+        super().__init__(employee)
+        self._current = None      # (year, hourly_rate, required)
+        self._start = self._end = None
+        self._hours = 0.0
+        self._contract = None     # 현재 시급이 미달이면 (today, hourly_rate, required)
+
+    def on_contract(self, job, today: date) -> None:
+        from .services import minimum_wage_for
+
+        required = minimum_wage_for(today.year)
+        rate = Decimal(str(job.hourly_rate))
+        if rate < required:
+            self._contract = (today, rate, required)
+
+    def on_day(self, day: ResolvedDay) -> None:
+        from .services import minimum_wage_for
+
+        required = minimum_wage_for(day.date.year)
+        rate = day.terms.hourly_rate
+        if rate >= required:
+            self._flush()
+            return
+        key = (day.date.year, rate, required)
+        if key != self._current:
+            self._flush()
+            self._current, self._start = key, day.date
+        self._end = day.date
+        self._hours += day.hours
+
+    def _flush(self) -> None:
+        if self._current is None:
+            return
+        year, rate, required = self._current
+        shortfall = Decimal(required) - Decimal(rate)
+        self.violations.append(Violation(
+            rule=self.code,
+            message=f"{year}년 최저임금({required:,}원)보다 낮은 시급({int(rate):,}원)으로 근무했습니다.",
+            start_date=self._start,
+            end_date=self._end,
+            amount=int(shortfall * Decimal(str(self._hours))),
+            detail={'hourly_rate': int(rate), 'minimum_wage': required, 'hours': round(self._hours, 1)},
+        ))
+        self._current = None
+        self._hours = 0.0
+
+    def finish(self) -> List[Violation]:
+        self._flush()
+        if self._contract is not None:
+            # 올해 같은 시급으로 근무한 구간이 이미 위반으로 잡혔으면 현재 조건 위반은 따로 내지 않음
+            today, rate, required = self._contract
+            if not any(v.start_date.year == today.year and v.detail['hourly_rate'] == int(rate) for v in self.violations):
+                self._contract_violation(
+                    f"현재 시급({int(rate):,}원)이 {today.year}년 최저임금({required:,}원)보다 낮습니다.",
+                    today, hourly_rate=int(rate), minimum_wage=required,
+                )
+        return self.violations
+
+
+class BreakTimeRule(Rule):
+    """근로시간 4시간 이상 30분, 8시간 이상 1시간 휴게 (근로기준법 제54조)
+
+    실제 근로기록만 점검합니다 (스케줄은 계획이므로 제외).
+    """
+    code = RULE_BREAK_TIME
+
+    def on_day(self, day: ResolvedDay) -> None:
+        if day.source != 'actual':
+            return
+        if day.hours >= 8:
+            required = 60
+        elif day.hours >= 4:
+            required = 30
+        else:
+            return
+        if day.break_minutes < required:
+            self.violations.append(Violation(
+                rule=self.code,
+                message=f"{day.hours:g}시간 근무에 휴게시간이 {day.break_minutes}분으로 법정 {required}분보다 짧습니다.",
+                start_date=day.date,
+                end_date=day.date,
+                detail={'hours': day.hours, 'break_minutes': day.break_minutes, 'required_minutes': required},
+            ))
+
+
+class WeeklyHoursCapRule(Rule):
+    """1주 52시간 초과 (근로기준법 제53조, 5인 이상 사업장)"""
+    code = RULE_WEEKLY_HOURS_CAP
+
+    def on_week(self, week: ResolvedWeek) -> None:
+        if not week.terms.is_workplace_over_5 or week.hours <= WEEKLY_HOURS_CAP:
+            return
+        self.violations.append(Violation(
+            rule=self.code,
+            message=f"주 {week.hours:g}시간 근무로 주 {WEEKLY_HOURS_CAP}시간 한도를 넘었습니다.",
+            start_date=week.week_start,
+            end_date=week.week_end,
+            detail={'hours': week.hours, 'cap': WEEKLY_HOURS_CAP},
+        ))
+
+
+class WeeklyHolidayPayRule(Rule):
+    """계약상 주 15시간 미만이지만 실제 근로로 주휴수당 요건을 채운 주 (근로기준법 제55조)
+
+    계약시간만 보면 주휴수당 대상이 아니어서 지급이 누락되기 쉬운 주를 찾습니다.
+    """
+    code = RULE_WEEKLY_HOLIDAY_PAY
+
+    def on_contract(self, job, today: date) -> None:
+        """계약(또는 스케줄)상 주 15시간 이상인데 주휴수당이 산정되지 않는 조건"""
+        from .services import calc_weekly_holiday_pay
+
+        weekly_hours = job.weekly_hours or 0
+        total_weekly_hours = job.contract_weekly_hours if job.contract_weekly_hours is not None else weekly_hours
+        if total_weekly_hours < 15:
+            return
+        if calc_weekly_holiday_pay(weekly_hours, job.hourly_rate, job.work_days_per_week, job.contract_weekly_hours) == 0:
+            self._contract_violation("주 15시간 이상 근무 시 주휴수당 지급이 필요합니다.", today,
+                                     weekly_hours=float(total_weekly_hours))
+
+    def on_week(self, week: ResolvedWeek) -> None:
+        from .law_params import WEEKLY_HOLIDAY_MIN_HOURS, law_param
+        from .services import price_weekly_holiday
+
+        contract_hours = week.terms.contract_weekly_hours
+        min_weekly_hours = Decimal(str(law_param(WEEKLY_HOLIDAY_MIN_HOURS, week.week_end)))
+        if contract_hours is None or Decimal(str(contract_hours)) >= min_weekly_hours:
+            return
+        if not week.facts.has_scheduled_day:
+            return
+        priced = price_weekly_holiday(week.facts, week.terms.hourly_rate, contract_hours)
+        if not priced['is_eligible']:
+            return
+        self.violations.append(Violation(
+            rule=self.code,
+            message=(
+                f"계약상 주 {contract_hours:g}시간이지만 실제 {week.facts.actual_hours:.1f}시간을 개근하여 "
+                f"주휴수당 대상입니다. 지급 여부를 확인하세요."
+            ),
+            start_date=week.week_start,
+            end_date=week.week_end,
+            amount=priced['amount'],
+            detail={'actual_hours': float(week.facts.actual_hours), 'contract_weekly_hours': float(contract_hours)},
+        ))
+
+
+class SeveranceRule(Rule):
+    """1년 이상, 주 15시간 이상 근무했는데 퇴직금이 산정되지 않는 조건 (근로자퇴직급여 보장법 제8조)"""
+    code = RULE_SEVERANCE
+
+    def on_contract(self, job, today: date) -> None:
+        from .services import calc_service_days, calc_severance
+
+        service_years = floor(calc_service_days(job.start_date, today) / 365)
+        weekly_hours = job.weekly_hours or 0
+        total_weekly_hours = job.contract_weekly_hours if job.contract_weekly_hours is not None else weekly_hours
+        if service_years < 1 or total_weekly_hours < 15:
+            return
+        severance = calc_severance(service_years, weekly_hours, job.total_wage_last_3m, job.total_days_last_3m,
+                                   job.contract_weekly_hours)
+        if severance == 0:
+            self._contract_violation("1년 이상, 주 15시간 이상 근무 시 퇴직금 지급이 필요합니다.", today,
+                                     service_years=service_years, weekly_hours=float(total_weekly_hours))
+
+
+DEFAULT_RULES = (MinimumWageRule, BreakTimeRule, WeeklyHoursCapRule, WeeklyHolidayPayRule, SeveranceRule)
+
+
+def compliance_period(employee, today: Optional[date] = None):
+    """점검 기간: 최근 1년 중 지난주 일요일까지의 완료된 주 (시작일 이전 제외)"""
+    today = today or timezone.localdate()
+    end = week_start_of(today) - timedelta(days=1)
+    start = today - timedelta(days=LOOKBACK_DAYS)
+    if employee.start_date and employee.start_date > start:
+        start = employee.start_date
+    return week_start_of(start), end
+
+
+def iter_resolved(employee, dataset: EmployeeDataset, start: date, end: date) -> Iterator[Union[ResolvedDay, ResolvedWeek]]:
+    """start(월요일) ~ end(일요일)의 날짜별 근로와 주 요약을 날짜 순으로 생성"""
+    from .services import weekly_holiday_facts
+
+    terms = terms_for(employee, dataset)
+    week_hours = 0.0
+    for d in iter_dates(start, end):
+        hours, _, source = day_hours(dataset, d)
+        if hours > 0:
+            record = dataset.record(d) if source == 'actual' else None
+            yield ResolvedDay(d, source, hours, int(record.break_minutes or 0) if record else 0, terms.as_of(d))
+            week_hours += hours
+        if d.weekday() == 6:
+            week_start = d - timedelta(days=6)
+            yield ResolvedWeek(
+                week_start, d, round(week_hours, 1),
+                weekly_holiday_facts(employee, week_start, dataset=dataset), terms.as_of(d),
+            )
+            week_hours = 0.0
+
+
+def check_compliance(employee, today: Optional[date] = None, dataset: Optional[EmployeeDataset] = None,
+                     rules=DEFAULT_RULES, inputs=None) -> Dict[str, Any]:
+    """모든 규칙을 한 번의 순회로 적용하여 위반 사항 반환
+
+    inputs: 현재 근로조건(services.JobInputs, 없으면 job_to_inputs로 생성)
+    """
+    from .services import job_to_inputs
+
+    today = today or timezone.localdate()
+    consumers = [rule(employee) for rule in rules]
+    job = inputs or job_to_inputs(employee)
+    for consumer in consumers:
+        consumer.on_contract(job, today)
+
+    start, end = compliance_period(employee, today)
+    if end >= start:
+        if dataset is None or not dataset.covers(start, end):
+            dataset = EmployeeDataset.load(employee, start, end)
+        for event in iter_resolved(employee, dataset, start, end):
+            if isinstance(event, ResolvedDay):
+                for consumer in consumers:
+                    consumer.on_day(event)
+            else:
+                for consumer in consumers:
+                    consumer.on_week(event)
+
+    violations = [v for consumer in consumers for v in consumer.finish()]
+    violations.sort(key=lambda v: (v.start_date, v.rule))
+    counts = {}
+    for v in violations:
+        counts[v.rule] = counts.get(v.rule, 0) + 1
+    return {
+        'period': {'start': start.isoformat(), 'end': end.isoformat()} if end >= start else None,
+        'violations': [v.to_dict() for v in violations],
+        'counts': counts,
+        'total_amount': sum(v.amount or 0 for v in violations),
+    }
+
+
+def compliance_warnings(result: Dict[str, Any]) -> List[str]:
+    """규칙별 한 문장 요약 (evaluation/AI 진단의 warnings)
+
+    근로기록 기반 위반이 있으면 건수·추정액 요약, 현재 근로조건 위반만 있으면 그 문구를 씁니다.
+    """
+    labels = {
+        RULE_MINIMUM_WAGE: "최저임금 미달 근무 구간",
+        RULE_BREAK_TIME: "휴게시간 부족 근무일",
+        RULE_WEEKLY_HOURS_CAP: f"주 {WEEKLY_HOURS_CAP}시간 초과 주",
+        RULE_WEEKLY_HOLIDAY_PAY: "주휴수당 누락 의심 주",
+    }
+    warnings = []
+    for rule in result['counts']:
+        violations = [v for v in result['violations'] if v['rule'] == rule]
+        dated = [v for v in violations if v['detail'].get('basis') != BASIS_CONTRACT]
+        if not dated:
+            warnings.extend(v['message'] for v in violations)
+            continue
+        amount = sum(v['amount'] or 0 for v in dated)
+        text = f"{labels.get(rule, rule)} {len(dated)}건"
+        if amount:
+            text += f" (추정 {amount:,}원)"
+        warnings.append(text + "이 확인되었습니다.")
+    return warnings
@@ -0,0 +1,152 @@
+"""labor/compression.py
+
+응답 압축 (gzip / brotli) + 압축 본문 캐시
+
+- Accept-Encoding을 보고 br(brotli 설치 시) > gzip 순으로 고릅니다 (q=0은 제외).
+- RESPONSE_COMPRESSION_MIN_BYTES보다 작은 응답, 스트리밍 응답, 이미 압축된 형식(zip, 이미지 등)은 그대로 보냅니다.
+- GET 응답에는 본문 해시로 ETag를 붙이고, If-None-Match가 같으면 304를 돌려줍니다.
+- 캐시해도 되는 응답(Cache-Control max-age가 있거나 view가 mark_compressed_cacheable로 표시한 응답:
+  공휴일, 마감된 월 급여 요약)만 압축 본문을 (인코딩, ETag) 키로 전용 캐시(RESPONSE_COMPRESSION_CACHE_ALIAS)에
+  저장하여 처음 한 번만 압축합니다. 사용자별로 자주 바뀌는 응답은 매번 압축하고 저장하지 않습니다.
+"""
+
+import gzip
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponseNotModified
+from django.utils.cache import get_max_age, patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli 미설치 환경
+    brotli = None
+
+DEFAULT_MIN_BYTES = 1024
+DEFAULT_CACHE_ALIAS = 'compressed_responses'
+DEFAULT_CACHE_TIMEOUT = 60 * 60 * 24
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+COMPRESSIBLE_TYPES = ('application/json', 'text/', 'application/javascript', 'application/xml')
+CACHE_PREFIX = 'compressed'
+CACHEABLE_ATTR = 'compressed_cacheable'
+
+# 304에 그대로 실어 보낼 헤더
+NOT_MODIFIED_HEADERS = ('Cache-Control', 'Content-Location', 'Date', 'ETag', 'Expires', 'Last-Modified', 'Vary')
+
+
+def accepted_encodings(header: str) -> dict:
+    """'gzip, br;q=0.5, *;q=0' → {'gzip': 1.0, 'br': 0.5, '*': 0.0}"""
+    encodings = {}
+    for part in header.split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        encodings[name] = q
+    return encodings
+
+
+def choose_encoding(header: str):
+    """사용할 인코딩 ('br' | 'gzip' | None)"""
+    accepted = accepted_encodings(header or '')
+    wildcard = accepted.get('*', 0.0)
+    candidates = ('br', 'gzip') if brotli is not None else ('gzip',)
+    for encoding in candidates:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def body_etag(body: bytes) -> str:
+    return '"%s"' % hashlib.md5(body, usedforsecurity=False).hexdigest()
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    def strip(tag):
+        tag = tag.strip()
+        return tag[2:] if tag.startswith('W/') else tag
+    if header.strip() == '*':
+        return True
+    return strip(etag) in {strip(tag) for tag in header.split(',')}
+
+
+def mark_compressed_cacheable(response):
+    """압축 본문을 캐시해도 되는 응답으로 표시 (본문이 같으면 결과도 같은 응답, 예: 마감된 월)"""
+    setattr(response, CACHEABLE_ATTR, True)
+    return response
+
+
+def is_compressed_cacheable(response) -> bool:
+    return getattr(response, CACHEABLE_ATTR, False) or (get_max_age(response) or 0) > 0
+
+
+class CompressionMiddleware:
+    """gzip/brotli 협상 + ETag 조건부 응답 + 압축 본문 캐시"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_bytes = getattr(settings, 'RESPONSE_COMPRESSION_MIN_BYTES', DEFAULT_MIN_BYTES)
+        self.cache_alias = getattr(settings, 'RESPONSE_COMPRESSION_CACHE_ALIAS', DEFAULT_CACHE_ALIAS)
+        self.cache_timeout = getattr(settings, 'RESPONSE_COMPRESSION_CACHE_TIMEOUT', DEFAULT_CACHE_TIMEOUT)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if response.streaming or response.status_code != 200 or response.has_header('Content-Encoding'):
+            return response
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        if not content_type.startswith(COMPRESSIBLE_TYPES):
+            return response
+        body = response.content
+
+        etag = None
+        if request.method in ('GET', 'HEAD'):
+            etag = response.get('ETag') or body_etag(body)
+            response['ETag'] = etag
+            if _etag_matches(request.META.get('HTTP_IF_NONE_MATCH', ''), etag):
+                not_modified = HttpResponseNotModified()
+                patch_vary_headers(response, ('Accept-Encoding',))
+                for header in NOT_MODIFIED_HEADERS:
+                    if response.has_header(header):
+                        not_modified[header] = response[header]
+                return not_modified
+
+        if len(body) < self.min_bytes:
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        cache = caches[self.cache_alias] if etag and is_compressed_cacheable(response) else None
+        key = f"{CACHE_PREFIX}:{encoding}:{etag.strip(chr(34))}" if cache is not None else None
+        compressed = cache.get(key) if key else None
+        if compressed is None:
+            compressed = compress(body, encoding)
+            if len(compressed) >= len(body):
+                return response
+            if key:
+                cache.set(key, compressed, self.cache_timeout)
+
+        response.content = compressed
+        response['Content-Encoding'] = encoding
+        response['Content-Length'] = str(len(compressed))
+        if etag and not etag.startswith('W/'):
+            # 압축 본문은 바이트가 다르므로 약한 ETag (Django GZipMiddleware와 같은 방식)
+            response['ETag'] = 'W/' + etag
+        return response
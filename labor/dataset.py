@@ -0,0 +1,216 @@
+"""labor/dataset.py
+
+기간 단위 근로 데이터 적재 (근로기록 + 주간/월별 스케줄)
+
+Employee.is_scheduled_workday / get_schedule_for_date는 날짜마다 쿼리를 실행합니다.
+EmployeeDataset은 기간 내 데이터를 한 번에 읽어 같은 판정 규칙을 메모리에서 적용합니다.
+(월별 스케줄 우선 → 주간 스케줄 fallback, 근무 시작일 이전은 스케줄 없음)
+근로조건 이력(EmploymentTerms)도 함께 적재하여 날짜별 시급 조회에 쓰입니다.
+"""
+
+import copy
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from .models import EmploymentTerms, MonthlySchedule, WorkRecord, WorkSchedule
+from .request_memo import active_memo
+
+_NO_SCHEDULE = {
+    'is_scheduled': False,
+    'start_time': None,
+    'end_time': None,
+    'break_minutes': 0,
+    'is_overnight': False,
+    'next_day_work_minutes': 0,
+}
+
+
+def week_start_of(target_date: date) -> date:
+    """해당 날짜가 속한 주의 월요일"""
+    return target_date - timedelta(days=target_date.weekday())
+
+
+def week_end_of(target_date: date) -> date:
+    """해당 날짜가 속한 주의 일요일"""
+    return week_start_of(target_date) + timedelta(days=6)
+
+
+def iter_dates(start: date, end: date):
+    current = start
+    while current <= end:
+        yield current
+        current += timedelta(days=1)
+
+
+def iter_week_records(employee, start: date, end: date, chunk_size: int = 500):
+    """(주 시작일, 그 주의 근로기록 목록)을 start(월요일) ~ end의 모든 주에 대해 생성
+
+    근로기록은 QuerySet.iterator로 날짜 순으로 흘려 읽으므로 메모리에는 한 주 분량만 남습니다.
+    with_records=False로 적재한 dataset의 window와 함께 씁니다.
+    """
+    records = WorkRecord.objects.filter(employee=employee, work_date__range=[start, end]) \
+        .order_by('work_date').iterator(chunk_size=chunk_size)
+    pending = next(records, None)
+    week_start = start
+    while week_start <= end:
+        week_end = week_start + timedelta(days=6)
+        week = []
+        while pending is not None and pending.work_date <= week_end:
+            week.append(pending)
+            pending = next(records, None)
+        yield week_start, week
+        week_start = week_end + timedelta(days=1)
+
+
+class EmployeeDataset:
+    """한 Employee의 기간 내 근로기록과 스케줄을 메모리에 보관"""
+
+    def __init__(self, employee, start: date, end: date, records=None, weekly_schedules=None, monthly_schedules=None,
+                 terms_rows=None):
+        from .terms import TermsTimeline
+
+        self.employee = employee
+        self.start = start
+        self.end = end
+        self.records: Dict[date, WorkRecord] = {r.work_date: r for r in (records or [])}
+        # 기간 조회용 정렬된 날짜 목록 (여러 해를 주 단위로 훑을 때 매번 정렬하지 않도록)
+        self._record_dates: List[date] = sorted(self.records)
+        # enabled=True인 스케줄만 보관 (ORM 조회 시 .filter(enabled=True).first()와 동일)
+        self.weekly: Dict[int, WorkSchedule] = {s.weekday: s for s in (weekly_schedules or []) if s.enabled}
+        self.monthly: Dict[Tuple[int, int, int], MonthlySchedule] = {
+            (s.year, s.month, s.weekday): s for s in (monthly_schedules or []) if s.enabled
+        }
+        self._schedule_cache: Dict[date, dict] = {}
+        # terms_rows가 None이면 적재하지 않은 것 (terms_for가 필요 시 조회)
+        self.terms = TermsTimeline(employee, terms_rows) if terms_rows is not None else None
+
+    @classmethod
+    def load(cls, employee, start: date, end: date, with_records: bool = True) -> 'EmployeeDataset':
+        """기간 내 데이터를 쿼리 4회로 적재 (근로기록, 주간/월별 스케줄, 근로조건 이력)
+
+        요청 범위 메모(labor/request_memo.py)가 활성화되어 있으면 이미 적재한 더 넓은 기간의
+        dataset을 잘라(window) 재사용합니다 (POST /api/batch/ 하위 요청끼리 공유).
+        """
+        memo = active_memo()
+        if memo is None:
+            return cls._load(employee, start, end, with_records)
+        loaded = memo.setdefault(('dataset', employee.pk), [])
+        for dataset, has_records in loaded:
+            if dataset.covers(start, end) and (has_records or not with_records):
+                return dataset.window(start, end, dataset.records_between(start, end) if with_records else [])
+        dataset = cls._load(employee, start, end, with_records)
+        loaded.append((dataset, with_records))
+        return dataset.window(start, end, dataset.records.values())
+
+    @classmethod
+    def _load(cls, employee, start: date, end: date, with_records: bool) -> 'EmployeeDataset':
+        records = []
+        if with_records:
+            records = list(WorkRecord.objects.filter(employee=employee, work_date__range=[start, end]))
+        weekly = list(WorkSchedule.objects.filter(employee=employee, enabled=True))
+        monthly = [
+            s for s in MonthlySchedule.objects.filter(
+                employee=employee, enabled=True, year__gte=start.year, year__lte=end.year
+            )
+            if (start.year, start.month) <= (s.year, s.month) <= (end.year, end.month)
+        ]
+        terms_rows = list(EmploymentTerms.objects.filter(employee=employee))
+        return cls(employee, start, end, records, weekly, monthly, terms_rows)
+
+    @classmethod
+    def load_many(cls, employees, start: date, end: date, with_records: bool = True) -> Dict[int, 'EmployeeDataset']:
+        """여러 Employee의 기간 내 데이터를 테이블당 쿼리 1회로 적재 (employee_id → dataset)"""
+        employees = list(employees)
+        ids = [e.pk for e in employees]
+        records: Dict[int, list] = {pk: [] for pk in ids}
+        weekly: Dict[int, list] = {pk: [] for pk in ids}
+        monthly: Dict[int, list] = {pk: [] for pk in ids}
+        terms_rows: Dict[int, list] = {pk: [] for pk in ids}
+        if with_records:
+            for r in WorkRecord.objects.filter(employee_id__in=ids, work_date__range=[start, end]):
+                records[r.employee_id].append(r)
+        for s in WorkSchedule.objects.filter(employee_id__in=ids, enabled=True):
+            weekly[s.employee_id].append(s)
+        for s in MonthlySchedule.objects.filter(
+            employee_id__in=ids, enabled=True, year__gte=start.year, year__lte=end.year
+        ):
+            if (start.year, start.month) <= (s.year, s.month) <= (end.year, end.month):
+                monthly[s.employee_id].append(s)
+        for t in EmploymentTerms.objects.filter(employee_id__in=ids):
+            terms_rows[t.employee_id].append(t)
+        return {
+            e.pk: cls(e, start, end, records[e.pk], weekly[e.pk], monthly[e.pk], terms_rows[e.pk])
+            for e in employees
+        }
+
+    def window(self, start: date, end: date, records) -> 'EmployeeDataset':
+        """스케줄/근로조건은 공유하고 기간과 근로기록만 바꾼 dataset
+
+        근로기록을 iterator로 흘려 읽으면서 주 단위로 판정할 때 사용합니다 (with_records=False로 적재한 dataset 기준).
+        """
+        clone = copy.copy(self)
+        clone.start, clone.end = start, end
+        clone.records = {r.work_date: r for r in records}
+        clone._record_dates = sorted(clone.records)
+        clone._schedule_cache = {}
+        return clone
+
+    def covers(self, start: date, end: date) -> bool:
+        return self.start <= start and end <= self.end
+
+    # --- 스케줄 판정 ---
+
+    def _schedule_object(self, target_date: date):
+        """(schedule, source) 반환. source: 'monthly' | 'weekly' | None"""
+        monthly = self.monthly.get((target_date.year, target_date.month, target_date.weekday()))
+        if monthly is not None:
+            return monthly, 'monthly'
+        weekly = self.weekly.get(target_date.weekday())
+        if weekly is not None:
+            return weekly, 'weekly'
+        return None, None
+
+    def schedule_source(self, target_date: date) -> Optional[str]:
+        """캘린더 표시용 스케줄 소스 (시작일 이전이면 None)"""
+        if target_date < self.employee.start_date:
+            return None
+        return self._schedule_object(target_date)[1]
+
+    def schedule_for(self, target_date: date) -> dict:
+        """Employee.get_schedule_for_date와 동일한 형식의 스케줄 정보"""
+        cached = self._schedule_cache.get(target_date)
+        if cached is not None:
+            return cached
+
+        schedule, _ = self._schedule_object(target_date)
+        if target_date < self.employee.start_date or schedule is None:
+            info = dict(_NO_SCHEDULE)
+        else:
+            info = {
+                'is_scheduled': schedule.start_time is not None and schedule.end_time is not None,
+                'start_time': schedule.start_time,
+                'end_time': schedule.end_time,
+                'break_minutes': schedule.break_minutes,
+                'is_overnight': schedule.is_overnight,
+                'next_day_work_minutes': schedule.next_day_work_minutes,
+            }
+        self._schedule_cache[target_date] = info
+        return info
+
+    def is_scheduled_workday(self, target_date: date) -> bool:
+        """Employee.is_scheduled_workday와 동일한 판정"""
+        return self.schedule_for(target_date)['is_scheduled']
+
+    # --- 근로기록 ---
+
+    def record(self, target_date: date) -> Optional[WorkRecord]:
+        return self.records.get(target_date)
+
+    def records_between(self, start: date, end: date) -> List[WorkRecord]:
+        lo = bisect_left(self._record_dates, start)
+        hi = bisect_right(self._record_dates, end)
+        return [self.records[d] for d in self._record_dates[lo:hi]]
+
+    def has_records_between(self, start: date, end: date) -> bool:
+        return bisect_right(self._record_dates, end) > bisect_left(self._record_dates, start)
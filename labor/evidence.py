@@ -0,0 +1,193 @@
+"""labor/evidence.py
+
+임금체불 진정(wage_claim)용 증빙 자료 묶음 (ZIP)
+
+- work_records.csv: 근로기록 전체 (DB에서 iterator로 읽어 바로 기록)
+- payroll.csv: 월별 급여 요약 (근로시간 원장 + 근로조건)
+- arrears.csv: 월별 체불 추정액 (labor/back_pay.py)
+- summary.docx: 근로자/사업장 정보와 체불 합계 요약
+
+ZIP은 쓰기 전용 버퍼(labor/streaming.py)에 항목을 조금씩 기록하고 쌓인 바이트를 바로 내보내는
+제너레이터로 만들므로, 아카이브 전체를 메모리나 임시 파일에 만들지 않고 StreamingHttpResponse로 전송할 수 있습니다.
+급여/체불 계산도 스케줄·근로조건만 미리 적재하고 근로기록은 주 단위로 흘려 읽어(labor/export.py와 같은 방식)
+월(급여) 또는 주(체불) window에 얹으므로, 근무 기간이 여러 해여도 메모리 사용량이 늘지 않습니다.
+"""
+
+import io
+import zipfile
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, Optional
+
+from django.utils import timezone
+
+from .back_pay import COMPONENT_LABELS, COMPONENTS, back_pay_period, iter_back_pay_months, limitation_start
+from .dataset import EmployeeDataset, iter_week_records, week_end_of, week_start_of
+from .snapshots import month_bounds
+from .streaming import StreamBuffer, local_datetime, write_csv_entry
+
+RECORD_COLUMNS = [
+    ('work_date', '근무일'), ('time_in', '출근'), ('time_out', '퇴근'), ('break_minutes', '휴게(분)'),
+    ('total_hours', '근로시간'), ('night_hours', '야간시간'), ('attendance_status', '출결'),
+]
+PAYROLL_COLUMNS = [
+    ('month', '월'), ('hourly_wage', '시급'), ('total_hours', '총 근로시간'), ('actual_hours', '기록 시간'),
+    ('scheduled_hours', '스케줄 시간'), ('night_hours', '야간시간'), ('holiday_hours', '휴일시간'),
+    ('overtime_hours', '연장시간'), ('base_pay', '기본급'), ('holiday_bonus', '휴일가산'),
+    ('night_bonus', '야간가산'), ('overtime_bonus', '연장가산'), ('weekly_holiday_pay', '주휴수당'),
+    ('estimated_monthly_pay', '세전 급여'), ('deduction_total', '공제액'), ('net_pay', '실수령액'),
+]
+ARREARS_COLUMNS = (
+    [('month', '월'), ('total_hours', '총 근로시간'), ('paid', '지급 추정액')]
+    + [(c, COMPONENT_LABELS[c]) for c in COMPONENTS]
+    + [('arrears', '체불액'), ('owed', '법정 지급액'), ('is_time_barred', '소멸시효 경과')]
+)
+
+
+def iter_record_rows(employee) -> Iterator[Dict[str, Any]]:
+    from .models import WorkRecord
+
+    statuses = dict(WorkRecord.ATTENDANCE_STATUS_CHOICES)
+    for r in WorkRecord.objects.filter(employee=employee).order_by('work_date').iterator(chunk_size=500):
+        yield {
+            'work_date': r.work_date.isoformat(),
+            'time_in': local_datetime(r.time_in),
+            'time_out': local_datetime(r.time_out),
+            'break_minutes': r.break_minutes,
+            'total_hours': round(float(r.get_total_hours()), 2),
+            'night_hours': round(float(r.get_night_hours()), 2),
+            'attendance_status': statuses.get(r.attendance_status, r.attendance_status),
+        }
+
+
+def _iter_months(start: date, end: date) -> Iterator[tuple]:
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def _iter_month_windows(base: EmployeeDataset, weeks: Iterator, start: date, end: date) -> Iterator[tuple]:
+    """(year, month, 그 달에 걸친 주 전체의 dataset window)
+
+    weeks는 week_start_of(start)부터의 (주 시작일, 근로기록) 흐름이며, 두 달에 걸친 주만 다음 달까지 보관합니다.
+    """
+    pending = []
+    for year, month in _iter_months(start, end):
+        month_start, month_end = month_bounds(year, month)
+        first, last = week_start_of(month_start), week_start_of(month_end)
+        pending = [w for w in pending if w[0] >= first]
+        while not pending or pending[-1][0] < last:
+            pending.append(next(weeks))
+        records = [r for _, week in pending for r in week]
+        yield year, month, base.window(first, last + timedelta(days=6), records)
+
+
+def iter_payroll_rows(employee, base: EmployeeDataset, start: date, end: date) -> Iterator[Dict[str, Any]]:
+    """start ~ end가 걸친 달의 월별 급여
+
+    base는 각 달에 걸친 주 전체를 포함하는 with_records=False dataset이며, 근로기록은 주 단위로 흘려 읽습니다.
+    """
+    from .holidays import get_holidays_for_year
+    from .ledger import build_month_ledger, price_payroll
+    from .terms import terms_for
+
+    terms = terms_for(employee, base)
+    weeks = iter_week_records(employee, base.start, base.end)
+    holidays_by_year = {}
+    for year, month, dataset in _iter_month_windows(base, weeks, start, end):
+        if year not in holidays_by_year:
+            holidays_by_year[year] = get_holidays_for_year(year)
+        holiday_dates = {h['date'] for h in holidays_by_year[year][month] if h['type'] == 'LEGAL'}
+        row = price_payroll(build_month_ledger(employee, year, month, dataset, holiday_dates), terms)
+        row['deduction_total'] = row['deduction']['total_deduction']
+        yield row
+
+
+def build_summary_docx(employee, period: Dict[str, str], totals: Dict[str, Any], today: date) -> bytes:
+    """체불 합계 요약 docx"""
+    from docx import Document
+    from docx.shared import Pt
+    from procedures.models import ReportProcedure
+
+    doc = Document()
+    title = doc.add_paragraph().add_run('임금체불 진정 증빙 요약')
+    title.bold = True
+    title.font.size = Pt(18)
+
+    doc.add_paragraph(f"사업장: {employee.workplace_name}")
+    if employee.workplace_reg_no:
+        doc.add_paragraph(f"사업자등록번호: {employee.workplace_reg_no}")
+    doc.add_paragraph(f"근무 기간: {period['start']} ~ {period['end']}")
+    doc.add_paragraph(f"사업장 규모: {'5인 이상' if employee.is_workplace_over_5 else '5인 미만'}")
+    doc.add_paragraph(f"작성일: {today.isoformat()}")
+
+    heading = doc.add_paragraph().add_run('체불 추정액')
+    heading.bold = True
+    heading.font.size = Pt(14)
+    table = doc.add_table(rows=1, cols=2)
+    table.rows[0].cells[0].text, table.rows[0].cells[1].text = '항목', '금액(원)'
+    for component in COMPONENTS:
+        cells = table.add_row().cells
+        cells[0].text, cells[1].text = COMPONENT_LABELS[component], f"{totals[component]:,}"
+    cells = table.add_row().cells
+    cells[0].text, cells[1].text = '합계', f"{totals['arrears']:,}"
+    cells = table.add_row().cells
+    cells[0].text, cells[1].text = '청구 가능액 (소멸시효 3년 이내)', f"{totals['claimable_arrears']:,}"
+
+    doc.add_paragraph(
+        f"{limitation_start(today).isoformat()} 이전에 지급기일이 지난 임금은 소멸시효(3년)가 지나 청구 가능액에서 제외했습니다. "
+        "지급액은 약정 시급 × 근로시간으로 추정한 값이며, 근로기록이 없는 날은 스케줄대로 근무한 것으로 계산했습니다."
+    )
+
+    procedure = ReportProcedure.objects.filter(code='wage_claim', is_active=True).first()
+    if procedure:
+        heading = doc.add_paragraph().add_run(f"진정 절차: {procedure.title}")
+        heading.bold = True
+        heading.font.size = Pt(14)
+        if procedure.authority:
+            doc.add_paragraph(f"제출처: {procedure.authority}")
+        for step in procedure.steps.all():
+            doc.add_paragraph(f"{step.step_order}. {step.title}")
+
+    out = io.BytesIO()
+    doc.save(out)
+    return out.getvalue()
+
+
+def iter_evidence_zip(employee, today: Optional[date] = None) -> Iterator[bytes]:
+    """증빙 ZIP 바이트 조각을 차례로 생성"""
+    today = today or timezone.localdate()
+    start, end = back_pay_period(employee, today)
+    # 아직 근무 시작 전이면 근로기록만 담고 급여/체불 CSV는 머리글만 기록
+    worked = end >= start
+    span_end = month_bounds(end.year, end.month)[1] if worked else start
+    # 급여 원장은 마지막 달에 걸친 주 전체, 체불 계산은 첫 주 월요일부터 필요 (근로기록은 주 단위로 흘려 읽음)
+    span_start = week_start_of(start)
+    base = EmployeeDataset.load(employee, span_start, week_end_of(span_end), with_records=False)
+
+    buffer = StreamBuffer()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        yield from write_csv_entry(zf, buffer, 'work_records.csv', RECORD_COLUMNS, iter_record_rows(employee))
+        payroll_rows = iter_payroll_rows(employee, base, start, end) if worked else ()
+        yield from write_csv_entry(zf, buffer, 'payroll.csv', PAYROLL_COLUMNS, payroll_rows)
+
+        # 체불 합계는 arrears.csv를 기록하면서 함께 누적 (요약 docx용)
+        totals = {c: 0 for c in COMPONENTS}
+        totals.update({'paid': 0, 'owed': 0, 'arrears': 0, 'claimable_arrears': 0})
+
+        def accumulate(rows):
+            for row in rows:
+                for field in COMPONENTS + ('paid', 'owed', 'arrears'):
+                    totals[field] += row[field]
+                if not row['is_time_barred']:
+                    totals['claimable_arrears'] += row['arrears']
+                yield row
+
+        arrears_rows = iter_back_pay_months(
+            employee, base, start, end, today=today, week_records=iter_week_records(employee, span_start, end),
+        ) if worked else ()
+        yield from write_csv_entry(zf, buffer, 'arrears.csv', ARREARS_COLUMNS, accumulate(arrears_rows))
+
+        period = {'start': start.isoformat(), 'end': max(start, end).isoformat()}
+        zf.writestr('summary.docx', build_summary_docx(employee, period, totals, today))
+    yield buffer.drain()
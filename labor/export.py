@@ -0,0 +1,115 @@
+"""labor/export.py
+
+근로기록/일별 급여 내보내기 (CSV, XLSX)
+
+근로기록은 QuerySet.iterator(chunk_size=...)로 날짜 순으로 흘려 읽고,
+스케줄/근로조건만 미리 적재한 dataset(with_records=False)에 한 주 분량의 기록을 얹어
+급여 요약과 같은 일자별 판정(인정 시간, 야간, 휴일, 연장근로, 주휴수당)을 적용합니다.
+메모리에는 한 주의 기록과 출력 버퍼만 남으므로 기간이 길어도 사용량이 늘지 않고,
+첫 행부터 바로 전송되어 요청 시간 제한에 걸리지 않습니다.
+
+금액은 세전 일별 금액이며, 공제는 월 단위이므로 포함하지 않습니다.
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator
+
+from .dataset import EmployeeDataset, iter_dates, iter_week_records, week_end_of, week_start_of
+from .ledger import day_hours
+from .streaming import local_datetime
+from .terms import terms_for
+
+EXPORT_CHUNK_SIZE = 500
+
+EXPORT_COLUMNS = [
+    ('date', '날짜'), ('weekday', '요일'), ('source', '구분'), ('time_in', '출근'), ('time_out', '퇴근'),
+    ('break_minutes', '휴게(분)'), ('hours', '근로시간'), ('night_hours', '야간시간'),
+    ('holiday_type', '휴일'), ('overtime_hours', '연장시간'), ('attendance_status', '출결'),
+    ('hourly_wage', '시급'), ('base_pay', '기본급'), ('holiday_bonus', '휴일가산'), ('night_bonus', '야간가산'),
+    ('overtime_bonus', '연장가산'), ('weekly_holiday_pay', '주휴수당'), ('daily_pay', '합계'),
+]
+
+WEEKDAY_LABELS = ('월', '화', '수', '목', '금', '토', '일')
+SOURCE_LABELS = {'actual': '근로기록', 'scheduled': '스케줄', 'none': ''}
+HOLIDAY_LABELS = {'WEEKLY_REST': '주휴일', 'LEGAL': '공휴일', None: ''}
+
+
+def iter_daily_rows(employee, start: date, end: date, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """start ~ end의 일별 근로/급여 행 (근로가 없고 주휴수당도 없는 날은 제외)
+
+    연장근로 주 누적과 주휴수당 판정을 위해 start가 속한 주의 월요일부터 기록을 읽습니다.
+    """
+    from .holidays import get_holidays_for_year
+    from .models import WorkRecord
+    from .overtime import WeeklyOvertimeCounter
+    from .services import price_weekly_holiday, weekly_holiday_facts
+
+    span_start, span_end = week_start_of(start), week_end_of(end)
+    base = EmployeeDataset.load(employee, span_start, span_end, with_records=False)
+    terms = terms_for(employee, base)
+    statuses = dict(WorkRecord.ATTENDANCE_STATUS_CHOICES)
+    overtime_counter = WeeklyOvertimeCounter()
+    holiday_dates, holiday_year = set(), None
+
+    for week_start, week_records in iter_week_records(employee, span_start, span_end, chunk_size):
+        week_end = week_start + timedelta(days=6)
+        dataset = base.window(week_start, week_end, week_records)
+        for d in iter_dates(week_start, week_end):
+            if d.year != holiday_year:
+                holiday_year = d.year
+                holiday_dates = {
+                    h['date'] for month in get_holidays_for_year(d.year).values() for h in month if h['type'] == 'LEGAL'
+                }
+            hours, night_hours, source = day_hours(dataset, d)
+            if d.weekday() == 6:
+                holiday_type = 'WEEKLY_REST'
+            elif d.isoformat() in holiday_dates:
+                holiday_type = 'LEGAL'
+            else:
+                holiday_type = None
+            overtime_hours = overtime_counter.add(d, hours, holiday_type is not None)
+            if not start <= d <= end:
+                continue
+
+            day_terms = terms.as_of(d)
+            weekly_holiday_pay = 0
+            if d.weekday() == 6:
+                facts = weekly_holiday_facts(employee, d, dataset=dataset)
+                if facts.has_scheduled_day:
+                    weekly_holiday_pay = int(price_weekly_holiday(
+                        facts, day_terms.hourly_rate, day_terms.contract_weekly_hours
+                    )['amount'])
+            if hours <= 0 and not weekly_holiday_pay:
+                continue
+
+            wage = int(day_terms.hourly_rate)
+            base_pay = int(hours * wage)
+            holiday_bonus = night_bonus = overtime_bonus = 0
+            if day_terms.is_workplace_over_5:
+                if holiday_type:
+                    holiday_bonus = int(hours * wage * 0.5)
+                if night_hours > 0:
+                    night_bonus = int(night_hours * wage * 0.5)
+                if overtime_hours > 0:
+                    overtime_bonus = int(overtime_hours * wage * 0.5)
+            record = dataset.record(d) if source == 'actual' else None
+            yield {
+                'date': d.isoformat(),
+                'weekday': WEEKDAY_LABELS[d.weekday()],
+                'source': SOURCE_LABELS[source],
+                'time_in': local_datetime(record.time_in) if record else '',
+                'time_out': local_datetime(record.time_out) if record else '',
+                'break_minutes': record.break_minutes if record else '',
+                'hours': round(hours, 2),
+                'night_hours': round(night_hours, 2),
+                'holiday_type': HOLIDAY_LABELS[holiday_type],
+                'overtime_hours': overtime_hours,
+                'attendance_status': statuses.get(record.attendance_status, record.attendance_status) if record else '',
+                'hourly_wage': wage,
+                'base_pay': base_pay,
+                'holiday_bonus': holiday_bonus,
+                'night_bonus': night_bonus,
+                'overtime_bonus': overtime_bonus,
+                'weekly_holiday_pay': weekly_holiday_pay,
+                'daily_pay': base_pay + holiday_bonus + night_bonus + overtime_bonus + weekly_holiday_pay,
+            }
@@ -0,0 +1,106 @@
+"""labor/fieldsets.py
+
+응답 필드 선택 (?fields= / ?omit=)
+
+    ?fields=month,summary.total,summary.total_hours
+    ?omit=rows,notes
+
+점(.)으로 중첩 필드를 가리킵니다. fields가 없으면 전체, omit은 fields 적용 후 제외합니다.
+선택 결과(FieldSelection)는 응답을 자르는 데만 쓰지 않고 계산 함수에도 넘겨서
+요청하지 않은 부분(일별 스케줄 조회, 중첩 근로기록 직렬화 등)을 아예 계산하지 않게 합니다.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+# 경로 트리: {이름: 하위 트리 | None(전체)}
+FieldTree = Dict[str, Optional['FieldTree']]
+
+
+def parse_field_paths(value: Optional[str]) -> Optional[FieldTree]:
+    """'a,b.c,b.d' → {'a': None, 'b': {'c': None, 'd': None}} (빈 값이면 None)"""
+    if not value:
+        return None
+    tree: FieldTree = {}
+    for path in value.split(','):
+        parts = [p.strip() for p in path.split('.') if p.strip()]
+        if not parts:
+            continue
+        node = tree
+        for i, part in enumerate(parts):
+            last = i == len(parts) - 1
+            if last:
+                node[part] = None
+            elif part in node and node[part] is None:
+                break  # 이미 전체 선택
+            else:
+                node = node.setdefault(part, {})
+    return tree or None
+
+
+class FieldSelection:
+    """포함(fields)/제외(omit) 경로 트리"""
+
+    def __init__(self, fields: Optional[FieldTree] = None, omit: Optional[FieldTree] = None):
+        self.fields = fields
+        self.omit = omit or {}
+
+    @classmethod
+    def from_request(cls, request) -> 'FieldSelection':
+        return cls(
+            parse_field_paths(request.query_params.get('fields')),
+            parse_field_paths(request.query_params.get('omit')),
+        )
+
+    @property
+    def is_all(self) -> bool:
+        return self.fields is None and not self.omit
+
+    def wants(self, name: str) -> bool:
+        if self.fields is not None and name not in self.fields:
+            return False
+        return not (name in self.omit and self.omit[name] is None)
+
+    def wants_any(self, names: Iterable[str]) -> bool:
+        return any(self.wants(name) for name in names)
+
+    def child(self, name: str) -> 'FieldSelection':
+        fields = self.fields.get(name) if self.fields is not None else None
+        return FieldSelection(fields, self.omit.get(name))
+
+    def unknown(self, allowed: Iterable[str]) -> list:
+        """허용되지 않은 최상위 이름 (400 응답용)"""
+        allowed = set(allowed)
+        names = set(self.fields or ()) | set(self.omit)
+        return sorted(names - allowed)
+
+    def apply(self, data: Any) -> Any:
+        """dict / dict 목록에서 선택한 필드만 남김"""
+        if self.is_all:
+            return data
+        if isinstance(data, list):
+            return [self.apply(item) for item in data]
+        if not isinstance(data, dict):
+            return data
+        return {
+            key: self.child(key).apply(value)
+            for key, value in data.items()
+            if self.wants(key)
+        }
+
+    def trim_serializer(self, serializer) -> Any:
+        """DRF serializer에서 선택하지 않은 필드를 제거 (직렬화 자체를 건너뜀)"""
+        if self.is_all:
+            return serializer
+        target = getattr(serializer, 'child', serializer)  # many=True → ListSerializer.child
+        fields = getattr(target, 'fields', None)
+        if fields is None:
+            return serializer
+        for name in list(fields):
+            if not self.wants(name):
+                fields.pop(name)
+            else:
+                self.child(name).trim_serializer(fields[name])
+        return serializer
+
+
+ALL_FIELDS = FieldSelection()
@@ -5,6 +5,8 @@ from typing import List, Dict, Optional
 import requests
 from django.core.cache import cache
 
+from .request_memo import memoize
+
 HOLIDAY_ICS_URL = "https://calendar.google.com/calendar/ical/ko.south_korea%23holiday%40group.v.calendar.google.com/public/full.ics"
 CACHE_TTL = 60 * 60 * 24  # 24 hours
 logger = logging.getLogger(__name__)
@@ -128,7 +130,24 @@ def _parse_holidays(ics_text: str) -> List[Dict]:
     return events
 
 
+def _month_events(events: List[Dict], year: int, month: int) -> List[Dict[str, str]]:
+    return [
+        {
+            "date": event["date"].isoformat(),
+            "name": event["name"],
+            "type": event.get("type", HOLIDAY_TYPE_LEGAL),
+        }
+        for event in events
+        if event["date"].year == year and event["date"].month == month
+    ]
+
+
 def get_holidays_for_month(year: int, month: int) -> List[Dict[str, str]]:
+    # POST /api/batch/ 하위 요청끼리는 한 번만 조회 (labor/request_memo.py)
+    return memoize(('holidays', year, month), lambda: _holidays_for_month(year, month))
+
+
+def _holidays_for_month(year: int, month: int) -> List[Dict[str, str]]:
     cache_key = f"holidays:{year:04d}-{month:02d}"
     cached = cache.get(cache_key)
     if cached is not None:
@@ -141,15 +160,30 @@ def get_holidays_for_month(year: int, month: int) -> List[Dict[str, str]]:
         logger.exception("Failed to fetch/parse holiday ICS: %s", exc)
         return []
 
-    month_events = [
-        {
-            "date": event["date"].isoformat(),
-            "name": event["name"],
-            "type": event.get("type", HOLIDAY_TYPE_LEGAL),
-        }
-        for event in events
-        if event["date"].year == year and event["date"].month == month
-    ]
+    month_events = _month_events(events, year, month)
 
     cache.set(cache_key, month_events, CACHE_TTL)
     return month_events
+
+
+def get_holidays_for_year(year: int) -> Dict[int, List[Dict[str, str]]]:
+    """연도 전체 공휴일을 월별로 반환 (캐시에 없는 달이 있으면 ICS를 한 번만 조회)"""
+    return memoize(('holidays', year), lambda: _holidays_for_year(year))
+
+
+def _holidays_for_year(year: int) -> Dict[int, List[Dict[str, str]]]:
+    cache_keys = {month: f"holidays:{year:04d}-{month:02d}" for month in range(1, 13)}
+    cached = cache.get_many(list(cache_keys.values()))
+    if len(cached) == len(cache_keys):
+        return {month: cached[key] for month, key in cache_keys.items()}
+
+    try:
+        ics_text = _fetch_ics_text()
+        events = _parse_holidays(ics_text)
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.exception("Failed to fetch/parse holiday ICS: %s", exc)
+        return {month: cached.get(key, []) for month, key in cache_keys.items()}
+
+    by_month = {month: _month_events(events, year, month) for month in cache_keys}
+    cache.set_many({cache_keys[month]: by_month[month] for month in cache_keys}, CACHE_TTL)
+    return by_month
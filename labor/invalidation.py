@@ -0,0 +1,242 @@
+"""labor/invalidation.py
+
+근로 데이터 변경 → 영향을 받는 계산 결과 키 매핑 (증분 무효화)
+
+하나의 근로기록 수정은 다음 결과에 영향을 줍니다.
+- 해당 월 급여 (payroll) 및 연간 급여 요약 (payroll_year)
+- 해당 주의 주휴수당 (weekly_holiday) → 주가 걸친 전월/익월 급여까지
+- 최근 90일 퇴직금 평균임금 창 (severance)
+- 1년 미만 연차 발생 30일 창 및 연도별 사용 연차 (annual_leave)
+- 누적 통계 (cumulative)
+
+변경된 날짜/스케줄/근로조건을 정확한 (calculator, period) 키 집합으로 바꾸고,
+스냅샷(labor/snapshots.py)과 결과 캐시에서 그 키만 제거합니다.
+결과 캐시 키에는 오늘 날짜가 포함되므로 날짜가 바뀌면 자연히 갱신됩니다.
+"""
+
+import uuid
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Callable, Iterable, Optional, Set
+
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+
+from .dataset import EmployeeDataset, iter_dates, week_end_of, week_start_of
+
+PAYROLL = 'payroll'
+PAYROLL_YEAR = 'payroll_year'
+LEDGER = 'ledger'  # 월별 근로시간 원장 (labor/ledger.py), 근로조건과 무관
+WEEKLY_HOLIDAY = 'weekly_holiday'
+SEVERANCE = 'severance'
+ANNUAL_LEAVE = 'annual_leave'
+CUMULATIVE = 'cumulative'
+
+RESULT_CACHE_TTL = 60 * 60 * 24  # 24 hours
+
+# 변경 출처: 근로기록은 사용 연차 집계에도 영향을 주고, 스케줄은 주지 않음
+SOURCE_RECORD = 'record'
+SOURCE_SCHEDULE = 'schedule'
+
+# 1년 미만 연차: 입사일부터 30일 단위 11개 창 (calculate_annual_leave_v2)
+ANNUAL_LEAVE_ACCRUAL_DAYS = 30 * 11
+SEVERANCE_WINDOW_DAYS = 90
+# 주간 스케줄 변경 시 무효화할 미래 범위 (예측 조회 범위와 동일)
+FUTURE_HORIZON_MONTHS = 12
+
+
+@dataclass(frozen=True)
+class ResultKey:
+    calculator: str
+    period: str = ''
+
+
+def payroll_key(year: int, month: int) -> ResultKey:
+    return ResultKey(PAYROLL, f"{year}-{month:02d}")
+
+
+def ledger_key(year: int, month: int) -> ResultKey:
+    return ResultKey(LEDGER, f"{year}-{month:02d}")
+
+
+def payroll_year_key(year: int) -> ResultKey:
+    return ResultKey(PAYROLL_YEAR, str(year))
+
+
+def weekly_holiday_key(week_start: date) -> ResultKey:
+    return ResultKey(WEEKLY_HOLIDAY, week_start.isoformat())
+
+
+def annual_leave_key(year: int) -> ResultKey:
+    return ResultKey(ANNUAL_LEAVE, str(year))
+
+
+def _month_end(target_date: date) -> date:
+    return (target_date.replace(day=1) + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+
+
+def keys_for_dates(employee, dates: Iterable[date], source: str = SOURCE_RECORD, today: Optional[date] = None) -> Set[ResultKey]:
+    """변경된 날짜들이 무효화하는 결과 키 집합"""
+    today = today or timezone.localdate()
+    start_date = employee.start_date
+    severance_start = today - timedelta(days=SEVERANCE_WINDOW_DAYS)
+    severance_end = today - timedelta(days=1)
+    accrual_end = start_date + timedelta(days=ANNUAL_LEAVE_ACCRUAL_DAYS - 1) if start_date else None
+    # 누적 통계: 입사 월 ~ 이번 달 급여 (각 월의 걸친 주 포함)
+    cumulative_start = week_start_of(start_date.replace(day=1)) if start_date else None
+    cumulative_end = week_end_of(_month_end(today))
+
+    keys: Set[ResultKey] = set()
+    for d in dates:
+        week_start, week_end = week_start_of(d), week_end_of(d)
+        # 급여: 해당 월 + 주휴수당 주가 걸친 월
+        for m in (week_start, d, week_end):
+            keys.add(payroll_key(m.year, m.month))
+            keys.add(payroll_year_key(m.year))
+            keys.add(ledger_key(m.year, m.month))
+        keys.add(weekly_holiday_key(week_start))
+
+        # 퇴직금: 90일 창 안의 날짜이거나, 창 안에서 끝나는 주(주휴수당)에 속한 날짜
+        if severance_start <= d <= severance_end or severance_start <= week_end <= severance_end:
+            keys.add(ResultKey(SEVERANCE))
+
+        # 연차: 발생 판정 창(입사 후 330일)은 모든 연도 결과에, 사용 연차는 해당 연도에만 영향
+        if accrual_end and start_date <= d <= accrual_end:
+            keys.update(annual_leave_key(y) for y in range(start_date.year, today.year + 1))
+        if source == SOURCE_RECORD:
+            keys.add(annual_leave_key(d.year))
+
+        if cumulative_start and cumulative_start <= d <= cumulative_end:
+            keys.add(ResultKey(CUMULATIVE))
+    return keys
+
+
+def keys_for_monthly_schedule(employee, year: int, month: int, today: Optional[date] = None) -> Set[ResultKey]:
+    """월별 스케줄(MonthlySchedule) 변경이 무효화하는 키"""
+    first = date(year, month, 1)
+    return keys_for_dates(employee, iter_dates(first, _month_end(first)), SOURCE_SCHEDULE, today)
+
+
+def _horizon_end(today: date) -> date:
+    year = today.year + (today.month - 1 + FUTURE_HORIZON_MONTHS) // 12
+    month = (today.month - 1 + FUTURE_HORIZON_MONTHS) % 12 + 1
+    return _month_end(date(year, month, 1))
+
+
+def keys_for_weekly_schedule(employee, weekdays: Optional[Iterable[int]] = None, today: Optional[date] = None) -> Set[ResultKey]:
+    """주간 스케줄(WorkSchedule) 변경이 무효화하는 키
+
+    월별 스케줄이 해당 요일을 덮어쓴 달은 주간 스케줄을 쓰지 않으므로 제외합니다.
+    """
+    today = today or timezone.localdate()
+    if not employee.start_date:
+        return set()
+    weekdays = set(range(7)) if weekdays is None else set(weekdays)
+    end = _horizon_end(today)
+    dataset = EmployeeDataset.load(employee, employee.start_date, end, with_records=False)
+    dates = [
+        d for d in iter_dates(employee.start_date, end)
+        if d.weekday() in weekdays and (d.year, d.month, d.weekday()) not in dataset.monthly
+    ]
+    return keys_for_dates(employee, dates, SOURCE_SCHEDULE, today)
+
+
+def keys_for_terms(employee, effective_from: Optional[date] = None, today: Optional[date] = None) -> Set[ResultKey]:
+    """근로조건(시급, 계약시간, 공제 방식 등) 변경이 무효화하는 키"""
+    today = today or timezone.localdate()
+    start = employee.start_date
+    if not start:
+        return set()
+    if effective_from and effective_from > start:
+        start = effective_from
+    end = _horizon_end(today)
+    # 근로시간 원장은 근로조건과 무관하므로 유지
+    keys = {k for k in keys_for_dates(employee, iter_dates(start, end), SOURCE_RECORD, today) if k.calculator != LEDGER}
+    # 연차/퇴직금 자격은 계약시간·사업장 규모에도 좌우됨
+    keys.add(ResultKey(SEVERANCE))
+    keys.update(annual_leave_key(y) for y in range(employee.start_date.year, today.year + 1))
+    return keys
+
+
+# --- 결과 캐시 ---
+
+def _generation_key(employee_id: int) -> str:
+    return f"labor:gen:{employee_id}"
+
+
+def reset_result_cache(employee_id: int) -> None:
+    """Employee 생성/삭제 시 이전 캐시 세대를 버림 (ID 재사용 대비)"""
+    cache.set(_generation_key(employee_id), uuid.uuid4().hex, None)
+
+
+def _generation(employee_id: int) -> str:
+    generation = cache.get(_generation_key(employee_id))
+    if generation is None:
+        generation = uuid.uuid4().hex
+        if not cache.add(_generation_key(employee_id), generation, None):
+            generation = cache.get(_generation_key(employee_id))
+    return generation
+
+
+def _cache_key(employee_id: int, key: ResultKey, generation: str, today: date) -> str:
+    # 법정 파라미터(최저임금, 보험 요율 등)가 바뀌면 revision이 달라져 전체 결과가 다시 계산됨
+    from .law_params import LawParameters
+    return (
+        f"labor:{employee_id}:{generation}:{key.calculator}:{key.period}:{today.isoformat()}"
+        f":{LawParameters.revision()}"
+    )
+
+
+def cached_result(employee, key: ResultKey, compute: Callable[[], dict]):
+    """결과 캐시 조회, 없으면 계산 후 저장"""
+    today = timezone.localdate()
+    cache_key = _cache_key(employee.pk, key, _generation(employee.pk), today)
+    result = cache.get(cache_key)
+    if result is None:
+        result = compute()
+        cache.set(cache_key, result, RESULT_CACHE_TTL)
+    return result
+
+
+def touch_employee(employee_id: int) -> None:
+    """근로 데이터 버전 증가 (update()는 시그널을 발생시키지 않음)"""
+    from .models import Employee
+    Employee.objects.filter(pk=employee_id).update(data_version=F('data_version') + 1)
+
+
+def invalidate(employee_id: int, keys: Iterable[ResultKey]) -> None:
+    """결과 키 집합을 스냅샷과 결과 캐시에서 제거"""
+    from .snapshots import invalidate_payroll_snapshots
+
+    keys = set(keys)
+    if not keys:
+        return
+    today = timezone.localdate()
+    generation = _generation(employee_id)
+    cache.delete_many([_cache_key(employee_id, k, generation, today) for k in keys])
+
+    months = [tuple(map(int, k.period.split('-'))) for k in keys if k.calculator == PAYROLL]
+    if months:
+        invalidate_payroll_snapshots(employee_id, months)
+
+
+def monthly_schedule_replaced(employee, year: int, month: int) -> None:
+    """bulk_create 등 시그널 없이 월별 스케줄을 바꾼 경우 호출"""
+    from .sync import log_monthly_schedules_of
+
+    touch_employee(employee.pk)
+    invalidate(employee.pk, keys_for_monthly_schedule(employee, year, month))
+    log_monthly_schedules_of(employee, year, month)
+
+
+def work_records_replaced(employee, dates: Iterable[date]) -> None:
+    """bulk_create/update 등 시그널 없이 근로기록을 바꾼 경우 한 번에 무효화"""
+    from .sync import log_work_records_on
+
+    dates = set(dates)
+    if not dates:
+        return
+    touch_employee(employee.pk)
+    invalidate(employee.pk, keys_for_dates(employee, dates))
+    log_work_records_on(employee, dates)
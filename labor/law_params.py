@@ -0,0 +1,144 @@
+"""labor/law_params.py
+
+적용일 기준 법정 파라미터 레지스트리 (최저임금, 4대보험 요율, 주휴수당 기준시간 등)
+
+labor/policy/law_parameters.json의 적용일별 값을 한 번 읽어 파라미터별 연도 테이블로 컴파일합니다.
+연중 변경이 없는 연도는 값 하나, 연중 변경이 있는 연도만 (적용일, 값) 목록을 두므로
+여러 해를 다시 계산할 때도 조회는 연도 키 한 번(연중 변경 시 bisect)으로 끝납니다.
+
+파일이 바뀌면(mtime) 다음 조회 때 다시 컴파일하므로 워커를 재시작하지 않아도 됩니다.
+mtime 확인은 RELOAD_CHECK_INTERVAL초에 한 번만 합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_right
+from datetime import date
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+RELOAD_CHECK_INTERVAL = 1.0  # seconds
+
+MINIMUM_WAGE = 'minimum_wage'
+NATIONAL_PENSION_RATE = 'national_pension_rate'
+HEALTH_INSURANCE_RATE = 'health_insurance_rate'
+LONG_TERM_CARE_RATE = 'long_term_care_rate'          # 건강보험료 대비 비율
+EMPLOYMENT_INSURANCE_RATE = 'employment_insurance_rate'
+FREELANCE_TAX_RATE = 'freelance_tax_rate'
+WEEKLY_HOLIDAY_MIN_HOURS = 'weekly_holiday_min_hours'
+
+
+class _Compiled:
+    """파라미터별 {연도: 값 | (적용일 목록, 값 목록)} 및 범위 밖 연도용 처음/마지막 값"""
+
+    def __init__(self, data: Dict[str, Any], revision: str):
+        self.version = data.get('version')
+        self.revision = revision
+        self.tables: Dict[str, Dict[int, Any]] = {}
+        self.first_year: Dict[str, int] = {}
+        self.last_year: Dict[str, int] = {}
+        self.earliest: Dict[str, Any] = {}
+        self.latest: Dict[str, Any] = {}
+        for name, entries in data['parameters'].items():
+            points = sorted((date.fromisoformat(e['effective_from']), e['value']) for e in entries)
+            dates = [d for d, _ in points]
+            values = [v for _, v in points]
+            first, last = dates[0].year, dates[-1].year
+            table = {}
+            for year in range(first, last + 1):
+                lo = bisect_right(dates, date(year, 1, 1))
+                hi = bisect_right(dates, date(year, 12, 31))
+                if lo == hi:
+                    table[year] = values[max(lo - 1, 0)]
+                else:
+                    # 연중 변경: 1월 1일 값 + 연중 적용일들
+                    year_dates = [date(year, 1, 1)] + dates[lo:hi]
+                    year_values = [values[max(lo - 1, 0)]] + values[lo:hi]
+                    table[year] = (year_dates, year_values)
+            self.tables[name] = table
+            self.first_year[name], self.last_year[name] = first, last
+            self.earliest[name], self.latest[name] = values[0], values[-1]
+
+    def get(self, name: str, on: date):
+        if name not in self.tables:
+            raise KeyError(f"unknown law parameter: {name}")
+        if on.year < self.first_year[name]:
+            return self.earliest[name]
+        if on.year > self.last_year[name]:
+            return self.latest[name]
+        entry = self.tables[name][on.year]
+        if isinstance(entry, tuple):
+            year_dates, year_values = entry
+            return year_values[bisect_right(year_dates, on) - 1]
+        return entry
+
+
+class LawParameters:
+    PATH = os.path.join(settings.BASE_DIR, 'labor', 'policy', 'law_parameters.json')
+    _compiled: Optional[_Compiled] = None
+    _mtime = None
+    _checked_at = 0.0
+    _lock = threading.Lock()
+
+    @classmethod
+    def _load(cls) -> _Compiled:
+        now = time.monotonic()
+        if cls._compiled is not None and now - cls._checked_at < RELOAD_CHECK_INTERVAL:
+            return cls._compiled
+        cls._checked_at = now
+        try:
+            mtime = os.stat(cls.PATH).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if cls._compiled is not None and mtime == cls._mtime:
+            return cls._compiled
+
+        with cls._lock:
+            if cls._compiled is not None and mtime == cls._mtime:
+                return cls._compiled
+            try:
+                with open(cls.PATH, 'rb') as f:
+                    raw = f.read()
+                compiled = _Compiled(json.loads(raw.decode('utf-8')), hashlib.sha1(raw).hexdigest()[:12])
+            except (OSError, ValueError, KeyError) as e:
+                if cls._compiled is None:
+                    raise ImproperlyConfigured(f"법정 파라미터 파일을 읽을 수 없습니다: {cls.PATH} ({e})")
+                # 편집 중인 파일 등: 이전 테이블 유지, 다음 확인 때 다시 시도
+                logger.warning("law parameter reload failed, keeping previous tables: %s", e)
+                return cls._compiled
+            cls._compiled, cls._mtime = compiled, mtime
+        return cls._compiled
+
+    @classmethod
+    def get(cls, name: str, on: Optional[date] = None):
+        """on(기본: 오늘)에 적용되는 값"""
+        return cls._load().get(name, on or timezone.localdate())
+
+    @classmethod
+    def version(cls) -> Optional[str]:
+        """파일의 version (적용 기준일, 예: '2026-01-01')"""
+        return cls._load().version
+
+    @classmethod
+    def revision(cls) -> str:
+        """파일 내용 해시 (결과 캐시 키에 포함하여 파라미터 변경 시 자동 무효화)"""
+        return cls._load().revision
+
+    @classmethod
+    def reload(cls) -> None:
+        cls._compiled = None
+        cls._mtime = None
+        cls._load()
+
+
+def law_param(name: str, on: Optional[date] = None):
+    return LawParameters.get(name, on)
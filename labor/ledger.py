@@ -0,0 +1,172 @@
+"""labor/ledger.py
+
+월별 근로시간 원장 (hour ledger)
+
+급여 계산을 두 단계로 나눕니다.
+1. 근로 사실 수집: 날짜별 인정 시간/야간 시간/휴일 여부/연장근로 시간, 주별 주휴수당 판정 사실
+   → 시급·계약시간·공제 방식과 무관하므로 근로 데이터가 바뀔 때까지 캐시
+2. 금액 산정: 원장 + 근로조건(PayTerms 또는 TermsTimeline) → 기본급, 가산수당, 주휴수당, 공제
+
+price_payroll(build_month_ledger(...), terms_for(employee))는
+compute_payroll_summary의 금액 항목과 같은 값을 냅니다.
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from .dataset import EmployeeDataset, week_end_of, week_start_of
+from .snapshots import month_bounds
+from .terms import PayTerms
+
+
+@dataclass(frozen=True)
+class DayEntry:
+    """하루의 인정 근로시간 (시간이 0인 날은 원장에 넣지 않음)"""
+    date: date
+    source: str                   # 'actual' | 'scheduled'
+    hours: float
+    night_hours: float
+    is_holiday: bool
+    holiday_type: Optional[str]   # 'WEEKLY_REST' | 'LEGAL' | None
+    overtime_hours: float = 0.0
+
+
+@dataclass(frozen=True)
+class MonthLedger:
+    year: int
+    month: int
+    days: Tuple[DayEntry, ...]
+    weeks: tuple                  # 월에 포함되는 주의 WeeklyHolidayFacts
+
+
+def day_hours(dataset: EmployeeDataset, target_date: date) -> Tuple[float, float, str]:
+    """하루의 (인정 시간, 야간 시간, source) - 근로기록 우선, 없으면 스케줄"""
+    from .services import record_day_hours, scheduled_day_hours
+
+    record = dataset.record(target_date)
+    if record:
+        return record_day_hours(record)
+    if dataset.is_scheduled_workday(target_date):
+        hours, night_hours = scheduled_day_hours(dataset.schedule_for(target_date))
+        return hours, night_hours, 'scheduled'
+    return 0.0, 0.0, 'none'
+
+
+def build_month_ledger(employee, year: int, month: int, dataset: Optional[EmployeeDataset] = None,
+                       holiday_dates: Optional[set] = None) -> MonthLedger:
+    """월 원장 생성 (compute_payroll_summary와 같은 일자별 판정 규칙)"""
+    from .holidays import get_holidays_for_month
+    from .overtime import WeeklyOvertimeCounter
+    from .services import weekly_holiday_facts
+
+    start_date, end_date = month_bounds(year, month)
+    span_start, span_end = week_start_of(start_date), week_end_of(end_date)
+    if dataset is None or not dataset.covers(span_start, span_end):
+        dataset = EmployeeDataset.load(employee, span_start, span_end)
+    if holiday_dates is None:
+        holiday_dates = {h['date'] for h in get_holidays_for_month(year, month) if h['type'] == 'LEGAL'}
+
+    days: List[DayEntry] = []
+    overtime_counter = WeeklyOvertimeCounter()
+    curr = span_start  # 월 첫 주의 전월 날짜는 연장근로 주 누적에만 사용
+    while curr <= end_date:
+        hours, night_hours, source = day_hours(dataset, curr)
+        if curr.weekday() == 6:
+            holiday_type = 'WEEKLY_REST'
+        elif curr.isoformat() in holiday_dates:
+            holiday_type = 'LEGAL'
+        else:
+            holiday_type = None
+        overtime_hours = overtime_counter.add(curr, hours, holiday_type is not None)
+        if hours > 0 and curr >= start_date:
+            days.append(DayEntry(
+                curr, source, hours, night_hours, holiday_type is not None, holiday_type, overtime_hours
+            ))
+        curr += timedelta(days=1)
+
+    # 주휴수당: 주의 시작일 또는 종료일이 해당 월인 주 (get_monthly_holiday_pay_info와 동일)
+    weeks = []
+    week_start = span_start
+    while week_start <= end_date:
+        week_end = week_start + timedelta(days=6)
+        if week_start.month == month or week_end.month == month:
+            weeks.append(weekly_holiday_facts(employee, week_start, dataset=dataset))
+        week_start += timedelta(days=7)
+
+    return MonthLedger(year, month, tuple(days), tuple(weeks))
+
+
+def get_month_ledger(employee, year: int, month: int) -> MonthLedger:
+    """결과 캐시를 거치는 월 원장 조회 (labor/invalidation.py가 근로 데이터 변경 시 무효화)"""
+    from .invalidation import cached_result, ledger_key
+
+    return cached_result(employee, ledger_key(year, month), lambda: build_month_ledger(employee, year, month))
+
+
+def price_payroll(ledger: MonthLedger, terms) -> Dict[str, Any]:
+    """원장 + 근로조건 → 월 급여 금액 (compute_payroll_summary의 금액 단계)
+
+    terms는 PayTerms 또는 TermsTimeline. 일급은 근무일, 주휴수당은 주 종료일,
+    공제와 대표 시급은 월말 기준 조건을 적용합니다.
+    """
+    from .services import compute_deductions, price_weekly_holiday
+
+    _, month_end = month_bounds(ledger.year, ledger.month)
+    month_terms = terms.as_of(month_end)
+    hourly_wage = int(month_terms.hourly_rate)
+    total_hours = actual_hours = scheduled_hours = night_hours = overtime_hours = 0.0
+    holiday_hours = 0
+    base_pay = holiday_bonus = night_bonus = overtime_bonus = 0
+
+    for day in ledger.days:
+        day_terms = terms.as_of(day.date)
+        day_wage = int(day_terms.hourly_rate)
+        base_pay += int(day.hours * day_wage)
+        if day_terms.is_workplace_over_5:
+            # 휴일/야간 가산수당 50%
+            if day.is_holiday:
+                holiday_bonus += int(day.hours * day_wage * 0.5)
+            if day.night_hours > 0:
+                night_bonus += int(day.night_hours * day_wage * 0.5)
+            if day.overtime_hours > 0:
+                overtime_bonus += int(day.overtime_hours * day_wage * 0.5)
+        total_hours += day.hours
+        if day.source == 'actual':
+            actual_hours += day.hours
+        else:
+            scheduled_hours += day.hours
+        night_hours += day.night_hours
+        overtime_hours += day.overtime_hours
+        if day.is_holiday:
+            holiday_hours += day.hours
+
+    weekly_holiday_pay = 0
+    for week in ledger.weeks:
+        if week.has_scheduled_day:
+            week_terms = terms.as_of(week.week_end)
+            weekly_holiday_pay += price_weekly_holiday(
+                week, week_terms.hourly_rate, week_terms.contract_weekly_hours
+            )['amount']
+    weekly_holiday_pay = int(weekly_holiday_pay)
+    estimated_monthly_pay = base_pay + holiday_bonus + night_bonus + overtime_bonus + weekly_holiday_pay
+    deduction = compute_deductions(month_terms.deduction_type, estimated_monthly_pay, as_of=month_end)
+
+    return {
+        'month': f"{ledger.year}-{ledger.month:02d}",
+        'hourly_wage': hourly_wage,
+        'total_hours': round(total_hours, 1),
+        'actual_hours': round(actual_hours, 1),
+        'scheduled_hours': round(scheduled_hours, 1),
+        'holiday_hours': round(holiday_hours, 1),
+        'night_hours': round(night_hours, 1),
+        'overtime_hours': round(overtime_hours, 1),
+        'base_pay': base_pay,
+        'holiday_bonus': holiday_bonus,
+        'night_bonus': night_bonus,
+        'overtime_bonus': overtime_bonus,
+        'weekly_holiday_pay': weekly_holiday_pay,
+        'estimated_monthly_pay': estimated_monthly_pay,
+        'deduction': deduction,
+        'net_pay': deduction['net_pay'],
+    }
@@ -0,0 +1,71 @@
+import time
+from datetime import date
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from labor.batch_evaluation import evaluate_labor_batch
+from labor.services import JobInputs, evaluate_labor
+
+
+def random_columns(n: int, seed: int = 0):
+    """플랫폼 규모 리포트와 비슷한 분포의 임의 입력 열"""
+    rng = np.random.default_rng(seed)
+    return {
+        'hourly_rate': rng.choice([9000.0, 10030.0, 12000.0], n),
+        'start_date': np.datetime64('2020-01-01') + rng.integers(0, 2000, n).astype('timedelta64[D]'),
+        'contract_weekly_hours': rng.choice([np.nan, 10.0, 20.0, 40.0], n),
+        'weekly_hours': rng.choice([np.nan, 12.0, 30.0], n),
+        'work_days_per_week': rng.choice([np.nan, 3.0, 5.0], n),
+        'total_wage_last_3m': rng.choice([np.nan, 2_000_000.0], n),
+        'total_days_last_3m': rng.choice([np.nan, 91.0], n),
+        'attendance_rate_last_year': rng.choice([np.nan, 0.7, 0.95], n),
+    }
+
+
+def _nullable(value):
+    return None if np.isnan(value) else float(value)
+
+
+class Command(BaseCommand):
+    help = "evaluate_labor(건별)와 evaluate_labor_batch(NumPy)의 처리 시간을 임의 입력으로 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', type=int, default=100_000, help="배치 입력 건수")
+        parser.add_argument('--sample', type=int, default=5_000, help="건별 계산 시간을 잴 표본 건수")
+
+    def handle(self, *args, **options):
+        n, sample = options['jobs'], min(options['sample'], options['jobs'])
+        today = date(2025, 6, 1)
+        columns = random_columns(n)
+
+        started = time.perf_counter()
+        evaluate_labor_batch(columns, today=today)
+        batch_elapsed = time.perf_counter() - started
+
+        jobs = [
+            JobInputs(
+                hourly_rate=float(columns['hourly_rate'][i]),
+                employment_type='PART_TIME',
+                start_date=columns['start_date'][i].astype(date),
+                is_current=True,
+                has_paid_weekly_holiday=False,
+                attendance_rate_last_year=_nullable(columns['attendance_rate_last_year'][i]),
+                total_wage_last_3m=_nullable(columns['total_wage_last_3m'][i]),
+                total_days_last_3m=None if np.isnan(columns['total_days_last_3m'][i]) else int(columns['total_days_last_3m'][i]),
+                contract_weekly_hours=_nullable(columns['contract_weekly_hours'][i]),
+                weekly_hours=_nullable(columns['weekly_hours'][i]),
+                work_days_per_week=None if np.isnan(columns['work_days_per_week'][i]) else int(columns['work_days_per_week'][i]),
+            )
+            for i in range(sample)
+        ]
+        started = time.perf_counter()
+        for job in jobs:
+            evaluate_labor(job, today=today)
+        scalar_elapsed = (time.perf_counter() - started) / max(sample, 1) * n
+
+        self.stdout.write(f"{n:,}건")
+        self.stdout.write(f"{'batch (NumPy)':<22}{batch_elapsed * 1000:>12.1f} ms")
+        self.stdout.write(f"{'evaluate_labor (추정)':<22}{scalar_elapsed * 1000:>12.1f} ms  ({sample:,}건 측정)")
+        if batch_elapsed:
+            self.stdout.write(f"{'x':<22}{scalar_elapsed / batch_elapsed:>12.1f}")
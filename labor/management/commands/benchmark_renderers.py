@@ -0,0 +1,59 @@
+import io
+import timeit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from labor.models import Employee
+from labor.renderers import ORJSONParser, ORJSONRenderer, orjson
+
+
+class Command(BaseCommand):
+    help = "DRF 기본 JSONRenderer와 orjson 렌더러/파서의 속도를 실제 응답 데이터로 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--employee', type=int, help="Employee ID (기본: 첫 번째 Employee)")
+        parser.add_argument('--month', help="YYYY-MM (기본: 이번 달)")
+        parser.add_argument('--repeat', type=int, default=200, help="반복 횟수")
+
+    def _payloads(self, job, year, month):
+        from labor.serializers import PayrollSummarySerializer
+        from labor.services import monthly_scheduled_dates
+        from labor.snapshots import get_payroll_summary
+        from labor.views import EmployeeViewSet
+
+        return {
+            'calendar': {'dates': monthly_scheduled_dates(job, year, month)},
+            'payroll-summary': PayrollSummarySerializer(get_payroll_summary(job, year, month)).data,
+            'cumulative-stats': EmployeeViewSet().get_cumulative_stats_data(job),
+        }
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            raise CommandError("orjson이 설치되어 있지 않습니다 (pip install orjson).")
+        employees = Employee.objects.order_by('pk')
+        job = employees.filter(pk=options['employee']).first() if options.get('employee') else employees.first()
+        if job is None:
+            raise CommandError("Employee가 없습니다.")
+        if options.get('month'):
+            year, month = map(int, options['month'].split('-'))
+        else:
+            today = timezone.localdate()
+            year, month = today.year, today.month
+        repeat = options['repeat']
+
+        self.stdout.write(f"{job} {year}-{month:02d}, {repeat}회 반복 (1회당 ms)")
+        self.stdout.write(f"{'payload':<18}{'bytes':>8}{'json':>10}{'orjson':>10}{'x':>7}")
+        for name, data in self._payloads(job, year, month).items():
+            body = JSONRenderer().render(data)
+            stdlib = timeit.timeit(lambda: JSONRenderer().render(data), number=repeat) / repeat * 1000
+            fast = timeit.timeit(lambda: ORJSONRenderer().render(data), number=repeat) / repeat * 1000
+            self.stdout.write(f"{name:<18}{len(body):>8}{stdlib:>10.3f}{fast:>10.3f}{stdlib / fast:>7.1f}")
+
+            parse_stdlib = timeit.timeit(lambda: JSONParser().parse(io.BytesIO(body)), number=repeat) / repeat * 1000
+            parse_fast = timeit.timeit(lambda: ORJSONParser().parse(io.BytesIO(body)), number=repeat) / repeat * 1000
+            self.stdout.write(
+                f"{'  (parse)':<18}{'':>8}{parse_stdlib:>10.3f}{parse_fast:>10.3f}{parse_stdlib / parse_fast:>7.1f}"
+            )
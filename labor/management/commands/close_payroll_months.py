@@ -0,0 +1,38 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from labor.models import CalculationResult, Employee
+from labor.snapshots import PAYROLL_SNAPSHOT_TYPE, close_month, is_month_closed
+
+
+class Command(BaseCommand):
+    help = "마감된 월의 급여 요약을 스냅샷(CalculationResult)으로 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--employee', type=int, help="특정 Employee ID만 처리")
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        employees = Employee.objects.all()
+        if options.get('employee'):
+            employees = employees.filter(pk=options['employee'])
+
+        closed_count = 0
+        for employee in employees.iterator():
+            if not employee.start_date or employee.start_date > today:
+                continue
+            existing = set(
+                CalculationResult.objects.filter(
+                    employee=employee, calculation_type=PAYROLL_SNAPSHOT_TYPE
+                ).values_list('period_start', flat=True)
+            )
+            year, month = employee.start_date.year, employee.start_date.month
+            while is_month_closed(year, month, today):
+                if date(year, month, 1) not in existing:
+                    close_month(employee, year, month)
+                    closed_count += 1
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+        self.stdout.write(self.style.SUCCESS(f"{closed_count}개 월 마감 스냅샷 저장 완료"))
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from labor.punches import CONSOLIDATE_BATCH_SIZE, consolidate_punches
+
+
+class Command(BaseCommand):
+    help = "대기 중인 출퇴근 펀치를 근로기록(WorkRecord)에 일괄 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=CONSOLIDATE_BATCH_SIZE, help="한 번에 반영할 펀치 수")
+        parser.add_argument('--interval', type=float, help="지정하면 이 간격(초)으로 계속 실행")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        interval = options.get('interval')
+        while True:
+            applied = unmatched = 0
+            # 대기 펀치가 batch_size보다 많으면 바로 다음 묶음 처리
+            while True:
+                result = consolidate_punches(batch_size)
+                applied += result.applied
+                unmatched += result.unmatched
+                if result.applied + result.unmatched < batch_size:
+                    break
+            if applied or unmatched or not interval:
+                self.stdout.write(self.style.SUCCESS(f"펀치 {applied}건 반영, 짝이 없는 퇴근 {unmatched}건"))
+            if not interval:
+                return
+            time.sleep(interval)
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labor', '0017_employee_deduction_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calculationresult',
+            name='data_version',
+            field=models.PositiveIntegerField(blank=True, help_text='계산 시점의 Employee.data_version', null=True),
+        ),
+        migrations.AddField(
+            model_name='employee',
+            name='data_version',
+            field=models.PositiveIntegerField(default=0, help_text='근로 데이터 변경 버전'),
+        ),
+        migrations.AddIndex(
+            model_name='calculationresult',
+            index=models.Index(fields=['employee', 'calculation_type', 'period_start'], name='labor_calcu_employe_d4e497_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labor', '0018_payroll_month_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmploymentTerms',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('effective_from', models.DateField(help_text='적용 시작일')),
+                ('hourly_rate', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('contract_weekly_hours', models.DecimalField(blank=True, decimal_places=1, max_digits=4, null=True)),
+                ('deduction_type', models.CharField(choices=[('NONE', '미선택 (세전)'), ('FOUR_INSURANCE', '4대보험'), ('FREELANCE', '3.3% (프리랜서)')], default='NONE', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terms_history', to='labor.employee')),
+            ],
+            options={
+                'ordering': ['effective_from'],
+                'unique_together': {('employee', 'effective_from')},
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labor', '0019_employment_terms'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PunchEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('IN', '출근'), ('OUT', '퇴근')], max_length=3)),
+                ('punched_at', models.DateTimeField()),
+                ('status', models.CharField(choices=[('PENDING', '반영 대기'), ('APPLIED', '반영됨'), ('UNMATCHED', '짝이 없는 퇴근')], default='PENDING', max_length=10)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='punches', to='labor.employee')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'id'], name='labor_punch_status_8a0f20_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:59
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_nickname'),
+        ('labor', '0020_punch_event'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='sync_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('last_seq', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SyncChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('seq', models.PositiveBigIntegerField()),
+                ('model', models.CharField(choices=[('employee', 'Employee'), ('work_record', 'WorkRecord'), ('work_schedule', 'WorkSchedule'), ('monthly_schedule', 'MonthlySchedule')], max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('employee_id', models.BigIntegerField()),
+                ('deleted', models.BooleanField(default=False)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sync_changes', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'seq'], name='labor_syncc_user_id_be81ac_idx')],
+                'unique_together': {('user', 'model', 'object_id')},
+            },
+        ),
+    ]
@@ -33,6 +33,8 @@ class Employee(models.Model):
         default=DeductionType.NONE,
         help_text="급여 공제 방식"
     )
+    # 근로기록/스케줄/근로조건이 바뀔 때마다 증가 (마감 스냅샷 태깅용)
+    data_version = models.PositiveIntegerField(default=0, help_text="근로 데이터 변경 버전")
 
     class Meta:
         verbose_name = "Job"
@@ -320,6 +322,12 @@ class CalculationResult(models.Model):
     detail_json = models.JSONField(null=True, blank=True)
     calculated_at = models.DateTimeField(auto_now_add=True)
     law_version_date = models.DateField(null=True, blank=True)
+    data_version = models.PositiveIntegerField(null=True, blank=True, help_text="계산 시점의 Employee.data_version")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['employee', 'calculation_type', 'period_start']),
+        ]
 
     def __str__(self):
         return f"{self.employee} / {self.calculation_type} ({self.period_start}~{self.period_end})"
@@ -405,3 +413,93 @@ class LeaveUsage(models.Model):
     
     def __str__(self):
         return f"{self.employee} - {self.leave_date} ({self.get_leave_type_display()} {self.days}일)"
+
+
+class EmploymentTerms(models.Model):
+    """근로조건 변경 이력 (적용 시작일 기준)
+
+    각 행은 effective_from부터 다음 행의 effective_from 전날까지 적용됩니다.
+    이력이 없으면 Employee의 현재 값이 전체 기간에 적용됩니다.
+    Employee.hourly_rate 등은 오늘 기준으로 적용 중인 조건을 반영합니다.
+    """
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='terms_history')
+    effective_from = models.DateField(help_text="적용 시작일")
+    hourly_rate = models.DecimalField(max_digits=10, decimal_places=2)
+    contract_weekly_hours = models.DecimalField(max_digits=4, decimal_places=1, null=True, blank=True)
+    deduction_type = models.CharField(
+        max_length=20,
+        choices=Employee.DeductionType.choices,
+        default=Employee.DeductionType.NONE,
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['effective_from']
+        unique_together = [['employee', 'effective_from']]
+
+    def __str__(self):
+        return f"{self.employee} - {self.effective_from} ~ ({self.hourly_rate}원)"
+
+
+class PunchEvent(models.Model):
+    """출퇴근 펀치 로그 (앱에서 실시간 출근/퇴근)
+
+    요청마다 이 행 하나만 추가하고, WorkRecord 반영은 labor/punches.py의
+    consolidate_punches가 모아서 일괄로 합니다.
+    """
+    KIND_CHOICES = [
+        ('IN', '출근'),
+        ('OUT', '퇴근'),
+    ]
+    STATUS_CHOICES = [
+        ('PENDING', '반영 대기'),
+        ('APPLIED', '반영됨'),
+        ('UNMATCHED', '짝이 없는 퇴근'),
+    ]
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='punches')
+    kind = models.CharField(max_length=3, choices=KIND_CHOICES)
+    punched_at = models.DateTimeField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'id']),
+        ]
+
+    def __str__(self):
+        return f"{self.employee} - {self.get_kind_display()} {self.punched_at}"
+
+
+class SyncCounter(models.Model):
+    """사용자별 동기화 변경 순번 (단조 증가)"""
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='sync_counter')
+    last_seq = models.PositiveBigIntegerField(default=0)
+
+
+class SyncChange(models.Model):
+    """동기화 변경 로그 (객체당 최신 변경 한 행, 삭제는 deleted=True로 남김)
+
+    클라이언트는 마지막으로 받은 seq(동기화 토큰) 이후의 행만 받아 갑니다 (labor/sync.py).
+    """
+    MODEL_CHOICES = [
+        ('employee', 'Employee'),
+        ('work_record', 'WorkRecord'),
+        ('work_schedule', 'WorkSchedule'),
+        ('monthly_schedule', 'MonthlySchedule'),
+    ]
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='sync_changes')
+    seq = models.PositiveBigIntegerField()
+    model = models.CharField(max_length=20, choices=MODEL_CHOICES)
+    object_id = models.BigIntegerField()
+    # Employee 삭제 후에도 삭제 표시가 남도록 FK가 아닌 정수로 저장
+    employee_id = models.BigIntegerField()
+    deleted = models.BooleanField(default=False)
+
+    class Meta:
+        unique_together = [['user', 'model', 'object_id']]
+        indexes = [
+            models.Index(fields=['user', 'seq']),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} #{self.seq} {self.model}:{self.object_id}{' (deleted)' if self.deleted else ''}"
@@ -0,0 +1,61 @@
+"""labor/overtime.py
+
+연장근로(근로기준법 제50조, 제56조) 시간 판정
+
+- 1일 8시간 초과분은 연장근로
+- 1주(월~일) 법정근로시간 40시간 초과분도 연장근로 (1일 8시간 이내의 소정근로만 누적하여 이중 계산 방지)
+- 휴일근로는 주 40시간 누적에서 제외하고, 8시간 초과분만 연장근로로 봄
+  (제56조 제2항: 8시간 이내 휴일가산 50%, 초과분은 100% = 휴일가산 50% + 연장가산 50%)
+
+판정은 근로 사실이므로 사업장 규모와 무관하게 계산하고,
+가산수당 50%는 금액 산정 단계에서 5인 이상 사업장에만 적용합니다.
+날짜 순으로 한 번만 순회하며 주별 누적값만 유지하므로 O(일수)이고 추가 쿼리가 없습니다.
+"""
+
+from datetime import date
+from typing import Dict, Iterable, Optional, Tuple
+
+from .dataset import week_start_of
+
+DAILY_REGULAR_HOURS = 8.0
+WEEKLY_REGULAR_HOURS = 40.0
+
+
+class WeeklyOvertimeCounter:
+    """날짜 순으로 add()를 호출하면 그날의 연장근로 시간을 돌려줌
+
+    주가 바뀌면 누적값을 초기화합니다. 월 초의 연장근로를 정확히 판정하려면
+    해당 주의 월요일(전월 날짜 포함)부터 넣어야 합니다.
+    """
+
+    def __init__(self):
+        self.week_start: Optional[date] = None
+        self.regular_hours = 0.0
+
+    def add(self, target_date: date, hours: float, is_holiday: bool = False) -> float:
+        week_start = week_start_of(target_date)
+        if week_start != self.week_start:
+            self.week_start = week_start
+            self.regular_hours = 0.0
+        if hours <= 0:
+            return 0.0
+
+        daily_overtime = max(hours - DAILY_REGULAR_HOURS, 0.0)
+        if is_holiday:
+            return round(daily_overtime, 2)
+
+        before = self.regular_hours
+        self.regular_hours += hours - daily_overtime
+        weekly_overtime = max(self.regular_hours - WEEKLY_REGULAR_HOURS, 0.0) - max(before - WEEKLY_REGULAR_HOURS, 0.0)
+        return round(daily_overtime + weekly_overtime, 2)
+
+
+def overtime_by_date(days: Iterable[Tuple[date, float, bool]]) -> Dict[date, float]:
+    """(날짜, 인정 시간, 휴일 여부) 목록(날짜 오름차순) → 날짜별 연장근로 시간 (0인 날 제외)"""
+    counter = WeeklyOvertimeCounter()
+    result = {}
+    for target_date, hours, is_holiday in days:
+        overtime = counter.add(target_date, hours, is_holiday)
+        if overtime > 0:
+            result[target_date] = overtime
+    return result
@@ -1,17 +1,31 @@
 import json
 import os
+import time
 from django.conf import settings
 
+# 정책 파일 변경 확인 주기 (초)
+RELOAD_CHECK_INTERVAL = 1.0
+
+
 class PolicyManager:
     _policy_cache = None
+    _policy_mtime = None
+    _checked_at = 0.0
     POLICY_PATH = os.path.join(settings.BASE_DIR, 'labor', 'policy', 'holiday_pay_policy.json')
 
     @classmethod
-    def get_holiday_pay_rules(cls):
-        """
-        Loads and returns the holiday pay rules from the JSON policy file.
-        """
-        if cls._policy_cache is None:
+    def _load(cls):
+        # 파일이 바뀌면(mtime) 다시 읽음 - 워커 재시작 없이 정책 반영
+        now = time.monotonic()
+        if cls._policy_cache is not None and now - cls._checked_at < RELOAD_CHECK_INTERVAL:
+            return cls._policy_cache
+        cls._checked_at = now
+        try:
+            mtime = os.stat(cls.POLICY_PATH).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if cls._policy_cache is None or mtime != cls._policy_mtime:
+            cls._policy_mtime = mtime
             try:
                 with open(cls.POLICY_PATH, 'r', encoding='utf-8') as f:
                     cls._policy_cache = json.load(f)
@@ -19,13 +33,28 @@ class PolicyManager:
                 # Fallback default if file is missing (failsafe)
                 cls._policy_cache = {
                     "rules": {
-                        "min_weekly_hours": 15,
                         "require_perfect_attendance": True,
                         "calculation_method": "daily_average",
                         "description_ko": "주 15시간 이상 근무 (기본값)"
                     }
                 }
-        return cls._policy_cache['rules']
+        return cls._policy_cache
+
+    @classmethod
+    def get_holiday_pay_rules(cls, on=None):
+        """
+        Loads and returns the holiday pay rules from the JSON policy file.
+        min_weekly_hours comes from the law-parameter registry as of `on` (default: today).
+        """
+        from .law_params import WEEKLY_HOLIDAY_MIN_HOURS, law_param
+        rules = dict(cls._load()['rules'])
+        rules['min_weekly_hours'] = law_param(WEEKLY_HOLIDAY_MIN_HOURS, on)
+        return rules
+
+    @classmethod
+    def get_policy_version(cls):
+        """Returns the policy version string (effective date, e.g. '2025-01-01')"""
+        return cls._load().get('version')
 
     @classmethod
     def reload_policy(cls):
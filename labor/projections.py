@@ -0,0 +1,185 @@
+"""labor/projections.py
+
+미래 월 급여/근무 통계 예측 캐시
+
+미래 월은 모든 날짜가 스케줄에서 계산되므로, 아래 요소(월 모양, month shape)가 같으면
+compute_payroll_summary / compute_month_schedule_totals 결과도 날짜만 다를 뿐 동일합니다.
+
+- 월의 첫 요일, 일수
+- 계산에 쓰이는 각 날짜의 스케줄 (주휴수당 계산을 위해 앞뒤로 걸친 주 포함)
+- 해당 월의 법정 공휴일(일자 기준)
+- 각 날짜에 적용되는 시급/공제 방식 등 근로조건(이력 기준)
+- 연도, 해당 기간에 적용되는 법정 파라미터 값(주휴 기준시간, 4대보험/원천징수 요율), 파라미터 파일 revision
+  (안내 문구에 연도가 들어가고 요율이 연도별로 달라지므로 같은 연도 안에서만 재사용)
+
+모양을 키로 결과를 캐시하여, 앞으로 3~12개월 예상 급여 같은 조회를
+서로 다른 모양 수만큼만 계산하도록 합니다.
+"""
+
+import hashlib
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from .dataset import EmployeeDataset, iter_dates, week_end_of, week_start_of
+from .snapshots import month_bounds
+from .terms import terms_for
+
+PROJECTION_CACHE_TTL = 60 * 60 * 24  # 24 hours (키에 오늘 날짜 포함)
+
+
+def is_future_month(year: int, month: int, today: Optional[date] = None) -> bool:
+    today = today or timezone.localdate()
+    return date(year, month, 1) > today
+
+
+def _schedule_signature(info: dict):
+    if not info['is_scheduled']:
+        return None
+    return (
+        info['start_time'].isoformat(),
+        info['end_time'].isoformat(),
+        info['break_minutes'],
+        info['is_overnight'],
+        info['next_day_work_minutes'],
+    )
+
+
+def _terms_signature(terms) -> tuple:
+    return (str(terms.hourly_rate), str(terms.contract_weekly_hours), terms.deduction_type, terms.is_workplace_over_5)
+
+
+def _law_signature(span_start: date, month_end: date, span_end: date) -> tuple:
+    """기간에 적용되는 법정 파라미터 값 (주휴 기준시간은 주 마지막 날, 공제 요율은 월말 기준)"""
+    from .law_params import (
+        EMPLOYMENT_INSURANCE_RATE, FREELANCE_TAX_RATE, HEALTH_INSURANCE_RATE, LONG_TERM_CARE_RATE,
+        NATIONAL_PENSION_RATE, WEEKLY_HOLIDAY_MIN_HOURS, law_param,
+    )
+
+    week_ends = [d for d in iter_dates(span_start, span_end) if d == week_end_of(d)]
+    return (
+        tuple(law_param(WEEKLY_HOLIDAY_MIN_HOURS, d) for d in week_ends),
+        tuple(law_param(name, month_end) for name in (
+            NATIONAL_PENSION_RATE, HEALTH_INSURANCE_RATE, LONG_TERM_CARE_RATE,
+            EMPLOYMENT_INSURANCE_RATE, FREELANCE_TAX_RATE,
+        )),
+    )
+
+
+def _shape_key(kind: str, parts: tuple) -> str:
+    digest = hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+    return f"projection:{kind}:{digest}"
+
+
+def _payroll_shape(employee, year: int, month: int, dataset: EmployeeDataset, today: date) -> Optional[tuple]:
+    """급여 요약 계산용 월 모양 (미래 월이 아니거나 근로기록이 있으면 None)"""
+    from .holidays import get_holidays_for_month
+    from .law_params import LawParameters
+
+    month_start, month_end = month_bounds(year, month)
+    span_start, span_end = week_start_of(month_start), week_end_of(month_end)
+    if month_start <= today or dataset.has_records_between(span_start, span_end):
+        return None
+
+    terms = terms_for(employee, dataset)
+    holiday_days = sorted(
+        int(h['date'][8:10]) for h in get_holidays_for_month(year, month) if h['type'] == 'LEGAL'
+    )
+    return (
+        today.isoformat(),
+        year,
+        month_start.weekday(),
+        month_end.day,
+        tuple(_schedule_signature(dataset.schedule_for(d)) for d in iter_dates(span_start, span_end)),
+        tuple(holiday_days),
+        tuple(_terms_signature(terms.as_of(d)) for d in iter_dates(span_start, span_end)),
+        _law_signature(span_start, month_end, span_end),
+        LawParameters.revision(),
+    )
+
+
+def _totals_shape(employee, year: int, month: int, dataset: EmployeeDataset, today: date) -> Optional[tuple]:
+    """월 근무 통계 계산용 월 모양"""
+    month_start, month_end = month_bounds(year, month)
+    if month_start <= today or dataset.has_records_between(month_start, month_end):
+        return None
+    terms = terms_for(employee, dataset)
+    return (
+        month_start.weekday(),
+        month_end.day,
+        tuple(_schedule_signature(dataset.schedule_for(d)) for d in iter_dates(month_start, month_end)),
+        tuple(_terms_signature(terms.as_of(d)) for d in iter_dates(month_start, month_end)),
+    )
+
+
+def _rebase_summary(summary: Dict[str, Any], year: int, month: int) -> Dict[str, Any]:
+    """같은 연도의 다른 월에서 계산된 결과의 날짜를 대상 월로 옮김 (모양이 같으므로 일자는 동일)
+
+    모양 키에 연도가 들어가므로 notes(연도가 들어간 요율 안내 등)는 대상 월과 같은 연도의 문구입니다.
+    """
+    summary['month'] = f"{year}-{month:02d}"
+    for row in summary['rows']:
+        row['date'] = date(year, month, int(row['date'][8:10])).isoformat()
+    return summary
+
+
+def _load_span(employee, year: int, month: int) -> EmployeeDataset:
+    month_start, month_end = month_bounds(year, month)
+    return EmployeeDataset.load(employee, week_start_of(month_start), week_end_of(month_end))
+
+
+def projected_payroll_summary(employee, year: int, month: int, dataset: Optional[EmployeeDataset] = None) -> Dict[str, Any]:
+    """미래 월 급여 요약 (월 모양이 같으면 캐시 재사용)"""
+    from .services import compute_payroll_summary
+
+    today = timezone.localdate()
+    dataset = dataset or _load_span(employee, year, month)
+    shape = _payroll_shape(employee, year, month, dataset, today)
+    if shape is None:
+        return compute_payroll_summary(employee, year, month)
+
+    key = _shape_key('payroll', shape)
+    cached = cache.get(key)
+    if cached is not None:
+        return _rebase_summary(cached, year, month)
+
+    summary = compute_payroll_summary(employee, year, month)
+    cache.set(key, summary, PROJECTION_CACHE_TTL)
+    return summary
+
+
+def projected_month_schedule_totals(employee, year: int, month: int, dataset: Optional[EmployeeDataset] = None) -> Dict[str, Any]:
+    """미래 월 근무 통계 합계 (compute_month_schedule_totals 캐시 버전)"""
+    from .services import compute_month_schedule_totals
+
+    today = timezone.localdate()
+    if dataset is None:
+        month_start, month_end = month_bounds(year, month)
+        dataset = EmployeeDataset.load(employee, month_start, month_end)
+    shape = _totals_shape(employee, year, month, dataset, today)
+    if shape is None:
+        return compute_month_schedule_totals(employee, year, month, dataset=dataset)
+
+    key = _shape_key('totals', shape)
+    cached = cache.get(key)
+    if cached is None:
+        cached = compute_month_schedule_totals(employee, year, month, dataset=dataset)
+        cache.set(key, cached, PROJECTION_CACHE_TTL)
+    return cached
+
+
+def project_payroll(employee, months: int = 3) -> List[Dict[str, Any]]:
+    """다음 달부터 N개월의 예상 급여 요약 목록 (스케줄/근로기록은 한 번만 적재)"""
+    today = timezone.localdate()
+    targets = []
+    year, month = today.year, today.month
+    for _ in range(months):
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        targets.append((year, month))
+
+    first_start, _ = month_bounds(*targets[0])
+    _, last_end = month_bounds(*targets[-1])
+    dataset = EmployeeDataset.load(employee, week_start_of(first_start), week_end_of(last_end))
+    return [projected_payroll_summary(employee, y, m, dataset=dataset) for y, m in targets]
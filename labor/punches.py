@@ -0,0 +1,172 @@
+"""labor/punches.py
+
+실시간 출퇴근 펀치 → WorkRecord 일괄 반영
+
+교대 시간(정각 전후 몇 분)에 펀치가 몰리므로 요청 처리는 PunchEvent 한 행 INSERT만 하고(record_punch),
+WorkRecord 반영은 consolidate_punches가 대기 중인 펀치를 batch_size개씩 묶어 처리합니다.
+한 묶음은 조회 몇 번 + bulk_create/bulk_update/update 각 1회이므로 SQLite 쓰기 잠금을 짧게 잡습니다.
+(주기 실행: python manage.py consolidate_punches --interval 5)
+
+반영 규칙 (직원별로 펀치 시각 순):
+- 출근: 출근 시각의 근무일 기록을 만들거나 엽니다. 첫 출근 시각이 time_in이 되고,
+  같은 날 퇴근 뒤 다시 출근하면 그 사이 시간을 휴게시간에 더합니다.
+- 퇴근: MAX_SHIFT_HOURS 안에 시작한 가장 최근 근무에 time_out으로 기록합니다 (자정을 넘기면 전날 근무).
+  닫을 근무가 없으면 UNMATCHED로 남깁니다.
+- 새 기록의 출결 상태는 소정근로일이면 REGULAR_WORK, 아니면 EXTRA_WORK.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from .dataset import EmployeeDataset
+from .models import Employee, PunchEvent, WorkRecord
+from .record_import import MAX_SHIFT_HOURS, WORK_STATUSES
+
+CONSOLIDATE_BATCH_SIZE = 500
+
+# 앱이 잠시 오프라인이었던 경우 기기 시각을 받되, 이 범위를 벗어나면 거부
+MAX_PUNCH_DELAY = timedelta(hours=MAX_SHIFT_HOURS)
+MAX_CLOCK_SKEW = timedelta(minutes=5)
+
+PUNCH_FIELDS = ['time_in', 'time_out', 'is_overnight', 'break_minutes', 'attendance_status']
+
+
+def record_punch(employee_id: int, kind: str, punched_at: Optional[datetime] = None) -> PunchEvent:
+    """펀치 한 건 기록 (INSERT 1회, 반영은 consolidate_punches)"""
+    return PunchEvent.objects.create(employee_id=employee_id, kind=kind, punched_at=punched_at or timezone.now())
+
+
+def check_punch_time(punched_at: datetime, now: Optional[datetime] = None) -> Optional[str]:
+    """기기에서 보낸 펀치 시각 검증 → 오류 메시지 (정상이면 None)"""
+    now = now or timezone.now()
+    if punched_at > now + MAX_CLOCK_SKEW:
+        return '미래 시각으로 펀치할 수 없습니다.'
+    if punched_at < now - MAX_PUNCH_DELAY:
+        return f"{MAX_SHIFT_HOURS}시간보다 지난 펀치는 근로기록에서 직접 입력해 주세요."
+    return None
+
+
+@dataclass
+class ConsolidateResult:
+    applied: int = 0
+    unmatched: int = 0
+    created: int = 0
+    updated: int = 0
+    dates: Dict[int, set] = field(default_factory=dict)  # employee_id → 바뀐 근무일
+
+
+class _Fold:
+    """한 묶음의 펀치를 근로기록에 접는 작업 상태"""
+
+    def __init__(self, records: List[WorkRecord], datasets: Dict[int, EmployeeDataset]):
+        self.records: Dict[Tuple[int, object], WorkRecord] = {(r.employee_id, r.work_date): r for r in records}
+        self.datasets = datasets
+        self.new: Dict[Tuple[int, object], WorkRecord] = {}
+        self.changed: Dict[Tuple[int, object], WorkRecord] = {}
+
+    def _status_for(self, employee_id: int, work_date) -> str:
+        scheduled = self.datasets[employee_id].is_scheduled_workday(work_date)
+        return 'REGULAR_WORK' if scheduled else 'EXTRA_WORK'
+
+    def _touch(self, key, record: WorkRecord) -> None:
+        if key not in self.new:
+            self.changed[key] = record
+
+    def punch_in(self, punch: PunchEvent) -> bool:
+        work_date = timezone.localtime(punch.punched_at).date()
+        key = (punch.employee_id, work_date)
+        record = self.records.get(key)
+        if record is None:
+            record = WorkRecord(
+                employee_id=punch.employee_id, work_date=work_date, time_in=punch.punched_at,
+                attendance_status=self._status_for(punch.employee_id, work_date),
+            )
+            self.records[key] = self.new[key] = record
+            return True
+        if record.time_in is None or record.attendance_status not in WORK_STATUSES:
+            # 자동 생성된 빈 기록이나 결근/휴가로 표시된 날에 실제로 출근
+            record.time_in, record.time_out = punch.punched_at, None
+            record.break_minutes = 0
+            record.attendance_status = self._status_for(punch.employee_id, work_date)
+        elif record.time_out is not None and record.time_out <= punch.punched_at:
+            # 퇴근 후 재출근: 사이 시간은 휴게시간
+            record.break_minutes += int((punch.punched_at - record.time_out).total_seconds() // 60)
+            record.time_out = None
+        elif punch.punched_at < record.time_in:
+            record.time_in = punch.punched_at
+        else:
+            return True  # 이미 출근 중 (중복 펀치)
+        self._touch(key, record)
+        return True
+
+    def punch_out(self, punch: PunchEvent) -> bool:
+        local_date = timezone.localtime(punch.punched_at).date()
+        candidates = [
+            ((punch.employee_id, d), self.records.get((punch.employee_id, d)))
+            for d in (local_date, local_date - timedelta(days=1))
+        ]
+        open_shifts = [
+            (key, r) for key, r in candidates
+            if r is not None and r.time_in is not None and r.attendance_status in WORK_STATUSES
+            and r.time_in < punch.punched_at <= r.time_in + MAX_PUNCH_DELAY
+        ]
+        if not open_shifts:
+            return False
+        key, record = max(open_shifts, key=lambda item: item[1].time_in)
+        if record.time_out is None or record.time_out < punch.punched_at:
+            record.time_out = punch.punched_at
+            record.is_overnight = timezone.localtime(record.time_out).date() > record.work_date
+            self._touch(key, record)
+        return True
+
+
+def consolidate_punches(batch_size: int = CONSOLIDATE_BATCH_SIZE) -> ConsolidateResult:
+    """대기 중인 펀치를 batch_size개 이하로 묶어 WorkRecord에 반영 (반영할 펀치가 없으면 빈 결과)"""
+    from .invalidation import work_records_replaced
+
+    result = ConsolidateResult()
+    with transaction.atomic():
+        punches = list(PunchEvent.objects.filter(status='PENDING').order_by('id')[:batch_size])
+        if not punches:
+            return result
+        employee_ids = {p.employee_id for p in punches}
+        local_dates = [timezone.localtime(p.punched_at).date() for p in punches]
+        first, last = min(local_dates) - timedelta(days=1), max(local_dates)
+        employees = list(Employee.objects.filter(pk__in=employee_ids))
+        fold = _Fold(
+            list(WorkRecord.objects.filter(employee_id__in=employee_ids, work_date__range=[first, last])),
+            EmployeeDataset.load_many(employees, first, last, with_records=False),
+        )
+
+        applied: List[int] = []
+        unmatched: List[int] = []
+        for punch in sorted(punches, key=lambda p: (p.employee_id, p.punched_at, p.id)):
+            ok = fold.punch_in(punch) if punch.kind == 'IN' else fold.punch_out(punch)
+            (applied if ok else unmatched).append(punch.id)
+
+        if fold.new:
+            WorkRecord.objects.bulk_create(
+                list(fold.new.values()),
+                update_conflicts=True,
+                unique_fields=['employee', 'work_date'],
+                update_fields=PUNCH_FIELDS,
+            )
+        if fold.changed:
+            WorkRecord.objects.bulk_update(list(fold.changed.values()), PUNCH_FIELDS)
+        if applied:
+            PunchEvent.objects.filter(id__in=applied).update(status='APPLIED')
+        if unmatched:
+            PunchEvent.objects.filter(id__in=unmatched).update(status='UNMATCHED')
+
+    result.applied, result.unmatched = len(applied), len(unmatched)
+    result.created, result.updated = len(fold.new), len(fold.changed)
+    for employee_id, work_date in list(fold.new) + list(fold.changed):
+        result.dates.setdefault(employee_id, set()).add(work_date)
+    for employee in employees:
+        if employee.pk in result.dates:
+            work_records_replaced(employee, result.dates[employee.pk])
+    return result
@@ -0,0 +1,144 @@
+"""labor/record_batch.py
+
+여러 날의 근로기록을 한 번에 수정 (한 주 연차 처리, 여러 날 퇴근 시간 정정 등)
+
+변경 목록 전체를 먼저 검증하고(하나라도 오류면 아무것도 적용하지 않음),
+조회 1회 + bulk_create/bulk_update/delete 각 1회로 한 트랜잭션 안에서 적용합니다.
+결과 무효화는 signals.collect_record_changes로 끝에서 한 번만 합니다.
+
+변경 항목 형식:
+    {"work_date": "2025-03-03", "attendance_status": "ANNUAL_LEAVE"}
+    {"work_date": "2025-03-04", "time_out": "19:00"}
+    {"work_date": "2025-03-05", "delete": true}
+지정하지 않은 필드는 기존 기록 값을 유지합니다 (기록이 없으면 새로 만듦).
+결근/휴가로 바꾸면서 출퇴근 시간을 지정하지 않으면 출퇴근 시간을 비웁니다.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, List
+
+from django.db import transaction
+from django.utils import timezone
+
+from .dataset import EmployeeDataset
+from .models import WorkRecord
+from .record_import import UPSERT_FIELDS, WORK_STATUSES, validate_row
+
+MAX_BATCH_CHANGES = 366
+
+EDITABLE_FIELDS = ('time_in', 'time_out', 'break_minutes', 'next_day_work_minutes', 'attendance_status')
+
+
+class BatchValidationError(Exception):
+    def __init__(self, errors: List[Dict[str, Any]]):
+        super().__init__('invalid batch')
+        self.errors = errors
+
+
+@dataclass
+class BatchResult:
+    created: List[WorkRecord] = field(default_factory=list)
+    updated: List[WorkRecord] = field(default_factory=list)
+    deleted: List[date] = field(default_factory=list)
+
+    @property
+    def dates(self) -> set:
+        return {r.work_date for r in self.created + self.updated} | set(self.deleted)
+
+
+def _clock_text(value, work_date: date) -> str:
+    """기존 출퇴근 시각 → 근무일 당일이면 'HH:MM', 아니면 ISO (validate_row 입력 형식)"""
+    if value is None:
+        return ''
+    local = timezone.localtime(value)
+    return local.strftime('%H:%M') if local.date() == work_date else local.isoformat()
+
+
+def _merged_raw(change: Dict[str, Any], record) -> Dict[str, Any]:
+    raw = {}
+    if record is not None:
+        raw = {
+            'time_in': _clock_text(record.time_in, record.work_date),
+            'time_out': _clock_text(record.time_out, record.work_date),
+            'break_minutes': record.break_minutes,
+            'next_day_work_minutes': record.next_day_work_minutes,
+            'attendance_status': record.attendance_status,
+        }
+    raw.update({k: change[k] for k in EDITABLE_FIELDS if k in change})
+    raw['work_date'] = change.get('work_date')
+    status = raw.get('attendance_status')
+    if status and status not in WORK_STATUSES and 'time_in' not in change and 'time_out' not in change:
+        raw['time_in'] = raw['time_out'] = ''
+    return raw
+
+
+def apply_record_changes(employee, changes: List[Dict[str, Any]]) -> BatchResult:
+    """변경 목록을 검증 후 일괄 적용 (오류가 있으면 BatchValidationError, 아무것도 적용하지 않음)"""
+    from .signals import collect_record_changes
+
+    if not isinstance(changes, list) or not changes:
+        raise BatchValidationError([{'index': None, 'errors': {'changes': '변경 목록이 비어 있습니다.'}}])
+    if len(changes) > MAX_BATCH_CHANGES:
+        raise BatchValidationError([
+            {'index': None, 'errors': {'changes': f"한 번에 {MAX_BATCH_CHANGES}건까지 수정할 수 있습니다."}}
+        ])
+
+    dates = []
+    for change in changes:
+        try:
+            dates.append(date.fromisoformat(str(change.get('work_date', ''))) if isinstance(change, dict) else None)
+        except ValueError:
+            dates.append(None)
+    existing = {r.work_date: r for r in WorkRecord.objects.filter(employee=employee, work_date__in=[d for d in dates if d])}
+    dataset = EmployeeDataset.load(employee, employee.start_date, date.max, with_records=False)
+
+    errors: List[Dict[str, Any]] = []
+    seen = set()
+    to_create: List[WorkRecord] = []
+    to_update: List[WorkRecord] = []
+    to_delete: List[date] = []
+    for index, (change, work_date) in enumerate(zip(changes, dates)):
+        if work_date is None:
+            errors.append({'index': index, 'errors': {'work_date': 'YYYY-MM-DD 형식이어야 합니다.'}})
+            continue
+        if work_date in seen:
+            errors.append({'index': index, 'errors': {'work_date': '같은 날짜가 두 번 포함되어 있습니다.'}})
+            continue
+        seen.add(work_date)
+        record = existing.get(work_date)
+
+        if change.get('delete'):
+            if record is None:
+                errors.append({'index': index, 'errors': {'work_date': '삭제할 근로기록이 없습니다.'}})
+            else:
+                to_delete.append(work_date)
+            continue
+
+        values, row_errors = validate_row(_merged_raw(change, record), employee, dataset)
+        if row_errors:
+            errors.append({'index': index, 'work_date': work_date.isoformat(), 'errors': row_errors})
+            continue
+        if record is None:
+            to_create.append(WorkRecord(employee=employee, **values))
+        else:
+            for name in UPSERT_FIELDS:
+                setattr(record, name, values[name])
+            to_update.append(record)
+
+    if errors:
+        raise BatchValidationError(errors)
+
+    result = BatchResult()
+    with collect_record_changes(employee) as changed_dates:
+        with transaction.atomic():
+            if to_delete:
+                WorkRecord.objects.filter(employee=employee, work_date__in=to_delete).delete()
+            if to_update:
+                WorkRecord.objects.bulk_update(to_update, UPSERT_FIELDS)
+            if to_create:
+                result.created = WorkRecord.objects.bulk_create(to_create)
+        result.updated = to_update
+        result.deleted = to_delete
+        changed_dates.update(result.dates)
+    return result
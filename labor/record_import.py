@@ -0,0 +1,279 @@
+"""labor/record_import.py
+
+근로기록 일괄 가져오기 (CSV / JSON)
+
+종이 출근부나 사업장 출퇴근 기록을 한 번에 옮길 때 사용합니다.
+- 입력은 스트림으로 한 행씩 읽습니다 (CSV는 csv.DictReader, JSON은 배열을 객체 단위로 디코딩하거나 JSON Lines).
+- 각 행은 근무 규칙(출퇴근 시간, 근무 길이, 휴게시간, 출결 상태, 근무 시작일)으로 검증하고
+  오류는 행 번호와 함께 모아 돌려줍니다. 오류가 있는 행만 건너뜁니다.
+- 검증된 행은 IMPORT_CHUNK_SIZE개씩 bulk_create(update_conflicts=True)로 upsert합니다
+  (같은 근무일 기록이 있으면 덮어씀).
+- bulk_create는 시그널을 발생시키지 않으므로 결과 무효화는 끝에서 한 번만 합니다.
+"""
+
+import codecs
+import csv
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from .dataset import EmployeeDataset
+from .models import WorkRecord
+
+IMPORT_CHUNK_SIZE = 500
+MAX_IMPORT_ROWS = 20000
+READ_CHUNK_SIZE = 64 * 1024
+
+MAX_SHIFT_HOURS = 24
+MAX_NEXT_DAY_MINUTES = 360  # 익일 추가 근무: 24:00~06:00
+
+WORK_STATUSES = ('REGULAR_WORK', 'EXTRA_WORK')
+STATUS_CHOICES = {code for code, _ in WorkRecord.ATTENDANCE_STATUS_CHOICES}
+
+# upsert 시 덮어쓸 필드 (employee, work_date는 충돌 판정 키)
+UPSERT_FIELDS = [
+    'time_in', 'time_out', 'is_overnight', 'next_day_work_minutes', 'break_minutes', 'attendance_status',
+]
+
+
+class ImportFormatError(ValueError):
+    """입력 전체를 읽을 수 없는 경우 (행 단위 오류와 구분)"""
+
+
+# --- 스트림 파싱 ---
+
+def iter_csv_rows(stream) -> Iterator[Dict[str, Any]]:
+    """바이트 스트림 → CSV 행 dict (BOM 포함 UTF-8 허용)"""
+    reader = codecs.getreader('utf-8-sig')(stream)
+    try:
+        for row in csv.DictReader(reader):
+            yield {(k or '').strip(): (v.strip() if isinstance(v, str) else v) for k, v in row.items()}
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise ImportFormatError(f"CSV를 읽을 수 없습니다: {e}")
+
+
+def iter_json_rows(stream) -> Iterator[Dict[str, Any]]:
+    """바이트 스트림 → JSON 객체
+
+    JSON 배열([{...}, {...}])은 객체 하나씩 디코딩하고, JSON Lines(한 줄에 객체 하나)도 받습니다.
+    전체를 한 번에 읽지 않고 READ_CHUNK_SIZE씩 읽으며, 객체가 조각 경계에 걸리면 다음 조각을 붙여 다시 디코딩합니다.
+    """
+    decoder = json.JSONDecoder()
+    reader = codecs.getreader('utf-8-sig')(stream)
+    buf, pos = '', 0
+    in_array = None  # None: 아직 모름, True: 배열, False: JSON Lines
+
+    def fill() -> bool:
+        nonlocal buf, pos
+        try:
+            chunk = reader.read(READ_CHUNK_SIZE)
+        except UnicodeDecodeError as e:
+            raise ImportFormatError(f"JSON을 읽을 수 없습니다: {e}")
+        if not chunk:
+            return False
+        buf, pos = buf[pos:] + chunk, 0
+        return True
+
+    while True:
+        while pos < len(buf) and (buf[pos].isspace() or (in_array and buf[pos] == ',')):
+            pos += 1
+        if pos >= len(buf):
+            if not fill():
+                break
+            continue
+        if in_array is None:
+            in_array = buf[pos] == '['
+            if in_array:
+                pos += 1
+            continue
+        if in_array and buf[pos] == ']':
+            return
+        try:
+            obj, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError as e:
+            if not fill():
+                raise ImportFormatError(f"JSON을 읽을 수 없습니다: {e}")
+            continue
+        if not isinstance(obj, dict):
+            raise ImportFormatError("JSON 항목은 객체여야 합니다.")
+        yield obj
+        pos = end
+    if in_array:
+        raise ImportFormatError("JSON 배열이 닫히지 않았습니다.")
+
+
+# --- 행 검증 ---
+
+def _parse_date(value) -> date:
+    return date.fromisoformat(str(value).strip())
+
+
+def _parse_moment(value, work_date: date) -> Tuple[datetime, bool]:
+    """'HH:MM[:SS]' 또는 ISO datetime → (aware datetime, 시각만 주어졌는지)"""
+    text = str(value).strip()
+    for fmt in ('%H:%M', '%H:%M:%S'):
+        try:
+            moment = datetime.combine(work_date, datetime.strptime(text, fmt).time())
+            return timezone.make_aware(moment), True
+        except ValueError:
+            pass
+    moment = datetime.fromisoformat(text)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment, False
+
+
+def _parse_int(value, default: int = 0) -> int:
+    if value in (None, ''):
+        return default
+    return int(str(value).strip())
+
+
+def validate_row(raw: Dict[str, Any], employee, dataset: EmployeeDataset) -> Tuple[Optional[Dict[str, Any]], Dict[str, str]]:
+    """행 하나를 근무 규칙으로 검증 → (WorkRecord 필드 dict, 필드별 오류)
+
+    - work_date: YYYY-MM-DD, 근무 시작일 이후
+    - time_in/time_out: 'HH:MM' 또는 ISO datetime. 시각만 주어지고 퇴근이 출근보다 이르면 자정을 넘긴 근무
+    - 근무(소정/추가)는 출퇴근 시간이 필요하고, 결근/휴가는 출퇴근 시간을 넣을 수 없음
+    - 근무 길이 24시간 이하, 휴게시간 0 이상 근무 길이 미만, 익일 추가 근무 0~360분
+    - attendance_status 생략 시 소정근로일이면 REGULAR_WORK, 아니면 EXTRA_WORK
+    """
+    errors: Dict[str, str] = {}
+    try:
+        work_date = _parse_date(raw.get('work_date', ''))
+    except ValueError:
+        return None, {'work_date': 'YYYY-MM-DD 형식이어야 합니다.'}
+    if work_date < employee.start_date:
+        errors['work_date'] = f"근무 시작일({employee.start_date.isoformat()}) 이전입니다."
+
+    status = str(raw.get('attendance_status') or '').strip()
+    if not status:
+        status = 'REGULAR_WORK' if dataset.is_scheduled_workday(work_date) else 'EXTRA_WORK'
+    elif status not in STATUS_CHOICES:
+        errors['attendance_status'] = f"{', '.join(sorted(STATUS_CHOICES))} 중 하나여야 합니다."
+
+    try:
+        break_minutes = _parse_int(raw.get('break_minutes'))
+    except ValueError:
+        errors['break_minutes'] = '정수(분)여야 합니다.'
+        break_minutes = 0
+    try:
+        next_day_work_minutes = _parse_int(raw.get('next_day_work_minutes'))
+        if not 0 <= next_day_work_minutes <= MAX_NEXT_DAY_MINUTES:
+            errors['next_day_work_minutes'] = f"0~{MAX_NEXT_DAY_MINUTES}분이어야 합니다."
+    except ValueError:
+        errors['next_day_work_minutes'] = '정수(분)여야 합니다.'
+        next_day_work_minutes = 0
+
+    time_in = time_out = None
+    is_overnight = False
+    raw_in, raw_out = raw.get('time_in') or '', raw.get('time_out') or ''
+    if status in WORK_STATUSES:
+        if not raw_in or not raw_out:
+            errors['time_in'] = '근무 기록에는 출근/퇴근 시간이 필요합니다.'
+        else:
+            try:
+                time_in, in_time_only = _parse_moment(raw_in, work_date)
+                time_out, out_time_only = _parse_moment(raw_out, work_date)
+            except ValueError:
+                errors['time_in'] = "출근/퇴근 시간은 'HH:MM' 또는 ISO 날짜시간이어야 합니다."
+            else:
+                if in_time_only and out_time_only and time_out <= time_in:
+                    # 퇴근 시각이 출근보다 이르면 자정을 넘긴 근무 → 퇴근을 익일 날짜로 저장
+                    time_out += timedelta(days=1)
+                is_overnight = timezone.localtime(time_out).date() > work_date
+                shift_minutes = (time_out - time_in).total_seconds() / 60
+                if shift_minutes <= 0:
+                    errors['time_out'] = '퇴근 시간이 출근 시간보다 늦어야 합니다.'
+                elif shift_minutes > MAX_SHIFT_HOURS * 60:
+                    errors['time_out'] = f"근무 길이가 {MAX_SHIFT_HOURS}시간을 넘습니다."
+                elif not 0 <= break_minutes < shift_minutes:
+                    errors['break_minutes'] = '휴게시간은 0분 이상, 근무 길이보다 짧아야 합니다.'
+    elif raw_in or raw_out:
+        errors['time_in'] = '결근/휴가 기록에는 출퇴근 시간을 넣을 수 없습니다.'
+
+    if errors:
+        return None, errors
+    return {
+        'work_date': work_date,
+        'time_in': time_in,
+        'time_out': time_out,
+        'is_overnight': is_overnight,
+        'next_day_work_minutes': next_day_work_minutes,
+        'break_minutes': break_minutes,
+        'attendance_status': status,
+    }, {}
+
+
+# --- 가져오기 ---
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    updated: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    dates: set = field(default_factory=set)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'created': self.created,
+            'updated': self.updated,
+            'error_count': len(self.errors),
+            'errors': self.errors,
+        }
+
+
+def _upsert(employee, rows: List[Dict[str, Any]], result: ImportResult) -> None:
+    dates = [r['work_date'] for r in rows]
+    existing = set(
+        WorkRecord.objects.filter(employee=employee, work_date__in=dates).values_list('work_date', flat=True)
+    )
+    WorkRecord.objects.bulk_create(
+        [WorkRecord(employee=employee, **r) for r in rows],
+        update_conflicts=True,
+        unique_fields=['employee', 'work_date'],
+        update_fields=UPSERT_FIELDS,
+    )
+    result.updated += len(existing)
+    result.created += len(rows) - len(existing)
+    result.dates.update(dates)
+
+
+def import_work_records(employee, rows: Iterable[Dict[str, Any]], chunk_size: int = IMPORT_CHUNK_SIZE) -> ImportResult:
+    """행 스트림을 검증하고 chunk_size개씩 upsert (행 번호는 1부터, CSV 머리글 제외)
+
+    모든 chunk를 하나의 트랜잭션으로 기록한 뒤 영향을 받는 결과를 한 번만 무효화합니다.
+    입력 형식 오류(ImportFormatError)가 나면 아무것도 기록하지 않습니다.
+    """
+    from .invalidation import work_records_replaced
+
+    # 기본 출결 상태 판정용 스케줄 (근로기록 제외)
+    dataset = EmployeeDataset.load(employee, employee.start_date, date.max, with_records=False)
+    result = ImportResult()
+    seen = set()
+    pending: List[Dict[str, Any]] = []
+
+    with transaction.atomic():
+        for number, raw in enumerate(rows, start=1):
+            if number > MAX_IMPORT_ROWS:
+                raise ImportFormatError(f"한 번에 {MAX_IMPORT_ROWS}행까지 가져올 수 있습니다.")
+            record, errors = validate_row(raw, employee, dataset)
+            if record and record['work_date'] in seen:
+                errors = {'work_date': '같은 파일에 같은 근무일이 이미 있습니다.'}
+            if errors:
+                result.errors.append({'row': number, 'work_date': raw.get('work_date'), 'errors': errors})
+                continue
+            seen.add(record['work_date'])
+            pending.append(record)
+            if len(pending) >= chunk_size:
+                _upsert(employee, pending, result)
+                pending = []
+        if pending:
+            _upsert(employee, pending, result)
+
+    work_records_replaced(employee, result.dates)
+    return result
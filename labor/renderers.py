@@ -0,0 +1,79 @@
+"""labor/renderers.py
+
+orjson 기반 JSON 렌더러/파서 (선택 사항)
+
+캘린더, 급여 요약 rows, 누적 통계처럼 숫자가 많은 큰 응답에서 DRF 기본 JSONRenderer(표준 json +
+파이썬 default 함수)보다 인코딩이 빠릅니다. REST_FRAMEWORK 설정에서 기본 렌더러/파서를 바꿔 사용합니다.
+
+    "DEFAULT_RENDERER_CLASSES": ("labor.renderers.ORJSONRenderer", "rest_framework.renderers.BrowsableAPIRenderer"),
+    "DEFAULT_PARSER_CLASSES": ("labor.renderers.ORJSONParser", "rest_framework.parsers.FormParser",
+                               "rest_framework.parsers.MultiPartParser"),
+
+- date/datetime/time, dataclass, numpy 값은 orjson이 직접 인코딩하고 (DRF와 같은 ISO 형식, UTC는 'Z'),
+  Decimal 등 나머지는 DRF JSONEncoder.default와 같은 규칙으로 변환합니다 (Decimal → float).
+- orjson이 설치되어 있지 않으면 DRF 기본 동작으로 대체합니다.
+- 속도 비교: python manage.py benchmark_renderers --employee <id>
+"""
+
+from decimal import Decimal
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
+
+ORJSON_OPTIONS = 0
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+_fallback_encoder = JSONEncoder()
+
+
+def _default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    return _fallback_encoder.default(obj)
+
+
+def dumps(data, indent: bool = False) -> bytes:
+    """orjson으로 인코딩 (orjson이 없으면 DRF JSONEncoder)"""
+    if orjson is None:
+        return JSONRenderer().render(data, renderer_context={'indent': 2 if indent else None})
+    options = ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+    return orjson.dumps(data, default=_default, option=options)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """DRF JSONRenderer와 같은 출력을 orjson으로 생성 (들여쓰기 요청 시 2칸)"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        renderer_context = renderer_context or {}
+        indent = bool(self.get_indent(accepted_media_type, renderer_context))
+        return dumps(data, indent=indent)
+
+
+class ORJSONParser(JSONParser):
+    """orjson으로 JSON 본문 파싱"""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        body = stream.read() if stream is not None else b''
+        try:
+            if encoding.lower().replace('-', '') != 'utf8':
+                body = body.decode(encoding)
+            return orjson.loads(body)
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise ParseError(f'JSON parse error - {exc}')
@@ -0,0 +1,45 @@
+"""labor/request_memo.py
+
+요청 범위 메모 (POST /api/batch/의 하위 요청끼리 공유)
+
+    with request_memo():
+        ...  # 블록 안에서 memoize(key, compute)는 같은 키를 한 번만 계산
+
+하위 요청들이 같은 Employee, 스케줄·근로기록(EmployeeDataset), 공휴일을 반복해서 읽지 않도록
+한 요청 처리 동안만 값을 보관합니다. 블록 밖(일반 요청)에서는 아무것도 저장하지 않고 매번 계산합니다.
+메모는 GET 하위 요청 사이에서만 쓰므로 블록 안에서 데이터가 바뀌는 경우는 고려하지 않습니다.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Optional
+
+_local = threading.local()
+
+
+@contextmanager
+def request_memo():
+    """블록 동안 메모 활성화 (이미 활성화되어 있으면 바깥 메모를 그대로 사용)"""
+    memo = getattr(_local, 'memo', None)
+    if memo is not None:
+        yield memo
+        return
+    memo = _local.memo = {}
+    try:
+        yield memo
+    finally:
+        _local.memo = None
+
+
+def active_memo() -> Optional[dict]:
+    return getattr(_local, 'memo', None)
+
+
+def memoize(key: Hashable, compute: Callable[[], Any]) -> Any:
+    """메모가 활성화되어 있으면 key로 한 번만 계산 (예외는 저장하지 않음)"""
+    memo = active_memo()
+    if memo is None:
+        return compute()
+    if key not in memo:
+        memo[key] = compute()
+    return memo[key]
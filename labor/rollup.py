@@ -0,0 +1,96 @@
+"""labor/rollup.py
+
+사용자 단위 다중 근로(알바 여러 개) 합산
+
+한 사용자의 모든 Employee에 대해 근로기록/주간 스케줄/월별 스케줄/근로조건 이력을 테이블당 쿼리 1회로 적재하고,
+근로별 월 급여와 전체 합계, 주별 합산 근로시간(주 52시간 확인용)을 한 번에 계산합니다.
+"""
+
+from datetime import timedelta
+from typing import Any, Dict
+
+from .dataset import EmployeeDataset, iter_dates, week_end_of, week_start_of
+from .ledger import build_month_ledger, day_hours, price_payroll
+from .snapshots import month_bounds
+from .terms import terms_for
+
+# 근로기준법 제53조: 1주 40시간 + 연장 12시간
+WEEKLY_HOURS_CAP = 52
+
+ROLLUP_SUM_FIELDS = (
+    'total_hours', 'base_pay', 'holiday_bonus', 'night_bonus', 'overtime_bonus', 'weekly_holiday_pay',
+    'estimated_monthly_pay', 'net_pay',
+)
+
+
+def compute_user_rollup(user, year: int, month: int) -> Dict[str, Any]:
+    from .holidays import get_holidays_for_month
+
+    employees = list(user.employees.all().order_by('id'))
+    month_start, month_end = month_bounds(year, month)
+    span_start, span_end = week_start_of(month_start), week_end_of(month_end)
+    datasets = EmployeeDataset.load_many(employees, span_start, span_end)
+    holiday_dates = {h['date'] for h in get_holidays_for_month(year, month) if h['type'] == 'LEGAL'}
+
+    jobs = []
+    totals = {field: 0 for field in ROLLUP_SUM_FIELDS}
+    weekly_hours = {}  # week_start → {employee_id: hours}
+    for employee in employees:
+        dataset = datasets[employee.pk]
+        ledger = build_month_ledger(employee, year, month, dataset=dataset, holiday_dates=holiday_dates)
+        payroll = price_payroll(ledger, terms_for(employee, dataset))
+        jobs.append({
+            'job_id': employee.pk,
+            'workplace_name': employee.workplace_name,
+            'hourly_wage': payroll['hourly_wage'],
+            'deduction_type': payroll['deduction']['type'],
+            **{field: payroll[field] for field in ROLLUP_SUM_FIELDS},
+            'total_deduction': payroll['deduction']['total_deduction'],
+        })
+        for field in ROLLUP_SUM_FIELDS:
+            totals[field] += payroll[field]
+
+        for d in iter_dates(span_start, span_end):
+            hours, _, _ = day_hours(dataset, d)
+            if hours > 0:
+                per_job = weekly_hours.setdefault(week_start_of(d), {})
+                per_job[employee.pk] = per_job.get(employee.pk, 0.0) + hours
+
+    totals['total_hours'] = round(totals['total_hours'], 1)
+    totals['total_deduction'] = sum(job['total_deduction'] for job in jobs)
+
+    weeks = []
+    week_start = span_start
+    while week_start <= span_end:
+        per_job = weekly_hours.get(week_start, {})
+        combined = round(sum(per_job.values()), 1)
+        weeks.append({
+            'week_start': week_start.isoformat(),
+            'week_end': (week_start + timedelta(days=6)).isoformat(),
+            'total_hours': combined,
+            'by_job': [
+                {'job_id': employee.pk, 'hours': round(per_job.get(employee.pk, 0.0), 1)}
+                for employee in employees
+            ],
+            'over_cap': combined > WEEKLY_HOURS_CAP,
+        })
+        week_start += timedelta(days=7)
+
+    notes = [
+        "근로별 금액은 월별 급여 요약과 같은 기준(실제 기록 우선, 없으면 스케줄)으로 계산되었습니다.",
+        "두 달에 걸친 주의 주휴수당은 월별 요약과 같이 해당 월에도 포함됩니다.",
+    ]
+    if any(w['over_cap'] for w in weeks):
+        notes.append(
+            f"주 {WEEKLY_HOURS_CAP}시간 한도는 사업장별로 적용되지만, 여러 근로를 합산한 근로시간이 "
+            f"{WEEKLY_HOURS_CAP}시간을 넘는 주가 있어 건강 관리에 유의가 필요합니다."
+        )
+
+    return {
+        'month': f"{year}-{month:02d}",
+        'jobs': jobs,
+        'totals': totals,
+        'weeks': weeks,
+        'weekly_hours_cap': WEEKLY_HOURS_CAP,
+        'notes': notes,
+    }
@@ -0,0 +1,346 @@
+"""labor/rows.py
+
+핫 경로 응답 행 (slots dataclass) + 미리 컴파일한 dict 변환기
+
+급여 요약(payroll-summary), 캘린더, 근로기록 목록은 DRF serializer를 거치면 행 × 필드마다 필드 객체의
+get_attribute / to_representation을 호출하고, WorkRecordSerializer는 행마다 스케줄 조회 쿼리를 실행합니다.
+여기의 row 클래스는 serializer와 같은 변환 규칙(IntegerField → int, FloatField → float, 기본값,
+required=False 필드 생략, DateTimeField → 현지 시각 ISO 문자열)을 생성 시점에 한 번 적용하고,
+to_dict는 row 클래스마다 한 번 만들어 둔 함수(dict 리터럴)로 변환합니다.
+?fields=/?omit= 부분 선택은 전체 변환 결과에서 선택하지 않은 키만 빼므로, 요청마다 다른 선택이 와도
+변환 함수는 row 클래스 수만큼만 만들어집니다.
+
+응답 형태의 기준(문서)은 계속 serializers.py의 serializer 정의입니다 (tests_rows.py에서 출력 동일성 확인).
+"""
+
+from dataclasses import dataclass, field, fields as dataclass_fields
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from django.utils import timezone
+
+from .fieldsets import ALL_FIELDS, FieldSelection
+
+
+class _Missing:
+    """값이 없어 응답에서 생략할 필드 (serializer의 required=False, default 없음)"""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'MISSING'
+
+
+MISSING: Any = _Missing()
+
+
+def nested(row_cls, many: bool = False):
+    """중첩 row 필드 (many=True면 row 목록)"""
+    return field(metadata={'row': row_cls, 'many': many})
+
+
+def omittable():
+    """값이 MISSING이면 응답에서 빠지는 필드"""
+    return field(default=MISSING, metadata={'omit_missing': True})
+
+
+@lru_cache(maxsize=None)
+def converter(row_cls):
+    """row → dict 변환 함수를 생성 (row 클래스당 한 번, 전체 필드)
+
+    생성 예:
+        def to_dict(self):
+            d = {'date': self.date, 'source': self.source, ...}
+            if self.hourly_wage is not MISSING:
+                d['hourly_wage'] = self.hourly_wage
+            d['night_hours'] = self.night_hours
+            return d
+    """
+    specs = {f.name: f for f in dataclass_fields(row_cls)}
+    namespace = {'MISSING': MISSING}
+    head: List[str] = []
+    tail: List[str] = []
+    for name in specs:
+        spec = specs[name]
+        value = f'self.{name}'
+        child_cls = spec.metadata.get('row')
+        if child_cls is not None:
+            dump = f'_dump_{name}'
+            namespace[dump] = converter(child_cls)
+            if spec.metadata['many']:
+                value = f'[{dump}(r) for r in {value}]'
+            else:
+                value = f'(None if {value} is None else {dump}({value}))'
+        if spec.metadata.get('omit_missing'):
+            tail.append(f'    if self.{name} is not MISSING:')
+            tail.append(f'        d[{name!r}] = {value}')
+        elif tail:
+            # 생략 가능한 필드 뒤는 순서를 지키기 위해 하나씩 대입
+            tail.append(f'    d[{name!r}] = {value}')
+        else:
+            head.append(f'{name!r}: {value}')
+    source = '\n'.join([
+        'def to_dict(self):',
+        '    d = {' + ', '.join(head) + '}',
+        *tail,
+        '    return d',
+    ])
+    exec(compile(source, f'<rows.{row_cls.__name__}.to_dict>', 'exec'), namespace)
+    return namespace['to_dict']
+
+
+class Row:
+    """slots dataclass 응답 행의 공통 변환"""
+
+    __slots__ = ()
+
+    def to_dict(self, fields: Optional[FieldSelection] = None) -> Dict[str, Any]:
+        """?fields= / ?omit= 선택을 반영한 dict (전체 변환 후 선택하지 않은 키를 뺌)
+
+        중첩 행처럼 비싼 필드는 생성 시점(from_dict 등)에 선택하지 않으면 만들지 않습니다.
+        """
+        fields = fields or ALL_FIELDS
+        full = converter(type(self))(self)
+        if fields.is_all:
+            return full
+        data = {}
+        for name, value in full.items():
+            if not fields.wants(name):
+                continue
+            child = fields.child(name)
+            data[name] = value if child.is_all else child.apply(value)
+        return data
+
+
+# --- serializer 필드와 같은 변환 (None은 그대로 None) ---
+
+def _int(value):
+    return None if value is None else int(value)
+
+
+def _float(value):
+    return None if value is None else float(value)
+
+
+def _bool(value):
+    return None if value is None else bool(value)
+
+
+def _str(value):
+    return None if value is None else str(value)
+
+
+def _date(value):
+    """DateField: date → 'YYYY-MM-DD' (문자열은 그대로)"""
+    if not value:
+        return None
+    return value if isinstance(value, str) else value.isoformat()
+
+
+def _datetime(value):
+    """DateTimeField: 현재 시간대(TIME_ZONE)로 바꾼 ISO 문자열 (UTC는 'Z')"""
+    if not value:
+        return None
+    if isinstance(value, str):
+        return value
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    text = value.isoformat()
+    return text[:-6] + 'Z' if text.endswith('+00:00') else text
+
+
+def _omittable(convert, data, key):
+    value = data.get(key, MISSING)
+    return value if value is MISSING or value is None else convert(value)
+
+
+# --- 급여 요약 (PayrollSummarySerializer) ---
+
+@dataclass(slots=True, kw_only=True)
+class PayrollRow(Row):
+    """일별 급여 상세 내역 (PayrollBreakdownSerializer)"""
+    date: Optional[str]
+    source: Optional[str]
+    hours: Optional[float]
+    is_holiday: Optional[bool]
+    holiday_type: Optional[str]
+    day_pay: Optional[int]
+    holiday_bonus: Optional[int]
+    hourly_wage: Optional[int] = omittable()
+    night_hours: Optional[float] = 0.0
+    night_bonus: Optional[int] = 0
+    overtime_hours: Optional[float] = 0.0
+    overtime_bonus: Optional[int] = 0
+    is_future: Optional[bool] = False
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PayrollRow':
+        return cls(
+            date=_date(data['date']),
+            source=_str(data['source']),
+            hours=_float(data['hours']),
+            is_holiday=_bool(data['is_holiday']),
+            holiday_type=_str(data.get('holiday_type')),
+            day_pay=_int(data['day_pay']),
+            holiday_bonus=_int(data['holiday_bonus']),
+            hourly_wage=_omittable(int, data, 'hourly_wage'),
+            night_hours=_float(data.get('night_hours', 0)),
+            night_bonus=_int(data.get('night_bonus', 0)),
+            overtime_hours=_float(data.get('overtime_hours', 0)),
+            overtime_bonus=_int(data.get('overtime_bonus', 0)),
+            is_future=_bool(data.get('is_future', False)),
+        )
+
+
+@dataclass(slots=True, kw_only=True)
+class PayrollTotals(Row):
+    """월 급여 합계 통계 (PayrollSummaryNestedSerializer)"""
+    base_pay: Optional[int]
+    night_extra: Optional[int]
+    holiday_extra: Optional[int]
+    overtime_extra: Optional[int] = 0
+    weekly_holiday_pay: Optional[int] = 0
+    total: Optional[int]
+    total_hours: Optional[float]
+    scheduled_hours: Optional[float]
+    deduction: Optional[dict] = omittable()
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PayrollTotals':
+        return cls(
+            base_pay=_int(data['base_pay']),
+            night_extra=_int(data['night_extra']),
+            holiday_extra=_int(data['holiday_extra']),
+            overtime_extra=_int(data.get('overtime_extra', 0)),
+            weekly_holiday_pay=_int(data.get('weekly_holiday_pay', 0)),
+            total=_int(data['total']),
+            total_hours=_float(data['total_hours']),
+            scheduled_hours=_float(data['scheduled_hours']),
+            deduction=_omittable(lambda d: {str(k): v for k, v in d.items()}, data, 'deduction'),
+        )
+
+
+@dataclass(slots=True, kw_only=True)
+class PayrollSummary(Row):
+    """월별 급여 집계 및 요약 (PayrollSummarySerializer)"""
+    month: Optional[str]
+    hourly_wage: Optional[int]
+    workplace_size: Optional[str]
+    contract_weekly_hours: Optional[float]
+    total_hours: Optional[float] = 0.0
+    actual_hours: Optional[float] = 0.0
+    scheduled_hours: Optional[float] = 0.0
+    base_pay: Optional[int] = 0
+    holiday_hours: Optional[float] = 0.0
+    holiday_bonus: Optional[int] = 0
+    night_hours: Optional[float] = 0.0
+    night_bonus: Optional[int] = 0
+    overtime_hours: Optional[float] = 0.0
+    overtime_bonus: Optional[int] = 0
+    estimated_monthly_pay: Optional[int] = 0
+    net_pay: Optional[int] = 0
+    summary: Optional[PayrollTotals] = nested(PayrollTotals)
+    rows: List[PayrollRow] = nested(PayrollRow, many=True)
+    notes: Optional[List[str]]
+
+    # 기본값이 있는 최상위 숫자 필드 (이름, 변환)
+    _DEFAULTED = (
+        ('total_hours', _float), ('actual_hours', _float), ('scheduled_hours', _float),
+        ('base_pay', _int), ('holiday_hours', _float), ('holiday_bonus', _int),
+        ('night_hours', _float), ('night_bonus', _int), ('overtime_hours', _float),
+        ('overtime_bonus', _int), ('estimated_monthly_pay', _int), ('net_pay', _int),
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict, fields: Optional[FieldSelection] = None) -> 'PayrollSummary':
+        """get_payroll_summary 결과로 생성 (선택하지 않은 summary/rows는 변환하지 않음)"""
+        fields = fields or ALL_FIELDS
+        summary = data['summary'] if fields.wants('summary') else None
+        rows = data['rows'] if fields.wants('rows') else []
+        notes = data['notes']
+        return cls(
+            month=_str(data['month']),
+            hourly_wage=_int(data['hourly_wage']),
+            workplace_size=_str(data['workplace_size']),
+            contract_weekly_hours=_float(data['contract_weekly_hours']),
+            summary=None if summary is None else PayrollTotals.from_dict(summary),
+            rows=[PayrollRow.from_dict(r) for r in rows],
+            notes=None if notes is None else [_str(n) for n in notes],
+            **{name: convert(data.get(name, 0)) for name, convert in cls._DEFAULTED},
+        )
+
+
+# --- 근로기록 (WorkRecordSerializer) ---
+
+@dataclass(slots=True, kw_only=True)
+class WorkRecordRow(Row):
+    """근로기록 1건 (WorkRecordSerializer와 같은 필드)"""
+    id: int
+    employee: int
+    work_date: Optional[str]
+    time_in: Optional[str]
+    time_out: Optional[str]
+    is_overnight: bool
+    next_day_work_minutes: int
+    break_minutes: int
+    day_type: Optional[str]
+    attendance_type: Optional[str]
+    attendance_status: Optional[str]
+    total_hours: float
+    is_overtime: bool
+    is_night: bool
+    is_holiday: bool
+    is_scheduled_workday: bool
+    schedule_info: dict
+
+    @classmethod
+    def from_record(cls, record, dataset=None) -> 'WorkRecordRow':
+        """dataset(EmployeeDataset)의 스케줄로 소정근로일/스케줄 정보를 채움 (없으면 해당 날짜만 적재)"""
+        if dataset is None:
+            from .dataset import EmployeeDataset
+            dataset = EmployeeDataset.load(record.employee, record.work_date, record.work_date, with_records=False)
+        schedule = dataset.schedule_for(record.work_date)
+        return cls(
+            id=record.pk,
+            employee=record.employee_id,
+            work_date=_date(record.work_date),
+            time_in=_datetime(record.time_in),
+            time_out=_datetime(record.time_out),
+            is_overnight=record.is_overnight,
+            next_day_work_minutes=_int(record.next_day_work_minutes),
+            break_minutes=_int(record.break_minutes),
+            day_type=record.day_type,
+            attendance_type=record.attendance_type,
+            attendance_status=record.attendance_status,
+            total_hours=float(record.get_total_hours()),
+            is_overtime=record.is_overtime,
+            is_night=record.is_night,
+            is_holiday=record.is_holiday,
+            is_scheduled_workday=schedule['is_scheduled'],
+            schedule_info=dict(schedule),
+        )
+
+
+def work_record_rows(records, dataset) -> List[Dict[str, Any]]:
+    """근로기록 목록 → dict 목록 (WorkRecordSerializer(many=True).data와 같은 내용)"""
+    return [converter(WorkRecordRow)(WorkRecordRow.from_record(r, dataset)) for r in records]
+
+
+# --- 캘린더 ---
+
+@dataclass(slots=True, kw_only=True)
+class CalendarDay(Row):
+    """캘린더 날짜 항목 (monthly_scheduled_dates)"""
+    date: str
+    day: int
+    is_scheduled_workday: bool = False
+    is_scheduled: bool = False  # 하위 호환성 (is_scheduled_workday와 같은 값)
+    schedule_source: Optional[str] = None  # "monthly" | "weekly" | None
+    scheduled_start_time: Optional[str] = None
+    scheduled_end_time: Optional[str] = None
+    scheduled_break_minutes: int = 0
+    scheduled_is_overnight: bool = False
+    scheduled_next_day_minutes: int = 0
+    is_worked: bool = False
+    attendance_status: Optional[str] = None
+    record: Optional[WorkRecordRow] = field(default=None, metadata={'row': WorkRecordRow, 'many': False})
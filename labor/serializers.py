@@ -2,7 +2,7 @@
 from rest_framework import serializers
 from datetime import datetime, timedelta
 from decimal import Decimal
-from .models import Employee, WorkRecord, CalculationResult, WorkSchedule, MonthlySchedule
+from .models import Employee, WorkRecord, CalculationResult, WorkSchedule, MonthlySchedule, EmploymentTerms
 
 
 class AnnualLeaveSummarySerializer(serializers.Serializer):
@@ -102,6 +102,19 @@ class EmployeeSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
+class EmployeeSyncSerializer(serializers.ModelSerializer):
+    """변경 피드용 Employee (근로기록/스케줄은 피드에서 따로 전달)"""
+
+    class Meta:
+        model = Employee
+        fields = [
+            'id', 'workplace_name', 'workplace_reg_no',
+            'employment_type', 'is_workplace_over_5', 'start_date',
+            'hourly_rate', 'contract_weekly_hours', 'deduction_type',
+            'attendance_rate_last_year', 'total_wage_last_3m', 'total_days_last_3m'
+        ]
+
+
 class EmployeeUpdateSerializer(serializers.ModelSerializer):
     """Employee 근로정보 수정용 Serializer (PATCH/PUT)"""
 
@@ -121,6 +134,20 @@ class EmployeeUpdateSerializer(serializers.ModelSerializer):
         return value
 
 
+class EmploymentTermsSerializer(serializers.ModelSerializer):
+    """근로조건 이력 행 (적용 시작일부터 다음 행 전날까지)"""
+
+    class Meta:
+        model = EmploymentTerms
+        fields = ['id', 'effective_from', 'hourly_rate', 'contract_weekly_hours', 'deduction_type', 'created_at']
+        read_only_fields = ['id', 'created_at']
+
+    def validate_hourly_rate(self, value):
+        if value < 0:
+            raise serializers.ValidationError("시급은 0 이상이어야 합니다.")
+        return value
+
+
 class CalculationResultSerializer(serializers.ModelSerializer):
     class Meta:
         model = CalculationResult
@@ -135,8 +162,11 @@ class PayrollBreakdownSerializer(serializers.Serializer):
     holiday_type = serializers.CharField(allow_null=True)
     day_pay = serializers.IntegerField()
     holiday_bonus = serializers.IntegerField()
+    hourly_wage = serializers.IntegerField(required=False)  # 해당 날짜에 적용된 시급
     night_hours = serializers.FloatField(required=False, default=0)
     night_bonus = serializers.IntegerField(required=False, default=0)
+    overtime_hours = serializers.FloatField(required=False, default=0)
+    overtime_bonus = serializers.IntegerField(required=False, default=0)
     is_future = serializers.BooleanField(required=False, default=False)
 
 
@@ -145,6 +175,7 @@ class PayrollSummaryNestedSerializer(serializers.Serializer):
     base_pay = serializers.IntegerField()
     night_extra = serializers.IntegerField()
     holiday_extra = serializers.IntegerField()
+    overtime_extra = serializers.IntegerField(required=False, default=0)
     weekly_holiday_pay = serializers.IntegerField(required=False, default=0)
     total = serializers.IntegerField()
     total_hours = serializers.FloatField()
@@ -171,6 +202,8 @@ class PayrollSummarySerializer(serializers.Serializer):
     holiday_bonus = serializers.IntegerField(required=False, default=0)
     night_hours = serializers.FloatField(required=False, default=0)
     night_bonus = serializers.IntegerField(required=False, default=0)
+    overtime_hours = serializers.FloatField(required=False, default=0)
+    overtime_bonus = serializers.IntegerField(required=False, default=0)
     estimated_monthly_pay = serializers.IntegerField(required=False, default=0)
     net_pay = serializers.IntegerField(required=False, default=0)
     
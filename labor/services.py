@@ -7,11 +7,15 @@
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, time
 from decimal import Decimal
+from functools import lru_cache
 from math import floor
 from typing import Optional, Dict, Any, List
 
 
-MIN_WAGE_2025 = 10030  # 2025년 최저임금 (시급)
+def minimum_wage_for(year: int) -> int:
+    """해당 연도 최저임금 (등록 범위 밖 연도는 가장 가까운 연도 값)"""
+    from .law_params import MINIMUM_WAGE, law_param
+    return int(law_param(MINIMUM_WAGE, date(year, 1, 1)))
 
 
 @dataclass
@@ -35,10 +39,11 @@ def calc_service_days(start: date, today: date) -> int:
     return (today - start).days
 
 
-def check_minimum_wage(hourly_rate: float) -> Dict[str, Any]:
+def check_minimum_wage(hourly_rate: float, year: Optional[int] = None) -> Dict[str, Any]:
+    required = minimum_wage_for(year or date.today().year)
     return {
-        "min_wage_ok": hourly_rate >= MIN_WAGE_2025,
-        "min_wage_required": MIN_WAGE_2025,
+        "min_wage_ok": hourly_rate >= required,
+        "min_wage_required": required,
     }
 
 
@@ -67,23 +72,32 @@ def calc_weekly_holiday_pay(weekly_hours: float, hourly_rate: float, work_days_p
     return int(round(pay))
 
 
-def calculate_weekly_holiday_pay_v2(employee, target_date: date) -> Dict[str, Any]:
-    """주휴수당 계산 v2 (사용자 요청 로직)
-    
-    - 계약상 주 소정근로시간 >= 15시간
-    - 해당 주의 소정근로일 개근 (REGULAR_WORK, ANNUAL_LEAVE 인정)
-    - 주휴시간 = 계약상 주 소정근로시간 / 해당 주의 소정근로일 수
-    - 주휴수당 = 주휴시간 * 시급
+@dataclass(frozen=True)
+class WeeklyHolidayFacts:
+    """주휴수당 판정에 필요한 한 주의 근로 사실 (시급/계약조건과 무관)"""
+    week_start: date
+    week_end: date
+    scheduled_hours: Decimal      # 스케줄 기반 주간 예정 시간
+    actual_hours: Decimal         # 실제 근로기록 시간 합계
+    has_scheduled_day: bool       # 소정근로일이 하루라도 있는지
+    is_perfect: bool              # 소정근로일 개근 여부
+
+
+def weekly_holiday_facts(employee, target_date: date, dataset=None) -> WeeklyHolidayFacts:
+    """기준 날짜가 속한 주(월~일)의 주휴수당 판정용 근로 사실 수집
+
+    dataset(EmployeeDataset)이 해당 주를 포함하면 쿼리 없이 메모리에서 계산합니다.
     """
     from .models import WorkRecord
-    from .policy_manager import PolicyManager
-    
-    rules = PolicyManager.get_holiday_pay_rules()
-    min_weekly_hours = Decimal(str(rules.get('min_weekly_hours', 15)))
-    
+
     # 기준 날짜가 속한 주 범위 (월~일)
     start_of_week = target_date - timedelta(days=target_date.weekday())
     end_of_week = start_of_week + timedelta(days=6)
+
+    if dataset is not None and not dataset.covers(start_of_week, end_of_week):
+        dataset = None
+    is_scheduled_workday = dataset.is_scheduled_workday if dataset else employee.is_scheduled_workday
+    get_schedule_for_date = dataset.schedule_for if dataset else employee.get_schedule_for_date
     
     # 주간 소정근로일 및 시간 정보 수집
     # 소정근로일 목록 수집 및 개근 체크
@@ -92,10 +106,10 @@ def calculate_weekly_holiday_pay_v2(employee, target_date: date) -> Dict[str, An
     
     current_date = start_of_week
     while current_date <= end_of_week:
-        if employee.is_scheduled_workday(current_date):
+        if is_scheduled_workday(current_date):
             scheduled_dates.append(current_date)
             # 스케줄 기반 예정 시간
-            s_info = employee.get_schedule_for_date(current_date)
+            s_info = get_schedule_for_date(current_date)
             if s_info['start_time'] and s_info['end_time']:
                 dummy_date = date(2000, 1, 1)
                 dt_start = datetime.combine(dummy_date, s_info['start_time'])
@@ -110,7 +124,10 @@ def calculate_weekly_holiday_pay_v2(employee, target_date: date) -> Dict[str, An
         current_date += timedelta(days=1)
     
     # 실제 근로 (추가근무 포함) 확인을 위해 레코드 조회
-    records = WorkRecord.objects.filter(employee=employee, work_date__range=[start_of_week, end_of_week])
+    if dataset:
+        records = dataset.records_between(start_of_week, end_of_week)
+    else:
+        records = WorkRecord.objects.filter(employee=employee, work_date__range=[start_of_week, end_of_week])
     record_map = {r.work_date: r for r in records}
     
     # 실제 근로시간 합계
@@ -118,12 +135,39 @@ def calculate_weekly_holiday_pay_v2(employee, target_date: date) -> Dict[str, An
     for r in records:
         actual_worked_hours += r.get_total_hours()
 
+    # 소정근로일 개근 여부
+    is_perfect = True
+    for sd in scheduled_dates:
+        record = record_map.get(sd)
+        # REGULAR_WORK, ANNUAL_LEAVE, EXTRA_WORK 모두 출근으로 인정
+        if not record or record.attendance_status not in ['REGULAR_WORK', 'ANNUAL_LEAVE', 'EXTRA_WORK']:
+            is_perfect = False
+            break
+
+    return WeeklyHolidayFacts(
+        week_start=start_of_week,
+        week_end=end_of_week,
+        scheduled_hours=weekly_scheduled_hours,
+        actual_hours=actual_worked_hours,
+        has_scheduled_day=bool(scheduled_dates),
+        is_perfect=is_perfect,
+    )
+
+
+def price_weekly_holiday(facts: WeeklyHolidayFacts, hourly_rate, contract_weekly_hours) -> Dict[str, Any]:
+    """근로 사실 + 시급/계약시간으로 주휴수당 산정 (calculate_weekly_holiday_pay_v2의 금액 단계)"""
+    from .law_params import WEEKLY_HOLIDAY_MIN_HOURS, law_param
+
+    start_of_week, end_of_week = facts.week_start, facts.week_end
+    min_weekly_hours = Decimal(str(law_param(WEEKLY_HOLIDAY_MIN_HOURS, end_of_week)))
+    actual_worked_hours = facts.actual_hours
+
     # 총 주간 근로시간 결정 (views.py의 holiday_pay 로직과 동일하게 맞춤)
     # 계약상 시간 우선, 단 실제 근로시간이 더 많아 15시간을 넘기면 그것을 인정
-    is_estimated = employee.contract_weekly_hours is None
+    is_estimated = contract_weekly_hours is None
     
     if not is_estimated:
-        contract_hours = Decimal(str(employee.contract_weekly_hours))
+        contract_hours = Decimal(str(contract_weekly_hours))
         # 계약 15시간 미만이나 실제 15시간 이상이면 인정
         if contract_hours < min_weekly_hours and actual_worked_hours >= min_weekly_hours:
             total_weekly_hours = actual_worked_hours
@@ -131,7 +175,7 @@ def calculate_weekly_holiday_pay_v2(employee, target_date: date) -> Dict[str, An
             total_weekly_hours = contract_hours
     else:
         # 스케줄 vs 실제 중 큰 값
-        total_weekly_hours = max(weekly_scheduled_hours, actual_worked_hours)
+        total_weekly_hours = max(facts.scheduled_hours, actual_worked_hours)
     
     # 조건 1: 15시간 
     if total_weekly_hours < min_weekly_hours:
@@ -141,15 +185,7 @@ def calculate_weekly_holiday_pay_v2(employee, target_date: date) -> Dict[str, An
         }
     
     # 조건 2: 소정근로일 개근 여부
-    is_perfect = True
-    for sd in scheduled_dates:
-        record = record_map.get(sd)
-        # REGULAR_WORK, ANNUAL_LEAVE, EXTRA_WORK 모두 출근으로 인정
-        if not record or record.attendance_status not in ['REGULAR_WORK', 'ANNUAL_LEAVE', 'EXTRA_WORK']:
-            is_perfect = False
-            break
-            
-    if not is_perfect:
+    if not facts.is_perfect:
         return {
             'amount': 0, 'hours': 0, 'reason': 'not_perfect_attendance', 
             'week_start': start_of_week, 'week_end': end_of_week, 'is_eligible': False
@@ -163,7 +199,7 @@ def calculate_weekly_holiday_pay_v2(employee, target_date: date) -> Dict[str, An
     if holiday_hours > 8:
         holiday_hours = Decimal('8')
         
-    amount = int(holiday_hours * employee.hourly_rate)
+    amount = int(holiday_hours * hourly_rate)
     
     return {
         'amount': amount,
@@ -175,9 +211,34 @@ def calculate_weekly_holiday_pay_v2(employee, target_date: date) -> Dict[str, An
     }
 
 
-def get_monthly_holiday_pay_info(employee, year: int, month: int) -> Dict[str, Any]:
-    """월별 주휴수당 정보 요약 (확정분 vs 예정분 구분)"""
+def calculate_weekly_holiday_pay_v2(employee, target_date: date, dataset=None, terms=None) -> Dict[str, Any]:
+    """주휴수당 계산 v2 (사용자 요청 로직)
+    
+    - 계약상 주 소정근로시간 >= 15시간
+    - 해당 주의 소정근로일 개근 (REGULAR_WORK, ANNUAL_LEAVE 인정)
+    - 주휴시간 = 계약상 주 소정근로시간 / 해당 주의 소정근로일 수
+    - 주휴수당 = 주휴시간 * 시급
+
+    근로 사실 수집(weekly_holiday_facts)과 금액 산정(price_weekly_holiday) 두 단계로 나뉩니다.
+    dataset(EmployeeDataset)이 해당 주를 포함하면 쿼리 없이 메모리에서 계산합니다.
+    시급/계약시간은 주휴일(주의 일요일) 기준으로 적용 중인 근로조건(terms: TermsTimeline)을 사용합니다.
+    """
+    from .terms import terms_for
+
+    facts = weekly_holiday_facts(employee, target_date, dataset=dataset)
+    week_terms = (terms or terms_for(employee, dataset)).as_of(facts.week_end)
+    return price_weekly_holiday(facts, week_terms.hourly_rate, week_terms.contract_weekly_hours)
+
+
+def get_monthly_holiday_pay_info(employee, year: int, month: int, dataset=None, week_results=None, terms=None) -> Dict[str, Any]:
+    """월별 주휴수당 정보 요약 (확정분 vs 예정분 구분)
+
+    dataset: 월에 걸친 주 전체를 포함하는 EmployeeDataset (없으면 ORM 조회)
+    week_results: 주 시작일 → 주휴수당 결과 dict. 여러 달을 이어서 계산할 때
+                  두 달에 걸친 주를 한 번만 평가하도록 공유합니다.
+    """
     from django.utils import timezone
+    from .invalidation import cached_result, weekly_holiday_key
     today = timezone.localdate()
     
     start_date = date(year, month, 1)
@@ -190,6 +251,10 @@ def get_monthly_holiday_pay_info(employee, year: int, month: int) -> Dict[str, A
     _, last_day = calendar.monthrange(year, month)
     end_of_month = date(year, month, last_day)
     
+    if dataset is not None and not dataset.covers(current_week_start, end_of_month + timedelta(days=6 - end_of_month.weekday())):
+        dataset = None
+    is_scheduled_workday = dataset.is_scheduled_workday if dataset else employee.is_scheduled_workday
+
     while current_week_start <= end_of_month:
         week_end = current_week_start + timedelta(days=6)
         
@@ -207,13 +272,23 @@ def get_monthly_holiday_pay_info(employee, year: int, month: int) -> Dict[str, A
             has_scheduled_day = False
             temp_date = current_week_start
             while temp_date <= week_end:
-                if employee.is_scheduled_workday(temp_date):
+                if is_scheduled_workday(temp_date):
                     has_scheduled_day = True
                     break
                 temp_date += timedelta(days=1)
             
             if has_scheduled_day:
-                res = calculate_weekly_holiday_pay_v2(employee, current_week_start)
+                # 전월/익월에 걸친 주는 양쪽 월에서 조회되므로 주 단위 결과 캐시 사용
+                week = current_week_start
+                if week_results is not None:
+                    if week not in week_results:
+                        week_results[week] = calculate_weekly_holiday_pay_v2(employee, week, dataset=dataset, terms=terms)
+                    res = week_results[week]
+                else:
+                    res = cached_result(
+                        employee, weekly_holiday_key(week),
+                        lambda: calculate_weekly_holiday_pay_v2(employee, week, dataset=dataset, terms=terms)
+                    )
                 
                 # 확정 여부: 주의 일요일(week_end)이 오늘 이전이면 확정
                 is_finished = week_end < today
@@ -285,7 +360,7 @@ def evaluate_labor(job: JobInputs, today: Optional[date] = None) -> Dict[str, An
     service_days = calc_service_days(job.start_date, today)
     service_years = floor(service_days / 365)
 
-    min_wage = check_minimum_wage(job.hourly_rate)
+    min_wage = check_minimum_wage(job.hourly_rate, today.year)
     weekly_hours = job.weekly_hours or 0
     weekly_holiday_pay = calc_weekly_holiday_pay(weekly_hours, job.hourly_rate, job.work_days_per_week, job.contract_weekly_hours)
     annual_leave_days = calc_annual_leave(job.start_date, job.attendance_rate_last_year, today)
@@ -293,7 +368,7 @@ def evaluate_labor(job: JobInputs, today: Optional[date] = None) -> Dict[str, An
 
     warnings: List[str] = []
     if not min_wage["min_wage_ok"]:
-        warnings.append("최저임금(10,030원) 미달 가능성이 있습니다.")
+        warnings.append(f"{today.year}년 최저임금({min_wage['min_wage_required']:,}원) 미달 가능성이 있습니다.")
     total_weekly_hours = job.contract_weekly_hours if job.contract_weekly_hours is not None else weekly_hours
     if total_weekly_hours >= 15 and weekly_holiday_pay == 0:
         warnings.append("주 15시간 이상 근무 시 주휴수당 지급이 필요합니다.")
@@ -538,7 +613,25 @@ from datetime import date, timedelta, time
 from django.utils import timezone
 from .models import WorkSchedule, WorkRecord, MonthlySchedule
 
-def monthly_scheduled_dates(employee, year, month):
+# 일별 스케줄 조회가 필요한 캘린더 필드
+CALENDAR_SCHEDULE_FIELDS = (
+    'is_scheduled_workday', 'is_scheduled', 'schedule_source', 'scheduled_start_time', 'scheduled_end_time',
+    'scheduled_break_minutes', 'scheduled_is_overnight', 'scheduled_next_day_minutes',
+)
+CALENDAR_FIELDS = ('date', 'day') + CALENDAR_SCHEDULE_FIELDS + ('is_worked', 'attendance_status', 'record')
+# calendar/?from=&to= 한 번에 요청할 수 있는 최대 개월 수
+MAX_CALENDAR_MONTHS = 12
+
+
+def _calendar_needs(fields):
+    """(스케줄 필요, 근로기록 항목 필요, 근로기록 적재 필요)"""
+    want_schedule = fields.wants_any(CALENDAR_SCHEDULE_FIELDS)
+    want_record = fields.wants('record')
+    want_attendance = want_record or fields.wants_any(('is_worked', 'attendance_status'))
+    return want_schedule, want_record, want_attendance
+
+
+def monthly_scheduled_dates(employee, year, month, fields=None, dataset=None):
     """
     주어진 월의 각 날짜에 대해 스케줄 여부를 표시하고, 실제 근로기록이 있으면 함께 반환합니다.
 
@@ -547,106 +640,92 @@ def monthly_scheduled_dates(employee, year, month):
     - is_worked: 실제 WorkRecord가 존재하고 시간이 0보다 크면 True
     - schedule_source: "monthly" | "weekly" | None
     - 캘린더 API와 동일한 형식으로 반환하여 프론트엔드에서 일관성 있게 처리
+    - fields(labor/fieldsets.FieldSelection): 날짜 항목 기준 필드 선택.
+      스케줄 필드가 없으면 스케줄 적재를, record가 없으면 근로기록 변환을 건너뜀
+    - 스케줄·근로기록은 EmployeeDataset으로 월 단위 한 번에 적재하고, 항목은 labor/rows.CalendarDay로 만듦
+      (날짜·근로기록마다 스케줄을 조회하지 않음)
+    - dataset: 여러 달을 한 번에 적재한 EmployeeDataset (calendar_months), 없으면 이 달만 적재
     """
-    # 실제 근무 기록 맵
-    work_records = WorkRecord.objects.filter(
-        employee=employee,
-        work_date__year=year,
-        work_date__month=month
-    )
-    records_map = {wr.work_date: wr for wr in work_records}
+    from .dataset import EmployeeDataset, iter_dates
+    from .fieldsets import ALL_FIELDS
+    from .rows import CalendarDay, WorkRecordRow
 
-    cal = calendar.Calendar()
-    month_dates = cal.itermonthdates(year, month)
-    scheduled_dates_data = []
-    
-    # Serializer import (circular import 방지 위해 함수 내부 import 권장)
-    from .serializers import WorkRecordSerializer
+    fields = fields or ALL_FIELDS
+    want_schedule, want_record, want_attendance = _calendar_needs(fields)
 
-    for dt in month_dates:
-        if dt.month != month:
-            continue
+    first_day = date(year, month, 1)
+    last_day = date(year, month, calendar.monthrange(year, month)[1])
+    if dataset is None and (want_schedule or want_attendance):
+        dataset = EmployeeDataset.load(employee, first_day, last_day, with_records=want_attendance)
+
+    scheduled_dates_data = []
+    for dt in iter_dates(first_day, last_day):
+        day = CalendarDay(date=dt.isoformat(), day=dt.day)
 
-        record = records_map.get(dt)
-        weekday = dt.weekday()
-        
         # 1. 소정근로일 여부 및 스케줄 소스 판정 (근무 시작일 이후여야 함)
-        is_scheduled_workday = False
-        schedule_source = None  # "monthly" | "weekly" | None
-        scheduled_start_time = None
-        scheduled_end_time = None
-        scheduled_break_minutes = 0
-        scheduled_is_overnight = False
-        scheduled_next_day_minutes = 0
-        
-        # 시작일 이전이면 스케줄링 건너뜀
-        if dt >= employee.start_date:
-            # 월별 스케줄 확인 (최우선)
-            monthly_schedule = MonthlySchedule.objects.filter(
-                employee=employee,
-                year=year,
-                month=month,
-                weekday=weekday,
-                enabled=True
-            ).first()
-            
-            if monthly_schedule:
+        if want_schedule and dt >= employee.start_date:
+            schedule = dataset.monthly.get((year, month, dt.weekday()))
+            if schedule is not None:
                 # 월별 스케줄이 존재하면, 시간이 있든 없든 이것을 최종 스케줄로 간주 (fallback 하지 않음)
-                schedule_source = "monthly"
-                if monthly_schedule.start_time and monthly_schedule.end_time:
-                    is_scheduled_workday = True
-                    scheduled_start_time = monthly_schedule.start_time.strftime('%H:%M')
-                    scheduled_end_time = monthly_schedule.end_time.strftime('%H:%M')
-                    scheduled_break_minutes = monthly_schedule.break_minutes
-                    scheduled_is_overnight = monthly_schedule.is_overnight
-                    scheduled_next_day_minutes = monthly_schedule.next_day_work_minutes
-                else:
-                    # 시간이 없는 월별 스케줄 = 명시적 근무 없음
-                    is_scheduled_workday = False
+                # 시간이 없는 월별 스케줄 = 명시적 근무 없음
+                day.schedule_source = "monthly"
             else:
-                # 월별 스케줄이 없을 때만 주간 스케줄 확인 (fallback)
-                weekly_schedule = WorkSchedule.objects.filter(
-                    employee=employee,
-                    weekday=weekday,
-                    enabled=True
-                ).first()
-                
-                if weekly_schedule and weekly_schedule.start_time and weekly_schedule.end_time:
-                    is_scheduled_workday = True
-                    schedule_source = "weekly"
-                    scheduled_start_time = weekly_schedule.start_time.strftime('%H:%M')
-                    scheduled_end_time = weekly_schedule.end_time.strftime('%H:%M')
-                    scheduled_break_minutes = weekly_schedule.break_minutes
-                    scheduled_is_overnight = weekly_schedule.is_overnight
-                    scheduled_next_day_minutes = weekly_schedule.next_day_work_minutes
-        
+                # 월별 스케줄이 없을 때만 주간 스케줄 확인 (fallback, 시간이 있어야 소스로 표시)
+                schedule = dataset.weekly.get(dt.weekday())
+                if schedule is not None and schedule.start_time and schedule.end_time:
+                    day.schedule_source = "weekly"
+            if schedule is not None and schedule.start_time and schedule.end_time:
+                day.is_scheduled_workday = day.is_scheduled = True
+                day.scheduled_start_time = schedule.start_time.strftime('%H:%M')
+                day.scheduled_end_time = schedule.end_time.strftime('%H:%M')
+                day.scheduled_break_minutes = schedule.break_minutes
+                day.scheduled_is_overnight = schedule.is_overnight
+                day.scheduled_next_day_minutes = schedule.next_day_work_minutes
+
         # 2. 출결 상태 및 실제 근무 여부
-        attendance_status = None
-        is_worked = False
+        record = dataset.record(dt) if want_attendance else None
         if record:
-            attendance_status = record.attendance_status
+            day.attendance_status = record.attendance_status
             # REGULAR_WORK 또는 EXTRA_WORK는 실제 근무로 간주
-            is_worked = attendance_status in ['REGULAR_WORK', 'EXTRA_WORK'] and record.get_total_hours() > 0
-
-        scheduled_dates_data.append({
-            "date": dt.isoformat(),
-            "day": dt.day,
-            "is_scheduled_workday": is_scheduled_workday,  # 소정근로일 여부
-            "is_scheduled": is_scheduled_workday,  # 하위 호환성
-            "schedule_source": schedule_source,  # "monthly" | "weekly" | None
-            "scheduled_start_time": scheduled_start_time,
-            "scheduled_end_time": scheduled_end_time,
-            "scheduled_break_minutes": scheduled_break_minutes,
-            "scheduled_is_overnight": scheduled_is_overnight,
-            "scheduled_next_day_minutes": scheduled_next_day_minutes,
-            "is_worked": is_worked,
-            "attendance_status": attendance_status,
-            "record": WorkRecordSerializer(record).data if record else None,
-        })
+            day.is_worked = record.attendance_status in ['REGULAR_WORK', 'EXTRA_WORK'] and record.get_total_hours() > 0
+            if want_record:
+                day.record = WorkRecordRow.from_record(record, dataset)
+
+        scheduled_dates_data.append(day.to_dict(fields))
 
     return scheduled_dates_data
 
 
+def calendar_months(employee, first_month, last_month, fields=None):
+    """여러 달의 캘린더 ((year, month) ~ (year, month), 양 끝 포함) → {'YYYY-MM': 날짜 목록}
+
+    기간 전체의 근로기록·스케줄을 EmployeeDataset으로 한 번 적재해 달마다 나눠 쓰므로
+    6~12개월을 미리 받아도 쿼리 수는 한 달과 같습니다.
+    """
+    from .dataset import EmployeeDataset
+    from .fieldsets import ALL_FIELDS
+
+    fields = fields or ALL_FIELDS
+    want_schedule, _, want_attendance = _calendar_needs(fields)
+    (first_year, first_mon), (last_year, last_mon) = first_month, last_month
+
+    dataset = None
+    if want_schedule or want_attendance:
+        dataset = EmployeeDataset.load(
+            employee,
+            date(first_year, first_mon, 1),
+            date(last_year, last_mon, calendar.monthrange(last_year, last_mon)[1]),
+            with_records=want_attendance,
+        )
+
+    months = {}
+    year, month = first_year, first_mon
+    while (year, month) <= (last_year, last_mon):
+        months[f'{year}-{month:02d}'] = monthly_scheduled_dates(employee, year, month, fields=fields, dataset=dataset)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
 def compute_monthly_schedule_stats(employee, year, month):
     """
     월별 근무 통계를 계산합니다.
@@ -658,13 +737,25 @@ def compute_monthly_schedule_stats(employee, year, month):
     
     v5 (2025-01-15): 미래 예정된 근무도 포함하도록 변경
     """
+    stats = compute_month_schedule_totals(employee, year, month)
+    stats.update(compute_this_week_schedule_stats(employee))
+    return stats
+
+
+def compute_month_schedule_totals(employee, year, month, dataset=None):
+    """월별 근무 통계 중 해당 월 합계 부분 (compute_monthly_schedule_stats 참고)
+
+    예상 급여는 날짜별로 그날 적용되는 시급(근로조건 이력)으로 계산합니다.
+    dataset: 근로조건 이력이 적재된 EmployeeDataset (없으면 이력 1회 조회)
+    """
     from django.utils import timezone
+    from .terms import terms_for
     import calendar
     
     # 오늘 날짜
     today = timezone.localdate()
     
-    hourly_rate = float(employee.hourly_rate)
+    terms = terms_for(employee, dataset)
     
     # 해당 월의 마지막 날 계산
     _, last_day = calendar.monthrange(year, month)
@@ -750,17 +841,28 @@ def compute_monthly_schedule_stats(employee, year, month):
 
         if daily_hours > 0:
             total_hours += daily_hours
-            total_salary += Decimal(str(daily_hours)) * Decimal(str(hourly_rate))
+            total_salary += Decimal(str(daily_hours)) * Decimal(str(terms.as_of(current).hourly_rate))
         
         if is_paid_day:
             total_days += 1
             
         current += timedelta(days=1)
 
+    return {
+        "scheduled_total_hours": total_hours,
+        "scheduled_estimated_salary": float(total_salary),
+        "scheduled_work_days": total_days,
+    }
+
+
+def compute_this_week_schedule_stats(employee):
+    """이번 주 통계 계산 (주휴수당 계산용 + 미래 예정 포함, 날짜별 적용 시급)"""
+    from django.utils import timezone
+    from .terms import terms_for
+
+    today = timezone.localdate()
+    terms = terms_for(employee)
 
-    # ============================================================
-    # 이번 주 통계 계산 (주휴수당 계산용 + 미래 예정 포함)
-    # ============================================================
     start_of_week = today - timedelta(days=today.weekday())
     end_of_week = start_of_week + timedelta(days=6)
     
@@ -771,6 +873,7 @@ def compute_monthly_schedule_stats(employee, year, month):
     week_records_map = {wr.work_date: wr for wr in week_records}
     
     total_this_week_hours = 0.0
+    total_this_week_salary = Decimal('0')
     
     curr_week = start_of_week
     while curr_week <= end_of_week:
@@ -815,14 +918,13 @@ def compute_monthly_schedule_stats(employee, year, month):
                         d_hours = max(0.0, (dur - brk) / 60.0)
         
         total_this_week_hours += d_hours
+        if d_hours > 0:
+            total_this_week_salary += Decimal(str(d_hours)) * Decimal(str(terms.as_of(curr_week).hourly_rate))
         curr_week += timedelta(days=1)
 
     return {
-        "scheduled_total_hours": total_hours,
-        "scheduled_estimated_salary": float(total_salary),
-        "scheduled_work_days": total_days,
         "scheduled_this_week_hours": float(total_this_week_hours),
-        "scheduled_this_week_estimated_salary": float(Decimal(str(total_this_week_hours)) * Decimal(str(hourly_rate))),
+        "scheduled_this_week_estimated_salary": float(total_this_week_salary),
     }
 
 
@@ -869,33 +971,44 @@ def compute_monthly_payroll(employee, year, month):
     추가 반영:
     - 휴게구간(break_intervals, break_start/break_end) 우선 적용 (WorkRecord.get_total_hours 내부 반영)
     - 휴일근무(`day_type=HOLIDAY_WORK`) 총 시간 및 금액 집계 (월별 부가 정보 제공)
-    TODO: 야간/연장/주휴 가산은 추후 단계에서 추가
+    - 연장근로(1일 8시간/1주 40시간 초과): 월 첫 주는 전월 기록부터 누적 (labor/overtime.py)
+    TODO: 주휴 가산은 추후 단계에서 추가
     """
+    from .dataset import week_start_of
+    from .overtime import WeeklyOvertimeCounter
+
     hourly_rate = float(employee.hourly_rate or 0)
+    month_start = date(year, month, 1)
 
     records = WorkRecord.objects.filter(
         employee=employee,
-        work_date__year=year,
-        work_date__month=month,
-    )
+        work_date__gte=week_start_of(month_start),
+        work_date__lt=(month_start + timedelta(days=32)).replace(day=1),
+    ).order_by('work_date')
 
     total_hours = 0.0
     total_work_days = 0
     holiday_hours = 0.0
     night_hours = 0.0  # [Fix] Initialize night_hours
+    overtime_hours = 0.0
+    overtime_counter = WeeklyOvertimeCounter()
     for r in records:
         hours = float(r.get_total_hours())
+        is_holiday_work = getattr(r, 'day_type', 'NORMAL') == 'HOLIDAY_WORK'
+        day_overtime_hours = overtime_counter.add(r.work_date, hours, is_holiday_work)
+        if r.work_date < month_start:
+            continue  # 전월 기록은 연장근로 주 누적에만 사용
         if hours > 0:
+            overtime_hours += day_overtime_hours
             total_hours += hours
             total_work_days += 1
-            if getattr(r, 'day_type', 'NORMAL') == 'HOLIDAY_WORK':
+            if is_holiday_work:
                 holiday_hours += hours
             
             # 야간 시간 합산 (v4)
             night_hours += float(r.get_night_hours())
 
     base_hours = max(total_hours - holiday_hours, 0.0)
-    overtime_hours = 0.0
     weekly_holiday_hours = 0.0
 
     is_over_5 = getattr(employee, 'is_workplace_over_5', False)
@@ -936,32 +1049,73 @@ def compute_monthly_payroll(employee, year, month):
     }
 
 
-def calculate_severance_v2(employee) -> Dict[str, Any]:
-    """퇴직금 예상액 계산 (MVP v2)
-    
-    1순위: ROLLING_90D_ACTUAL (최근 90일 실제 임금 / 90)
-    2순위: CONTRACT_ESTIMATE (계약 시간 기반 추정)
-    """
-    from datetime import date, timedelta
-    from decimal import Decimal
+@dataclass(frozen=True)
+class SeveranceFacts:
+    """퇴직금 평균임금 산정용 근로 사실 (최근 90일, 시급/계약조건과 무관)"""
+    today: date
+    start_date: Optional[date]
+    service_days: int
+    worked_days: tuple            # ((근로시간, 야간시간, 일요일 여부), ...) - 근로 상태 기록만
+    weeks: tuple                  # 90일 기간 안에서 끝나는 주의 WeeklyHolidayFacts
+
+
+def severance_facts(employee, today: Optional[date] = None, dataset=None) -> SeveranceFacts:
+    """최근 90일(오늘 제외 어제부터 90일간) 근로 사실 수집"""
     from django.utils import timezone
     from .models import WorkRecord
-    
-    today = timezone.localdate()
+
+    today = today or timezone.localdate()
     start_date = employee.start_date
     if not start_date:
+        return SeveranceFacts(today, None, 0, (), ())
+
+    end_90 = today - timedelta(days=1)
+    start_90 = today - timedelta(days=90)
+    first_week_start = start_90 - timedelta(days=start_90.weekday())
+    if dataset is not None and not dataset.covers(first_week_start, end_90 + timedelta(days=6)):
+        dataset = None
+
+    # 1. 실제 근로 기반 임금 (기본 + 야간/휴일 가산)용 시간
+    if dataset:
+        records = dataset.records_between(start_90, end_90)
+    else:
+        records = WorkRecord.objects.filter(employee=employee, work_date__range=[start_90, end_90])
+    worked_days = []
+    for r in records:
+        if r.attendance_status in ['REGULAR_WORK', 'EXTRA_WORK']:
+            h = r.get_total_hours()
+            if h > 0:
+                worked_days.append((h, r.get_night_hours(), r.work_date.weekday() == 6))
+
+    # 2. 90일 기간에 '종료'된 주들
+    # start_90이 포함된 주의 일요일부터 end_90이 포함된 주의 일요일까지
+    weeks = []
+    curr_week_start = first_week_start
+    while curr_week_start <= end_90:
+        week_end = curr_week_start + timedelta(days=6)
+        # 주의 종료일이 90일 기간 내에 있고, 오늘보다 이전(종료된 주)인 경우
+        if start_90 <= week_end <= end_90:
+            weeks.append(weekly_holiday_facts(employee, curr_week_start, dataset=dataset))
+        curr_week_start += timedelta(days=7)
+
+    return SeveranceFacts(today, start_date, (today - start_date).days, tuple(worked_days), tuple(weeks))
+
+
+def price_severance(facts: SeveranceFacts, hourly_rate, contract_weekly_hours, is_workplace_over_5) -> Dict[str, Any]:
+    """근로 사실 + 시급/계약조건으로 퇴직금 산정 (calculate_severance_v2의 금액 단계)"""
+    if not facts.start_date:
         return {
             'eligible': False, 'severance_pay': 0, 'reason': 'start_date_missing',
             'service_days': 0, 'service_months': 0, 'avg_daily_wage': 0, 'method': 'NONE'
         }
         
-    service_days = (today - start_date).days
+    service_days = facts.service_days
     service_months = round(service_days / 30.41, 1) # 근사치
     
     # 지급 대상 조건
     # 1) 재직 365일 이상
     # 2) 주 소정근로시간 15시간 이상
-    contract_hours = Decimal(str(employee.contract_weekly_hours)) if employee.contract_weekly_hours is not None else Decimal('0')
+    contract_hours = Decimal(str(contract_weekly_hours)) if contract_weekly_hours is not None else Decimal('0')
     
     eligible = True
     reason = ''
@@ -972,49 +1126,29 @@ def calculate_severance_v2(employee) -> Dict[str, Any]:
         eligible = False
         reason = 'hours_under_15'
         
-    hourly_rate = Decimal(str(employee.hourly_rate))
+    hourly_rate = Decimal(str(hourly_rate))
     
     # --- 평균임금 산정 ---
     method = 'ROLLING_90D_ACTUAL'
-    # 최근 90일 (오늘 제외 어제부터 90일간)
-    end_90 = today - timedelta(days=1)
-    start_90 = today - timedelta(days=90)
     
     # 1. 실제 근로 기반 임금 (기본 + 야간/휴일 가산)
-    records = WorkRecord.objects.filter(employee=employee, work_date__range=[start_90, end_90])
-    
     total_earnings_90 = Decimal('0')
-    is_over_5 = employee.is_workplace_over_5
-    
-    for r in records:
-        if r.attendance_status in ['REGULAR_WORK', 'EXTRA_WORK']:
-            h = r.get_total_hours()
-            if h > 0:
-                # 기본급
-                total_earnings_90 += h * hourly_rate
-                if is_over_5:
-                    # 야간 가산
-                    nh = r.get_night_hours()
-                    if nh > 0:
-                        total_earnings_90 += nh * hourly_rate * Decimal('0.5')
-                    # 휴일 가산 (단순화: 일요일이면 휴일로 간주)
-                    if r.work_date.weekday() == 6:
-                        total_earnings_90 += h * hourly_rate * Decimal('0.5')
+    for h, nh, is_sunday in facts.worked_days:
+        # 기본급
+        total_earnings_90 += h * hourly_rate
+        if is_workplace_over_5:
+            # 야간 가산
+            if nh > 0:
+                total_earnings_90 += nh * hourly_rate * Decimal('0.5')
+            # 휴일 가산 (단순화: 일요일이면 휴일로 간주)
+            if is_sunday:
+                total_earnings_90 += h * hourly_rate * Decimal('0.5')
                         
     # 2. 확정 주휴수당 합산
-    from .services import calculate_weekly_holiday_pay_v2
     total_holiday_pay_90 = Decimal('0')
-    
-    # 90일 기간에 '종료'된 주들을 찾음
-    # start_90이 포함된 주의 일요일부터 end_90이 포함된 주의 일요일까지
-    curr_week_start = start_90 - timedelta(days=start_90.weekday())
-    while curr_week_start <= end_90:
-        week_end = curr_week_start + timedelta(days=6)
-        # 주의 종료일이 90일 기간 내에 있고, 오늘보다 이전(종료된 주)인 경우
-        if start_90 <= week_end <= end_90:
-            h_res = calculate_weekly_holiday_pay_v2(employee, curr_week_start)
-            total_holiday_pay_90 += Decimal(str(h_res['amount']))
-        curr_week_start += timedelta(days=7)
+    for week in facts.weeks:
+        h_res = price_weekly_holiday(week, hourly_rate, contract_weekly_hours)
+        total_holiday_pay_90 += Decimal(str(h_res['amount']))
         
     total_wage_90 = total_earnings_90 + total_holiday_pay_90
     avg_daily_wage = total_wage_90 / Decimal('90')
@@ -1046,6 +1180,18 @@ def calculate_severance_v2(employee) -> Dict[str, Any]:
     }
 
 
+def calculate_severance_v2(employee) -> Dict[str, Any]:
+    """퇴직금 예상액 계산 (MVP v2)
+    
+    1순위: ROLLING_90D_ACTUAL (최근 90일 실제 임금 / 90)
+    2순위: CONTRACT_ESTIMATE (계약 시간 기반 추정)
+
+    근로 사실 수집(severance_facts)과 금액 산정(price_severance) 두 단계로 나뉩니다.
+    """
+    facts = severance_facts(employee)
+    return price_severance(facts, employee.hourly_rate, employee.contract_weekly_hours, employee.is_workplace_over_5)
+
+
 def calculate_retirement_pay(employee) -> Dict[str, Any]:
     """퇴직금 계산 (근로기준법 제34조)
     
@@ -1232,7 +1378,126 @@ def calculate_retirement_pay(employee) -> Dict[str, Any]:
         "calculation_details": calculation_details
     }
 
-def compute_payroll_summary(employee, year, month):
+def compute_deductions(deduction_type, gross_pay, notes=None, as_of=None):
+    """공제 계산 (v2.1) - 세전 금액에 대한 예상 공제액 (10원 미만 절사)
+
+    요율은 as_of(기본: 오늘) 기준 법정 파라미터(labor/law_params.py)를 사용합니다.
+    notes 리스트를 넘기면 공제 방식별 안내 문구를 추가합니다.
+    """
+    import math
+    from django.utils import timezone
+    from .law_params import (
+        EMPLOYMENT_INSURANCE_RATE, FREELANCE_TAX_RATE, HEALTH_INSURANCE_RATE, LONG_TERM_CARE_RATE,
+        NATIONAL_PENSION_RATE, law_param,
+    )
+
+    as_of = as_of or timezone.localdate()
+
+    if notes is None:
+        notes = []
+    deduction_summary = {
+        'type': deduction_type, # NONE, FOUR_INSURANCE, FREELANCE
+        'total_deduction': 0,
+        'net_pay': gross_pay,
+        'details': []
+    }
+
+    if deduction_type == 'FOUR_INSURANCE':
+        pension_rate = law_param(NATIONAL_PENSION_RATE, as_of)
+        health_rate = law_param(HEALTH_INSURANCE_RATE, as_of)
+        care_rate = law_param(LONG_TERM_CARE_RATE, as_of)
+        employment_rate = law_param(EMPLOYMENT_INSURANCE_RATE, as_of)
+        # 국민연금
+        pension = math.floor((gross_pay * pension_rate) / 10) * 10
+        # 건강보험
+        health = math.floor((gross_pay * health_rate) / 10) * 10
+        # 장기요양보험 (건강보험료 대비 비율)
+        care = math.floor((health * care_rate) / 10) * 10
+        # 고용보험
+        employment = math.floor((gross_pay * employment_rate) / 10) * 10
+        
+        total_deduction = pension + health + care + employment
+        deduction_summary['total_deduction'] = total_deduction
+        deduction_summary['net_pay'] = gross_pay - total_deduction
+        deduction_summary['details'] = [
+            {'label': f'국민연금 ({pension_rate * 100:g}%)', 'amount': pension},
+            {'label': f'건강보험 ({health_rate * 100:g}%)', 'amount': health},
+            {'label': f'장기요양 (건보의 {care_rate * 100:g}%)', 'amount': care},
+            {'label': f'고용보험 ({employment_rate * 100:g}%)', 'amount': employment},
+        ]
+        notes.append(f"4대보험료는 예상 요율({as_of.year}년 기준)로 계산되었으며 실제와 다를 수 있습니다.")
+        
+    elif deduction_type == 'FREELANCE':
+        tax_rate = law_param(FREELANCE_TAX_RATE, as_of)
+        tax = math.floor((gross_pay * tax_rate) / 10) * 10
+        deduction_summary['total_deduction'] = tax
+        deduction_summary['net_pay'] = gross_pay - tax
+        deduction_summary['details'] = [
+            {'label': f'사업소득세 ({tax_rate * 100:g}%)', 'amount': tax}
+        ]
+        notes.append(f"프리랜서(사업소득) {tax_rate * 100:g}% 원천징수 기준으로 계산되었습니다.")
+        
+    else:
+        # 미선택
+        notes.append("현재 공제 방식이 선택되지 않아 세전 기준 급여로 계산되었습니다.")
+        notes.append("정확한 실수령액을 알고 싶다면 근로정보 수정에서 공제 방식을 선택해주세요.")
+
+    return deduction_summary
+
+
+@lru_cache(maxsize=256)
+def _scheduled_night_hours(st, et, is_overnight, next_day_mins):
+    """스케줄 기반 야간 근로 시간 계산 (같은 스케줄은 한 번만 계산)"""
+    dummy_date = date(2000, 1, 1)
+    dt_start = datetime.combine(dummy_date, st)
+    dt_end = datetime.combine(dummy_date, et)
+    if dt_end < dt_start or is_overnight:
+         dt_end += timedelta(days=1)
+    
+    overlap_mins = 0
+    curr = dt_start
+    while curr < dt_end:
+        if curr.hour >= 22 or curr.hour < 6:
+            overlap_mins += 1
+        curr += timedelta(minutes=1)
+    
+    total_night_mins = overlap_mins + next_day_mins
+    return total_night_mins / 60.0
+
+
+def record_day_hours(record):
+    """근로기록 하루의 (인정 시간, 야간 시간, source) - 근로 상태가 아니면 0시간"""
+    if record.attendance_status in ['REGULAR_WORK', 'EXTRA_WORK']:
+        return float(record.get_total_hours()), float(record.get_night_hours()), 'actual'
+    return 0.0, 0.0, 'none'
+
+
+def scheduled_day_hours(schedule_info):
+    """스케줄 하루의 (예정 시간, 야간 시간)"""
+    if not schedule_info or not schedule_info['is_scheduled']:
+        return 0.0, 0.0
+    st = schedule_info['start_time']
+    et = schedule_info['end_time']
+    br = schedule_info['break_minutes']
+    is_ov = schedule_info.get('is_overnight', False)
+    nm = schedule_info.get('next_day_work_minutes', 0)
+    if not (st and et):
+        return 0.0, 0.0
+
+    dummy_date = date(2000, 1, 1)
+    dt_start = datetime.combine(dummy_date, st)
+    dt_end = datetime.combine(dummy_date, et)
+    if dt_end < dt_start or is_ov:
+         dt_end += timedelta(days=1)
+    
+    diff = (dt_end - dt_start).total_seconds() / 3600.0
+    hours = max(0.0, diff - (br / 60.0))
+    
+    # 야간 시간 계산
+    return hours, _scheduled_night_hours(st, et, is_ov, nm)
+
+
+def compute_payroll_summary(employee, year, month, dataset=None, holiday_dates=None, week_results=None):
     """월별 급여 집계 및 요약 서비스 (v3 - 복구 및 교정)
     
     계산 로직:
@@ -1242,9 +1507,17 @@ def compute_payroll_summary(employee, year, month):
     - 인정 기준:
         - '오늘' 이전(오늘 포함)의 기록만 '총 인정 시간' 및 '실제 근로 시간'에 포함.
         - '오늘' 이후의 예정 기록은 '예정 근로 시간' 및 '급여 예상액'에만 합산.
+
+    - 연장근로(labor/overtime.py): 월 첫 주는 전월 날짜부터 주 40시간 누적을 이어서 판정
+      (전월 날짜는 일요일과 holiday_dates에 있는 날만 휴일로 봄)
+
+    여러 달을 이어서 계산할 때(compute_payroll_year)는 미리 적재한 dataset,
+    법정 공휴일 날짜(holiday_dates), 주휴수당 주별 결과(week_results)를 넘겨받습니다.
     """
+    from .dataset import week_start_of
     from .holidays import get_holidays_for_month
     from .models import WorkRecord
+    from .overtime import WeeklyOvertimeCounter
     from datetime import date, datetime, timedelta
     from django.utils import timezone
     import calendar
@@ -1255,13 +1528,24 @@ def compute_payroll_summary(employee, year, month):
     start_date = date(year, month, 1)
     _, last_day = calendar.monthrange(year, month)
     end_date = date(year, month, last_day)
+    # 연장근로 주 누적용: 월 첫 주의 월요일부터 순회
+    span_start = week_start_of(start_date)
         
-    holidays = get_holidays_for_month(year, month)
-    holiday_dates = {h['date'] for h in holidays if h['type'] == 'LEGAL'}
+    if holiday_dates is None:
+        holidays = get_holidays_for_month(year, month)
+        holiday_dates = {h['date'] for h in holidays if h['type'] == 'LEGAL'}
     
     # 1. 실제 근로기록 가져오기
-    work_records_queryset = employee.work_records.filter(work_date__range=[start_date, end_date])
-    work_record_map = {wr.work_date: wr for wr in work_records_queryset}
+    if dataset is not None and dataset.covers(span_start, end_date):
+        work_record_map = {wr.work_date: wr for wr in dataset.records_between(span_start, end_date)}
+        is_scheduled_workday = dataset.is_scheduled_workday
+        get_schedule_for_date = dataset.schedule_for
+    else:
+        dataset = None
+        work_records_queryset = employee.work_records.filter(work_date__range=[span_start, end_date])
+        work_record_map = {wr.work_date: wr for wr in work_records_queryset}
+        is_scheduled_workday = employee.is_scheduled_workday
+        get_schedule_for_date = employee.get_schedule_for_date
     
     total_hours = 0.0
     actual_hours = 0.0
@@ -1271,32 +1555,20 @@ def compute_payroll_summary(employee, year, month):
     holiday_hours = 0
     night_hours = 0.0
     night_bonus = 0
-    
-    hourly_wage = int(employee.hourly_rate)
+    overtime_hours = 0.0
+    overtime_bonus = 0
+    overtime_counter = WeeklyOvertimeCounter()
+    
+    # 근로조건 이력: 날짜별 시급, 월말 기준 공제 방식/계약시간
+    from .terms import terms_for
+    terms = terms_for(employee, dataset)
+    month_terms = terms.as_of(end_date)
+    hourly_wage = int(month_terms.hourly_rate)
     breakdown = []
     notes = []  # Initialize notes early
     
-    # 야간 수당 계산을 위한 헬퍼 함수 (Scheduled 용)
-    def calculate_scheduled_night_hours(st, et, is_overnight, next_day_mins):
-        """스케줄 기반 야간 근로 시간 계산"""
-        dummy_date = date(2000, 1, 1)
-        dt_start = datetime.combine(dummy_date, st)
-        dt_end = datetime.combine(dummy_date, et)
-        if dt_end < dt_start or is_overnight:
-             dt_end += timedelta(days=1)
-        
-        overlap_mins = 0
-        curr = dt_start
-        while curr < dt_end:
-            if curr.hour >= 22 or curr.hour < 6:
-                overlap_mins += 1
-            curr += timedelta(minutes=1)
-        
-        total_night_mins = overlap_mins + next_day_mins
-        return total_night_mins / 60.0
-
-    # 해당 월의 모든 날짜 순회
-    curr = start_date
+    # 해당 월의 모든 날짜 순회 (월 첫 주의 전월 날짜는 연장근로 누적에만 사용)
+    curr = span_start
     while curr <= end_date:
         hours = 0.0
         day_night_hours = 0.0
@@ -1315,50 +1587,36 @@ def compute_payroll_summary(employee, year, month):
             
         if record:
             # 실제 기록이 있는 경우 (출결 상태가 근로인 경우만)
-            if record.attendance_status in ['REGULAR_WORK', 'EXTRA_WORK']:
-                hours = float(record.get_total_hours())
-                day_night_hours = float(record.get_night_hours())
-                source = 'actual'
-        else:
+            hours, day_night_hours, source = record_day_hours(record)
+        elif is_scheduled_workday(curr):
             # 실제 기록이 없는 경우 스케줄 확인
-            if employee.is_scheduled_workday(curr):
-                source = 'scheduled'
-                schedule_info = employee.get_schedule_for_date(curr)
-                if schedule_info and schedule_info['is_scheduled']:
-                    # 시간 계산
-                    st = schedule_info['start_time']
-                    et = schedule_info['end_time']
-                    br = schedule_info['break_minutes']
-                    is_ov = schedule_info.get('is_overnight', False)
-                    nm = schedule_info.get('next_day_work_minutes', 0)
-                    
-                    if st and et:
-                        dummy_date = date(2000, 1, 1)
-                        dt_start = datetime.combine(dummy_date, st)
-                        dt_end = datetime.combine(dummy_date, et)
-                        if dt_end < dt_start or is_ov:
-                             dt_end += timedelta(days=1)
-                        
-                        diff = (dt_end - dt_start).total_seconds() / 3600.0
-                        hours = max(0.0, diff - (br / 60.0))
-                        
-                        # 야간 시간 계산
-                        day_night_hours = calculate_scheduled_night_hours(st, et, is_ov, nm)
+            source = 'scheduled'
+            hours, day_night_hours = scheduled_day_hours(get_schedule_for_date(curr))
+
+        day_overtime_hours = overtime_counter.add(curr, hours, is_holiday)
+        if curr < start_date:
+            curr += timedelta(days=1)
+            continue
         
         # 통계 합산 (인정 기준 적용)
         if hours > 0:
-            day_pay = int(hours * hourly_wage)
+            day_wage = int(terms.as_of(curr).hourly_rate)
+            day_pay = int(hours * day_wage)
             day_holiday_bonus = 0
             day_night_bonus = 0
+            day_overtime_bonus = 0
             
             # 5인 이상 사업장인 경우 가산수당 적용
             if employee.is_workplace_over_5:
                 # 휴일 가산수당 50%
                 if is_holiday:
-                    day_holiday_bonus = int(hours * hourly_wage * 0.5)
+                    day_holiday_bonus = int(hours * day_wage * 0.5)
                 # 야간 가산수당 50%
                 if day_night_hours > 0:
-                    day_night_bonus = int(day_night_hours * hourly_wage * 0.5)
+                    day_night_bonus = int(day_night_hours * day_wage * 0.5)
+                # 연장 가산수당 50% (야간/휴일 가산과 중복 적용)
+                if day_overtime_hours > 0:
+                    day_overtime_bonus = int(day_overtime_hours * day_wage * 0.5)
             
             # 미래 날짜도 집계에 포함 (사용자 요청: 예정된 근무도 통계 및 예상 급여에 반영)
             # if curr <= today:  <-- 조건 제거
@@ -1373,6 +1631,8 @@ def compute_payroll_summary(employee, year, month):
             holiday_bonus += day_holiday_bonus
             night_hours += day_night_hours
             night_bonus += day_night_bonus
+            overtime_hours += day_overtime_hours
+            overtime_bonus += day_overtime_bonus
             if is_holiday:
                 holiday_hours += hours
             
@@ -1381,12 +1641,15 @@ def compute_payroll_summary(employee, year, month):
                 "date": curr.isoformat(),
                 "source": source,
                 "hours": round(hours, 1),
+                "hourly_wage": day_wage,
                 "night_hours": round(day_night_hours, 1),
                 "is_holiday": is_holiday,
                 "holiday_type": holiday_type,
                 "day_pay": day_pay,
                 "holiday_bonus": day_holiday_bonus,
                 "night_bonus": day_night_bonus,
+                "overtime_hours": day_overtime_hours,
+                "overtime_bonus": day_overtime_bonus,
                 "is_future": curr > today
             })
             
@@ -1396,65 +1659,24 @@ def compute_payroll_summary(employee, year, month):
     
     # 주휴수당 계산 (이번 달 전체 예상)
     from .services import get_monthly_holiday_pay_info
-    holiday_pay_info = get_monthly_holiday_pay_info(employee, year, month)
+    holiday_pay_info = get_monthly_holiday_pay_info(
+        employee, year, month, dataset=dataset, week_results=week_results, terms=terms
+    )
     monthly_weekly_holiday_pay = int(holiday_pay_info['estimated_total'])
     
-    total_extra = holiday_bonus + night_bonus
-    # 최종 예상 급여 = 기본급 + 추가수당(야간/휴일) + 주휴수당
+    total_extra = holiday_bonus + night_bonus + overtime_bonus
+    # 최종 예상 급여 = 기본급 + 추가수당(야간/휴일/연장) + 주휴수당
     estimated_monthly_pay = base_pay + total_extra + monthly_weekly_holiday_pay
     
     # 공제 계산 (v2.1)
-    import math
-
-    gross_pay = estimated_monthly_pay
-    deduction_summary = {
-        'type': employee.deduction_type, # NONE, FOUR_INSURANCE, FREELANCE
-        'total_deduction': 0,
-        'net_pay': gross_pay,
-        'details': []
-    }
-
-    if employee.deduction_type == 'FOUR_INSURANCE':
-        # 국민연금 4.5%
-        pension = math.floor((gross_pay * 0.045) / 10) * 10
-        # 건강보험 3.545%
-        health = math.floor((gross_pay * 0.03545) / 10) * 10
-        # 장기요양보험 (건강보험의 12.95%)
-        care = math.floor((health * 0.1295) / 10) * 10
-        # 고용보험 0.9%
-        employment = math.floor((gross_pay * 0.009) / 10) * 10
-        
-        total_deduction = pension + health + care + employment
-        deduction_summary['total_deduction'] = total_deduction
-        deduction_summary['net_pay'] = gross_pay - total_deduction
-        deduction_summary['details'] = [
-            {'label': '국민연금 (4.5%)', 'amount': pension},
-            {'label': '건강보험 (3.545%)', 'amount': health},
-            {'label': '장기요양 (건보의 12.95%)', 'amount': care},
-            {'label': '고용보험 (0.9%)', 'amount': employment},
-        ]
-        notes.append("4대보험료는 예상 요율(2025년 기준)로 계산되었으며 실제와 다를 수 있습니다.")
-        
-    elif employee.deduction_type == 'FREELANCE':
-        # 3.3%
-        tax = math.floor((gross_pay * 0.033) / 10) * 10
-        deduction_summary['total_deduction'] = tax
-        deduction_summary['net_pay'] = gross_pay - tax
-        deduction_summary['details'] = [
-            {'label': '사업소득세 (3.3%)', 'amount': tax}
-        ]
-        notes.append("프리랜서(사업소득) 3.3% 원천징수 기준으로 계산되었습니다.")
-        
-    else:
-        # 미선택
-        notes.append("현재 공제 방식이 선택되지 않아 세전 기준 급여로 계산되었습니다.")
-        notes.append("정확한 실수령액을 알고 싶다면 근로정보 수정에서 공제 방식을 선택해주세요.")
+    deduction_summary = compute_deductions(month_terms.deduction_type, estimated_monthly_pay, notes, as_of=end_date)
 
     # 사용자 요구사항에 맞춘 summary 구조 (v2)
     summary = {
         "base_pay": base_pay,
         "night_extra": night_bonus,
         "holiday_extra": holiday_bonus,
+        "overtime_extra": overtime_bonus,
         "weekly_holiday_pay": monthly_weekly_holiday_pay, 
         "total": estimated_monthly_pay, # 세전 총액
         "total_hours": round(total_hours, 1),
@@ -1469,9 +1691,11 @@ def compute_payroll_summary(employee, year, month):
     ])
     
     if employee.is_workplace_over_5:
-        notes.append("본 급여는 근로기준법(5인 이상 사업장)에 따라 야간근로 및 휴일근로 가산수당이 반영되었습니다.")
+        notes.append("본 급여는 근로기준법(5인 이상 사업장)에 따라 연장·야간·휴일근로 가산수당이 반영되었습니다.")
+        if overtime_hours > 0:
+            notes.append("1일 8시간 또는 1주 40시간을 넘는 근로는 연장근로로 보아 50% 가산했습니다. (근로기준법 제50조, 제56조)")
     else:
-        notes.append("본 사업장은 5인 미만 사업장으로 야간·휴일 근로에 대한 가산수당이 적용되지 않습니다. (근로기준법 제11조)")
+        notes.append("본 사업장은 5인 미만 사업장으로 연장·야간·휴일 근로에 대한 가산수당이 적용되지 않습니다. (근로기준법 제11조)")
     
     notes.append("모든 공제 계산은 '예상 계산'이며 실제 급여 및 공제는 사업장/세무 처리 기준에 따라 달라질 수 있습니다.")
 
@@ -1479,15 +1703,17 @@ def compute_payroll_summary(employee, year, month):
         "month": f"{year}-{month:02d}",
         "hourly_wage": hourly_wage,
         "workplace_size": "GE_5" if employee.is_workplace_over_5 else "LT_5",
-        "contract_weekly_hours": float(employee.contract_weekly_hours) if employee.contract_weekly_hours else None,
+        "contract_weekly_hours": float(month_terms.contract_weekly_hours) if month_terms.contract_weekly_hours else None,
         "total_hours": round(total_hours, 1),
         "actual_hours": round(actual_hours, 1),
         "scheduled_hours": round(scheduled_hours, 1),
         "holiday_hours": round(holiday_hours, 1),
         "night_hours": round(night_hours, 1),
+        "overtime_hours": round(overtime_hours, 1),
         "base_pay": base_pay,
         "holiday_bonus": holiday_bonus,
         "night_bonus": night_bonus,
+        "overtime_bonus": overtime_bonus,
         "monthly_weekly_holiday_pay": monthly_weekly_holiday_pay, 
         "estimated_monthly_pay": estimated_monthly_pay, # 세전
         "net_pay": deduction_summary['net_pay'], # 세후 (최상위에도 노출)
@@ -1495,3 +1721,109 @@ def compute_payroll_summary(employee, year, month):
         "rows": breakdown, 
         "notes": notes
     }
+
+
+PAYROLL_YEAR_SUM_FIELDS = (
+    'total_hours', 'actual_hours', 'scheduled_hours', 'holiday_hours', 'night_hours', 'overtime_hours',
+    'base_pay', 'holiday_bonus', 'night_bonus', 'overtime_bonus',
+)
+
+
+def compute_payroll_year(employee, year):
+    """연간 급여 집계 (연간 소득 요약)
+
+    - 근로기록/스케줄은 1월 첫 주 ~ 12월 마지막 주 범위를 한 번에 적재
+    - 공휴일은 연도 단위로 한 번 조회
+    - 두 달에 걸친 주의 주휴수당은 한 번만 평가하여 양쪽 달에서 재사용
+    월별 결과는 compute_payroll_summary와 동일합니다.
+    연간 합계의 주휴수당은 주마다 한 번, 주휴일(주 마지막 날)이 속한 달에 계상하므로(back_pay와 같은 기준)
+    세전/공제/세후 합계는 그렇게 계상한 월 금액으로 다시 계산하며 월별 합계와 다를 수 있습니다.
+    최상위 hourly_wage/deduction.type은 연말 기준 근로조건이며, 월별 값은 months에 있습니다.
+    """
+    from .dataset import EmployeeDataset, week_end_of, week_start_of
+    from .holidays import get_holidays_for_year
+    from .terms import terms_for
+
+    dataset = EmployeeDataset.load(employee, week_start_of(date(year, 1, 1)), week_end_of(date(year, 12, 31)))
+    holidays_by_month = get_holidays_for_year(year)
+    week_results = {}
+
+    months = []
+    totals = {field: 0 for field in PAYROLL_YEAR_SUM_FIELDS}
+    for month in range(1, 13):
+        holiday_dates = {h['date'] for h in holidays_by_month.get(month, []) if h['type'] == 'LEGAL'}
+        summary = compute_payroll_summary(
+            employee, year, month, dataset=dataset, holiday_dates=holiday_dates, week_results=week_results
+        )
+        deduction = summary['summary']['deduction']
+        months.append({
+            'month': summary['month'],
+            'hourly_wage': summary['hourly_wage'],
+            'deduction_type': deduction['type'],
+            'total_hours': summary['total_hours'],
+            'actual_hours': summary['actual_hours'],
+            'scheduled_hours': summary['scheduled_hours'],
+            'holiday_hours': summary['holiday_hours'],
+            'night_hours': summary['night_hours'],
+            'overtime_hours': summary['overtime_hours'],
+            'base_pay': summary['base_pay'],
+            'holiday_bonus': summary['holiday_bonus'],
+            'night_bonus': summary['night_bonus'],
+            'overtime_bonus': summary['overtime_bonus'],
+            'weekly_holiday_pay': summary['monthly_weekly_holiday_pay'],
+            'estimated_monthly_pay': summary['estimated_monthly_pay'],
+            'total_deduction': deduction['total_deduction'],
+            'net_pay': summary['net_pay'],
+            'work_days': len(summary['rows']),
+        })
+        for field in PAYROLL_YEAR_SUM_FIELDS:
+            totals[field] += summary[field]
+
+    # 주휴수당은 주휴일이 속한 달에 한 번만 계상 (다음 해로 끝나는 12월 마지막 주는 다음 해 몫)
+    weekly_by_month = {}
+    for week, res in week_results.items():
+        week_end = week_end_of(week)
+        if week_end.year == year:
+            weekly_by_month[week_end.month] = weekly_by_month.get(week_end.month, 0) + res['amount']
+
+    weekly_holiday_pay = estimated_pay = net_pay = total_deduction = 0
+    deduction_totals = {}
+    for month, row in enumerate(months, start=1):
+        month_weekly = int(weekly_by_month.get(month, 0))
+        gross = row['base_pay'] + row['holiday_bonus'] + row['night_bonus'] + row['overtime_bonus'] + month_weekly
+        _, last_day = calendar.monthrange(year, month)
+        deduction = compute_deductions(row['deduction_type'], gross, as_of=date(year, month, last_day))
+        weekly_holiday_pay += month_weekly
+        estimated_pay += gross
+        net_pay += deduction['net_pay']
+        total_deduction += deduction['total_deduction']
+        for item in deduction['details']:
+            deduction_totals[item['label']] = deduction_totals.get(item['label'], 0) + item['amount']
+
+    for field in ('total_hours', 'actual_hours', 'scheduled_hours', 'holiday_hours', 'night_hours', 'overtime_hours'):
+        totals[field] = round(totals[field], 1)
+    totals['weekly_holiday_pay'] = weekly_holiday_pay
+    totals['estimated_pay'] = estimated_pay
+    totals['net_pay'] = net_pay
+    totals['work_days'] = sum(m['work_days'] for m in months)
+
+    year_end_terms = terms_for(employee, dataset).as_of(date(year, 12, 31))
+    return {
+        'year': year,
+        'hourly_wage': int(year_end_terms.hourly_rate),
+        'workplace_size': "GE_5" if employee.is_workplace_over_5 else "LT_5",
+        'months': months,
+        'totals': totals,
+        'deduction': {
+            'type': year_end_terms.deduction_type,
+            'total_deduction': total_deduction,
+            'details': [{'label': label, 'amount': amount} for label, amount in deduction_totals.items()],
+        },
+        'notes': [
+            "월별 금액은 월별 급여 요약(payroll-summary)과 동일한 기준으로 계산되었습니다.",
+            "두 달에 걸친 주의 주휴수당은 월별 요약에서는 양쪽 달에 각각 포함되지만, "
+            "연간 합계에는 주휴일이 속한 달에 한 번만 포함됩니다.",
+            "연간 공제액은 위 기준으로 계상한 월 금액별 공제액(10원 미만 절사)의 합계입니다.",
+            "시급과 공제 방식은 연말 기준이며, 연중 변경된 경우 월별 값을 확인해주세요.",
+        ],
+    }
@@ -0,0 +1,231 @@
+"""labor/signals.py
+
+근로 데이터 변경 시 data_version 증가 및 영향받는 계산 결과 무효화
+(변경 → 결과 키 매핑은 labor/invalidation.py)
+"""
+
+import threading
+from contextlib import contextmanager
+
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .invalidation import (
+    invalidate,
+    keys_for_dates,
+    keys_for_monthly_schedule,
+    keys_for_terms,
+    keys_for_weekly_schedule,
+    reset_result_cache,
+    touch_employee,
+    work_records_replaced,
+)
+from . import sync
+from .models import Employee, EmploymentTerms, MonthlySchedule, WorkRecord, WorkSchedule
+from .snapshots import invalidate_payroll_snapshots
+from .terms import TERMS_FIELDS, TermsTimeline
+
+# 급여 계산에 영향을 주는 근로조건 필드
+PAY_TERM_FIELDS = ('hourly_rate', 'contract_weekly_hours', 'deduction_type', 'is_workplace_over_5', 'start_date')
+
+
+# 일괄 변경 중인 스레드: 근로기록 시그널은 날짜만 모으고 끝에서 한 번 무효화
+_batch = threading.local()
+
+
+def _employee(employee_id):
+    return Employee.objects.filter(pk=employee_id).first()
+
+
+@contextmanager
+def collect_record_changes(employee):
+    """블록 안의 근로기록 변경(save/delete 시그널)을 모아 블록이 끝날 때 한 번만 무효화
+
+    bulk_create/bulk_update처럼 시그널이 없는 변경은 yield된 집합에 날짜를 직접 추가합니다.
+    블록에서 예외가 나면(트랜잭션 롤백) 무효화하지 않습니다.
+    """
+    dates = set()
+    _batch.dates = dates
+    try:
+        yield dates
+    finally:
+        _batch.dates = None
+    work_records_replaced(employee, dates)
+
+
+@receiver(pre_save, sender=WorkRecord)
+def remember_previous_work_date(sender, instance, **kwargs):
+    instance._previous_work_date = None
+    if instance.pk:
+        instance._previous_work_date = (
+            WorkRecord.objects.filter(pk=instance.pk).values_list('work_date', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=WorkRecord)
+@receiver(post_delete, sender=WorkRecord)
+def work_record_changed(sender, instance, **kwargs):
+    dates = {instance.work_date}
+    previous = getattr(instance, '_previous_work_date', None)
+    if previous:
+        dates.add(previous)
+    collecting = getattr(_batch, 'dates', None)
+    if collecting is not None:
+        collecting.update(dates)
+        return
+    employee = _employee(instance.employee_id)
+    if employee is None:
+        return  # Employee 삭제에 따른 연쇄 삭제
+    touch_employee(employee.pk)
+    invalidate(employee.pk, keys_for_dates(employee, dates))
+
+
+@receiver(post_save, sender=MonthlySchedule)
+@receiver(post_delete, sender=MonthlySchedule)
+def monthly_schedule_changed(sender, instance, **kwargs):
+    employee = _employee(instance.employee_id)
+    if employee is None:
+        return
+    touch_employee(employee.pk)
+    invalidate(employee.pk, keys_for_monthly_schedule(employee, instance.year, instance.month))
+
+
+@receiver(pre_save, sender=WorkSchedule)
+def remember_previous_weekday(sender, instance, **kwargs):
+    instance._previous_weekday = None
+    if instance.pk:
+        instance._previous_weekday = (
+            WorkSchedule.objects.filter(pk=instance.pk).values_list('weekday', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=WorkSchedule)
+@receiver(post_delete, sender=WorkSchedule)
+def weekly_schedule_changed(sender, instance, **kwargs):
+    # 주간 스케줄은 해당 요일을 월별 스케줄로 덮어쓰지 않은 모든 달에 적용됨
+    employee = _employee(instance.employee_id)
+    if employee is None:
+        return
+    weekdays = {instance.weekday}
+    previous = getattr(instance, '_previous_weekday', None)
+    if previous is not None:
+        weekdays.add(previous)
+    touch_employee(employee.pk)
+    invalidate(employee.pk, keys_for_weekly_schedule(employee, weekdays))
+
+
+@receiver(pre_save, sender=Employee)
+def remember_previous_terms(sender, instance, **kwargs):
+    instance._previous_terms = None
+    if instance.pk:
+        instance._previous_terms = (
+            Employee.objects.filter(pk=instance.pk).values(*PAY_TERM_FIELDS).first()
+        )
+
+
+@receiver(post_save, sender=Employee)
+def employee_terms_changed(sender, instance, created, **kwargs):
+    if created:
+        reset_result_cache(instance.pk)
+        return
+    previous = getattr(instance, '_previous_terms', None)
+    if previous is None:
+        return
+    changed = [field for field in PAY_TERM_FIELDS if previous[field] != getattr(instance, field)]
+    if not changed:
+        return
+    if set(changed) <= set(TERMS_FIELDS) and _update_current_terms_row(instance):
+        return  # 이력 행의 시그널이 적용일 이후만 무효화
+    touch_employee(instance.pk)
+    if 'start_date' in changed:
+        # 시작일 변경은 모든 기간의 스케줄 적용 범위를 바꿈
+        reset_result_cache(instance.pk)
+        invalidate_payroll_snapshots(instance.pk)
+    else:
+        invalidate(instance.pk, keys_for_terms(instance))
+
+
+def _update_current_terms_row(employee) -> bool:
+    """근로조건 이력이 있으면 Employee 직접 수정을 오늘 적용 중인 이력 행에 반영"""
+    row = TermsTimeline.load(employee).row_as_of(timezone.localdate())
+    if row is None:
+        return False
+    for field in TERMS_FIELDS:
+        setattr(row, field, getattr(employee, field))
+    row.save()
+    return True
+
+
+@receiver(pre_save, sender=EmploymentTerms)
+def remember_previous_effective_from(sender, instance, **kwargs):
+    instance._previous_effective_from = None
+    if instance.pk:
+        instance._previous_effective_from = (
+            EmploymentTerms.objects.filter(pk=instance.pk).values_list('effective_from', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=EmploymentTerms)
+@receiver(post_delete, sender=EmploymentTerms)
+def employment_terms_changed(sender, instance, **kwargs):
+    employee = _employee(instance.employee_id)
+    if employee is None:
+        return
+    effective_from = instance.effective_from
+    previous = getattr(instance, '_previous_effective_from', None)
+    if previous and previous < effective_from:
+        effective_from = previous
+    # 가장 이른 행은 그 이전 기간에도 적용되므로 전체 기간 무효화
+    earlier_exists = EmploymentTerms.objects.filter(
+        employee_id=employee.pk, effective_from__lt=effective_from
+    ).exclude(pk=instance.pk).exists()
+    touch_employee(employee.pk)
+    invalidate(employee.pk, keys_for_terms(employee, effective_from if earlier_exists else None))
+
+
+@receiver(post_delete, sender=Employee)
+def employee_deleted(sender, instance, **kwargs):
+    reset_result_cache(instance.pk)
+
+
+# --- 동기화 변경 로그 (labor/sync.py) ---
+
+SYNC_MODELS = {
+    WorkRecord: sync.WORK_RECORD,
+    WorkSchedule: sync.WORK_SCHEDULE,
+    MonthlySchedule: sync.MONTHLY_SCHEDULE,
+}
+
+
+def _cascaded(sender, origin) -> bool:
+    """다른 모델(Employee/사용자) 삭제에 따른 연쇄 삭제인지 (상위 객체의 삭제 표시로 충분)"""
+    if origin is None:
+        return False
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return origin_model is not sender
+
+
+@receiver(post_save, sender=WorkRecord)
+@receiver(post_delete, sender=WorkRecord)
+@receiver(post_save, sender=WorkSchedule)
+@receiver(post_delete, sender=WorkSchedule)
+@receiver(post_save, sender=MonthlySchedule)
+@receiver(post_delete, sender=MonthlySchedule)
+def log_sync_change(sender, instance, signal, **kwargs):
+    deleted = signal is post_delete
+    if deleted and _cascaded(sender, kwargs.get('origin')):
+        return
+    user_id = sync.user_id_of_employee(instance.employee_id)
+    if user_id is not None:
+        sync.log_changes(user_id, SYNC_MODELS[sender], [(instance.pk, instance.employee_id, deleted)])
+
+
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+def log_sync_employee(sender, instance, signal, **kwargs):
+    deleted = signal is post_delete
+    if deleted and _cascaded(sender, kwargs.get('origin')):
+        return  # 사용자 삭제: 변경 로그도 함께 삭제됨
+    sync.log_employee(instance, deleted=deleted)
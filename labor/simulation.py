@@ -0,0 +1,135 @@
+"""labor/simulation.py
+
+근로조건 가정(what-if) 시뮬레이션
+
+"시급이 11,000원이 되면?", "4대보험으로 바꾸면?" 같은 질문을 Employee를 수정하지 않고 계산합니다.
+근로 사실(월 원장, 퇴직금 90일 사실)은 한 번만 준비하고,
+시나리오마다 금액 산정 단계(price_*)만 다시 실행합니다.
+"""
+
+import copy
+from datetime import date, timedelta
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional
+
+from django.utils import timezone
+
+from .dataset import EmployeeDataset, week_start_of
+from .ledger import get_month_ledger, price_payroll
+from .terms import PayTerms
+from .models import Employee
+
+MAX_SCENARIOS = 10
+
+
+class SimulationError(ValueError):
+    """시나리오 입력 오류"""
+
+
+def parse_overrides(data: Dict[str, Any]) -> Dict[str, Any]:
+    """요청 본문의 시나리오 → PayTerms 필드 override (검증 포함)"""
+    overrides = {}
+    if 'hourly_rate' in data:
+        try:
+            rate = Decimal(str(data['hourly_rate']))
+        except (InvalidOperation, ValueError):
+            raise SimulationError('hourly_rate must be a number')
+        if not rate.is_finite():  # 'NaN', 'Infinity'도 Decimal로는 파싱됨
+            raise SimulationError('hourly_rate must be a finite number')
+        if rate <= 0:
+            raise SimulationError('hourly_rate must be positive')
+        overrides['hourly_rate'] = rate
+    if 'contract_weekly_hours' in data:
+        value = data['contract_weekly_hours']
+        if value is None:
+            overrides['contract_weekly_hours'] = None
+        else:
+            try:
+                hours = Decimal(str(value))
+            except (InvalidOperation, ValueError):
+                raise SimulationError('contract_weekly_hours must be a number')
+            if not hours.is_finite():
+                raise SimulationError('contract_weekly_hours must be a finite number')
+            if hours < 0 or hours > 168:
+                raise SimulationError('contract_weekly_hours must be between 0 and 168')
+            overrides['contract_weekly_hours'] = hours
+    if 'deduction_type' in data:
+        if data['deduction_type'] not in Employee.DeductionType.values:
+            raise SimulationError(f"deduction_type must be one of {', '.join(Employee.DeductionType.values)}")
+        overrides['deduction_type'] = data['deduction_type']
+    if 'is_workplace_over_5' in data:
+        if not isinstance(data['is_workplace_over_5'], bool):
+            raise SimulationError('is_workplace_over_5 must be a boolean')
+        overrides['is_workplace_over_5'] = data['is_workplace_over_5']
+    return overrides
+
+
+def _annual_leave(employee, terms: PayTerms, year: int, memo: dict) -> Dict[str, Any]:
+    """연차는 금액이 아닌 일수이므로 자격 조건(5인 이상, 주 15시간)이 같으면 결과도 같음"""
+    from .services import calculate_annual_leave_v2
+
+    key = (terms.is_workplace_over_5, terms.contract_weekly_hours)
+    if key not in memo:
+        shadow = copy.copy(employee)  # 저장하지 않는 사본
+        shadow.is_workplace_over_5 = terms.is_workplace_over_5
+        shadow.contract_weekly_hours = terms.contract_weekly_hours
+        memo[key] = calculate_annual_leave_v2(shadow, year)
+    return memo[key]
+
+
+def _evaluate(employee, terms: PayTerms, ledger, this_week, sev_facts, leave_memo, today) -> Dict[str, Any]:
+    from .services import price_severance, price_weekly_holiday
+
+    weekly = price_weekly_holiday(this_week, terms.hourly_rate, terms.contract_weekly_hours) if this_week else None
+    return {
+        'payroll': price_payroll(ledger, terms),
+        'weekly_holiday': weekly,
+        'severance': price_severance(sev_facts, terms.hourly_rate, terms.contract_weekly_hours, terms.is_workplace_over_5),
+        'annual_leave': _annual_leave(employee, terms, today.year, leave_memo),
+    }
+
+
+def simulate(employee, year: int, month: int, scenarios: List[Dict[str, Any]], today: Optional[date] = None) -> Dict[str, Any]:
+    """기준(현재 근로조건) 대비 시나리오별 급여/주휴/퇴직금/연차 비교"""
+    from .services import severance_facts
+
+    if len(scenarios) > MAX_SCENARIOS:
+        raise SimulationError(f'최대 {MAX_SCENARIOS}개의 시나리오까지 비교할 수 있습니다.')
+    parsed = [(s.get('name') or f'scenario_{i + 1}', parse_overrides(s)) for i, s in enumerate(scenarios)]
+
+    today = today or timezone.localdate()
+    base_terms = PayTerms.from_employee(employee)
+
+    # 근로 사실 준비 (시나리오 수와 무관하게 1회)
+    ledger = get_month_ledger(employee, year, month)
+    current_ledger = ledger if (year, month) == (today.year, today.month) else get_month_ledger(employee, today.year, today.month)
+    this_week_start = week_start_of(today)
+    this_week = next((w for w in current_ledger.weeks if w.week_start == this_week_start), None)
+    start_90 = today - timedelta(days=90)
+    sev_dataset = EmployeeDataset.load(employee, week_start_of(start_90), today + timedelta(days=6))
+    sev_facts = severance_facts(employee, today, dataset=sev_dataset)
+    leave_memo = {}
+
+    baseline = _evaluate(employee, base_terms, ledger, this_week, sev_facts, leave_memo, today)
+    results = []
+    for name, overrides in parsed:
+        result = _evaluate(employee, base_terms.with_overrides(**overrides), ledger, this_week, sev_facts, leave_memo, today)
+        result['name'] = name
+        result['overrides'] = {k: (str(v) if isinstance(v, Decimal) else v) for k, v in overrides.items()}
+        result['diff'] = {
+            'estimated_monthly_pay': result['payroll']['estimated_monthly_pay'] - baseline['payroll']['estimated_monthly_pay'],
+            'net_pay': result['payroll']['net_pay'] - baseline['payroll']['net_pay'],
+            'weekly_holiday_pay': result['payroll']['weekly_holiday_pay'] - baseline['payroll']['weekly_holiday_pay'],
+            'severance_pay': result['severance']['severance_pay'] - baseline['severance']['severance_pay'],
+        }
+        results.append(result)
+
+    return {
+        'month': f"{year}-{month:02d}",
+        'baseline': baseline,
+        'scenarios': results,
+        'notes': [
+            "시뮬레이션은 실제 근로정보를 변경하지 않습니다.",
+            "근로기록과 스케줄은 그대로 두고 시급·계약시간·공제 방식·사업장 규모만 바꿔 계산한 예상치입니다.",
+        ],
+    }
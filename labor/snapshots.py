@@ -0,0 +1,135 @@
+"""labor/snapshots.py
+
+마감된 월의 급여 요약 스냅샷 관리
+
+- 월의 마지막 주(주휴일 포함)가 오늘 이전에 끝났으면 '마감된 월'로 보고
+  compute_payroll_summary 결과 전체를 CalculationResult에 불변 스냅샷으로 저장합니다.
+- 이후 조회는 스냅샷에서 바로 응답하고, 해당 월을 건드리는 소급 수정이 있을 때만
+  스냅샷을 삭제(무효화)합니다. 무효화 대상 월은 labor/invalidation.py가 결정합니다.
+"""
+
+import calendar
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import CalculationResult, Employee
+
+PAYROLL_SNAPSHOT_TYPE = 'PAYROLL_MONTH_CLOSE'
+
+
+def month_bounds(year: int, month: int) -> Tuple[date, date]:
+    """해당 월의 첫날과 말일"""
+    _, last_day = calendar.monthrange(year, month)
+    return date(year, month, 1), date(year, month, last_day)
+
+
+def is_month_closed(year: int, month: int, today: Optional[date] = None) -> bool:
+    """월 마감 여부
+
+    월 급여에는 말일이 속한 주의 주휴수당까지 포함되므로,
+    말일이 속한 주의 일요일까지 지나야 결과가 더 이상 바뀌지 않습니다.
+    """
+    today = today or timezone.localdate()
+    _, month_end = month_bounds(year, month)
+    last_week_end = month_end + timedelta(days=6 - month_end.weekday())
+    return last_week_end < today
+
+
+def _law_version_date() -> Optional[date]:
+    """주휴 정책과 법정 파라미터 중 최신 적용 기준일"""
+    from .law_params import LawParameters
+    from .policy_manager import PolicyManager
+
+    dates = []
+    for version in (PolicyManager.get_policy_version(), LawParameters.version()):
+        try:
+            if version:
+                dates.append(date.fromisoformat(version))
+        except ValueError:
+            continue
+    return max(dates) if dates else None
+
+
+def close_month(employee, year: int, month: int) -> Dict[str, Any]:
+    """월 급여 요약을 계산하여 스냅샷으로 저장하고 결과를 반환
+
+    계산 도중 근로 데이터가 바뀌면(data_version 불일치) 저장하지 않고 결과만 반환합니다.
+    """
+    from .services import compute_payroll_summary
+
+    version = Employee.objects.filter(pk=employee.pk).values_list('data_version', flat=True).first()
+    summary = compute_payroll_summary(employee, year, month)
+    if version is None or not is_month_closed(year, month):
+        return summary
+
+    period_start, period_end = month_bounds(year, month)
+    with transaction.atomic():
+        current = (
+            Employee.objects.select_for_update()
+            .filter(pk=employee.pk)
+            .values_list('data_version', flat=True)
+            .first()
+        )
+        if current != version:
+            return summary
+        CalculationResult.objects.update_or_create(
+            employee_id=employee.pk,
+            calculation_type=PAYROLL_SNAPSHOT_TYPE,
+            period_start=period_start,
+            defaults={
+                'period_end': period_end,
+                'expected_base_wage': summary['base_pay'],
+                'expected_total_pay': summary['estimated_monthly_pay'],
+                'detail_json': summary,
+                'law_version_date': _law_version_date(),
+                'data_version': version,
+            },
+        )
+    return summary
+
+
+def get_payroll_summary(employee, year: int, month: int) -> Dict[str, Any]:
+    """월 급여 요약 조회 (마감된 월은 스냅샷, 미래 월은 예측 캐시, 진행 중인 월은 결과 캐시)"""
+    from .invalidation import cached_result, payroll_key
+    from .projections import is_future_month, projected_payroll_summary
+    from .services import compute_payroll_summary
+
+    if is_future_month(year, month):
+        return projected_payroll_summary(employee, year, month)
+    if not is_month_closed(year, month):
+        return cached_result(employee, payroll_key(year, month), lambda: compute_payroll_summary(employee, year, month))
+
+    period_start, _ = month_bounds(year, month)
+    detail = (
+        CalculationResult.objects.filter(
+            employee_id=employee.pk,
+            calculation_type=PAYROLL_SNAPSHOT_TYPE,
+            period_start=period_start,
+        )
+        .values_list('detail_json', flat=True)
+        .first()
+    )
+    if detail is not None:
+        return detail
+    return close_month(employee, year, month)
+
+
+def invalidate_payroll_snapshots(employee_id: int, months: Optional[Iterable[Tuple[int, int]]] = None) -> int:
+    """스냅샷 무효화
+
+    Args:
+        months: (year, month) 목록. None이면 해당 Employee의 모든 스냅샷 삭제
+    Returns:
+        삭제된 스냅샷 수
+    """
+    qs = CalculationResult.objects.filter(employee_id=employee_id, calculation_type=PAYROLL_SNAPSHOT_TYPE)
+    if months is not None:
+        starts = {date(y, m, 1) for y, m in months}
+        if not starts:
+            return 0
+        qs = qs.filter(period_start__in=starts)
+    deleted, _ = qs.delete()
+    return deleted
@@ -0,0 +1,163 @@
+"""labor/streaming.py
+
+스트리밍 응답(StreamingHttpResponse)용 CSV/ZIP/XLSX 기록 도구
+
+- StreamBuffer: zipfile 출력용 쓰기 전용 버퍼. seek할 수 없으므로 zipfile이 data descriptor
+  방식으로 기록하고, 쌓인 바이트는 drain()으로 꺼내 바로 내보냅니다.
+- iter_csv / iter_xlsx: 행 dict 제너레이터 → 바이트 조각 제너레이터
+  XLSX는 공유 문자열 없이(inlineStr) 시트 XML을 행 단위로 기록하는 최소 구성입니다.
+"""
+
+import csv
+import io
+import zipfile
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+from django.utils import timezone
+
+# CSV는 엑셀에서 한글이 깨지지 않도록 BOM 포함 UTF-8
+CSV_ENCODING = 'utf-8-sig'
+# 이 크기 이상 쌓이면 기록 중간에도 내보냄
+FLUSH_BYTES = 64 * 1024
+
+Columns = Sequence[Tuple[str, str]]  # (행 키, 머리글)
+
+
+class StreamBuffer:
+    """zipfile 출력용 쓰기 전용 버퍼 (seek 불가 → zipfile이 스트리밍 모드로 기록)"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        self.size = 0
+        return data
+
+
+def local_datetime(value) -> str:
+    """DateTimeField 값 → 'YYYY-MM-DD HH:MM' (현지 시각, 없으면 빈 문자열)"""
+    if value is None:
+        return ''
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.strftime('%Y-%m-%d %H:%M')
+
+
+def csv_line(values: Iterable[Any]) -> str:
+    out = io.StringIO()
+    csv.writer(out).writerow(values)
+    return out.getvalue()
+
+
+def iter_csv(columns: Columns, rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """CSV 바이트 조각 (FLUSH_BYTES 단위로 모아서 생성)"""
+    chunk = [csv_line(label for _, label in columns).encode(CSV_ENCODING)]
+    size = 0
+    for row in rows:
+        line = csv_line(row[key] for key, _ in columns).encode('utf-8')
+        chunk.append(line)
+        size += len(line)
+        if size >= FLUSH_BYTES:
+            yield b''.join(chunk)
+            chunk, size = [], 0
+    yield b''.join(chunk)
+
+
+def write_csv_entry(zf: zipfile.ZipFile, buffer: StreamBuffer, name: str, columns: Columns,
+                    rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """ZIP 안에 CSV 항목 하나를 기록하면서 FLUSH_BYTES마다 압축된 바이트를 내보냄"""
+    with zf.open(name, 'w') as entry:
+        entry.write(csv_line(label for _, label in columns).encode(CSV_ENCODING))
+        for row in rows:
+            entry.write(csv_line(row[key] for key, _ in columns).encode('utf-8'))
+            if buffer.size >= FLUSH_BYTES:
+                yield buffer.drain()
+    yield buffer.drain()
+
+
+# --- XLSX (SpreadsheetML 최소 구성) ---
+
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_XLSX_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_XLSX_SHEET_TAIL = '</sheetData></worksheet>'
+
+
+def _xlsx_cell(value: Any) -> str:
+    if value is None or value == '':
+        return '<c/>'
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c><v>{value}</v></c>'
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{escape(str(value))}</t></is></c>'
+
+
+def _xlsx_row(values: Iterable[Any]) -> str:
+    return '<row>' + ''.join(_xlsx_cell(v) for v in values) + '</row>'
+
+
+def iter_xlsx(columns: Columns, rows: Iterable[Dict[str, Any]], sheet_name: str = 'Sheet1') -> Iterator[bytes]:
+    """단일 시트 XLSX 바이트 조각 (시트 XML을 행 단위로 압축하며 생성)"""
+    buffer = StreamBuffer()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', _XLSX_CONTENT_TYPES)
+        zf.writestr('_rels/.rels', _XLSX_ROOT_RELS)
+        zf.writestr('xl/workbook.xml', _XLSX_WORKBOOK.format(name=escape(sheet_name, {'"': '&quot;'})))
+        zf.writestr('xl/_rels/workbook.xml.rels', _XLSX_WORKBOOK_RELS)
+        with zf.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+            sheet.write(_XLSX_SHEET_HEAD.encode('utf-8'))
+            sheet.write(_xlsx_row(label for _, label in columns).encode('utf-8'))
+            for row in rows:
+                sheet.write(_xlsx_row(row[key] for key, _ in columns).encode('utf-8'))
+                if buffer.size >= FLUSH_BYTES:
+                    yield buffer.drain()
+            sheet.write(_XLSX_SHEET_TAIL.encode('utf-8'))
+    yield buffer.drain()
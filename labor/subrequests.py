@@ -0,0 +1,119 @@
+"""labor/subrequests.py
+
+여러 GET 요청을 한 번에 처리 (POST /api/batch/)
+
+    POST /api/batch/
+    {"requests": [
+        {"id": "holiday", "path": "/api/labor/employees/3/holiday-pay/"},
+        {"id": "calendar", "path": "/api/labor/jobs/3/calendar/", "params": {"month": "2025-03"}}
+    ]}
+    → {"responses": [{"id": "holiday", "status": 200, "body": {...}}, ...]}
+
+- 하위 요청은 원래 요청의 헤더(Authorization 등)를 그대로 가진 GET 요청으로 만들어 URL의 view를 직접 호출합니다.
+  따라서 인증·권한 확인, get_queryset의 소유자 제한은 하위 요청마다 각 view의 규칙대로 적용됩니다.
+- 모든 하위 요청은 하나의 요청 범위 메모(labor/request_memo.py) 안에서 실행되어
+  Employee, 스케줄·근로기록(EmployeeDataset), 공휴일 조회를 공유합니다.
+- 하위 요청의 실패는 해당 항목의 status/body로만 돌려주고 나머지는 계속 처리합니다.
+- /api/ 아래 경로만, GET만 허용하며 batch 자체는 중첩할 수 없습니다.
+"""
+
+import io
+import json
+import logging
+from typing import Any, Dict, List
+from urllib.parse import urlencode, urlsplit
+
+from django.core.handlers.wsgi import WSGIRequest
+from django.urls import Resolver404, resolve
+from rest_framework.response import Response
+
+from .request_memo import request_memo
+
+logger = logging.getLogger(__name__)
+
+MAX_SUBREQUESTS = 20
+ALLOWED_PREFIX = '/api/'
+
+
+class SubrequestError(Exception):
+    """batch 본문 형식 오류 (400)"""
+
+
+def parse_subrequests(data: Any) -> List[Dict[str, Any]]:
+    """본문 {"requests": [...]} (또는 목록 그대로) 검증"""
+    items = data.get('requests') if isinstance(data, dict) else data
+    if not isinstance(items, list) or not items:
+        raise SubrequestError('requests must be a non-empty list')
+    if len(items) > MAX_SUBREQUESTS:
+        raise SubrequestError(f'at most {MAX_SUBREQUESTS} requests per batch')
+    return items
+
+
+def _error(item_id, status_code: int, message: str) -> Dict[str, Any]:
+    return {'id': item_id, 'status': status_code, 'body': {'error': message}}
+
+
+def _build_request(parent, path: str, query: str) -> WSGIRequest:
+    """원래 요청의 헤더를 유지한 GET 하위 요청"""
+    environ = dict(parent.META)
+    environ.update({
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+        'CONTENT_TYPE': '',
+        'CONTENT_LENGTH': '0',
+        'HTTP_ACCEPT': 'application/json',
+        'wsgi.input': io.BytesIO(b''),
+    })
+    environ.pop('HTTP_IF_NONE_MATCH', None)
+    return WSGIRequest(environ)
+
+
+def _body(response) -> Any:
+    """하위 응답 본문 (JSON 렌더러면 렌더링하지 않고 data 그대로)"""
+    renderer = getattr(response, 'accepted_renderer', None)
+    if isinstance(response, Response) and renderer is not None and renderer.format == 'json':
+        return response.data
+    if hasattr(response, 'render') and not response.is_rendered:
+        response.render()
+    content = b''.join(response.streaming_content) if response.streaming else response.content
+    if response.get('Content-Type', '').startswith('application/json'):
+        return json.loads(content or b'null')
+    return content.decode('utf-8', errors='replace')
+
+
+def run_subrequest(parent, item: Any, index: int, batch_view) -> Dict[str, Any]:
+    if not isinstance(item, dict) or not isinstance(item.get('path'), str):
+        return _error(index, 400, 'each request needs a path')
+    item_id = item.get('id', index)
+    if str(item.get('method', 'GET')).upper() != 'GET':
+        return _error(item_id, 400, 'only GET requests can be batched')
+    params = item.get('params') or {}
+    if not isinstance(params, dict):
+        return _error(item_id, 400, 'params must be an object')
+
+    url = urlsplit(item['path'])
+    if not url.path.startswith(ALLOWED_PREFIX):
+        return _error(item_id, 400, f'path must start with {ALLOWED_PREFIX}')
+    try:
+        match = resolve(url.path)
+    except Resolver404:
+        return _error(item_id, 404, 'not found')
+    if match.func is batch_view:
+        return _error(item_id, 400, 'batch requests cannot be nested')
+
+    query = '&'.join(filter(None, [url.query, urlencode(params, doseq=True)]))
+    request = _build_request(parent, url.path, query)
+    try:
+        response = match.func(request, *match.args, **match.kwargs)
+        body = _body(response)
+    except Exception:
+        logger.exception('batch sub-request failed: %s', item['path'])
+        return _error(item_id, 500, 'internal error')
+    return {'id': item_id, 'status': response.status_code, 'body': body}
+
+
+def run_subrequests(parent, items: List[Any], batch_view) -> List[Dict[str, Any]]:
+    """하위 요청을 순서대로 실행 (요청 범위 메모 공유)"""
+    with request_memo():
+        return [run_subrequest(parent, item, index, batch_view) for index, item in enumerate(items)]
@@ -0,0 +1,174 @@
+"""labor/sync.py
+
+오프라인 지원 클라이언트용 변경 피드 (델타 동기화)
+
+Employee / WorkRecord / WorkSchedule / MonthlySchedule이 바뀔 때마다 사용자별 순번(SyncCounter)을
+하나 올려 SyncChange에 (모델, id, 삭제 여부)를 기록합니다. 객체당 최신 변경 한 행만 유지하므로
+로그 크기는 객체 수를 넘지 않고, 삭제는 deleted=True(툼스톤)로 남습니다.
+
+클라이언트는 받은 token(마지막 순번)을 보관했다가 다음 요청에 since로 보내면
+그 이후 바뀐 객체만 받습니다. since가 없으면(0) 로그 대신 현재 전체 데이터를 보냅니다.
+
+기록 경로:
+- save/delete 시그널 (labor/signals.py)
+- 시그널이 없는 일괄 변경: invalidation.work_records_replaced / monthly_schedule_replaced,
+  terms.sync_employee_terms가 log_* 함수를 호출
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import F
+
+from .models import Employee, MonthlySchedule, SyncChange, SyncCounter, WorkRecord, WorkSchedule
+
+SYNC_PAGE_SIZE = 500
+MAX_SYNC_PAGE_SIZE = 2000
+
+EMPLOYEE, WORK_RECORD, WORK_SCHEDULE, MONTHLY_SCHEDULE = 'employee', 'work_record', 'work_schedule', 'monthly_schedule'
+
+# 응답 키 (모델 → 복수형)
+SECTIONS = {
+    EMPLOYEE: 'employees',
+    WORK_RECORD: 'work_records',
+    WORK_SCHEDULE: 'work_schedules',
+    MONTHLY_SCHEDULE: 'monthly_schedules',
+}
+
+
+class InvalidSyncToken(ValueError):
+    pass
+
+
+# --- 변경 기록 ---
+
+def _allocate(user_id: int, count: int) -> int:
+    """사용자 순번을 count만큼 올리고 새 마지막 순번 반환 (행 잠금으로 동시 요청에도 단조 증가)"""
+    updated = SyncCounter.objects.filter(user_id=user_id).update(last_seq=F('last_seq') + count)
+    if not updated:
+        SyncCounter.objects.get_or_create(user_id=user_id)
+        SyncCounter.objects.filter(user_id=user_id).update(last_seq=F('last_seq') + count)
+    return SyncCounter.objects.filter(user_id=user_id).values_list('last_seq', flat=True).get()
+
+
+def log_changes(user_id: int, model: str, changes: Iterable[Tuple[int, int, bool]]) -> None:
+    """(object_id, employee_id, deleted) 목록을 변경 로그에 기록"""
+    changes = list(changes)
+    if not changes:
+        return
+    with transaction.atomic():
+        last = _allocate(user_id, len(changes))
+        first = last - len(changes) + 1
+        SyncChange.objects.bulk_create(
+            [
+                SyncChange(user_id=user_id, seq=first + i, model=model, object_id=object_id,
+                           employee_id=employee_id, deleted=deleted)
+                for i, (object_id, employee_id, deleted) in enumerate(changes)
+            ],
+            update_conflicts=True,
+            unique_fields=['user', 'model', 'object_id'],
+            update_fields=['seq', 'employee_id', 'deleted'],
+        )
+
+
+def user_id_of_employee(employee_id: int) -> Optional[int]:
+    return Employee.objects.filter(pk=employee_id).values_list('user_id', flat=True).first()
+
+
+def log_employee(employee, deleted: bool = False) -> None:
+    log_changes(employee.user_id, EMPLOYEE, [(employee.pk, employee.pk, deleted)])
+
+
+def log_work_records_on(employee, dates: Iterable) -> None:
+    """시그널 없이 바뀐 근로기록(bulk_create/update)을 날짜로 찾아 기록 (삭제는 시그널이 기록)"""
+    ids = WorkRecord.objects.filter(employee=employee, work_date__in=set(dates)).values_list('pk', flat=True)
+    log_changes(employee.user_id, WORK_RECORD, [(pk, employee.pk, False) for pk in ids])
+
+
+def log_monthly_schedules_of(employee, year: int, month: int) -> None:
+    ids = MonthlySchedule.objects.filter(employee=employee, year=year, month=month).values_list('pk', flat=True)
+    log_changes(employee.user_id, MONTHLY_SCHEDULE, [(pk, employee.pk, False) for pk in ids])
+
+
+# --- 변경 피드 ---
+
+def _serialize(model: str, objects) -> List[Dict[str, Any]]:
+    from .serializers import (
+        EmployeeSyncSerializer, MonthlyScheduleSerializer, WorkRecordSerializer, WorkScheduleSerializer,
+    )
+
+    if model == EMPLOYEE:
+        return EmployeeSyncSerializer(objects, many=True).data
+    if model == WORK_RECORD:
+        return WorkRecordSerializer(objects, many=True).data
+    serializer = WorkScheduleSerializer if model == WORK_SCHEDULE else MonthlyScheduleSerializer
+    return [dict(data, employee=obj.employee_id) for obj, data in zip(objects, serializer(objects, many=True).data)]
+
+
+def _querysets(user) -> Dict[str, Any]:
+    return {
+        EMPLOYEE: Employee.objects.filter(user=user).order_by('pk'),
+        WORK_RECORD: WorkRecord.objects.filter(employee__user=user).select_related('employee').order_by('pk'),
+        WORK_SCHEDULE: WorkSchedule.objects.filter(employee__user=user).order_by('pk'),
+        MONTHLY_SCHEDULE: MonthlySchedule.objects.filter(employee__user=user).order_by('pk'),
+    }
+
+
+def _empty_feed(token: int) -> Dict[str, Any]:
+    return {
+        'token': str(token),
+        'full': False,
+        'has_more': False,
+        'changes': {section: [] for section in SECTIONS.values()},
+        'deleted': {section: [] for section in SECTIONS.values()},
+    }
+
+
+def change_feed(user, since: Optional[str] = None, limit: int = SYNC_PAGE_SIZE) -> Dict[str, Any]:
+    """since(동기화 토큰) 이후의 변경
+
+    반환: {"token": "42", "full": false, "has_more": false,
+           "changes": {"employees": [...], "work_records": [...], ...},
+           "deleted": {"work_records": [12, 13], ...}}
+    has_more가 true면 받은 token으로 바로 다시 요청합니다.
+    """
+    current = SyncCounter.objects.filter(user=user).values_list('last_seq', flat=True).first() or 0
+    try:
+        since_seq = int(since) if since not in (None, '') else 0
+    except (TypeError, ValueError):
+        raise InvalidSyncToken('잘못된 동기화 토큰입니다.')
+    if since_seq < 0 or since_seq > current:
+        raise InvalidSyncToken('잘못된 동기화 토큰입니다.')
+
+    if since_seq == 0:
+        # 첫 동기화: 순번을 먼저 읽고 전체 데이터를 보냄 (그 사이 변경은 다음 동기화에 다시 옴)
+        feed = _empty_feed(current)
+        feed['full'] = True
+        for model, queryset in _querysets(user).items():
+            feed['changes'][SECTIONS[model]] = _serialize(model, list(queryset))
+        return feed
+
+    entries = list(
+        SyncChange.objects.filter(user=user, seq__gt=since_seq).order_by('seq')
+        .values_list('seq', 'model', 'object_id', 'deleted')[:limit + 1]
+    )
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    feed = _empty_feed(entries[-1][0] if entries else since_seq)
+    feed['has_more'] = has_more
+
+    wanted: Dict[str, List[int]] = {model: [] for model in SECTIONS}
+    for _, model, object_id, deleted in entries:
+        if deleted:
+            feed['deleted'][SECTIONS[model]].append(object_id)
+        else:
+            wanted[model].append(object_id)
+    for model, queryset in _querysets(user).items():
+        if not wanted[model]:
+            continue
+        objects = list(queryset.filter(pk__in=wanted[model]))
+        feed['changes'][SECTIONS[model]] = _serialize(model, objects)
+        # 로그 이후 시그널 없이 지워진 객체는 삭제로 알림
+        found = {obj.pk for obj in objects}
+        feed['deleted'][SECTIONS[model]].extend(pk for pk in wanted[model] if pk not in found)
+    return feed
@@ -0,0 +1,109 @@
+"""labor/terms.py
+
+근로조건(시급, 계약시간, 공제 방식)의 적용일 기준 조회
+
+EmploymentTerms 이력을 계산 1회당 한 번만 읽어 TermsTimeline으로 보관하고,
+날짜별 조건은 bisect로 찾습니다. 이력이 없으면 Employee의 현재 값을 전체 기간에 적용합니다.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass, replace
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
+
+from django.utils import timezone
+
+from .models import EmploymentTerms
+
+TERMS_FIELDS = ('hourly_rate', 'contract_weekly_hours', 'deduction_type')
+
+
+@dataclass(frozen=True)
+class PayTerms:
+    """금액 산정에 쓰이는 근로조건"""
+    hourly_rate: Decimal
+    contract_weekly_hours: Optional[Decimal]
+    deduction_type: str
+    is_workplace_over_5: bool
+
+    @classmethod
+    def from_employee(cls, employee) -> 'PayTerms':
+        return cls(
+            hourly_rate=employee.hourly_rate,
+            contract_weekly_hours=employee.contract_weekly_hours,
+            deduction_type=employee.deduction_type,
+            is_workplace_over_5=employee.is_workplace_over_5,
+        )
+
+    def with_overrides(self, **overrides) -> 'PayTerms':
+        return replace(self, **overrides)
+
+    def as_of(self, target_date: date) -> 'PayTerms':
+        """고정 조건 (TermsTimeline과 같은 인터페이스)"""
+        return self
+
+
+class TermsTimeline:
+    """적용 시작일 순으로 정렬된 근로조건 목록"""
+
+    def __init__(self, employee, rows=None):
+        self.employee = employee
+        rows = sorted(rows or [], key=lambda r: r.effective_from)
+        self.rows: List[EmploymentTerms] = rows
+        self._dates = [r.effective_from for r in rows]
+        self._terms = [
+            PayTerms(r.hourly_rate, r.contract_weekly_hours, r.deduction_type, employee.is_workplace_over_5)
+            for r in rows
+        ]
+        self._current = PayTerms.from_employee(employee)
+
+    @classmethod
+    def load(cls, employee) -> 'TermsTimeline':
+        return cls(employee, list(EmploymentTerms.objects.filter(employee=employee)))
+
+    @property
+    def has_history(self) -> bool:
+        return bool(self.rows)
+
+    def index_of(self, target_date: date) -> int:
+        """target_date에 적용되는 행의 위치 (첫 행 이전 날짜는 첫 행)"""
+        return max(bisect_right(self._dates, target_date) - 1, 0)
+
+    def as_of(self, target_date: date) -> PayTerms:
+        if not self._terms:
+            return self._current
+        return self._terms[self.index_of(target_date)]
+
+    def row_as_of(self, target_date: date) -> Optional[EmploymentTerms]:
+        if not self.rows:
+            return None
+        return self.rows[self.index_of(target_date)]
+
+    def is_uniform(self, start: date, end: date) -> bool:
+        """기간 내 조건이 하나뿐인지"""
+        return not self.rows or self.index_of(start) == self.index_of(end)
+
+
+def terms_for(employee, dataset=None) -> TermsTimeline:
+    """dataset에 적재된 이력이 있으면 재사용, 없으면 1회 조회"""
+    if dataset is not None and getattr(dataset, 'terms', None) is not None:
+        return dataset.terms
+    return TermsTimeline.load(employee)
+
+
+def sync_employee_terms(employee, timeline: Optional[TermsTimeline] = None, today: Optional[date] = None) -> None:
+    """Employee의 현재 값(hourly_rate 등)을 오늘 적용 중인 이력 행에 맞춤 (시그널 없이 update)"""
+    from .models import Employee
+    from .sync import log_employee
+
+    today = today or timezone.localdate()
+    timeline = timeline or TermsTimeline.load(employee)
+    row = timeline.row_as_of(today)
+    if row is None:
+        return
+    values = {field: getattr(row, field) for field in TERMS_FIELDS}
+    Employee.objects.filter(pk=employee.pk).update(**values)
+    for field, value in values.items():
+        setattr(employee, field, value)
+    log_employee(employee)
@@ -0,0 +1,110 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from .models import Employee, WorkRecord, WorkSchedule
+from .back_pay import calculate_back_pay
+
+User = get_user_model()
+
+
+class BackPayTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='backpayuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Arrears Cafe',
+            hourly_rate=Decimal('9000'),
+            start_date=date(2022, 1, 3),
+            contract_weekly_hours=20,
+        )
+        for i in range(5):
+            WorkSchedule.objects.create(
+                employee=self.employee, weekday=i,
+                start_time=time(9, 0), end_time=time(13, 0), enabled=True
+            )
+        # 2022-01-03 ~ 2025-01-14 평일 하루 4시간 근로기록 (3년 이상)
+        records = []
+        day = date(2022, 1, 3)
+        while day <= date(2025, 1, 14):
+            if day.weekday() < 5:
+                records.append(WorkRecord(
+                    employee=self.employee, work_date=day,
+                    time_in=datetime.combine(day, time(9, 0)), time_out=datetime.combine(day, time(13, 0)),
+                    attendance_status='REGULAR_WORK'
+                ))
+            day += timedelta(days=1)
+        WorkRecord.objects.bulk_create(records)
+        self.today = date(2025, 1, 15)
+
+    def test_monthly_ledger_over_full_history(self):
+        with self.assertNumQueries(4):
+            result = calculate_back_pay(self.employee, today=self.today)
+        self.assertEqual(result['period'], {'start': '2022-01-03', 'end': '2025-01-14'})
+        months = result['months']
+        self.assertEqual((months[0]['month'], months[-1]['month']), ('2022-01', '2025-01'))
+        self.assertEqual(len(months), 37)
+
+        # 2022-01: 21일 × 4시간, 최저임금 9,160원 - 시급 9,000원
+        jan = months[0]
+        self.assertEqual(jan['total_hours'], 84.0)
+        self.assertEqual(jan['paid'], 84 * 9000)
+        self.assertEqual(jan['minimum_wage'], 84 * 160)
+        # 일요일이 1월인 완료된 주 4개 × 주휴 4시간 × 9,160원
+        self.assertEqual(jan['weekly_holiday_pay'], 4 * 4 * 9160)
+        self.assertEqual(jan['night_premium'] + jan['holiday_premium'] + jan['overtime_premium'], 0)
+        self.assertEqual(jan['arrears'], jan['minimum_wage'] + jan['weekly_holiday_pay'])
+        self.assertEqual(jan['owed'], jan['paid'] + jan['arrears'])
+
+        # 연도별 최저임금 적용 (2024년 9,860원)
+        jan_2024 = next(m for m in months if m['month'] == '2024-01')
+        self.assertEqual(jan_2024['minimum_wage'], int(jan_2024['total_hours'] * 860))
+
+        totals = result['totals']
+        self.assertEqual(totals['arrears'], sum(m['arrears'] for m in months))
+        self.assertEqual(totals['claimable_arrears'], totals['arrears'])
+
+    def test_time_bar_and_assume_paid(self):
+        result = calculate_back_pay(self.employee, today=date(2025, 2, 15), assume_paid=['weekly_holiday_pay'])
+        first = result['months'][0]
+        self.assertTrue(first['is_time_barred'])
+        self.assertEqual(result['totals']['weekly_holiday_pay'], 0)
+        self.assertEqual(
+            result['totals']['claimable_arrears'],
+            sum(m['arrears'] for m in result['months'] if not m['is_time_barred'])
+        )
+        self.assertEqual(result['totals']['claimable_arrears'], result['totals']['arrears'] - first['arrears'])
+
+    def test_premiums_for_workplace_over_5(self):
+        employee = Employee.objects.create(
+            user=self.user, workplace_name='Night Shift', hourly_rate=Decimal('12000'),
+            start_date=date(2025, 1, 6), contract_weekly_hours=10, is_workplace_over_5=True
+        )
+        # 일요일(휴일) 14:00~23:00, 휴게 60분 → 8시간, 야간 1시간
+        day = date(2025, 1, 12)
+        WorkRecord.objects.create(
+            employee=employee, work_date=day, break_minutes=60,
+            time_in=datetime.combine(day, time(14, 0)), time_out=datetime.combine(day, time(23, 0)),
+            attendance_status='EXTRA_WORK'
+        )
+        [month] = calculate_back_pay(employee, today=self.today)['months']
+        self.assertEqual(month['minimum_wage'], 0)
+        self.assertEqual(month['holiday_premium'], 48000)
+        self.assertEqual(month['night_premium'], 6000)
+        self.assertEqual(month['overtime_premium'], 0)
+
+    def test_back_pay_endpoint(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        url = f'/api/labor/jobs/{self.employee.pk}/back-pay/'
+        response = client.get(url, {'paid': 'night_premium,weekly_holiday_pay'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['assume_paid'], ['weekly_holiday_pay', 'night_premium'])
+        self.assertEqual(response.data['totals']['weekly_holiday_pay'], 0)
+
+        response = client.get(url, {'paid': 'bonus'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.data)
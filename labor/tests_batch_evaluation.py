@@ -0,0 +1,54 @@
+import random
+
+from django.test import SimpleTestCase
+from datetime import date, timedelta
+from .services import JobInputs, evaluate_labor
+from .batch_evaluation import evaluate_labor_batch, inputs_to_columns
+
+
+def _random_job(rng):
+    def maybe(value):
+        return None if rng.random() < 0.2 else value
+
+    return JobInputs(
+        hourly_rate=float(rng.choice([9000, 9860, 10030, 10320, 12000.5])),
+        employment_type='PART_TIME',
+        start_date=date(2025, 6, 1) - timedelta(days=rng.randint(-30, 3000)),
+        is_current=True,
+        has_paid_weekly_holiday=False,
+        attendance_rate_last_year=maybe(rng.choice([0.5, 0.79, 0.8, 1.0])),
+        total_wage_last_3m=maybe(rng.choice([0.0, 1500000.0, 2345678.9])),
+        total_days_last_3m=maybe(rng.choice([0, 89, 92])),
+        contract_weekly_hours=maybe(rng.choice([0.0, 10.0, 14.9, 15.0, 22.5, 40.0])),
+        weekly_hours=maybe(rng.choice([0.0, 12.0, 15.0, 27.5, 40.0, 52.0])),
+        work_days_per_week=maybe(rng.choice([0, 2, 3, 5, 6])),
+    )
+
+
+class BatchEvaluationTestCase(SimpleTestCase):
+    def test_matches_scalar_evaluate_labor(self):
+        rng = random.Random(7)
+        today = date(2025, 6, 1)
+        jobs = [_random_job(rng) for _ in range(2000)]
+        batch = evaluate_labor_batch(inputs_to_columns(jobs), today=today)
+        for i, job in enumerate(jobs):
+            expected = evaluate_labor(job, today=today)
+            self.assertEqual(batch['service_days'][i], expected['service_days'])
+            self.assertEqual(batch['service_years'][i], expected['service_years'])
+            self.assertEqual(batch['min_wage_ok'][i], expected['min_wage']['min_wage_ok'])
+            self.assertEqual(batch['weekly_holiday_pay'][i], expected['weekly_holiday_pay'], job)
+            self.assertEqual(batch['annual_leave_days'][i], expected['annual_leave_days'], job)
+            self.assertEqual(batch['severance_estimate'][i], expected['severance_estimate'], job)
+            warnings = expected['warnings']
+            self.assertEqual(bool(batch['warn_min_wage'][i]), any('최저임금' in w for w in warnings))
+            self.assertEqual(bool(batch['warn_weekly_holiday'][i]), any('주휴수당' in w for w in warnings))
+            self.assertEqual(bool(batch['warn_severance'][i]), any('퇴직금' in w for w in warnings))
+
+    def test_population_scale(self):
+        # 처리 시간 비교는 manage.py benchmark_batch_evaluation
+        from .management.commands.benchmark_batch_evaluation import random_columns
+
+        n = 100_000
+        result = evaluate_labor_batch(random_columns(n), today=date(2025, 6, 1))
+        self.assertEqual(len(result['weekly_holiday_pay']), n)
+        self.assertEqual(len(result['warn_min_wage']), n)
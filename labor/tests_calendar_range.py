@@ -0,0 +1,68 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .models import Employee, MonthlySchedule, WorkRecord, WorkSchedule
+from .services import calendar_months, monthly_scheduled_dates
+
+User = get_user_model()
+
+
+class CalendarRangeTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='rangeuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Range Cafe',
+            hourly_rate=Decimal('10030'),
+            start_date=date(2025, 3, 1),
+        )
+        WorkSchedule.objects.create(
+            employee=self.employee, weekday=0, start_time=time(9, 0), end_time=time(13, 0), enabled=True
+        )
+        # 5월 월요일은 월별 스케줄로 휴무
+        MonthlySchedule.objects.create(
+            employee=self.employee, year=2025, month=5, weekday=0, start_time=None, end_time=None, enabled=True
+        )
+        for d in (date(2024, 12, 30), date(2025, 1, 6), date(2025, 3, 3), date(2025, 5, 12)):
+            WorkRecord.objects.create(
+                employee=self.employee, work_date=d,
+                time_in=timezone.make_aware(datetime.combine(d, time(9, 0))),
+                time_out=timezone.make_aware(datetime.combine(d, time(13, 0))),
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = f'/api/labor/jobs/{self.employee.pk}/calendar/'
+
+    def test_months_match_single_month_calendar_with_one_load(self):
+        with self.assertNumQueries(4):
+            months = calendar_months(self.employee, (2024, 12), (2025, 5))
+        self.assertEqual(list(months), ['2024-12', '2025-01', '2025-02', '2025-03', '2025-04', '2025-05'])
+        for key, dates in months.items():
+            year, month = map(int, key.split('-'))
+            self.assertEqual(dates, monthly_scheduled_dates(self.employee, year, month))
+        self.assertFalse(months['2025-05'][11]['is_scheduled_workday'])
+        self.assertEqual(months['2025-05'][11]['record']['work_date'], '2025-05-12')
+
+    def test_api(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'from': '2025-01', 'to': '2025-12', 'fields': 'date,is_worked'})
+        year_queries = len(queries)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url, {'month': '2025-03', 'fields': 'date,is_worked'})
+        self.assertLessEqual(year_queries, len(queries))
+
+        self.assertEqual(response.status_code, 200)
+        months = response.data['months']
+        self.assertEqual(len(months), 12)
+        self.assertEqual(months['2025-01']['dates'][5], {'date': '2025-01-06', 'is_worked': True})
+
+        for params in ({'from': '2025-03'}, {'from': '2025-05', 'to': '2025-03'},
+                       {'from': '2024-01', 'to': '2025-01'}, {'from': '2025-13', 'to': '2026-01'}):
+            self.assertEqual(self.client.get(self.url, params).status_code, 400)
@@ -0,0 +1,76 @@
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .columnar import to_columns
+from .models import Employee, WorkRecord, WorkSchedule
+
+User = get_user_model()
+
+
+def from_columns(block):
+    """열 단위 → dict 목록 (검증용 역변환)"""
+    rows = [{} for _ in range(block['length'])]
+    for name, column in block['columns'].items():
+        if isinstance(column, dict) and 'codes' in column:
+            values = [None if c is None else column['enum'][c] for c in column['codes']]
+        elif isinstance(column, dict):
+            values = from_columns(column)
+            values = [None if all(v is None for v in row.values()) else row for row in values]
+        else:
+            values = column
+        for row, value in zip(rows, values):
+            row[name] = value
+    return rows
+
+
+class ColumnarTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='columnaruser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Columnar Mart',
+            hourly_rate=Decimal('10030'),
+            start_date=date(2025, 3, 1),
+        )
+        WorkSchedule.objects.create(
+            employee=self.employee, weekday=0, start_time=time(9, 0), end_time=time(13, 0), enabled=True
+        )
+        d = date(2025, 3, 4)
+        WorkRecord.objects.create(
+            employee=self.employee, work_date=d, attendance_status='EXTRA_WORK',
+            time_in=timezone.make_aware(datetime.combine(d, time(10, 0))),
+            time_out=timezone.make_aware(datetime.combine(d, time(14, 0))),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.base = f'/api/labor/jobs/{self.employee.pk}'
+
+    def test_enum_and_nested_columns(self):
+        block = to_columns([{'source': 'actual', 'n': 1, 'record': {'id': 1}}, {'source': 'none', 'n': 2, 'record': None}])
+        self.assertEqual(block['columns']['source'], {'enum': ['actual', 'none'], 'codes': [0, 1]})
+        self.assertEqual(block['columns']['n'], [1, 2])
+        self.assertEqual(block['columns']['record'], {'length': 2, 'columns': {'id': [1, None]}})
+
+    def test_calendar_and_payroll_round_trip(self):
+        for path, key in (('calendar', 'dates'), ('payroll-summary', 'rows')):
+            plain = self.client.get(f'{self.base}/{path}/', {'month': '2025-03'})
+            compact = self.client.get(f'{self.base}/{path}/', {'month': '2025-03', 'format': 'columnar'})
+            self.assertEqual(compact.status_code, 200)
+            expected = json.loads(plain.content)
+            decoded = json.loads(compact.content)
+            self.assertEqual(from_columns(decoded[key]), expected[key])
+            self.assertLess(len(compact.content), len(plain.content))
+
+        statuses = json.loads(self.client.get(
+            f'{self.base}/calendar/', {'month': '2025-03', 'format': 'columnar', 'fields': 'attendance_status'}
+        ).content)['dates']['columns']['attendance_status']
+        self.assertEqual(statuses['enum'], ['EXTRA_WORK'])
+        self.assertEqual(statuses['codes'][3], 0)
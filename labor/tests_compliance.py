@@ -0,0 +1,110 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from .models import Employee, WorkRecord, WorkSchedule
+from . import services
+from .compliance import (
+    RULE_BREAK_TIME, RULE_MINIMUM_WAGE, RULE_SEVERANCE, RULE_WEEKLY_HOLIDAY_PAY, RULE_WEEKLY_HOURS_CAP,
+    check_compliance, compliance_warnings,
+)
+
+User = get_user_model()
+
+
+class ComplianceEngineTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='compuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Compliance Diner',
+            hourly_rate=Decimal('9000'),
+            start_date=date(2024, 1, 1),
+            contract_weekly_hours=10,
+            is_workplace_over_5=True
+        )
+        for i in range(5):
+            WorkSchedule.objects.create(
+                employee=self.employee, weekday=i,
+                start_time=time(9, 0), end_time=time(12, 0), enabled=True
+            )
+        # 2024-05-06(월)~05-11(토): 하루 10시간, 휴게 없음 → 주 60시간
+        for i in range(6):
+            day = date(2024, 5, 6) + timedelta(days=i)
+            WorkRecord.objects.create(
+                employee=self.employee, work_date=day,
+                time_in=datetime.combine(day, time(8, 0)), time_out=datetime.combine(day, time(18, 0)),
+                attendance_status='REGULAR_WORK' if i < 5 else 'EXTRA_WORK'
+            )
+        self.today = date(2025, 1, 15)
+
+    def test_rules_report_dates_and_amounts(self):
+        result = check_compliance(self.employee, today=self.today)
+        self.assertEqual(result['period'], {'start': '2024-01-15', 'end': '2025-01-12'})
+        by_rule = {}
+        for v in result['violations']:
+            by_rule.setdefault(v['rule'], []).append(v)
+
+        wage_2024, wage_2025 = by_rule[RULE_MINIMUM_WAGE]
+        self.assertEqual(wage_2024['detail']['minimum_wage'], 9860)
+        self.assertEqual(wage_2025['detail']['minimum_wage'], 10030)
+        self.assertEqual(wage_2025['start_date'], '2025-01-01')
+        self.assertEqual(wage_2025['amount'], int(Decimal('1030') * Decimal(str(wage_2025['detail']['hours']))))
+
+        self.assertEqual(len(by_rule[RULE_BREAK_TIME]), 6)
+        self.assertEqual(by_rule[RULE_BREAK_TIME][0]['detail']['required_minutes'], 60)
+
+        [cap] = by_rule[RULE_WEEKLY_HOURS_CAP]
+        self.assertEqual((cap['start_date'], cap['detail']['hours']), ('2024-05-06', 60.0))
+
+        # 계약 주 10시간이지만 실제 60시간 개근 → 주휴 8시간 × 9,000원
+        [holiday] = by_rule[RULE_WEEKLY_HOLIDAY_PAY]
+        self.assertEqual((holiday['start_date'], holiday['amount']), ('2024-05-06', 72000))
+        self.assertEqual(result['total_amount'], sum(v['amount'] or 0 for v in result['violations']))
+
+    def test_single_pass_over_preloaded_data(self):
+        inputs = services.job_to_inputs(self.employee)
+        with mock.patch.object(services, 'weekly_holiday_facts', wraps=services.weekly_holiday_facts) as spy:
+            with self.assertNumQueries(4):
+                check_compliance(self.employee, today=self.today, inputs=inputs)
+        # 2024-01-15 ~ 2025-01-12: 52주, 주마다 한 번
+        self.assertEqual(spy.call_count, 52)
+
+    def test_evaluation_endpoint_includes_violations(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.get(f'/api/labor/jobs/{self.employee.pk}/evaluation/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('compliance', response.data)
+        self.assertIn(RULE_MINIMUM_WAGE, response.data['compliance']['counts'])
+        warnings = response.data['warnings']
+        self.assertEqual(sum('최저임금' in w for w in warnings), 1)
+        self.assertEqual(warnings, compliance_warnings(response.data['compliance']))
+
+    def test_contract_rules_without_records(self):
+        # 근무 시작 전이라 점검할 주가 없어도 현재 근로조건은 점검
+        self.employee.start_date = date(2025, 1, 13)
+        self.employee.save()
+        result = check_compliance(self.employee, today=date(2025, 1, 15))
+        self.assertIsNone(result['period'])
+        [wage] = result['violations']
+        self.assertEqual((wage['rule'], wage['detail']['basis']), (RULE_MINIMUM_WAGE, 'contract'))
+        self.assertEqual(compliance_warnings(result), [wage['message']])
+
+    def test_severance_rule(self):
+        self.employee.hourly_rate = Decimal('10030')
+        self.employee.contract_weekly_hours = 20
+        self.employee.save()
+        result = check_compliance(self.employee, today=self.today)
+        self.assertEqual(result['counts'].get(RULE_SEVERANCE), 1)
+        self.assertIn("1년 이상, 주 15시간 이상 근무 시 퇴직금 지급이 필요합니다.", compliance_warnings(result))
+
+        self.employee.total_wage_last_3m = Decimal('2400000')
+        self.employee.total_days_last_3m = 90
+        self.employee.save()
+        self.assertNotIn(RULE_SEVERANCE, check_compliance(self.employee, today=self.today)['counts'])
@@ -0,0 +1,89 @@
+import gzip
+import json
+from datetime import date, time
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from . import compression
+from .compression import choose_encoding
+from .models import Employee, WorkSchedule
+
+User = get_user_model()
+
+
+class CompressionTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.compressed_cache = caches['compressed_responses']
+        self.compressed_cache.clear()
+        self.user = User.objects.create_user(username='gzipuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Gzip Deli',
+            hourly_rate=Decimal('10030'),
+            start_date=date(2025, 3, 1),
+        )
+        WorkSchedule.objects.create(
+            employee=self.employee, weekday=0, start_time=time(9, 0), end_time=time(13, 0), enabled=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = f'/api/labor/jobs/{self.employee.pk}/calendar/'
+
+    def test_choose_encoding(self):
+        self.assertEqual(choose_encoding('gzip, deflate'), 'gzip')
+        self.assertIsNone(choose_encoding('gzip;q=0, identity'))
+        self.assertIsNone(choose_encoding(''))
+        self.assertEqual(choose_encoding('*'), 'br' if compression.brotli else 'gzip')
+
+    def test_gzip_once_per_identical_body_and_not_modified(self):
+        # 마감된 월 급여 요약은 압축 본문 캐시 대상
+        url = f'/api/labor/jobs/{self.employee.pk}/payroll-summary/'
+        plain = self.client.get(url, {'month': '2025-03'})
+        self.assertNotIn('Content-Encoding', plain)
+
+        with mock.patch('labor.compression.compress', wraps=compression.compress) as spy:
+            first = self.client.get(url, {'month': '2025-03'}, HTTP_ACCEPT_ENCODING='gzip')
+            second = self.client.get(url, {'month': '2025-03'}, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(first['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', first['Vary'])
+        self.assertEqual(json.loads(gzip.decompress(first.content)), json.loads(plain.content))
+        self.assertEqual(second.content, first.content)
+        self.assertLess(len(first.content), len(plain.content) / 2)
+
+        not_modified = self.client.get(
+            url, {'month': '2025-03'}, HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=first['ETag']
+        )
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b'')
+
+    def test_only_opted_in_responses_cached(self):
+        # 캘린더는 캐시 허용 표시가 없으므로 매번 압축하고 저장하지 않음
+        with mock.patch('labor.compression.compress', wraps=compression.compress) as spy:
+            for _ in range(2):
+                response = self.client.get(self.url, {'month': '2025-03'}, HTTP_ACCEPT_ENCODING='gzip')
+                self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(spy.call_count, 2)
+        self.assertEqual(len(self.compressed_cache._cache), 0)
+
+        # 공휴일은 Cache-Control max-age가 있으므로 전용 캐시에 저장 (기본 캐시는 사용하지 않음)
+        holidays = [{'date': f'2025-03-{d:02d}', 'name': f'테스트 공휴일 {d}', 'type': 'LEGAL'} for d in range(1, 29)]
+        with mock.patch('labor.views.get_holidays_for_month', return_value=holidays):
+            response = self.client.get('/api/labor/holidays/', {'month': '2025-03'}, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(len(self.compressed_cache._cache), 1)
+        self.assertFalse(any(':compressed:' in key for key in cache._cache))
+
+    def test_small_and_error_responses_untouched(self):
+        small = self.client.get('/api/labor/sync/', {'since': '0', 'limit': 1}, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertLess(len(small.content), compression.DEFAULT_MIN_BYTES)
+        self.assertNotIn('Content-Encoding', small)
+        error = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(error.status_code, 400)
+        self.assertNotIn('Content-Encoding', error)
@@ -0,0 +1,90 @@
+import csv
+import io
+import zipfile
+
+from django.core.cache import cache
+from django.http import StreamingHttpResponse
+from django.test import TestCase
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from docx import Document
+from rest_framework.test import APIClient
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from .models import Employee, WorkRecord, WorkSchedule
+
+User = get_user_model()
+
+
+class WageClaimEvidenceTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='evidenceuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Evidence Mart',
+            hourly_rate=Decimal('9000'),
+            start_date=date(2024, 11, 4),
+            contract_weekly_hours=20,
+        )
+        for i in range(5):
+            WorkSchedule.objects.create(
+                employee=self.employee, weekday=i,
+                start_time=time(9, 0), end_time=time(13, 0), enabled=True
+            )
+        day = date(2024, 11, 4)
+        while day <= date(2025, 1, 10):
+            if day.weekday() < 5:
+                WorkRecord.objects.create(
+                    employee=self.employee, work_date=day,
+                    time_in=datetime.combine(day, time(9, 0)), time_out=datetime.combine(day, time(13, 0)),
+                    attendance_status='REGULAR_WORK'
+                )
+            day += timedelta(days=1)
+
+    def test_streams_zip_with_csvs_and_summary(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.get(f'/api/labor/jobs/{self.employee.pk}/wage-claim-evidence/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(response['Content-Type'], 'application/zip')
+
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+        self.assertEqual(archive.namelist(), ['work_records.csv', 'payroll.csv', 'arrears.csv', 'summary.docx'])
+
+        records = list(csv.reader(io.StringIO(archive.read('work_records.csv').decode('utf-8-sig'))))
+        self.assertEqual(records[0][0], '근무일')
+        self.assertEqual(len(records) - 1, WorkRecord.objects.filter(employee=self.employee).count())
+        self.assertEqual(records[1][:3], ['2024-11-04', '2024-11-04 09:00', '2024-11-04 13:00'])
+
+        payroll = list(csv.reader(io.StringIO(archive.read('payroll.csv').decode('utf-8-sig'))))
+        arrears = list(csv.reader(io.StringIO(archive.read('arrears.csv').decode('utf-8-sig'))))
+        # 근무 시작 월 ~ 어제가 속한 달
+        end = timezone.localdate() - timedelta(days=1)
+        months = (end.year - 2024) * 12 + end.month - 11 + 1
+        self.assertEqual(len(payroll) - 1, months)
+        self.assertEqual(len(arrears) - 1, months)
+
+        text = '\n'.join(p.text for p in Document(io.BytesIO(archive.read('summary.docx'))).paragraphs)
+        self.assertIn('Evidence Mart', text)
+        self.assertIn('2024-11-04', text)
+
+    def test_streamed_windows_match_full_calculations(self):
+        from . import services
+        from .back_pay import calculate_back_pay
+        from .evidence import iter_evidence_zip
+
+        today = date(2025, 2, 3)
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(iter_evidence_zip(self.employee, today=today))))
+        payroll = list(csv.DictReader(io.StringIO(archive.read('payroll.csv').decode('utf-8-sig'))))
+        arrears = list(csv.DictReader(io.StringIO(archive.read('arrears.csv').decode('utf-8-sig'))))
+
+        expected = calculate_back_pay(self.employee, today=today)['months']
+        self.assertEqual([row['체불액'] for row in arrears], [str(m['arrears']) for m in expected])
+        self.assertEqual([row['주휴수당'] for row in arrears], [str(m['weekly_holiday_pay']) for m in expected])
+        for row in payroll:
+            year, month = map(int, row['월'].split('-'))
+            summary = services.compute_payroll_summary(self.employee, year, month)
+            self.assertEqual(row['주휴수당'], str(summary['monthly_weekly_holiday_pay']), row['월'])
+            self.assertEqual(row['기본급'], str(summary['base_pay']), row['월'])
@@ -0,0 +1,90 @@
+import csv
+import io
+import zipfile
+
+from django.core.cache import cache
+from django.http import StreamingHttpResponse
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from .models import Employee, WorkRecord, WorkSchedule
+from .export import iter_daily_rows
+from .services import compute_payroll_summary
+
+User = get_user_model()
+
+
+class ExportTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='exportuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Export Bakery',
+            hourly_rate=Decimal('10030'),
+            start_date=date(2025, 3, 3),
+            contract_weekly_hours=20,
+            is_workplace_over_5=True,
+        )
+        for i in range(5):
+            WorkSchedule.objects.create(
+                employee=self.employee, weekday=i,
+                start_time=time(9, 0), end_time=time(13, 0), enabled=True
+            )
+        day = date(2025, 3, 3)
+        while day <= date(2025, 5, 30):
+            if day.weekday() < 5:
+                WorkRecord.objects.create(
+                    employee=self.employee, work_date=day,
+                    time_in=datetime.combine(day, time(9, 0)), time_out=datetime.combine(day, time(13, 0)),
+                    attendance_status='REGULAR_WORK'
+                )
+            day += timedelta(days=1)
+        # 토요일 추가근무 18:00~23:00 (야간 1시간)
+        day = date(2025, 4, 12)
+        WorkRecord.objects.create(
+            employee=self.employee, work_date=day,
+            time_in=datetime.combine(day, time(18, 0)), time_out=datetime.combine(day, time(23, 0)),
+            attendance_status='EXTRA_WORK'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = f'/api/labor/jobs/{self.employee.pk}/export/'
+
+    def test_daily_rows_match_payroll_summary(self):
+        # 근로기록은 iterator 1회 + 스케줄/근로조건 3회
+        with self.assertNumQueries(4):
+            rows = list(iter_daily_rows(self.employee, date(2025, 4, 1), date(2025, 4, 30), chunk_size=7))
+        summary = compute_payroll_summary(self.employee, 2025, 4)
+        for field in ('base_pay', 'holiday_bonus', 'night_bonus', 'overtime_bonus'):
+            self.assertEqual(sum(r[field] for r in rows), summary[field])
+        self.assertEqual(rows[0]['date'], '2025-04-01')
+        self.assertEqual(rows[-1]['date'], '2025-04-30')
+        saturday = next(r for r in rows if r['date'] == '2025-04-12')
+        self.assertEqual((saturday['night_hours'], saturday['time_in']), (1.0, '2025-04-12 18:00'))
+        # 4/6(일): 전주 개근 → 주휴 4시간
+        sunday = next(r for r in rows if r['date'] == '2025-04-06')
+        self.assertEqual(sunday['weekly_holiday_pay'], 4 * 10030)
+
+    def test_csv_and_xlsx_downloads(self):
+        response = self.client.get(self.url, {'from': '2025-03-01', 'to': '2025-05-31'})
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response, StreamingHttpResponse)
+        lines = list(csv.reader(io.StringIO(b''.join(response.streaming_content).decode('utf-8-sig'))))
+        self.assertEqual(lines[0][0], '날짜')
+        self.assertEqual(lines[1][0], '2025-03-03')
+
+        response = self.client.get(self.url, {'from': '2025-03-01', 'to': '2025-05-31', 'format': 'xlsx'})
+        self.assertEqual(response.status_code, 200)
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+        self.assertIn('xl/worksheets/sheet1.xml', archive.namelist())
+        sheet = archive.read('xl/worksheets/sheet1.xml').decode('utf-8')
+        self.assertEqual(sheet.count('<row>'), len(lines))
+        self.assertIn('2025-04-12 18:00', sheet)
+
+    def test_invalid_params(self):
+        self.assertEqual(self.client.get(self.url, {'format': 'pdf'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'from': '2025-13-01'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'from': '2025-05-01', 'to': '2025-04-01'}).status_code, 400)
@@ -0,0 +1,84 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .fieldsets import FieldSelection, parse_field_paths
+from .models import Employee, WorkRecord, WorkSchedule
+
+User = get_user_model()
+
+
+class FieldSelectionTestCase(TestCase):
+    def test_parse_and_apply(self):
+        self.assertEqual(parse_field_paths('a, b.c,b.d'), {'a': None, 'b': {'c': None, 'd': None}})
+        selection = FieldSelection(parse_field_paths('a,b.c'), parse_field_paths('a'))
+        data = {'a': 1, 'b': {'c': 2, 'd': 3}, 'e': [4]}
+        self.assertEqual(selection.apply(data), {'b': {'c': 2}})
+        self.assertEqual(FieldSelection().apply(data), data)
+
+
+class SparseFieldsApiTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='fieldsuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Fields Diner',
+            hourly_rate=Decimal('10030'),
+            start_date=date(2025, 3, 1),
+        )
+        WorkSchedule.objects.create(
+            employee=self.employee, weekday=0, start_time=time(9, 0), end_time=time(13, 0), enabled=True
+        )
+        for day in (3, 10, 17):
+            d = date(2025, 3, day)
+            WorkRecord.objects.create(
+                employee=self.employee, work_date=d,
+                time_in=timezone.make_aware(datetime.combine(d, time(9, 0))),
+                time_out=timezone.make_aware(datetime.combine(d, time(13, 0))),
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.base = f'/api/labor/jobs/{self.employee.pk}'
+
+    def test_payroll_summary_fields_and_omit(self):
+        url = f'{self.base}/payroll-summary/'
+        full = self.client.get(url, {'month': '2025-03'}).data
+        picked = self.client.get(url, {'month': '2025-03', 'fields': 'month,summary.total'}).data
+        self.assertEqual(picked, {'month': '2025-03', 'summary': {'total': full['summary']['total']}})
+
+        omitted = self.client.get(url, {'month': '2025-03', 'omit': 'rows,notes'}).data
+        self.assertNotIn('rows', omitted)
+        self.assertNotIn('notes', omitted)
+        self.assertEqual(omitted['summary'], full['summary'])
+
+        self.assertEqual(self.client.get(url, {'month': '2025-03', 'fields': 'nope'}).status_code, 400)
+
+    def test_calendar_skips_unrequested_work(self):
+        url = f'{self.base}/calendar/'
+        with CaptureQueriesContext(connection) as queries:
+            full = self.client.get(url, {'month': '2025-03'}).data['dates']
+        # 다음 요청 시작 시 쿼리 로그가 초기화되므로 바로 센다
+        full_query_count = len(queries)
+        slim = self.client.get(url, {'month': '2025-03', 'fields': 'date,is_worked'}).data['dates']
+        self.assertEqual(slim[2], {'date': '2025-03-03', 'is_worked': True})
+        self.assertEqual(len(slim), len(full))
+        with CaptureQueriesContext(connection) as queries:
+            bare = self.client.get(url, {'month': '2025-03', 'fields': 'date,day'}).data['dates']
+        self.assertLess(len(queries), full_query_count)
+        self.assertEqual(bare[2], {'date': '2025-03-03', 'day': 3})
+
+        nested = self.client.get(url, {'month': '2025-03', 'fields': 'date,record.time_in'}).data['dates']
+        self.assertEqual(set(nested[2]['record']), {'time_in'})
+        self.assertIsNone(nested[0]['record'])
+
+        no_record = self.client.get(url, {'month': '2025-03', 'omit': 'record'}).data['dates']
+        self.assertNotIn('record', no_record[2])
+        self.assertTrue(no_record[2]['is_scheduled_workday'])
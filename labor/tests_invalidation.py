@@ -0,0 +1,90 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from datetime import date, datetime, time
+from decimal import Decimal
+from .models import Employee, WorkRecord, WorkSchedule, MonthlySchedule
+from . import services
+from .invalidation import (
+    ResultKey, PAYROLL, SEVERANCE, CUMULATIVE,
+    keys_for_dates, keys_for_weekly_schedule, payroll_key, weekly_holiday_key, annual_leave_key,
+)
+
+User = get_user_model()
+
+
+class InvalidationGraphTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='invuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Invalidation Cafe',
+            hourly_rate=Decimal('10000'),
+            start_date=date(2024, 1, 1),
+            contract_weekly_hours=20,
+            is_workplace_over_5=True
+        )
+        self.today = date(2025, 3, 20)
+
+    def test_record_date_maps_to_straddling_months(self):
+        # 2025-01-31(금): 주(1/27~2/2)가 1월/2월에 걸침
+        keys = keys_for_dates(self.employee, [date(2025, 1, 31)], today=self.today)
+        self.assertIn(payroll_key(2025, 1), keys)
+        self.assertIn(payroll_key(2025, 2), keys)
+        self.assertNotIn(payroll_key(2025, 3), keys)
+        self.assertIn(weekly_holiday_key(date(2025, 1, 27)), keys)
+        self.assertIn(annual_leave_key(2025), keys)
+        self.assertIn(ResultKey(SEVERANCE), keys)
+        self.assertIn(ResultKey(CUMULATIVE), keys)
+
+    def test_old_record_skips_severance_window(self):
+        keys = keys_for_dates(self.employee, [date(2024, 6, 12)], today=self.today)
+        self.assertEqual({k.period for k in keys if k.calculator == PAYROLL}, {'2024-06'})
+        self.assertNotIn(ResultKey(SEVERANCE), keys)
+        # 입사 후 330일 이내 → 1년 미만 연차 발생 판정에 영향
+        self.assertIn(annual_leave_key(2025), keys)
+
+    def test_weekly_schedule_skips_overridden_months(self):
+        for wd in range(7):
+            MonthlySchedule.objects.create(
+                employee=self.employee, year=2025, month=6, weekday=wd,
+                start_time=None, end_time=None, enabled=True
+            )
+        keys = keys_for_weekly_schedule(self.employee, weekdays=[2], today=self.today)
+        self.assertIn(weekly_holiday_key(date(2025, 5, 19)), keys)
+        # 6월 안에 완전히 포함된 주는 월별 스케줄만 사용
+        self.assertNotIn(weekly_holiday_key(date(2025, 6, 9)), keys)
+        # 5/26~6/1 주의 수요일(5/28)은 주간 스케줄 → 6월 급여(주휴수당)에 영향
+        self.assertIn(payroll_key(2025, 6), keys)
+
+    def test_record_edit_evicts_only_affected_months(self):
+        WorkSchedule.objects.create(
+            employee=self.employee, weekday=0,
+            start_time=time(9, 0), end_time=time(13, 0), enabled=True
+        )
+        with mock.patch('labor.invalidation.timezone.localdate', return_value=self.today), \
+                mock.patch('labor.snapshots.invalidate_payroll_snapshots') as evict:
+            WorkRecord.objects.create(
+                employee=self.employee, work_date=date(2025, 3, 10),
+                time_in=datetime(2025, 3, 10, 9, 0), time_out=datetime(2025, 3, 10, 13, 0),
+                attendance_status='REGULAR_WORK'
+            )
+        months = set(evict.call_args[0][1])
+        self.assertEqual(months, {(2025, 3)})
+
+    def test_weekly_holiday_result_cached_across_months(self):
+        cache.set('holidays:2025-01', [])
+        cache.set('holidays:2025-02', [])
+        WorkSchedule.objects.create(
+            employee=self.employee, weekday=4,
+            start_time=time(9, 0), end_time=time(13, 0), enabled=True
+        )
+        with mock.patch.object(services, 'calculate_weekly_holiday_pay_v2', wraps=services.calculate_weekly_holiday_pay_v2) as spy:
+            services.get_monthly_holiday_pay_info(self.employee, 2025, 1)
+            calls_january = spy.call_count
+            services.get_monthly_holiday_pay_info(self.employee, 2025, 2)
+        # 1/27~2/2 주는 1월 조회에서 계산된 결과를 재사용
+        self.assertEqual(spy.call_count - calls_january, 4)
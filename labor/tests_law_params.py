@@ -0,0 +1,62 @@
+import json
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.test import SimpleTestCase
+from datetime import date
+from .law_params import (
+    EMPLOYMENT_INSURANCE_RATE, MINIMUM_WAGE, NATIONAL_PENSION_RATE, LawParameters, law_param,
+)
+from .services import compute_deductions, minimum_wage_for
+
+
+class LawParametersTestCase(SimpleTestCase):
+    def test_effective_dated_lookup(self):
+        self.assertEqual(minimum_wage_for(2024), 9860)
+        self.assertEqual(minimum_wage_for(2025), 10030)
+        # 연중 변경 (2022-07-01 고용보험 0.8% → 0.9%)
+        self.assertEqual(law_param(EMPLOYMENT_INSURANCE_RATE, date(2022, 6, 30)), 0.008)
+        self.assertEqual(law_param(EMPLOYMENT_INSURANCE_RATE, date(2022, 7, 1)), 0.009)
+        # 등록 범위 밖은 가장 가까운 값
+        self.assertEqual(minimum_wage_for(2010), 8590)
+        self.assertEqual(law_param(MINIMUM_WAGE, date(2099, 1, 1)), law_param(MINIMUM_WAGE, date(2026, 1, 1)))
+
+    def test_deductions_use_rates_as_of_period(self):
+        before = compute_deductions('FOUR_INSURANCE', 1_000_000, as_of=date(2025, 6, 30))
+        after = compute_deductions('FOUR_INSURANCE', 1_000_000, as_of=date(2026, 6, 30))
+        self.assertEqual(before['details'][0], {'label': '국민연금 (4.5%)', 'amount': 45000})
+        self.assertEqual(after['details'][0], {'label': '국민연금 (4.75%)', 'amount': 47500})
+        self.assertEqual(before['details'][1]['label'], '건강보험 (3.545%)')
+
+    def test_hot_reload_on_file_change(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, 'law_parameters.json')
+        shutil.copy(LawParameters.PATH, path)
+
+        with mock.patch.object(LawParameters, 'PATH', path), mock.patch('labor.law_params.RELOAD_CHECK_INTERVAL', 0):
+            LawParameters.reload()
+            self.addCleanup(LawParameters.reload)
+            revision = LawParameters.revision()
+            self.assertEqual(law_param(NATIONAL_PENSION_RATE, date(2027, 1, 1)), 0.0475)
+
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            data['parameters'][NATIONAL_PENSION_RATE].append({'effective_from': '2027-01-01', 'value': 0.05})
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            self.assertEqual(law_param(NATIONAL_PENSION_RATE, date(2027, 1, 1)), 0.05)
+            self.assertEqual(law_param(NATIONAL_PENSION_RATE, date(2026, 12, 31)), 0.0475)
+            self.assertNotEqual(LawParameters.revision(), revision)
+
+            # 잘못된 파일은 무시하고 이전 테이블 유지
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('{')
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+            with self.assertLogs('labor.law_params', level='WARNING'):
+                self.assertEqual(law_param(NATIONAL_PENSION_RATE, date(2027, 1, 1)), 0.05)
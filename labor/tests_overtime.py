@@ -0,0 +1,87 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from .models import Employee, WorkRecord
+from . import services
+from .dataset import EmployeeDataset
+from .ledger import build_month_ledger, price_payroll
+from .overtime import WeeklyOvertimeCounter, overtime_by_date
+from .terms import terms_for
+
+User = get_user_model()
+
+
+class OvertimeCounterTestCase(TestCase):
+    def test_daily_and_weekly_limits(self):
+        monday = date(2024, 5, 6)
+        # 월~금 9시간: 1일 8시간 초과분만 연장 (주 소정근로 누적은 40시간)
+        days = [(monday + timedelta(days=i), 9.0, False) for i in range(5)]
+        # 토 8시간: 주 40시간 초과 → 전부 연장
+        days.append((monday + timedelta(days=5), 8.0, False))
+        # 일(휴일) 10시간: 주 누적과 무관하게 8시간 초과분만 연장
+        days.append((monday + timedelta(days=6), 10.0, True))
+        result = overtime_by_date(days)
+        self.assertEqual([result[d] for d, _, _ in days], [1.0] * 5 + [8.0, 2.0])
+
+    def test_week_boundary_resets(self):
+        counter = WeeklyOvertimeCounter()
+        for i in range(5):
+            counter.add(date(2024, 5, 6) + timedelta(days=i), 8.0)
+        self.assertEqual(counter.add(date(2024, 5, 13), 8.0), 0.0)
+
+
+class PayrollOvertimeTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        cache.set('holidays:2024-05', [])
+        self.user = User.objects.create_user(username='otuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Overtime Factory',
+            hourly_rate=Decimal('10000'),
+            start_date=date(2024, 1, 1),
+            contract_weekly_hours=40,
+            is_workplace_over_5=True
+        )
+        # 4/29(월)~5/4(토): 주가 4월/5월에 걸침
+        for day, hours in ((date(2024, 4, 29), 10), (date(2024, 4, 30), 10), (date(2024, 5, 1), 8),
+                           (date(2024, 5, 2), 8), (date(2024, 5, 3), 8), (date(2024, 5, 4), 8)):
+            start = datetime.combine(day, datetime.min.time()).replace(hour=9)
+            WorkRecord.objects.create(
+                employee=self.employee, work_date=day,
+                time_in=start, time_out=start + timedelta(hours=hours),
+                attendance_status='REGULAR_WORK'
+            )
+
+    def test_weekly_limit_counts_previous_month_days(self):
+        summary = services.compute_payroll_summary(self.employee, 2024, 5)
+        rows = {row['date']: row for row in summary['rows']}
+        self.assertEqual(rows['2024-05-03']['overtime_hours'], 0.0)
+        self.assertEqual(rows['2024-05-04']['overtime_hours'], 8.0)
+        self.assertEqual(summary['overtime_hours'], 8.0)
+        self.assertEqual(summary['overtime_bonus'], 40000)
+        self.assertEqual(summary['summary']['overtime_extra'], 40000)
+
+    def test_ledger_pricing_matches_summary(self):
+        for is_over_5 in (True, False):
+            self.employee.is_workplace_over_5 = is_over_5
+            summary = services.compute_payroll_summary(self.employee, 2024, 5)
+            priced = price_payroll(build_month_ledger(self.employee, 2024, 5), terms_for(self.employee))
+            for field in ('overtime_hours', 'overtime_bonus', 'estimated_monthly_pay', 'net_pay'):
+                self.assertEqual(priced[field], summary[field], field)
+        # 5인 미만: 연장근로 시간은 표시하되 가산수당 없음
+        self.assertEqual(summary['overtime_hours'], 8.0)
+        self.assertEqual(summary['overtime_bonus'], 0)
+
+    def test_no_extra_queries_with_preloaded_dataset(self):
+        dataset = EmployeeDataset.load(self.employee, date(2024, 4, 29), date(2024, 6, 2))
+        with self.assertNumQueries(0):
+            services.compute_payroll_summary(self.employee, 2024, 5, dataset=dataset)
+
+    def test_monthly_payroll_card(self):
+        result = services.compute_monthly_payroll(self.employee, 2024, 5)
+        self.assertEqual(result['breakdown']['overtime_hours'], 8.0)
+        self.assertEqual(result['breakdown']['overtime_pay'], 40000.0)
+        self.assertEqual(result['total_hours'], 32.0)
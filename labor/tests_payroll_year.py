@@ -0,0 +1,99 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from .models import Employee, EmploymentTerms, WorkRecord, WorkSchedule
+from . import services
+
+User = get_user_model()
+
+
+class PayrollYearTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='yearuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Year Mart',
+            hourly_rate=Decimal('10000'),
+            start_date=date(2024, 1, 1),
+            contract_weekly_hours=20,
+            is_workplace_over_5=True,
+            deduction_type='FOUR_INSURANCE'
+        )
+        for i in range(5):
+            WorkSchedule.objects.create(
+                employee=self.employee, weekday=i,
+                start_time=time(18, 0), end_time=time(23, 0), enabled=True
+            )
+        for month in range(1, 13):
+            cache.set(f'holidays:2024-{month:02d}', [])
+        WorkRecord.objects.create(
+            employee=self.employee, work_date=date(2024, 1, 31),
+            time_in=datetime(2024, 1, 31, 18, 0), time_out=datetime(2024, 1, 31, 22, 0),
+            attendance_status='REGULAR_WORK'
+        )
+
+    def test_months_match_monthly_summary(self):
+        result = services.compute_payroll_year(self.employee, 2024)
+        self.assertEqual(len(result['months']), 12)
+        for row in result['months']:
+            year, month = map(int, row['month'].split('-'))
+            summary = services.compute_payroll_summary(self.employee, year, month)
+            self.assertEqual(row['estimated_monthly_pay'], summary['estimated_monthly_pay'])
+            self.assertEqual(row['weekly_holiday_pay'], summary['monthly_weekly_holiday_pay'])
+            self.assertEqual(row['net_pay'], summary['net_pay'])
+
+    def test_totals_count_each_week_once(self):
+        # 2024년 평일 개근 → 매주 주휴수당 발생 (두 달에 걸친 주는 월별 요약에서 양쪽 달에 포함)
+        WorkRecord.objects.bulk_create([
+            WorkRecord(
+                employee=self.employee, work_date=d,
+                time_in=datetime.combine(d, time(18, 0)), time_out=datetime.combine(d, time(23, 0)),
+                attendance_status='REGULAR_WORK'
+            )
+            for d in (date(2024, 1, 1) + timedelta(days=i) for i in range(366))
+            if d.weekday() < 5 and d != date(2024, 1, 31)
+        ])
+        result = services.compute_payroll_year(self.employee, 2024)
+        totals = result['totals']
+        # 주휴일(일요일)이 2024년인 주: 2024-01-01 ~ 2024-12-23(월) 시작, 52주
+        weeks = [date(2024, 1, 1) + timedelta(weeks=i) for i in range(52)]
+        expected_weekly = sum(int(services.calculate_weekly_holiday_pay_v2(self.employee, w)['amount']) for w in weeks)
+        self.assertEqual(totals['weekly_holiday_pay'], expected_weekly)
+        self.assertLess(totals['weekly_holiday_pay'], sum(r['weekly_holiday_pay'] for r in result['months']))
+        self.assertEqual(
+            totals['estimated_pay'],
+            totals['base_pay'] + totals['holiday_bonus'] + totals['night_bonus'] + totals['overtime_bonus'] + expected_weekly
+        )
+        self.assertEqual(totals['net_pay'] + result['deduction']['total_deduction'], totals['estimated_pay'])
+        self.assertEqual(
+            result['deduction']['total_deduction'],
+            sum(item['amount'] for item in result['deduction']['details'])
+        )
+
+    def test_year_end_terms_reported(self):
+        EmploymentTerms.objects.create(
+            employee=self.employee, effective_from=date(2024, 1, 1),
+            hourly_rate=Decimal('10000'), contract_weekly_hours=Decimal('20'), deduction_type='FOUR_INSURANCE',
+        )
+        EmploymentTerms.objects.create(
+            employee=self.employee, effective_from=date(2024, 7, 1),
+            hourly_rate=Decimal('12000'), contract_weekly_hours=Decimal('20'), deduction_type='FREELANCE',
+        )
+        result = services.compute_payroll_year(self.employee, 2024)
+        self.assertEqual(result['hourly_wage'], 12000)
+        self.assertEqual(result['deduction']['type'], 'FREELANCE')
+        self.assertEqual((result['months'][0]['hourly_wage'], result['months'][0]['deduction_type']), (10000, 'FOUR_INSURANCE'))
+        self.assertEqual(result['months'][11]['deduction_type'], 'FREELANCE')
+
+    def test_straddling_weeks_evaluated_once(self):
+        with mock.patch.object(services, 'calculate_weekly_holiday_pay_v2', wraps=services.calculate_weekly_holiday_pay_v2) as spy:
+            services.compute_payroll_year(self.employee, 2024)
+        evaluated = [c.args[1] for c in spy.call_args_list]
+        self.assertEqual(len(evaluated), len(set(evaluated)))
+        # 2024-01-01(월) ~ 2025-01-05(일): 53주
+        self.assertEqual(len(evaluated), 53)
@@ -0,0 +1,90 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from datetime import date, time
+from decimal import Decimal
+from .models import Employee, EmploymentTerms, WorkSchedule, MonthlySchedule
+from . import services
+from .projections import projected_payroll_summary, projected_month_schedule_totals
+
+User = get_user_model()
+
+
+class ProjectionCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='projuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Projection Mart',
+            hourly_rate=Decimal('10000'),
+            start_date=date(2025, 1, 1),
+            contract_weekly_hours=20,
+            is_workplace_over_5=True
+        )
+        for i in range(5):
+            WorkSchedule.objects.create(
+                employee=self.employee, weekday=i,
+                start_time=time(18, 0), end_time=time(23, 0), enabled=True
+            )
+        # 2030-01, 2030-10: 모두 화요일 시작, 31일 (공휴일 없음으로 고정)
+        cache.set('holidays:2030-01', [])
+        cache.set('holidays:2030-10', [])
+
+    def test_same_shape_computed_once(self):
+        with mock.patch.object(services, 'compute_payroll_summary', wraps=services.compute_payroll_summary) as spy:
+            january = projected_payroll_summary(self.employee, 2030, 1)
+            october = projected_payroll_summary(self.employee, 2030, 10)
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(october['month'], '2030-10')
+        self.assertEqual(october['rows'][0]['date'], '2030-10-01')
+        self.assertEqual(october['estimated_monthly_pay'], january['estimated_monthly_pay'])
+
+    def test_matches_direct_computation(self):
+        projected_payroll_summary(self.employee, 2030, 1)
+        projected = projected_payroll_summary(self.employee, 2030, 10)
+        self.assertEqual(projected, services.compute_payroll_summary(self.employee, 2030, 10))
+
+    def test_monthly_override_changes_shape(self):
+        MonthlySchedule.objects.create(
+            employee=self.employee, year=2030, month=10, weekday=0,
+            start_time=None, end_time=None, enabled=True
+        )
+        projected_payroll_summary(self.employee, 2030, 1)
+        october = projected_payroll_summary(self.employee, 2030, 10)
+        self.assertEqual(october, services.compute_payroll_summary(self.employee, 2030, 10))
+
+    def test_schedule_totals_cached(self):
+        with mock.patch.object(services, 'compute_month_schedule_totals', wraps=services.compute_month_schedule_totals) as spy:
+            projected_month_schedule_totals(self.employee, 2030, 1)
+            totals = projected_month_schedule_totals(self.employee, 2030, 10)
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(totals, services.compute_month_schedule_totals(self.employee, 2030, 10))
+
+    def test_shape_not_shared_across_years(self):
+        # 2029-05도 화요일 시작 31일이지만 요율·안내 문구 연도가 다르므로 별도 계산
+        cache.set('holidays:2029-05', [])
+        self.employee.deduction_type = Employee.DeductionType.FOUR_INSURANCE
+        self.employee.save()
+        with mock.patch.object(services, 'compute_payroll_summary', wraps=services.compute_payroll_summary) as spy:
+            projected_payroll_summary(self.employee, 2030, 1)
+            may = projected_payroll_summary(self.employee, 2029, 5)
+        self.assertEqual(spy.call_count, 2)
+        self.assertEqual(may, services.compute_payroll_summary(self.employee, 2029, 5))
+        self.assertTrue(any('2029년' in note for note in may['notes']))
+
+    def test_schedule_totals_shape_uses_terms_history(self):
+        EmploymentTerms.objects.create(
+            employee=self.employee, effective_from=date(2025, 1, 1),
+            hourly_rate=Decimal('10000'), contract_weekly_hours=Decimal('20'),
+        )
+        EmploymentTerms.objects.create(
+            employee=self.employee, effective_from=date(2030, 10, 1),
+            hourly_rate=Decimal('12000'), contract_weekly_hours=Decimal('20'),
+        )
+        with mock.patch.object(services, 'compute_month_schedule_totals', wraps=services.compute_month_schedule_totals) as spy:
+            projected_month_schedule_totals(self.employee, 2030, 1)
+            projected_month_schedule_totals(self.employee, 2030, 10)
+        self.assertEqual(spy.call_count, 2)
@@ -0,0 +1,77 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .models import Employee, PunchEvent, WorkRecord, WorkSchedule
+from .punches import consolidate_punches, record_punch
+
+User = get_user_model()
+
+
+def local(d: date, hour: int, minute: int = 0) -> datetime:
+    return timezone.make_aware(datetime.combine(d, time(hour, minute)))
+
+
+class PunchTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='punchuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Punch Store',
+            hourly_rate=Decimal('10030'),
+            start_date=date(2025, 3, 1),
+        )
+        WorkSchedule.objects.create(
+            employee=self.employee, weekday=0, start_time=time(9, 0), end_time=time(18, 0), enabled=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_punch_endpoint_only_appends(self):
+        url = f'/api/labor/jobs/{self.employee.pk}/punch/'
+        with self.assertNumQueries(2):  # 소유 확인 + INSERT
+            response = self.client.post(url, {'kind': 'IN'}, format='json')
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data['status'], 'PENDING')
+        self.assertFalse(WorkRecord.objects.filter(employee=self.employee).exists())
+
+        self.assertEqual(self.client.post(url, {'kind': 'LUNCH'}, format='json').status_code, 400)
+        future = (timezone.now() + timedelta(hours=1)).isoformat()
+        self.assertEqual(self.client.post(url, {'kind': 'OUT', 'punched_at': future}, format='json').status_code, 400)
+        other = User.objects.create_user(username='other', password='testpass123')
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.post(url, {'kind': 'IN'}, format='json').status_code, 404)
+
+    def test_consolidate_folds_punches_in_batches(self):
+        monday, tuesday = date(2025, 3, 3), date(2025, 3, 4)
+        record_punch(self.employee.pk, 'IN', local(monday, 9, 2))
+        record_punch(self.employee.pk, 'OUT', local(monday, 12))
+        record_punch(self.employee.pk, 'IN', local(monday, 13))       # 재출근 → 60분 휴게
+        record_punch(self.employee.pk, 'OUT', local(monday, 18, 1))
+        record_punch(self.employee.pk, 'IN', local(tuesday, 22))      # 자정 넘김
+        record_punch(self.employee.pk, 'OUT', local(tuesday + timedelta(days=1), 3))
+        record_punch(self.employee.pk, 'OUT', local(date(2025, 3, 10), 18))  # 출근 없음
+
+        first = consolidate_punches(batch_size=4)
+        self.assertEqual((first.applied, first.unmatched, first.created), (4, 0, 1))
+        rest = consolidate_punches(batch_size=4)
+        self.assertEqual((rest.applied, rest.unmatched), (2, 1))
+        self.assertEqual(consolidate_punches().applied, 0)
+
+        day = WorkRecord.objects.get(employee=self.employee, work_date=monday)
+        self.assertEqual(day.attendance_status, 'REGULAR_WORK')
+        self.assertEqual(day.break_minutes, 60)
+        self.assertEqual(timezone.localtime(day.time_in).time(), time(9, 2))
+        self.assertEqual(timezone.localtime(day.time_out).time(), time(18, 1))
+
+        night = WorkRecord.objects.get(employee=self.employee, work_date=tuesday)
+        self.assertEqual(night.attendance_status, 'EXTRA_WORK')
+        self.assertTrue(night.is_overnight)
+        self.assertEqual(float(night.get_total_hours()), 5.0)
+        self.assertEqual(PunchEvent.objects.filter(status='UNMATCHED').count(), 1)
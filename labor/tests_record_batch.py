@@ -0,0 +1,86 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from . import invalidation
+from .models import Employee, WorkRecord, WorkSchedule
+
+User = get_user_model()
+
+
+class RecordBatchTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='batchuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Batch Cafe',
+            hourly_rate=Decimal('10030'),
+            start_date=date(2025, 3, 1),
+        )
+        for weekday in range(5):
+            WorkSchedule.objects.create(
+                employee=self.employee, weekday=weekday, start_time=time(9, 0), end_time=time(18, 0),
+                break_minutes=60, enabled=True,
+            )
+        # 2025-03-03(월) ~ 03-07(금) 근무 기록
+        for offset in range(5):
+            d = date(2025, 3, 3) + timedelta(days=offset)
+            WorkRecord.objects.create(
+                employee=self.employee, work_date=d,
+                time_in=timezone.make_aware(datetime.combine(d, time(9, 0))),
+                time_out=timezone.make_aware(datetime.combine(d, time(18, 0))),
+                break_minutes=60, attendance_status='REGULAR_WORK',
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = f'/api/labor/jobs/{self.employee.pk}/work-records/batch/'
+
+    def test_week_of_leave_and_clock_out_fix(self):
+        changes = [
+            {'work_date': f'2025-03-{day:02d}', 'attendance_status': 'ANNUAL_LEAVE'} for day in range(3, 6)
+        ] + [
+            {'work_date': '2025-03-06', 'time_out': '20:00'},
+            {'work_date': '2025-03-31', 'time_in': '09:00', 'time_out': '13:00'},
+        ]
+        with mock.patch('labor.invalidation.invalidate', wraps=invalidation.invalidate) as spy:
+            response = self.client.post(self.url, {'changes': changes}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual((response.data['created'], response.data['updated'], response.data['deleted']), (1, 4, 0))
+        self.assertEqual([m['month'] for m in response.data['months']], ['2025-03'])
+
+        leave = WorkRecord.objects.get(employee=self.employee, work_date=date(2025, 3, 4))
+        self.assertEqual(leave.attendance_status, 'ANNUAL_LEAVE')
+        self.assertIsNone(leave.time_in)
+        fixed = WorkRecord.objects.get(employee=self.employee, work_date=date(2025, 3, 6))
+        self.assertEqual(timezone.localtime(fixed.time_in).time(), time(9, 0))
+        self.assertEqual(float(fixed.get_total_hours()), 10.0)
+        created = WorkRecord.objects.get(employee=self.employee, work_date=date(2025, 3, 31))
+        self.assertEqual(created.attendance_status, 'REGULAR_WORK')
+
+    def test_invalid_change_applies_nothing(self):
+        changes = [
+            {'work_date': '2025-03-03', 'attendance_status': 'ANNUAL_LEAVE'},
+            {'work_date': '2025-03-04', 'time_out': '09:30'},  # 휴게시간(60분) > 근무 길이
+            {'work_date': '2025-03-20', 'delete': True},
+        ]
+        response = self.client.post(self.url, {'changes': changes}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([e['index'] for e in response.data['errors']], [1, 2])
+        monday = WorkRecord.objects.get(employee=self.employee, work_date=date(2025, 3, 3))
+        self.assertEqual(monday.attendance_status, 'REGULAR_WORK')
+
+    def test_delete(self):
+        response = self.client.post(self.url, {'changes': [
+            {'work_date': '2025-03-07', 'delete': True},
+        ]}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['deleted'], 1)
+        self.assertFalse(WorkRecord.objects.filter(employee=self.employee, work_date=date(2025, 3, 7)).exists())
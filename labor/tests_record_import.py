@@ -0,0 +1,92 @@
+import io
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from datetime import date, datetime, time
+from decimal import Decimal
+from .models import Employee, WorkRecord, WorkSchedule
+from . import record_import
+from .record_import import import_work_records, iter_json_rows
+
+User = get_user_model()
+
+
+class RecordImportTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='importuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Import Pub',
+            hourly_rate=Decimal('10030'),
+            start_date=date(2025, 3, 1),
+        )
+        WorkSchedule.objects.create(
+            employee=self.employee, weekday=0, start_time=time(18, 0), end_time=time(23, 0), enabled=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = f'/api/labor/jobs/{self.employee.pk}/work-records/import/'
+
+    def test_csv_upload_validates_rows(self):
+        content = (
+            '﻿work_date,time_in,time_out,break_minutes,attendance_status\n'
+            '2025-03-03,18:00,23:00,30,\n'          # 월요일(소정근로일) → REGULAR_WORK
+            '2025-03-04,22:00,04:00,60,\n'          # 자정 넘김 → 6시간 근무, EXTRA_WORK
+            '2025-03-05,09:00,13:00,300,\n'         # 휴게시간 > 근무 길이
+            '2025-03-03,10:00,12:00,0,\n'           # 파일 내 중복
+            '2025-02-28,10:00,12:00,0,\n'           # 근무 시작일 이전
+            '2025-03-06,10:00,12:00,0,ABSENT\n'     # 결근에 출퇴근 시간
+            '2025-03-07,,,0,ANNUAL_LEAVE\n'
+            '2025-3-8,10:00,12:00,0,\n'             # 날짜 형식
+        ).encode('utf-8')
+        upload = SimpleUploadedFile('timesheet.csv', content, content_type='text/csv')
+        response = self.client.post(self.url, {'file': upload}, format='multipart')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['created'], response.data['updated']), (3, 0))
+        self.assertEqual([e['row'] for e in response.data['errors']], [3, 4, 5, 6, 8])
+        self.assertIn('break_minutes', response.data['errors'][0]['errors'])
+        self.assertEqual([m['month'] for m in response.data['months']], ['2025-03'])
+
+        monday = WorkRecord.objects.get(employee=self.employee, work_date=date(2025, 3, 3))
+        self.assertEqual(monday.attendance_status, 'REGULAR_WORK')
+        overnight = WorkRecord.objects.get(employee=self.employee, work_date=date(2025, 3, 4))
+        self.assertTrue(overnight.is_overnight)
+        self.assertEqual(overnight.attendance_status, 'EXTRA_WORK')
+        self.assertEqual(float(overnight.get_total_hours()), 5.0)
+
+    def test_json_upsert_in_chunks_invalidates_once(self):
+        WorkRecord.objects.create(
+            employee=self.employee, work_date=date(2025, 3, 10),
+            time_in=datetime(2025, 3, 10, 18, 0), time_out=datetime(2025, 3, 10, 20, 0),
+        )
+        body = '[' + ','.join(
+            f'{{"work_date": "2025-03-{d:02d}", "time_in": "18:00", "time_out": "23:00", "break_minutes": 30}}'
+            for d in range(3, 15)
+        ) + ']'
+        # 작은 읽기 조각으로 객체가 조각 경계에 걸리는 경우까지 확인
+        with mock.patch.object(record_import, 'READ_CHUNK_SIZE', 16), \
+                mock.patch('labor.invalidation.invalidate') as invalidate:
+            result = import_work_records(self.employee, iter_json_rows(io.BytesIO(body.encode('utf-8'))), chunk_size=5)
+        self.assertEqual((result.created, result.updated, result.errors), (11, 1, []))
+        invalidate.assert_called_once()
+        updated = WorkRecord.objects.get(employee=self.employee, work_date=date(2025, 3, 10))
+        self.assertEqual(float(updated.get_total_hours()), 4.5)
+        self.assertEqual(WorkRecord.objects.filter(employee=self.employee).count(), 12)
+
+    def test_raw_json_lines_and_bad_input(self):
+        body = b'{"work_date": "2025-03-03", "time_in": "18:00", "time_out": "22:00"}\n' \
+               b'{"work_date": "2025-03-10", "time_in": "18:00", "time_out": "22:00"}\n'
+        response = self.client.post(self.url, body, content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['created'], 2)
+
+        response = self.client.post(self.url, b'[{"work_date": "2025-03-03"', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.data)
+        response = self.client.post(self.url, b'<xml/>', content_type='application/xml')
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,60 @@
+import io
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time, timezone as dt_timezone
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from .models import Employee
+from .renderers import ORJSONParser, ORJSONRenderer
+
+User = get_user_model()
+
+
+@dataclass
+class Point:
+    x: int
+    label: str
+
+
+class ORJSONRendererTestCase(TestCase):
+    def test_same_output_as_drf_renderer(self):
+        data = {
+            'amount': Decimal('10030.50'),
+            'day': date(2025, 3, 3),
+            'utc': datetime(2025, 3, 3, 0, 0, tzinfo=dt_timezone.utc),
+            'local': timezone.localtime(datetime(2025, 3, 3, 0, 0, 0, 123456, tzinfo=dt_timezone.utc)),
+            'at': time(9, 30),
+            'months': {3: ['한글'], 4: []},
+            'empty': None,
+        }
+        self.assertEqual(json.loads(ORJSONRenderer().render(data)), json.loads(JSONRenderer().render(data)))
+        self.assertEqual(json.loads(ORJSONRenderer().render({'p': Point(1, 'a')})), {'p': {'x': 1, 'label': 'a'}})
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_parser(self):
+        body = '{"changes": [{"work_date": "2025-03-03", "break_minutes": 30}], "name": "카페"}'.encode()
+        self.assertEqual(ORJSONParser().parse(io.BytesIO(body)), json.loads(body))
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"a": '))
+
+    def test_api_uses_configured_classes(self):
+        user = User.objects.create_user(username='jsonuser', password='testpass123')
+        client = APIClient()
+        client.force_authenticate(user)
+        response = client.post('/api/labor/jobs/', data=json.dumps({
+            'workplace_name': '제이슨 카페', 'start_date': '2025-03-01', 'hourly_rate': '10030.00',
+        }), content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(response.content)['workplace_name'], '제이슨 카페')
+        self.assertEqual(Employee.objects.get(user=user).hourly_rate, Decimal('10030.00'))
+
+        bad = client.post('/api/labor/jobs/', data='{"workplace_name": ', content_type='application/json')
+        self.assertEqual(bad.status_code, 400)
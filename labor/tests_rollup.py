@@ -0,0 +1,73 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from datetime import date, datetime, time
+from decimal import Decimal
+from .models import Employee, WorkRecord, WorkSchedule
+from .services import compute_payroll_summary
+from .rollup import compute_user_rollup
+
+User = get_user_model()
+
+
+class UserRollupTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        cache.set('holidays:2024-05', [])
+        self.user = User.objects.create_user(username='rollupuser', password='testpass123')
+        self.cafe = Employee.objects.create(
+            user=self.user, workplace_name='Cafe', hourly_rate=Decimal('10000'),
+            start_date=date(2024, 1, 1), contract_weekly_hours=30, is_workplace_over_5=True
+        )
+        self.store = Employee.objects.create(
+            user=self.user, workplace_name='Store', hourly_rate=Decimal('11000'),
+            start_date=date(2024, 1, 1), contract_weekly_hours=25, deduction_type='FREELANCE'
+        )
+        for i in range(5):
+            WorkSchedule.objects.create(
+                employee=self.cafe, weekday=i,
+                start_time=time(9, 0), end_time=time(15, 0), enabled=True
+            )
+        for i in (0, 1, 2, 3, 4, 5):
+            WorkSchedule.objects.create(
+                employee=self.store, weekday=i,
+                start_time=time(17, 0), end_time=time(22, 0), enabled=True
+            )
+        WorkRecord.objects.create(
+            employee=self.store, work_date=date(2024, 5, 11),
+            time_in=datetime(2024, 5, 11, 17, 0), time_out=datetime(2024, 5, 11, 23, 0),
+            attendance_status='EXTRA_WORK'
+        )
+
+    def test_per_job_matches_monthly_summary(self):
+        result = compute_user_rollup(self.user, 2024, 5)
+        self.assertEqual([j['job_id'] for j in result['jobs']], [self.cafe.pk, self.store.pk])
+        for job, employee in zip(result['jobs'], (self.cafe, self.store)):
+            summary = compute_payroll_summary(employee, 2024, 5)
+            self.assertEqual(job['estimated_monthly_pay'], summary['estimated_monthly_pay'])
+            self.assertEqual(job['net_pay'], summary['net_pay'])
+        self.assertEqual(
+            result['totals']['net_pay'],
+            sum(j['net_pay'] for j in result['jobs'])
+        )
+
+    def test_cross_job_weekly_hours(self):
+        result = compute_user_rollup(self.user, 2024, 5)
+        week = next(w for w in result['weeks'] if w['week_start'] == '2024-05-06')
+        # 카페 6h × 5일 + 편의점 5h × 5일 + 토요일 실제 6h
+        self.assertEqual(week['total_hours'], 61.0)
+        self.assertTrue(week['over_cap'])
+        self.assertEqual(sum(j['hours'] for j in week['by_job']), week['total_hours'])
+
+    def test_query_count_independent_of_job_count(self):
+        with CaptureQueriesContext(connection) as two_jobs:
+            compute_user_rollup(self.user, 2024, 5)
+        Employee.objects.create(
+            user=self.user, workplace_name='Third', hourly_rate=Decimal('10000'),
+            start_date=date(2024, 1, 1)
+        )
+        with CaptureQueriesContext(connection) as three_jobs:
+            compute_user_rollup(self.user, 2024, 5)
+        self.assertEqual(len(two_jobs.captured_queries), len(three_jobs.captured_queries))
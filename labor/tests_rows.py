@@ -0,0 +1,113 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .dataset import EmployeeDataset
+from .fieldsets import FieldSelection, parse_field_paths
+from .models import Employee, MonthlySchedule, WorkRecord, WorkSchedule
+from .rows import PayrollSummary, WorkRecordRow, converter, work_record_rows
+from .serializers import PayrollSummarySerializer, WorkRecordSerializer
+from .services import monthly_scheduled_dates
+from .snapshots import get_payroll_summary
+
+User = get_user_model()
+
+
+class RowBuildersTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='rowsuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Rows Bistro',
+            hourly_rate=Decimal('10030'),
+            start_date=date(2025, 3, 1),
+        )
+        WorkSchedule.objects.create(
+            employee=self.employee, weekday=0, start_time=time(9, 0), end_time=time(13, 0), enabled=True
+        )
+        WorkSchedule.objects.create(
+            employee=self.employee, weekday=2, start_time=time(22, 0), end_time=time(2, 0),
+            is_overnight=True, break_minutes=30, enabled=True
+        )
+        MonthlySchedule.objects.create(
+            employee=self.employee, year=2025, month=3, weekday=4, start_time=None, end_time=None, enabled=True
+        )
+        for day, (t_in, t_out) in {3: (time(9, 0), time(13, 0)), 5: (time(22, 0), time(2, 0)),
+                                   7: (time(10, 0), time(12, 0))}.items():
+            d = date(2025, 3, day)
+            WorkRecord.objects.create(
+                employee=self.employee, work_date=d,
+                time_in=timezone.make_aware(datetime.combine(d, t_in)),
+                time_out=timezone.make_aware(datetime.combine(d, t_out)),
+            )
+        WorkRecord.objects.create(employee=self.employee, work_date=date(2025, 3, 10), attendance_status='ABSENT')
+
+    def test_payroll_summary_matches_serializer(self):
+        data = get_payroll_summary(self.employee, 2025, 3)
+        self.assertEqual(PayrollSummary.from_dict(data).to_dict(), PayrollSummarySerializer(data).data)
+
+        # 오래된 스냅샷처럼 선택 필드가 빠진 경우 (기본값 / 생략 규칙)
+        legacy = dict(data, rows=[{k: v for k, v in data['rows'][0].items() if k not in ('hourly_wage', 'is_future')}])
+        legacy['summary'] = dict(data['summary'], deduction={'type': 'NONE', 'total': 0})
+        for key in ('net_pay', 'night_hours'):
+            legacy.pop(key, None)
+        self.assertEqual(PayrollSummary.from_dict(legacy).to_dict(), PayrollSummarySerializer(legacy).data)
+        self.assertNotIn('hourly_wage', PayrollSummary.from_dict(legacy).to_dict()['rows'][0])
+
+        selection = FieldSelection(parse_field_paths('month,summary.total,rows.date'))
+        picked = PayrollSummary.from_dict(data, selection).to_dict(selection)
+        self.assertEqual(picked, selection.trim_serializer(PayrollSummarySerializer(data)).data)
+
+        # 선택 조합이 달라도 변환 함수는 row 클래스당 하나
+        converter.cache_clear()
+        names = list(PayrollSummarySerializer().fields)
+        for i in range(1, len(names)):
+            paths = parse_field_paths(','.join(names[i - 1:i + 2]))
+            selection = FieldSelection(paths) if i % 2 else FieldSelection(omit=paths)
+            picked = PayrollSummary.from_dict(data, selection).to_dict(selection)
+            self.assertEqual(picked, selection.trim_serializer(PayrollSummarySerializer(data)).data)
+        # PayrollSummary, PayrollTotals, PayrollRow (+ 중첩 deduction 등)
+        self.assertLessEqual(converter.cache_info().currsize, 5)
+
+    def test_work_record_rows_match_serializer_with_fewer_queries(self):
+        records = WorkRecord.objects.filter(employee=self.employee).order_by('work_date')
+        expected = WorkRecordSerializer(records, many=True).data
+        dataset = EmployeeDataset.load(self.employee, date(2025, 3, 1), date(2025, 3, 31), with_records=False)
+        with self.assertNumQueries(1):
+            rows = work_record_rows(records.all(), dataset)
+        self.assertEqual(rows, expected)
+        record = records.first()
+        self.assertEqual(WorkRecordRow.from_record(record).to_dict(), WorkRecordSerializer(record).data)
+
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.get(
+            f'/api/labor/jobs/{self.employee.pk}/work-records/', {'start': '2025-03-01', 'end': '2025-03-31'}
+        )
+        self.assertEqual(response.json(), [dict(r, schedule_info={
+            k: v.strftime('%H:%M:%S') if isinstance(v, time) else v for k, v in r['schedule_info'].items()
+        }) for r in reversed(expected)])
+
+    def test_calendar_days(self):
+        with self.assertNumQueries(4):
+            dates = monthly_scheduled_dates(self.employee, 2025, 3)
+        by_day = {d['day']: d for d in dates}
+        self.assertEqual(len(dates), 31)
+        self.assertEqual(by_day[3]['record'], WorkRecordSerializer(WorkRecord.objects.get(work_date=date(2025, 3, 3))).data)
+        self.assertTrue(by_day[3]['is_worked'])
+        self.assertEqual(by_day[5]['schedule_source'], 'weekly')
+        self.assertEqual(by_day[5]['scheduled_start_time'], '22:00')
+        self.assertTrue(by_day[5]['scheduled_is_overnight'])
+        # 시간 없는 월별 스케줄 = 명시적 휴무 (주간 스케줄로 fallback 하지 않음)
+        self.assertEqual(by_day[7]['schedule_source'], 'monthly')
+        self.assertFalse(by_day[7]['is_scheduled_workday'])
+        self.assertEqual(by_day[10]['attendance_status'], 'ABSENT')
+        self.assertFalse(by_day[10]['is_worked'])
+        self.assertIsNone(by_day[11]['schedule_source'])
+        self.assertIsNone(by_day[11]['record'])
@@ -0,0 +1,105 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from rest_framework.test import APIClient
+from .models import Employee, WorkRecord, WorkSchedule
+from . import services
+from .ledger import PayTerms, build_month_ledger, price_payroll
+from .simulation import SimulationError, simulate
+
+User = get_user_model()
+
+
+class SimulationTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='simuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Simulation Pub',
+            hourly_rate=Decimal('10000'),
+            start_date=date(2024, 1, 1),
+            contract_weekly_hours=20,
+            is_workplace_over_5=True
+        )
+        for i in range(5):
+            WorkSchedule.objects.create(
+                employee=self.employee, weekday=i,
+                start_time=time(19, 0), end_time=time(23, 0), enabled=True
+            )
+        cache.set('holidays:2024-03', [{'date': '2024-03-01', 'name': '삼일절', 'type': 'LEGAL'}])
+        for day in (1, 4, 5):
+            WorkRecord.objects.create(
+                employee=self.employee, work_date=date(2024, 3, day),
+                time_in=datetime(2024, 3, day, 19, 0), time_out=datetime(2024, 3, day, 23, 30),
+                attendance_status='REGULAR_WORK'
+            )
+
+    def test_ledger_pricing_matches_payroll_summary(self):
+        ledger = build_month_ledger(self.employee, 2024, 3)
+        for terms in (
+            PayTerms.from_employee(self.employee),
+            PayTerms.from_employee(self.employee).with_overrides(
+                hourly_rate=Decimal('12345'), deduction_type='FOUR_INSURANCE', is_workplace_over_5=False
+            ),
+        ):
+            self.employee.hourly_rate = terms.hourly_rate
+            self.employee.deduction_type = terms.deduction_type
+            self.employee.is_workplace_over_5 = terms.is_workplace_over_5
+            summary = services.compute_payroll_summary(self.employee, 2024, 3)
+            priced = price_payroll(ledger, terms)
+            for field in ('total_hours', 'base_pay', 'holiday_bonus', 'night_bonus', 'estimated_monthly_pay', 'net_pay'):
+                self.assertEqual(priced[field], summary[field], field)
+            self.assertEqual(priced['weekly_holiday_pay'], summary['monthly_weekly_holiday_pay'])
+
+    def test_scenarios_reuse_ledger_and_leave_employee_unchanged(self):
+        today = date(2024, 3, 20)
+        scenarios = [
+            {'name': 'raise', 'hourly_rate': 11000},
+            {'name': 'insurance', 'deduction_type': 'FOUR_INSURANCE'},
+        ]
+        with mock.patch.object(services, 'weekly_holiday_facts', wraps=services.weekly_holiday_facts) as facts_spy:
+            result = simulate(self.employee, 2024, 3, scenarios, today=today)
+            facts_calls = facts_spy.call_count
+            simulate(self.employee, 2024, 3, scenarios * 3, today=today)
+        # 두 번째 요청은 캐시된 원장을 사용 → 퇴직금 90일 창의 주만 다시 수집
+        self.assertEqual(facts_spy.call_count - facts_calls, 13)
+
+        raise_scenario = result['scenarios'][0]
+        self.assertEqual(raise_scenario['payroll']['hourly_wage'], 11000)
+        self.assertGreater(raise_scenario['diff']['net_pay'], 0)
+        insurance = result['scenarios'][1]
+        self.assertLess(insurance['diff']['net_pay'], 0)
+        self.assertEqual(insurance['diff']['estimated_monthly_pay'], 0)
+
+        self.employee.refresh_from_db()
+        self.assertEqual(self.employee.hourly_rate, Decimal('10000'))
+        self.assertEqual(self.employee.deduction_type, 'NONE')
+
+    def test_severance_pricing_matches_calculator(self):
+        today = self.employee.start_date + timedelta(days=400)
+        with mock.patch('django.utils.timezone.localdate', return_value=today):
+            expected = services.calculate_severance_v2(self.employee)
+            result = simulate(self.employee, today.year, today.month, [], today=today)
+        self.assertEqual(result['baseline']['severance'], expected)
+
+    def test_invalid_override_rejected(self):
+        with self.assertRaises(SimulationError):
+            simulate(self.employee, 2024, 3, [{'deduction_type': 'BOGUS'}])
+        with self.assertRaises(SimulationError):
+            simulate(self.employee, 2024, 3, [{'hourly_rate': -1}])
+        for bad in ({'hourly_rate': 'NaN'}, {'hourly_rate': 'Infinity'}, {'hourly_rate': '-Infinity'},
+                    {'contract_weekly_hours': 'NaN'}, {'contract_weekly_hours': 'Infinity'}):
+            with self.assertRaises(SimulationError):
+                simulate(self.employee, 2024, 3, [bad])
+
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.post(
+            f'/api/labor/jobs/{self.employee.pk}/simulate/', {'month': '2024-03', 'hourly_rate': 'NaN'}, format='json'
+        )
+        self.assertEqual(response.status_code, 400)
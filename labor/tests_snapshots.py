@@ -0,0 +1,71 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from datetime import datetime, date, time, timedelta
+from decimal import Decimal
+from .models import Employee, WorkRecord, WorkSchedule, CalculationResult
+from .snapshots import PAYROLL_SNAPSHOT_TYPE, get_payroll_summary, is_month_closed
+
+User = get_user_model()
+
+
+class PayrollSnapshotTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='snapuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Snapshot Cafe',
+            hourly_rate=Decimal('10000'),
+            start_date=date(2025, 1, 1),
+            contract_weekly_hours=20
+        )
+        for i in range(5):
+            WorkSchedule.objects.create(
+                employee=self.employee, weekday=i,
+                start_time=time(9, 0), end_time=time(13, 0), enabled=True
+            )
+        # 2025-03: 토요일 시작, 3/31은 월요일 -> 마지막 주는 4/6(일)에 끝남
+        for d in (date(2025, 3, 3), date(2025, 3, 4)):
+            WorkRecord.objects.create(
+                employee=self.employee, work_date=d, attendance_status='REGULAR_WORK',
+                time_in=datetime.combine(d, time(9, 0)), time_out=datetime.combine(d, time(13, 0))
+            )
+
+    def _snapshots(self):
+        return CalculationResult.objects.filter(employee=self.employee, calculation_type=PAYROLL_SNAPSHOT_TYPE)
+
+    def test_month_closed_after_last_week(self):
+        self.assertFalse(is_month_closed(2025, 3, today=date(2025, 4, 6)))
+        self.assertTrue(is_month_closed(2025, 3, today=date(2025, 4, 7)))
+
+    def test_snapshot_created_and_served(self):
+        first = get_payroll_summary(self.employee, 2025, 3)
+        snapshot = self._snapshots().get()
+        self.assertEqual(snapshot.period_start, date(2025, 3, 1))
+        self.assertEqual(snapshot.period_end, date(2025, 3, 31))
+        self.assertEqual(snapshot.data_version, Employee.objects.get(pk=self.employee.pk).data_version)
+        self.assertEqual(get_payroll_summary(self.employee, 2025, 3), first)
+        self.assertEqual(self._snapshots().count(), 1)
+
+    def test_backdated_edit_invalidates_only_touched_month(self):
+        get_payroll_summary(self.employee, 2025, 2)
+        get_payroll_summary(self.employee, 2025, 3)
+        self.assertEqual(self._snapshots().count(), 2)
+
+        record = WorkRecord.objects.get(employee=self.employee, work_date=date(2025, 3, 4))
+        record.time_out = datetime.combine(record.work_date, time(15, 0))
+        record.save()
+
+        self.assertEqual(list(self._snapshots().values_list('period_start', flat=True)), [date(2025, 2, 1)])
+        refreshed = get_payroll_summary(self.employee, 2025, 3)
+        self.assertEqual(refreshed['actual_hours'], 10.0)
+
+    def test_rate_change_invalidates_all(self):
+        get_payroll_summary(self.employee, 2025, 3)
+        self.employee.hourly_rate = Decimal('11000')
+        self.employee.save()
+        self.assertFalse(self._snapshots().exists())
+
+    def test_open_month_not_snapshotted(self):
+        today = date.today()
+        get_payroll_summary(self.employee, today.year, today.month)
+        self.assertFalse(self._snapshots().exists())
@@ -0,0 +1,105 @@
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .models import Employee, WorkRecord, WorkSchedule
+from .subrequests import MAX_SUBREQUESTS
+
+User = get_user_model()
+
+
+class BatchRequestsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='batchuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Batch Kitchen',
+            hourly_rate=Decimal('10030'),
+            start_date=date(2025, 3, 1),
+        )
+        WorkSchedule.objects.create(
+            employee=self.employee, weekday=0, start_time=time(9, 0), end_time=time(13, 0), enabled=True
+        )
+        d = date(2025, 3, 3)
+        WorkRecord.objects.create(
+            employee=self.employee, work_date=d,
+            time_in=timezone.make_aware(datetime.combine(d, time(9, 0))),
+            time_out=timezone.make_aware(datetime.combine(d, time(13, 0))),
+        )
+        other = User.objects.create_user(username='otheruser', password='testpass123')
+        self.other_employee = Employee.objects.create(
+            user=other, workplace_name='Other Shop', hourly_rate=Decimal('10030'), start_date=date(2025, 3, 1),
+        )
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+        self.base = f'/api/labor/jobs/{self.employee.pk}'
+
+    def batch(self, requests):
+        return self.client.post('/api/batch/', {'requests': requests}, format='json')
+
+    def test_responses_match_direct_requests_with_shared_loads(self):
+        requests = [
+            {'id': 'calendar', 'path': f'{self.base}/calendar/', 'params': {'month': '2025-03'}},
+            {'id': 'payroll', 'path': f'{self.base}/payroll-summary/?month=2025-03'},
+            {'id': 'records', 'path': f'{self.base}/work-records/',
+             'params': {'start': '2025-03-01', 'end': '2025-03-31'}},
+        ]
+        direct_queries = 0
+        for item in requests:
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get(item['path'], item.get('params'))
+            direct_queries += len(queries)
+        cache.clear()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.batch(requests)
+        batch_sql = [q['sql'] for q in queries]
+        self.assertEqual(response.status_code, 200)
+        self.assertLess(len(batch_sql), direct_queries)
+        self.assertEqual(sum('FROM "labor_employee"' in sql for sql in batch_sql), 1)
+        self.assertEqual(sum('FROM "labor_workschedule"' in sql and 'COUNT' not in sql for sql in batch_sql), 2)
+
+        responses = json.loads(response.content)['responses']
+        self.assertEqual([r['id'] for r in responses], ['calendar', 'payroll', 'records'])
+        for item, sub in zip(requests, responses):
+            self.assertEqual(sub['status'], 200)
+            self.assertEqual(sub['body'], self.client.get(item['path'], item.get('params')).json())
+
+    def test_holidays_fetched_once_per_batch(self):
+        with mock.patch('labor.holidays._fetch_ics_text', side_effect=OSError('offline')) as fetch:
+            response = self.batch([
+                {'path': '/api/labor/holidays/', 'params': {'month': '2025-03'}},
+                {'path': '/api/labor/holidays/', 'params': {'month': '2025-03'}},
+            ])
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual([r['body'] for r in response.data['responses']], [[], []])
+
+    def test_permissions_and_validation(self):
+        responses = self.batch([
+            {'path': f'/api/labor/jobs/{self.other_employee.pk}/calendar/', 'params': {'month': '2025-03'}},
+            {'path': '/api/batch/'},
+            {'path': f'{self.base}/', 'method': 'DELETE'},
+            {'path': '/admin/'},
+            {'path': '/api/labor/nope/'},
+            {'id': 'bad-month', 'path': f'{self.base}/calendar/'},
+        ]).data['responses']
+        self.assertEqual([r['status'] for r in responses], [404, 400, 400, 400, 404, 400])
+        self.assertEqual(responses[5]['id'], 'bad-month')
+        self.assertTrue(Employee.objects.filter(pk=self.employee.pk).exists())
+
+        self.assertEqual(self.batch([{'path': f'{self.base}/'}] * (MAX_SUBREQUESTS + 1)).status_code, 400)
+        self.assertEqual(self.client.post('/api/batch/', {'requests': []}, format='json').status_code, 400)
+
+        anonymous = APIClient().post('/api/batch/', {'requests': [{'path': f'{self.base}/'}]}, format='json')
+        self.assertEqual(anonymous.status_code, 401)
@@ -0,0 +1,87 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .models import Employee, MonthlySchedule, SyncChange, WorkRecord, WorkSchedule
+from .record_import import import_work_records
+
+User = get_user_model()
+
+
+class SyncFeedTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='syncuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Sync Bakery',
+            hourly_rate=Decimal('10030'),
+            start_date=date(2025, 3, 1),
+        )
+        self.schedule = WorkSchedule.objects.create(
+            employee=self.employee, weekday=0, start_time=time(9, 0), end_time=time(13, 0), enabled=True
+        )
+        self.record = WorkRecord.objects.create(
+            employee=self.employee, work_date=date(2025, 3, 3),
+            time_in=timezone.make_aware(datetime(2025, 3, 3, 9, 0)),
+            time_out=timezone.make_aware(datetime(2025, 3, 3, 13, 0)),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = '/api/labor/sync/'
+
+    def test_full_then_delta_with_tombstones(self):
+        full = self.client.get(self.url).data
+        self.assertTrue(full['full'])
+        self.assertEqual([e['id'] for e in full['changes']['employees']], [self.employee.pk])
+        self.assertEqual([r['id'] for r in full['changes']['work_records']], [self.record.pk])
+        token = full['token']
+
+        # 변경 없음
+        empty = self.client.get(self.url, {'since': token}).data
+        self.assertEqual((empty['token'], empty['changes']['work_records']), (token, []))
+
+        self.record.break_minutes = 30
+        self.record.save()
+        schedule_id = self.schedule.pk
+        self.schedule.delete()
+        MonthlySchedule.objects.create(employee=self.employee, year=2025, month=3, weekday=1, enabled=True)
+        import_work_records(self.employee, [{'work_date': '2025-03-04', 'time_in': '10:00', 'time_out': '12:00'}])
+
+        delta = self.client.get(self.url, {'since': token}).data
+        self.assertFalse(delta['full'])
+        self.assertGreater(int(delta['token']), int(token))
+        self.assertEqual(
+            sorted(r['work_date'] for r in delta['changes']['work_records']), ['2025-03-03', '2025-03-04']
+        )
+        self.assertEqual(delta['deleted']['work_schedules'], [schedule_id])
+        self.assertEqual(len(delta['changes']['monthly_schedules']), 1)
+        self.assertEqual(delta['changes']['monthly_schedules'][0]['employee'], self.employee.pk)
+
+        # 나눠 받기
+        page = self.client.get(self.url, {'since': token, 'limit': 1}).data
+        self.assertTrue(page['has_more'])
+        rest = self.client.get(self.url, {'since': page['token']}).data
+        self.assertEqual(rest['token'], delta['token'])
+
+        self.assertEqual(self.client.get(self.url, {'since': '999999'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'since': 'abc'}).status_code, 400)
+
+    def test_log_keeps_one_row_per_object(self):
+        for minutes in (10, 20, 30):
+            self.record.break_minutes = minutes
+            self.record.save()
+        self.assertEqual(SyncChange.objects.filter(model='work_record', object_id=self.record.pk).count(), 1)
+
+        other = User.objects.create_user(username='othersync', password='testpass123')
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.get(self.url).data['changes']['work_records'], [])
+
+        # 사용자 삭제 시 연쇄 삭제에서 변경 로그를 다시 만들지 않음
+        self.user.delete()
+        self.assertFalse(SyncChange.objects.filter(user_id=self.user.pk).exists())
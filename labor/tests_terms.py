@@ -0,0 +1,90 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from datetime import date, time
+from decimal import Decimal
+from .models import Employee, EmploymentTerms, WorkSchedule
+from . import services
+from .invalidation import payroll_key
+from .terms import TermsTimeline
+
+User = get_user_model()
+
+
+class EmploymentTermsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='termsuser', password='testpass123')
+        self.employee = Employee.objects.create(
+            user=self.user,
+            workplace_name='Terms Bakery',
+            hourly_rate=Decimal('10000'),
+            start_date=date(2024, 1, 1),
+            contract_weekly_hours=20,
+            is_workplace_over_5=True
+        )
+        for i in range(5):
+            WorkSchedule.objects.create(
+                employee=self.employee, weekday=i,
+                start_time=time(9, 0), end_time=time(13, 0), enabled=True
+            )
+        for month in range(1, 13):
+            cache.set(f'holidays:2024-{month:02d}', [])
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _add_terms(self, **data):
+        return self.client.post(f'/api/labor/jobs/{self.employee.pk}/terms/', data, format='json')
+
+    def test_as_of_lookup(self):
+        EmploymentTerms.objects.create(employee=self.employee, effective_from=date(2024, 1, 1), hourly_rate=10000)
+        EmploymentTerms.objects.create(employee=self.employee, effective_from=date(2024, 7, 1), hourly_rate=11000)
+        timeline = TermsTimeline.load(self.employee)
+        self.assertEqual(timeline.as_of(date(2023, 12, 1)).hourly_rate, Decimal('10000'))
+        self.assertEqual(timeline.as_of(date(2024, 6, 30)).hourly_rate, Decimal('10000'))
+        self.assertEqual(timeline.as_of(date(2024, 7, 1)).hourly_rate, Decimal('11000'))
+        self.assertEqual(timeline.as_of(date(2025, 1, 1)).hourly_rate, Decimal('11000'))
+        self.assertTrue(timeline.is_uniform(date(2024, 2, 1), date(2024, 6, 30)))
+        self.assertFalse(timeline.is_uniform(date(2024, 6, 1), date(2024, 7, 31)))
+
+    def test_dated_raise_keeps_past_months(self):
+        june_before = services.compute_payroll_summary(self.employee, 2024, 6)
+        response = self._add_terms(effective_from='2024-07-15', hourly_rate=12000)
+        self.assertEqual(response.status_code, 201)
+        # 기준 행(근무 시작일) + 인상 행
+        self.assertEqual(EmploymentTerms.objects.filter(employee=self.employee).count(), 2)
+        self.employee.refresh_from_db()
+        self.assertEqual(self.employee.hourly_rate, Decimal('12000'))
+
+        june_after = services.compute_payroll_summary(self.employee, 2024, 6)
+        self.assertEqual(june_after['estimated_monthly_pay'], june_before['estimated_monthly_pay'])
+
+        july = services.compute_payroll_summary(self.employee, 2024, 7)
+        wages = {row['date']: row['hourly_wage'] for row in july['rows']}
+        self.assertEqual(wages['2024-07-12'], 10000)
+        self.assertEqual(wages['2024-07-15'], 12000)
+        self.assertEqual(july['hourly_wage'], 12000)
+
+    def test_schedule_totals_priced_per_day(self):
+        EmploymentTerms.objects.create(employee=self.employee, effective_from=date(2024, 1, 1), hourly_rate=10000)
+        EmploymentTerms.objects.create(employee=self.employee, effective_from=date(2030, 7, 15), hourly_rate=12000)
+        totals = services.compute_month_schedule_totals(self.employee, 2030, 7)
+        # 2030-07: 평일 23일 중 1~12일 10일은 10000원, 15일 이후 13일은 12000원 (하루 4시간)
+        self.assertEqual(totals['scheduled_work_days'], 23)
+        self.assertEqual(totals['scheduled_estimated_salary'], 10 * 4 * 10000 + 13 * 4 * 12000)
+
+    def test_invalidation_starts_at_effective_from(self):
+        self._add_terms(effective_from='2024-01-01', hourly_rate=10000)
+        with mock.patch('labor.signals.invalidate') as spy:
+            self._add_terms(effective_from='2024-07-01', hourly_rate=11000)
+        keys = set().union(*(c.args[1] for c in spy.call_args_list))
+        self.assertIn(payroll_key(2024, 7), keys)
+        self.assertNotIn(payroll_key(2024, 6), keys)
+
+    def test_invalid_terms_rejected(self):
+        self.assertEqual(self._add_terms(effective_from='2024-13-01', hourly_rate=11000).status_code, 400)
+        self.assertEqual(self._add_terms(effective_from='2024-07-01', hourly_rate=-1).status_code, 400)
+        self.assertFalse(EmploymentTerms.objects.filter(employee=self.employee).exists())
@@ -7,6 +7,8 @@ from .views import (
     CalculationResultViewSet,
     annual_leave_summary,
     holidays,
+    me_rollup,
+    sync_changes,
 )
 
 router = DefaultRouter()
@@ -27,4 +29,6 @@ router.register("employees", EmployeeViewSet, basename="employee")
 urlpatterns = [
     path('leave/annual/summary/', annual_leave_summary, name='annual-leave-summary'),
     path('holidays/', holidays, name='holidays'),
+    path('me/rollup/', me_rollup, name='me-rollup'),
+    path('sync/', sync_changes, name='sync-changes'),
 ] + router.urls
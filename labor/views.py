@@ -3,6 +3,7 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action, api_view, permission_classes as drf_permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.settings import api_settings
 from datetime import datetime, timedelta, date, time
 from dateutil.relativedelta import relativedelta
 from decimal import Decimal
@@ -11,7 +12,14 @@ from django.db import models
 import calendar as pycal  # calendar 모듈 import 추가
 from .models import Employee, WorkRecord, CalculationResult, LeaveUsage, WorkSchedule
 from .services import job_to_inputs, evaluate_labor, calculate_annual_leave, compute_monthly_schedule_stats, monthly_scheduled_dates, compute_payroll_summary
+from .columnar import ColumnarJSONRenderer
+from .dataset import EmployeeDataset
 from .holidays import get_holidays_for_month
+from .request_memo import memoize
+from .rows import PayrollSummary, work_record_rows
+from .snapshots import get_payroll_summary, is_month_closed
+from .compression import mark_compressed_cacheable
+from .invalidation import ResultKey, SEVERANCE, CUMULATIVE, annual_leave_key, cached_result, monthly_schedule_replaced, payroll_year_key
 from .serializers import (
     EmployeeSerializer,
     EmployeeUpdateSerializer,
@@ -21,11 +29,15 @@ from .serializers import (
     PayrollSummarySerializer
 )
 from django.http import Http404
+from django.utils.cache import patch_cache_control
 import logging
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
+# 행 배열 응답(캘린더, 급여 요약)에 ?format=columnar 추가
+COLUMNAR_RENDERERS = [*api_settings.DEFAULT_RENDERER_CLASSES, ColumnarJSONRenderer]
+
 today = date.today()
 
 
@@ -44,9 +56,24 @@ class EmployeeViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         return Employee.objects.filter(user=self.request.user)
 
+    def get_object(self):
+        # POST /api/batch/ 하위 요청끼리는 같은 Employee를 한 번만 조회 (조회 자체는 get_queryset 기준이라 소유자 확인 동일)
+        if self.request.method not in permissions.SAFE_METHODS:
+            return super().get_object()
+        lookup = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        obj = memoize(('employee', self.request.user.pk, str(lookup)), super().get_object)
+        self.check_object_permissions(self.request, obj)
+        return obj
+
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    def perform_content_negotiation(self, request, force=False):
+        # export의 ?format=csv|xlsx는 파일 형식이므로 DRF의 format 지정(렌더러 선택)으로 404가 나지 않도록 함
+        if self.action == 'export':
+            force = True
+        return super().perform_content_negotiation(request, force)
+
     def get_serializer_class(self):
         """액션에 따라 다른 Serializer 사용"""
         if self.action in ['update', 'partial_update']:
@@ -159,11 +186,22 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         
         return Response(data)
 
-    @action(detail=True, methods=['get'], url_path='payroll-summary')
+    @action(detail=True, methods=['get'], url_path='payroll-summary', renderer_classes=COLUMNAR_RENDERERS)
     def payroll_summary(self, request, pk=None):
-        """월별 급여 집계 및 요약 API"""
+        """월별 급여 집계 및 요약 API
+
+        ?fields=month,summary.total / ?omit=rows,notes 로 필요한 필드만 받을 수 있음
+        (선택하지 않은 필드는 변환하지 않음)
+        ?format=columnar: rows를 필드별 배열로 (labor/columnar.py)
+        """
+        from .fieldsets import FieldSelection
+
         job = self.get_object()
         month_str = request.query_params.get('month')  # YYYY-MM 형식
+        selection = FieldSelection.from_request(request)
+        unknown = selection.unknown(PayrollSummarySerializer().fields)
+        if unknown:
+            return Response({'error': f"unknown fields: {', '.join(unknown)}"}, status=status.HTTP_400_BAD_REQUEST)
         
         if not month_str:
             return Response(
@@ -179,9 +217,171 @@ class EmployeeViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        summary_data = compute_payroll_summary(job, year, month)
-        serializer = PayrollSummarySerializer(summary_data)
-        return Response(serializer.data)
+        summary_data = get_payroll_summary(job, year, month)
+        # 응답 형태는 PayrollSummarySerializer와 동일 (serializer 대신 labor/rows.py 변환)
+        response = Response(PayrollSummary.from_dict(summary_data, selection).to_dict(selection))
+        if is_month_closed(year, month):
+            # 마감된 월은 스냅샷이므로 압축 본문 캐시 허용 (labor/compression.py)
+            mark_compressed_cacheable(response)
+        return response
+
+    @action(detail=True, methods=['get'], url_path='payroll-projection')
+    def payroll_projection(self, request, pk=None):
+        """다음 달부터 N개월의 예상 급여
+
+        GET /api/labor/jobs/<id>/payroll-projection/?months=6  (1~12, 기본 3)
+        """
+        job = self.get_object()
+        try:
+            months = int(request.query_params.get('months', 3))
+        except ValueError:
+            return Response({'error': 'months must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+        if months < 1 or months > 12:
+            return Response({'error': 'months must be between 1 and 12'}, status=status.HTTP_400_BAD_REQUEST)
+
+        from .projections import project_payroll
+        summaries = project_payroll(job, months)
+        rows = [
+            {
+                'month': s['month'],
+                'total_hours': s['total_hours'],
+                'base_pay': s['base_pay'],
+                'holiday_bonus': s['holiday_bonus'],
+                'night_bonus': s['night_bonus'],
+                'overtime_bonus': s['overtime_bonus'],
+                'weekly_holiday_pay': s['monthly_weekly_holiday_pay'],
+                'estimated_monthly_pay': s['estimated_monthly_pay'],
+                'net_pay': s['net_pay'],
+            }
+            for s in summaries
+        ]
+        return Response({
+            'months': rows,
+            'total_estimated_pay': sum(r['estimated_monthly_pay'] for r in rows),
+            'total_net_pay': sum(r['net_pay'] for r in rows),
+        })
+
+    @action(detail=True, methods=['get'], url_path='payroll-year')
+    def payroll_year(self, request, pk=None):
+        """연간 급여 요약 (월별 행 + 연간 합계/공제)
+
+        GET /api/labor/jobs/<id>/payroll-year/?year=2025  (기본: 올해)
+        """
+        job = self.get_object()
+        try:
+            year = int(request.query_params.get('year', timezone.localdate().year))
+        except ValueError:
+            return Response({'error': 'year must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+        if year < 1900 or year > 2100:
+            return Response({'error': 'year out of range'}, status=status.HTTP_400_BAD_REQUEST)
+
+        from .services import compute_payroll_year
+        result = cached_result(job, payroll_year_key(year), lambda: compute_payroll_year(job, year))
+        return Response(result)
+
+    @action(detail=True, methods=['get', 'post', 'delete'], url_path='terms')
+    def terms(self, request, pk=None):
+        """근로조건 이력 (시급/계약시간/공제 방식의 적용 시작일별 기록)
+
+        GET    /api/labor/jobs/<id>/terms/
+        POST   /api/labor/jobs/<id>/terms/  {"effective_from": "2025-07-01", "hourly_rate": 11000, ...}
+               - 같은 적용일이 있으면 수정, 없으면 추가 (생략한 필드는 직전 조건 유지)
+        DELETE /api/labor/jobs/<id>/terms/?effective_from=2025-07-01
+        """
+        from .models import EmploymentTerms
+        from .serializers import EmploymentTermsSerializer
+        from .terms import TERMS_FIELDS, TermsTimeline, sync_employee_terms
+
+        job = self.get_object()
+        if request.method == 'GET':
+            rows = EmploymentTerms.objects.filter(employee=job)
+            return Response(EmploymentTermsSerializer(rows, many=True).data)
+
+        if request.method == 'DELETE':
+            raw = request.query_params.get('effective_from')
+            try:
+                effective_from = datetime.strptime(raw or '', '%Y-%m-%d').date()
+            except ValueError:
+                return Response({'error': 'effective_from must be YYYY-MM-DD'}, status=status.HTTP_400_BAD_REQUEST)
+            row = EmploymentTerms.objects.filter(employee=job, effective_from=effective_from).first()
+            if row is None:
+                return Response({'error': 'terms not found'}, status=status.HTTP_404_NOT_FOUND)
+            if EmploymentTerms.objects.filter(employee=job).count() == 1:
+                return Response({'error': 'cannot delete the only terms row'}, status=status.HTTP_400_BAD_REQUEST)
+            row.delete()
+            sync_employee_terms(job)
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        try:
+            effective_from = datetime.strptime(str(request.data.get('effective_from', '')), '%Y-%m-%d').date()
+        except ValueError:
+            return Response({'error': 'effective_from must be YYYY-MM-DD'}, status=status.HTTP_400_BAD_REQUEST)
+        existing = EmploymentTerms.objects.filter(employee=job, effective_from=effective_from).first()
+        serializer = EmploymentTermsSerializer(existing, data=request.data, partial=True)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        timeline = TermsTimeline.load(job)
+        if not timeline.has_history and job.start_date and effective_from != job.start_date:
+            # 첫 이력: 근무 시작일부터의 현재 조건을 기준 행으로 남김
+            EmploymentTerms.objects.create(
+                employee=job, effective_from=job.start_date,
+                **{field: getattr(job, field) for field in TERMS_FIELDS}
+            )
+            timeline = TermsTimeline.load(job)
+        if existing is None:
+            # 생략한 필드는 적용일 직전 조건을 이어받음
+            inherited = timeline.as_of(serializer.validated_data['effective_from'])
+            for field in TERMS_FIELDS:
+                serializer.validated_data.setdefault(field, getattr(inherited, field))
+            row = serializer.save(employee=job)
+        else:
+            row = serializer.save()
+        sync_employee_terms(job)
+        return Response(
+            EmploymentTermsSerializer(row).data,
+            status=status.HTTP_200_OK if existing else status.HTTP_201_CREATED,
+        )
+
+    @action(detail=True, methods=['post'], url_path='simulate')
+    def simulate(self, request, pk=None):
+        """근로조건 가정(what-if) 시뮬레이션 - 실제 근로정보는 변경하지 않음
+
+        POST /api/labor/jobs/<id>/simulate/
+        {
+            "month": "2025-03",   # 선택 (기본: 이번 달)
+            "scenarios": [
+                {"name": "시급 인상", "hourly_rate": 11000},
+                {"name": "4대보험", "deduction_type": "FOUR_INSURANCE"}
+            ]
+        }
+        scenarios가 없으면 본문 전체를 하나의 시나리오로 봅니다.
+        """
+        job = self.get_object()
+        from .simulation import SimulationError, simulate
+
+        month_str = request.data.get('month')
+        if month_str:
+            try:
+                year, month = map(int, month_str.split('-'))
+                date(year, month, 1)
+            except (ValueError, AttributeError):
+                return Response({'error': 'month 형식 오류 (형식: YYYY-MM)'}, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            today = timezone.localdate()
+            year, month = today.year, today.month
+
+        scenarios = request.data.get('scenarios')
+        if scenarios is None:
+            scenarios = [{k: v for k, v in request.data.items() if k != 'month'}]
+        if not isinstance(scenarios, list) or not all(isinstance(s, dict) for s in scenarios):
+            return Response({'error': 'scenarios must be a list of objects'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            result = simulate(job, year, month, scenarios)
+        except SimulationError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(result)
 
     @action(detail=True, methods=['get'], url_path='holiday-pay')
     def holiday_pay(self, request, pk=None):
@@ -207,7 +407,7 @@ class EmployeeViewSet(viewsets.ModelViewSet):
             target_date = date.today()
 
         # 정책 로드
-        rules = PolicyManager.get_holiday_pay_rules()
+        rules = PolicyManager.get_holiday_pay_rules(target_date)
         min_weekly_hours = Decimal(str(rules.get('min_weekly_hours', 15)))
         calc_method = rules.get('calculation_method', 'daily_average')
 
@@ -387,14 +587,93 @@ class EmployeeViewSet(viewsets.ModelViewSet):
           "weekly_holiday_pay": 12040,
           "annual_leave_days": 8.0,
           "severance_estimate": 0,
-          "warnings": ["..."]
+          "warnings": ["..."],
+          "compliance": {"period": {...}, "violations": [...], "counts": {...}, "total_amount": 0}
         }
         """
+        from .compliance import check_compliance, compliance_warnings
+
         job = self.get_object()
         inputs = job_to_inputs(job)
         result = evaluate_labor(inputs)
+        # 경고는 규칙 엔진 결과에서만 (현재 근로조건 + 근로기록 기반 점검)
+        compliance = check_compliance(job, inputs=inputs)
+        result['warnings'] = compliance_warnings(compliance)
+        result['compliance'] = compliance
         return Response(result)
 
+    @action(detail=True, methods=['get'], url_path='back-pay')
+    def back_pay(self, request, pk=None):
+        """전체 근무 기간의 체불임금 추정 (월별 원장 + 합계)
+
+        GET /api/labor/jobs/<id>/back-pay/?paid=weekly_holiday_pay,night_premium
+        paid: 이미 지급받은 항목 (쉼표 구분, 해당 항목은 체불액에서 제외)
+        """
+        from .back_pay import COMPONENTS, calculate_back_pay
+
+        job = self.get_object()
+        paid = [p.strip() for p in request.query_params.get('paid', '').split(',') if p.strip()]
+        unknown = [p for p in paid if p not in COMPONENTS]
+        if unknown:
+            return Response(
+                {'error': f"알 수 없는 항목입니다: {', '.join(unknown)} (가능: {', '.join(COMPONENTS)})"},
+                status=400,
+            )
+        return Response(calculate_back_pay(job, assume_paid=paid))
+
+    @action(detail=True, methods=['get'], url_path='wage-claim-evidence')
+    def wage_claim_evidence(self, request, pk=None):
+        """임금체불 진정용 증빙 ZIP 다운로드 (근로기록/월별 급여/체불 CSV + 요약 docx)
+
+        GET /api/labor/jobs/<id>/wage-claim-evidence/
+        아카이브를 만들면서 바로 전송하므로 여러 해의 기록도 메모리에 모으지 않습니다.
+        """
+        from django.http import StreamingHttpResponse
+        from .evidence import iter_evidence_zip
+
+        job = self.get_object()
+        filename = f"wage_claim_{job.pk}_{timezone.localdate():%Y%m%d}.zip"
+        response = StreamingHttpResponse(iter_evidence_zip(job), content_type='application/zip')
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    @action(detail=True, methods=['get'], url_path='export')
+    def export(self, request, pk=None):
+        """근로기록/일별 급여 내보내기
+
+        GET /api/labor/jobs/<id>/export/?from=2025-01-01&to=2025-06-30&format=csv|xlsx
+        from 기본값: 근무 시작일, to 기본값: 오늘. 행을 계산하는 대로 전송합니다.
+        """
+        from django.http import StreamingHttpResponse
+        from .export import EXPORT_COLUMNS, iter_daily_rows
+        from .streaming import iter_csv, iter_xlsx
+
+        job = self.get_object()
+        export_format = request.query_params.get('format', 'csv')
+        if export_format not in ('csv', 'xlsx'):
+            return Response({'error': 'format must be csv or xlsx'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            start = datetime.strptime(request.query_params['from'], '%Y-%m-%d').date() \
+                if request.query_params.get('from') else job.start_date
+            end = datetime.strptime(request.query_params['to'], '%Y-%m-%d').date() \
+                if request.query_params.get('to') else timezone.localdate()
+        except ValueError:
+            return Response({'error': 'from/to must be YYYY-MM-DD'}, status=status.HTTP_400_BAD_REQUEST)
+        if end < start:
+            return Response({'error': 'from must be on or before to'}, status=status.HTTP_400_BAD_REQUEST)
+
+        rows = iter_daily_rows(job, start, end)
+        filename = f"work_records_{job.pk}_{start:%Y%m%d}_{end:%Y%m%d}.{export_format}"
+        if export_format == 'xlsx':
+            response = StreamingHttpResponse(
+                iter_xlsx(EXPORT_COLUMNS, rows, sheet_name='근로기록'),
+                content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            )
+        else:
+            response = StreamingHttpResponse(iter_csv(EXPORT_COLUMNS, rows), content_type='text/csv; charset=utf-8')
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
 
     @action(detail=True, methods=['get'], url_path='annual-leave')
     def annual_leave(self, request, pk=None):
@@ -406,7 +685,7 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         # [Fix] Use V2 logic for consistency with diagnosis
         from .services import calculate_annual_leave_v2
         today = timezone.localdate()
-        result = calculate_annual_leave_v2(job, today.year)
+        result = cached_result(job, annual_leave_key(today.year), lambda: calculate_annual_leave_v2(job, today.year))
         
         # V2 returns {eligible, accrued_days, used_days, remaining_days}
         # Card expects {total, used, available}
@@ -474,8 +753,130 @@ class EmployeeViewSet(viewsets.ModelViewSet):
             work_date__lte=end
         ).order_by('-work_date')
         
-        serializer = WorkRecordSerializer(records, many=True)
-        return Response(serializer.data)
+        # WorkRecordSerializer와 같은 형태, 스케줄 정보는 기간 단위로 한 번에 적재
+        dataset = EmployeeDataset.load(job, start, end, with_records=False)
+        return Response(work_record_rows(records, dataset))
+
+    @action(detail=True, methods=['post'], url_path='work-records/import')
+    def import_work_records(self, request, pk=None):
+        """근로기록 일괄 가져오기 (CSV / JSON, 같은 근무일은 덮어씀)
+
+        POST /api/labor/jobs/<id>/work-records/import/
+        - multipart/form-data: file=<.csv | .json | .jsonl>
+        - 또는 본문 그대로: Content-Type text/csv | application/json | application/x-ndjson
+        열: work_date, time_in, time_out, break_minutes, next_day_work_minutes, attendance_status
+        반환: {"created": 40, "updated": 2, "error_count": 1, "errors": [{"row": 3, "errors": {...}}], "months": [...]}
+        """
+        from .record_import import ImportFormatError, import_work_records, iter_csv_rows, iter_json_rows
+        from .services import compute_monthly_schedule_stats
+
+        job = self.get_object()
+        if request.content_type.startswith('multipart/form-data'):
+            upload = request.FILES.get('file')
+            if upload is None:
+                return Response({'error': 'file 필드가 필요합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+            name = upload.name.lower()
+            kind = 'csv' if name.endswith('.csv') else 'json' if name.endswith(('.json', '.jsonl', '.ndjson')) else None
+            stream = upload
+        else:
+            content_type = request.content_type.split(';')[0].strip()
+            kind = {
+                'text/csv': 'csv', 'application/json': 'json', 'application/x-ndjson': 'json',
+            }.get(content_type)
+            stream = request.stream
+        if kind is None or stream is None:
+            return Response({'error': 'CSV 또는 JSON 파일만 가져올 수 있습니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        rows = iter_csv_rows(stream) if kind == 'csv' else iter_json_rows(stream)
+        try:
+            result = import_work_records(job, rows)
+        except ImportFormatError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 영향을 받은 달의 통계를 달마다 한 번씩 다시 계산
+        data = result.to_dict()
+        data['months'] = [
+            {'month': f"{year}-{month:02d}", 'stats': compute_monthly_schedule_stats(job, year, month)}
+            for year, month in sorted({(d.year, d.month) for d in result.dates})
+        ]
+        imported = result.created + result.updated
+        return Response(data, status=status.HTTP_200_OK if imported or not result.errors else status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=True, methods=['post'], url_path='punch')
+    def punch(self, request, pk=None):
+        """실시간 출근/퇴근 펀치 (기록만 하고 근로기록 반영은 consolidate_punches가 모아서 처리)
+
+        POST /api/labor/jobs/<id>/punch/
+        {"kind": "IN" | "OUT", "punched_at": "2025-03-03T09:00:00+09:00"(선택, 오프라인 기기 시각)}
+        반환(202): {"id": 1, "kind": "IN", "punched_at": "...", "status": "PENDING"}
+        """
+        from .punches import check_punch_time, record_punch
+
+        kind = str(request.data.get('kind', '')).upper()
+        if kind not in ('IN', 'OUT'):
+            return Response({'error': 'kind는 IN 또는 OUT이어야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+        punched_at = None
+        if request.data.get('punched_at'):
+            try:
+                punched_at = datetime.fromisoformat(str(request.data['punched_at']))
+            except ValueError:
+                return Response({'error': 'punched_at은 ISO 날짜시간이어야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+            if timezone.is_naive(punched_at):
+                punched_at = timezone.make_aware(punched_at)
+            error = check_punch_time(punched_at)
+            if error:
+                return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 소유 확인만 하고 Employee 전체를 읽지 않음
+        employee_id = self.get_queryset().filter(pk=pk).values_list('pk', flat=True).first()
+        if employee_id is None:
+            return Response({'error': 'Job을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+        event = record_punch(employee_id, kind, punched_at)
+        return Response({
+            'id': event.id,
+            'kind': event.kind,
+            'punched_at': event.punched_at.isoformat(),
+            'status': event.status,
+        }, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=True, methods=['post'], url_path='work-records/batch')
+    def batch_work_records(self, request, pk=None):
+        """여러 날의 근로기록을 한 번에 수정 (전부 적용하거나 전부 적용하지 않음)
+
+        POST /api/labor/jobs/<id>/work-records/batch/
+        {"changes": [{"work_date": "2025-03-03", "attendance_status": "ANNUAL_LEAVE"},
+                     {"work_date": "2025-03-04", "time_out": "19:00"},
+                     {"work_date": "2025-03-05", "delete": true}]}
+        반환: {"created": 0, "updated": 2, "deleted": 1, "records": [...],
+               "months": [{"month": "2025-03", "stats": {...}, "dates": [...]}], "cumulative_stats": {...}}
+        """
+        from .record_batch import BatchValidationError, apply_record_changes
+
+        job = self.get_object()
+        try:
+            result = apply_record_changes(job, request.data.get('changes'))
+        except BatchValidationError as e:
+            return Response({'error': '잘못된 변경이 있어 적용하지 않았습니다.', 'errors': e.errors},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        # 영향을 받은 달의 통계를 달마다 한 번씩 다시 계산
+        months = [
+            {
+                'month': f"{year}-{month:02d}",
+                'stats': compute_monthly_schedule_stats(job, year, month),
+                'dates': monthly_scheduled_dates(job, year, month),
+            }
+            for year, month in sorted({(d.year, d.month) for d in result.dates})
+        ]
+        records = sorted(result.created + result.updated, key=lambda r: r.work_date)
+        return Response({
+            'created': len(result.created),
+            'updated': len(result.updated),
+            'deleted': len(result.deleted),
+            'records': WorkRecordSerializer(records, many=True).data,
+            'months': months,
+            'cumulative_stats': self.get_cumulative_stats_data(job),
+        }, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=['get', 'post'], url_path='schedules')
     def schedules(self, request, pk=None):
@@ -632,7 +1033,7 @@ class EmployeeViewSet(viewsets.ModelViewSet):
                 'message': message
             })
 
-    @action(detail=True, methods=['get'], url_path='calendar')
+    @action(detail=True, methods=['get'], url_path='calendar', renderer_classes=COLUMNAR_RENDERERS)
     def calendar(self, request, pk=None):
         """월별 캘린더 데이터 반환 (소정근로일 정보 포함)
         
@@ -640,14 +1041,45 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         - 월별 스케줄이 없으면 주간 스케줄을 fallback으로 사용
         - source 필드로 "monthly" | "weekly" 구분
         - 스케줄 기반 기본 시간 정보 제공
+        - ?fields=date,is_scheduled_workday,record.time_in / ?omit=record (날짜 항목 기준)
+          선택하지 않은 스케줄 조회·근로기록 직렬화는 계산하지 않음
+        - ?format=columnar: dates를 필드별 배열로 (labor/columnar.py)
+        - ?from=YYYY-MM&to=YYYY-MM: 여러 달 (최대 12개월)을 한 번의 데이터 적재로
+          반환: {"months": {"2025-03": {"dates": [...]}, ...}}
         """
+        from .fieldsets import FieldSelection
         from .models import MonthlySchedule, WorkSchedule
+        from .services import CALENDAR_FIELDS, MAX_CALENDAR_MONTHS, calendar_months
         
         job = self.get_object()
         month = request.query_params.get('month')  # YYYY-MM
+        selection = FieldSelection.from_request(request)
+        unknown = selection.unknown(CALENDAR_FIELDS)
+        if unknown:
+            return Response({'error': f"unknown fields: {', '.join(unknown)}"}, status=status.HTTP_400_BAD_REQUEST)
         
         logger.info(f'[calendar] API 호출됨 - job_id={job.id}, month={month}')
         
+        month_from = request.query_params.get('from')
+        month_to = request.query_params.get('to')
+        if month_from or month_to:
+            if not (month_from and month_to):
+                return Response({'error': 'from, to parameters required'}, status=status.HTTP_400_BAD_REQUEST)
+            try:
+                first = date(*map(int, month_from.split('-')), 1)
+                last = date(*map(int, month_to.split('-')), 1)
+            except Exception:
+                return Response({'error': 'from/to format error (YYYY-MM)'}, status=status.HTTP_400_BAD_REQUEST)
+            span = (last.year - first.year) * 12 + last.month - first.month + 1
+            if span < 1 or span > MAX_CALENDAR_MONTHS:
+                return Response(
+                    {'error': f'from~to must be 1~{MAX_CALENDAR_MONTHS} months'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            months = calendar_months(job, (first.year, first.month), (last.year, last.month), fields=selection)
+            logger.info(f'[calendar] {month_from}~{month_to} {len(months)}개월 응답')
+            return Response({'months': {key: {'dates': dates} for key, dates in months.items()}})
+        
         if not month:
             return Response({'error': 'month parameter required'}, status=status.HTTP_400_BAD_REQUEST)
         try:
@@ -667,11 +1099,11 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         
         # 1. 공통 서비스 함수를 사용하여 날짜별 데이터 생성 (중복 로직 제거)
         from .services import monthly_scheduled_dates
-        dates = monthly_scheduled_dates(job, year, mon)
+        dates = monthly_scheduled_dates(job, year, mon, fields=selection)
         
         # 2. 결과 반환
         logger.info(f'[calendar] 응답 데이터: {len(dates)}개 날짜, '
-                   f'소정근로일={sum(1 for d in dates if d["is_scheduled_workday"])}일')
+                   f'소정근로일={sum(1 for d in dates if d.get("is_scheduled_workday"))}일')
         
         return Response({'dates': dates})
 
@@ -738,6 +1170,8 @@ class EmployeeViewSet(viewsets.ModelViewSet):
                 break_minutes=0
             ))
         MonthlySchedule.objects.bulk_create(new_monthly_schedules)
+        # bulk_create는 post_save 시그널을 보내지 않으므로 직접 무효화
+        monthly_schedule_replaced(job, year, mon)
         
         total_deleted = work_records_count + monthly_schedules_count
         
@@ -775,7 +1209,11 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         
         사용자 요청: "업적 합계의 금액도 그냥 급여 예상액의 합산이면 돼"
         따라서 개별 WorkRecord 집계 대신, 매월의 compute_monthly_schedule_stats 결과를 합산합니다.
+        결과는 근로 데이터가 바뀔 때까지 캐시됩니다 (labor/invalidation.py).
         """
+        return cached_result(job, ResultKey(CUMULATIVE), lambda: self._compute_cumulative_stats(job))
+
+    def _compute_cumulative_stats(self, job):
         today = timezone.localdate()
         from .services import compute_monthly_schedule_stats
         
@@ -809,14 +1247,14 @@ class EmployeeViewSet(viewsets.ModelViewSet):
             # 1. 해당 월의 요약 통계 계산 (services.py 로직 활용)
             # ...
             
-            from .services import compute_payroll_summary
-            summary = compute_payroll_summary(job, curr_y, curr_m)
+            # 마감된 달은 스냅샷에서 조회 (labor/snapshots.py)
+            summary = get_payroll_summary(job, curr_y, curr_m)
             
             # 합산
             cumulative_hours += summary['total_hours'] # 실제 + 예정 시간
             
             # 전체 예상 급여 (세전 -> 세후 반영 요청)
-            # summary['estimated_monthly_pay'] = base + night + holiday + weekly_holiday (세전)
+            # summary['estimated_monthly_pay'] = base + night + holiday + overtime + weekly_holiday (세전)
             # summary['net_pay'] = estimated - deductions (세후, 공제 방식 반영됨)
             
             # 사용자 요청: "공제 방식을 변경하면 업적합계도 변경되어야 함" 
@@ -828,7 +1266,11 @@ class EmployeeViewSet(viewsets.ModelViewSet):
                  cumulative_days += len(summary['rows'])
             
             # 분리 집계 (디테일 UI용)
-            monthly_base = summary['base_pay'] + summary['night_bonus'] + summary['holiday_bonus']
+            # 연장근로 도입 이전에 마감된 스냅샷에는 overtime_bonus가 없음
+            monthly_base = (
+                summary['base_pay'] + summary['night_bonus'] + summary['holiday_bonus']
+                + summary.get('overtime_bonus', 0)
+            )
             cumulative_base_pay += monthly_base
             cumulative_holiday_pay += summary['monthly_weekly_holiday_pay']
             cumulative_night_pay += summary['night_bonus']
@@ -922,8 +1364,15 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         today_month = today.month
         is_future = (year > today_year) or (year == today_year and mon > today_month)
 
-        from .services import compute_monthly_schedule_stats
-        stats = compute_monthly_schedule_stats(job, year, mon)
+        if is_future:
+            # 미래 월은 월 모양(month shape) 기준 예측 캐시 사용
+            from .projections import projected_month_schedule_totals
+            from .services import compute_this_week_schedule_stats
+            stats = projected_month_schedule_totals(job, year, mon)
+            stats.update(compute_this_week_schedule_stats(job))
+        else:
+            from .services import compute_monthly_schedule_stats
+            stats = compute_monthly_schedule_stats(job, year, mon)
         stats['month'] = month
         stats['is_future_month'] = is_future
         
@@ -1038,7 +1487,7 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         """퇴직금 예상액 정보 조회 (MVP v2)"""
         job = self.get_object()
         from .services import calculate_severance_v2
-        res = calculate_severance_v2(job)
+        res = cached_result(job, ResultKey(SEVERANCE), lambda: calculate_severance_v2(job))
         return Response(res)
 
     @action(detail=True, methods=['get', 'post'], url_path='monthly-schedule-override')
@@ -1467,7 +1916,79 @@ def holidays(request):
         return Response({'error': 'month must be formatted as YYYY-MM'}, status=status.HTTP_400_BAD_REQUEST)
 
     data = get_holidays_for_month(year, month)
-    return Response(data)
+    response = Response(data)
+    # 공휴일은 거의 바뀌지 않으므로 하루 동안 브라우저 캐시 (max-age가 있으면 압축 본문도 캐시됨, labor/compression.py)
+    patch_cache_control(response, private=True, max_age=60 * 60 * 24)
+    return response
+
+
+@api_view(['GET'])
+@drf_permission_classes([IsAuthenticated])
+def me_rollup(request):
+    """사용자의 모든 근로(알바) 월 합산
+
+    GET /api/labor/me/rollup/?month=YYYY-MM  (기본: 이번 달)
+    응답: 근로별/전체 월 급여 합계 + 주별 합산 근로시간(주 52시간 확인용)
+    """
+    month_param = request.query_params.get('month')
+    if month_param:
+        try:
+            year_str, month_str = month_param.split('-')
+            year = int(year_str)
+            month = int(month_str)
+            if month < 1 or month > 12:
+                raise ValueError
+        except ValueError:
+            return Response({'error': 'month must be formatted as YYYY-MM'}, status=status.HTTP_400_BAD_REQUEST)
+    else:
+        today = timezone.localdate()
+        year, month = today.year, today.month
+
+    from .rollup import compute_user_rollup
+    return Response(compute_user_rollup(request.user, year, month))
+
+
+@api_view(['GET'])
+@drf_permission_classes([IsAuthenticated])
+def sync_changes(request):
+    """동기화 토큰 이후의 변경 (Employee / 근로기록 / 주간·월별 스케줄, 삭제 포함)
+
+    GET /api/labor/sync/?since=<token>&limit=500
+    - since 생략: 전체 데이터 + token (full=true)
+    - 응답: {"token": "42", "full": false, "has_more": false, "changes": {...}, "deleted": {...}}
+    - 잘못된/만료된 토큰은 400 → since 없이 다시 요청
+    """
+    from .sync import MAX_SYNC_PAGE_SIZE, SYNC_PAGE_SIZE, InvalidSyncToken, change_feed
+
+    try:
+        limit = int(request.query_params.get('limit', SYNC_PAGE_SIZE))
+    except ValueError:
+        return Response({'error': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+    limit = max(1, min(limit, MAX_SYNC_PAGE_SIZE))
+    try:
+        return Response(change_feed(request.user, request.query_params.get('since'), limit))
+    except InvalidSyncToken as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+@api_view(['POST'])
+@drf_permission_classes([IsAuthenticated])
+def batch_requests(request):
+    """여러 GET 요청을 한 번에 (화면 진입 시 동시에 필요한 조회 묶음)
+
+    POST /api/batch/
+    {"requests": [{"id": "calendar", "path": "/api/labor/jobs/3/calendar/", "params": {"month": "2025-03"}}, ...]}
+    응답: {"responses": [{"id": "calendar", "status": 200, "body": {...}}, ...]} (요청 순서 그대로)
+    - 하위 요청마다 각 view의 인증/권한/소유자 확인을 그대로 적용
+    - Employee, 스케줄·근로기록, 공휴일 조회는 하위 요청끼리 공유 (labor/subrequests.py)
+    """
+    from .subrequests import SubrequestError, parse_subrequests, run_subrequests
+
+    try:
+        items = parse_subrequests(request.data)
+    except SubrequestError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({'responses': run_subrequests(request, items, batch_requests)})
 
 
 @api_view(['GET'])
@@ -1495,7 +2016,7 @@ def annual_leave_summary(request):
     
     from .services import calculate_annual_leave_v2
     today = date.today()
-    res = calculate_annual_leave_v2(employee, today.year)
+    res = cached_result(employee, annual_leave_key(today.year), lambda: calculate_annual_leave_v2(employee, today.year))
     
     return Response({
         "as_of": today.isoformat(),